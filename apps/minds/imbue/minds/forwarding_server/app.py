@@ -23,6 +23,10 @@ from fastapi.responses import HTMLResponse
 from fastapi.responses import Response
 from fastapi.responses import StreamingResponse
 from loguru import logger
+from starlette.background import BackgroundTask
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
 from websockets import ClientConnection
 
 from imbue.minds.forwarding_server.agent_creator import AgentCreationStatus
@@ -33,11 +37,11 @@ from imbue.minds.forwarding_server.backend_resolver import BackendResolverInterf
 from imbue.minds.forwarding_server.cookie_manager import SESSION_COOKIE_NAME
 from imbue.minds.forwarding_server.cookie_manager import create_session_cookie
 from imbue.minds.forwarding_server.cookie_manager import verify_session_cookie
+from imbue.minds.forwarding_server.proxy import StreamingHtmlRewriter
 from imbue.minds.forwarding_server.proxy import generate_backend_loading_html
 from imbue.minds.forwarding_server.proxy import generate_bootstrap_html
 from imbue.minds.forwarding_server.proxy import generate_service_worker_js
 from imbue.minds.forwarding_server.proxy import rewrite_cookie_path
-from imbue.minds.forwarding_server.proxy import rewrite_proxied_html
 from imbue.minds.forwarding_server.ssh_tunnel import SSHTunnelError
 from imbue.minds.forwarding_server.ssh_tunnel import SSHTunnelManager
 from imbue.minds.forwarding_server.ssh_tunnel import parse_url_host_port
@@ -323,8 +327,11 @@ async def _forward_http_request(
 ) -> httpx.Response | Response:
     """Forward an HTTP request to the backend, returning the backend response or an error Response.
 
-    When http_client is not None, uses it instead of the app's default client. This is
-    used for SSH-tunneled connections where the client is configured with UDS transport.
+    The backend response is returned as soon as its headers arrive, with the body left
+    unread so that it can be streamed to the client; the caller is responsible for
+    closing it. When http_client is not None, uses it instead of the app's default
+    client. This is used for SSH-tunneled connections where the client is configured
+    with UDS transport.
     """
     base_url, stored_query = _split_backend_url(backend_url)
     proxy_url = _build_proxy_url(base_url, path, stored_query, request.url.query)
@@ -335,13 +342,14 @@ async def _forward_http_request(
     body = await request.body()
 
     active_http_client = http_client or request.app.state.http_client
+    backend_request = active_http_client.build_request(
+        method=request.method,
+        url=proxy_url,
+        headers=headers,
+        content=body,
+    )
     try:
-        return await active_http_client.request(
-            method=request.method,
-            url=proxy_url,
-            headers=headers,
-            content=body,
-        )
+        return await active_http_client.send(backend_request, stream=True)
     except httpx.ConnectError:
         logger.debug("Backend connection refused for {} server {}", agent_id, server_name)
         return Response(status_code=502, content="Backend connection refused")
@@ -405,12 +413,35 @@ async def _forward_http_request_streaming(
     )
 
 
+class _CleanUpAlwaysStreamingResponse(StreamingResponse):
+    """StreamingResponse that runs its background task however the response ends.
+
+    Starlette skips the background task when the client disconnects before the
+    body is sent (the disconnect is raised first), so cleanup that must always
+    happen, like closing a backend response, would otherwise be leaked.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        background = self.background
+        self.background = None
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            if background is not None:
+                await background()
+
+
 def _build_proxy_response(
     backend_response: httpx.Response,
     agent_id: AgentId,
     server_name: ServerName,
 ) -> Response:
-    """Transform a backend httpx response into a FastAPI Response with header/content rewriting."""
+    """Transform a backend httpx response into a streaming FastAPI Response with header/content rewriting.
+
+    The body is forwarded chunk by chunk as it arrives from the backend (HTML is
+    rewritten on the fly), so neither time-to-first-byte nor memory use grows with
+    the size of the response.
+    """
     # Build response headers, dropping hop-by-hop headers
     resp_headers: dict[str, list[str]] = {}
     for header_key, header_value in backend_response.headers.multi_items():
@@ -425,26 +456,47 @@ def _build_proxy_response(
         resp_headers.setdefault(header_key, [])
         resp_headers[header_key].append(header_value)
 
-    content: str | bytes = backend_response.content
-
-    # Rewrite HTML responses (absolute paths, base tag, WS shim)
-    content_type = backend_response.headers.get("content-type", "")
-    if "text/html" in content_type:
-        html_text = backend_response.text
-        rewritten_html = rewrite_proxied_html(
-            html_content=html_text,
-            agent_id=agent_id,
-            server_name=server_name,
-        )
-        content = rewritten_html.encode()
-
-    response = Response(content=content, status_code=backend_response.status_code)
+    # The body generator closes the backend response when it finishes, but it never
+    # runs if the client goes away first, so the response is also closed afterwards
+    response = _CleanUpAlwaysStreamingResponse(
+        _stream_proxied_body(backend_response=backend_response, agent_id=agent_id, server_name=server_name),
+        status_code=backend_response.status_code,
+        background=BackgroundTask(backend_response.aclose),
+    )
     for header_key, header_values in resp_headers.items():
         for header_value in header_values:
             response.headers.append(header_key, header_value)
     return response
 
 
+async def _stream_proxied_body(
+    backend_response: httpx.Response,
+    agent_id: AgentId,
+    server_name: ServerName,
+) -> AsyncGenerator[bytes, None]:
+    """Yield the backend response body as it arrives, rewriting HTML (absolute paths, base tag, WS shim)."""
+    try:
+        content_type = backend_response.headers.get("content-type", "")
+        if "text/html" in content_type:
+            rewriter = StreamingHtmlRewriter(agent_id=agent_id, server_name=server_name)
+            async for text in backend_response.aiter_text():
+                rewritten_html = rewriter.feed(text)
+                if rewritten_html:
+                    yield rewritten_html.encode()
+            yield rewriter.finish().encode()
+        else:
+            async for chunk in backend_response.aiter_bytes():
+                yield chunk
+    except httpx.TransportError as e:
+        # Re-raised so that the response is aborted, rather than ended as if the body were complete
+        logger.warning(
+            "Backend connection lost while streaming response for {} server {}: {}", agent_id, server_name, e
+        )
+        raise
+    finally:
+        await backend_response.aclose()
+
+
 async def _handle_proxy_http(
     agent_id: str,
     server_name: str,
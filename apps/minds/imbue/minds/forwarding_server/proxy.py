@@ -1,6 +1,10 @@
 import re
 from typing import Final
 
+from pydantic import Field
+from pydantic import PrivateAttr
+
+from imbue.imbue_common.mutable_model import MutableModel
 from imbue.imbue_common.pure import pure
 from imbue.minds.primitives import ServerName
 from imbue.mngr.primitives import AgentId
@@ -14,6 +18,21 @@ _ABSOLUTE_PATH_ATTR_PATTERN: Final[re.Pattern[str]] = re.compile(
     re.IGNORECASE,
 )
 
+# Matches an attribute that could still turn into an _ABSOLUTE_PATH_ATTR_PATTERN match
+# once more text arrives (e.g. 'href = "' at the very end of a chunk)
+_INCOMPLETE_ABSOLUTE_PATH_ATTR_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"""(?:href|src|action|formaction)\s*(?:=\s*(?:["']/?)?)?\Z""",
+    re.IGNORECASE,
+)
+
+_ABSOLUTE_PATH_ATTR_NAMES: Final[tuple[str, ...]] = ("href", "src", "action", "formaction")
+
+_MAX_ABSOLUTE_PATH_ATTR_NAME_LENGTH: Final[int] = max(len(name) for name in _ABSOLUTE_PATH_ATTR_NAMES)
+
+# How much rewritten HTML the streaming rewriter buffers while looking for the <head>
+# tag before giving up and injecting at the start of the document instead
+_MAX_HEAD_SEARCH_CHARS: Final[int] = 64 * 1024
+
 
 @pure
 def _get_server_prefix(agent_id: AgentId, server_name: ServerName) -> str:
@@ -169,24 +188,49 @@ def rewrite_absolute_paths_in_html(
     last_end = 0
 
     for match in _ABSOLUTE_PATH_ATTR_PATTERN.finditer(html_content):
-        quote = match.group(2)
-        path_start = match.group(3)
-
-        # Check full attribute value to avoid double-prefixing
-        remaining = html_content[match.start(3) :]
-        end_quote_idx = remaining.find(quote, 1)
-        full_path = remaining[:end_quote_idx] if end_quote_idx > 0 else remaining
-        if full_path.startswith(prefix + "/") or full_path == prefix:
-            result_parts.append(html_content[last_end : match.end()])
-        else:
-            result_parts.append(html_content[last_end : match.start(3)])
-            result_parts.append(f"{prefix}{path_start}")
+        result_parts.append(_rewrite_absolute_path_match(html_content, match, last_end, prefix))
         last_end = match.end(3)
 
     result_parts.append(html_content[last_end:])
     return "".join(result_parts)
 
 
+@pure
+def _rewrite_absolute_path_match(html_content: str, match: re.Match[str], last_end: int, prefix: str) -> str:
+    """Return the text from last_end through the end of the match, with the path prefixed if needed.
+
+    Only the first len(prefix) + 2 characters of the attribute value are inspected,
+    which is enough to tell whether it is already prefixed.
+    """
+    quote = match.group(2)
+    path_start = match.group(3)
+
+    # Check the attribute value to avoid double-prefixing
+    value_head = html_content[match.start(3) : match.start(3) + len(prefix) + 2]
+    end_quote_idx = value_head.find(quote, 1)
+    full_path = value_head[:end_quote_idx] if end_quote_idx > 0 else value_head
+    if full_path.startswith(prefix + "/") or full_path == prefix:
+        return html_content[last_end : match.end()]
+    return html_content[last_end : match.start(3)] + f"{prefix}{path_start}"
+
+
+@pure
+def _find_incomplete_absolute_path_attr_start(html_content: str) -> int:
+    """Return where a trailing, not yet complete absolute-path attribute could begin.
+
+    Returns len(html_content) when no suffix of the text could grow into a match.
+    """
+    match = _INCOMPLETE_ABSOLUTE_PATH_ATTR_PATTERN.search(html_content)
+    if match is not None:
+        return match.start()
+    # The text may also end partway through an attribute name (e.g. "formact")
+    for suffix_length in range(min(len(html_content), _MAX_ABSOLUTE_PATH_ATTR_NAME_LENGTH), 0, -1):
+        suffix = html_content[-suffix_length:].lower()
+        if any(name.startswith(suffix) for name in _ABSOLUTE_PATH_ATTR_NAMES):
+            return len(html_content) - suffix_length
+    return len(html_content)
+
+
 @pure
 def _inject_into_head(html_content: str, injection: str) -> str:
     """Inject content after the opening <head> tag."""
@@ -200,6 +244,19 @@ def _inject_into_head(html_content: str, injection: str) -> str:
         return injection + html_content
 
 
+@pure
+def _find_head_injection_point(html_content: str) -> int | None:
+    """Return the index just past the first opening <head> tag, or None if it is not (yet) complete."""
+    plain_idx = html_content.find("<head>")
+    attrs_idx = html_content.find("<head ")
+    if plain_idx >= 0 and (attrs_idx < 0 or plain_idx < attrs_idx):
+        return plain_idx + len("<head>")
+    if attrs_idx >= 0:
+        close_idx = html_content.find(">", attrs_idx)
+        return close_idx + 1 if close_idx >= 0 else None
+    return None
+
+
 _BACKEND_LOADING_RETRY_INTERVAL_MS: Final[int] = 1000
 
 
@@ -248,8 +305,6 @@ def rewrite_proxied_html(
     This rewrites absolute-path URLs, injects a <base> tag for relative URL resolution,
     and injects the WebSocket shim script.
     """
-    prefix = _get_server_prefix(agent_id, server_name)
-
     # Rewrite absolute paths in HTML attributes
     rewritten = rewrite_absolute_paths_in_html(
         html_content=html_content,
@@ -257,9 +312,76 @@ def rewrite_proxied_html(
         server_name=server_name,
     )
 
-    # Build the injection: base tag + WS shim
-    base_tag = f'<base href="{prefix}/">'
-    shim = generate_websocket_shim_js(agent_id, server_name)
-    injection = base_tag + shim
+    return _inject_into_head(html_content=rewritten, injection=_build_head_injection(agent_id, server_name))
+
+
+@pure
+def _build_head_injection(agent_id: AgentId, server_name: ServerName) -> str:
+    """Build the <base> tag and WebSocket shim injected at the start of <head>."""
+    prefix = _get_server_prefix(agent_id, server_name)
+    return f'<base href="{prefix}/">' + generate_websocket_shim_js(agent_id, server_name)
+
+
+class StreamingHtmlRewriter(MutableModel):
+    """Applies the rewrite_proxied_html transformations to an HTML document as it streams through.
+
+    Text is fed in arbitrary chunks, and rewritten text is returned as soon as it can
+    no longer be affected by text that has not arrived yet. Only a partial attribute
+    at the end of a chunk is held back, plus the start of the document until the
+    <head> tag has been seen, so memory use does not grow with the document size.
+
+    Unlike rewrite_proxied_html, the injection goes after whichever <head> tag comes
+    first, and it goes at the start of the document if a <body> tag (or more than
+    _MAX_HEAD_SEARCH_CHARS of text) arrives before any <head> tag.
+    """
 
-    return _inject_into_head(html_content=rewritten, injection=injection)
+    agent_id: AgentId = Field(frozen=True, description="The agent whose server the document came from")
+    server_name: ServerName = Field(frozen=True, description="The server the document came from")
+
+    _unrewritten_text: str = PrivateAttr(default="")
+    _head_search_text: str | None = PrivateAttr(default="")
+
+    def feed(self, text: str) -> str:
+        """Consume the next chunk of the document, returning whatever rewritten text is ready."""
+        return self._inject_head(self._rewrite_absolute_paths(text, is_final=False), is_final=False)
+
+    def finish(self) -> str:
+        """Return all remaining rewritten text once the whole document has been fed."""
+        return self._inject_head(self._rewrite_absolute_paths("", is_final=True), is_final=True)
+
+    def _rewrite_absolute_paths(self, text: str, is_final: bool) -> str:
+        html_content = self._unrewritten_text + text
+        prefix = _get_server_prefix(self.agent_id, self.server_name)
+        safe_end = len(html_content) if is_final else _find_incomplete_absolute_path_attr_start(html_content)
+        result_parts: list[str] = []
+        last_end = 0
+
+        for match in _ABSOLUTE_PATH_ATTR_PATTERN.finditer(html_content):
+            if match.start() >= safe_end:
+                break
+            # The double-prefix check needs to see the start of the attribute value
+            if not is_final and match.start(3) + len(prefix) + 2 > len(html_content):
+                safe_end = match.start()
+                break
+            result_parts.append(_rewrite_absolute_path_match(html_content, match, last_end, prefix))
+            last_end = match.end(3)
+
+        emit_end = max(safe_end, last_end)
+        result_parts.append(html_content[last_end:emit_end])
+        self._unrewritten_text = html_content[emit_end:]
+        return "".join(result_parts)
+
+    def _inject_head(self, rewritten: str, is_final: bool) -> str:
+        if self._head_search_text is None:
+            return rewritten
+        html_content = self._head_search_text + rewritten
+        injection_point = _find_head_injection_point(html_content)
+        if injection_point is None:
+            is_head_still_possible = "<body" not in html_content and len(html_content) <= _MAX_HEAD_SEARCH_CHARS
+            if is_head_still_possible and not is_final:
+                self._head_search_text = html_content
+                return ""
+            injection_point = 0
+        self._head_search_text = None
+        injection = _build_head_injection(self.agent_id, self.server_name)
+        return html_content[:injection_point] + injection + html_content[injection_point:]
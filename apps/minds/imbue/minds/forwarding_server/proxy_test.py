@@ -1,5 +1,6 @@
 from inline_snapshot import snapshot
 
+from imbue.minds.forwarding_server.proxy import StreamingHtmlRewriter
 from imbue.minds.forwarding_server.proxy import generate_bootstrap_html
 from imbue.minds.forwarding_server.proxy import generate_service_worker_js
 from imbue.minds.forwarding_server.proxy import generate_websocket_shim_js
@@ -208,3 +209,71 @@ def test_rewrite_proxied_html_without_head_tag() -> None:
     )
     assert result.startswith(f'<base href="/agents/{_TEST_AGENT}/{_TEST_SERVER}/">')
     assert "<html><body>Hello</body></html>" in result
+
+
+# -- Streaming HTML rewriting --
+
+
+def _rewrite_in_chunks(html: str, chunk_size: int) -> str:
+    rewriter = StreamingHtmlRewriter(agent_id=_TEST_AGENT, server_name=_TEST_SERVER)
+    output_parts = [rewriter.feed(html[idx : idx + chunk_size]) for idx in range(0, len(html), chunk_size)]
+    output_parts.append(rewriter.finish())
+    return "".join(output_parts)
+
+
+_STREAMING_TEST_HTML: str = (
+    '<!DOCTYPE html><html><head lang="en"><title>Test</title>'
+    '<link rel="stylesheet" href="/static/app.css"></head><body>'
+    f'<a href="/agents/{_TEST_AGENT}/{_TEST_SERVER}/already">a</a>'
+    "<a href='//cdn.example.com/x.js'>b</a><img SRC = \"/img.png\">"
+    '<form action="/submit"><button formaction="/alt">go</button></form>'
+    f'<a href="/agents/{_TEST_AGENT}/{_TEST_SERVER}">exact</a><a href="relative">c</a></body></html>'
+)
+
+
+def test_streaming_html_rewriter_matches_rewrite_proxied_html_for_every_chunk_size() -> None:
+    expected = rewrite_proxied_html(html_content=_STREAMING_TEST_HTML, agent_id=_TEST_AGENT, server_name=_TEST_SERVER)
+    for chunk_size in range(1, len(_STREAMING_TEST_HTML) + 1):
+        assert _rewrite_in_chunks(_STREAMING_TEST_HTML, chunk_size) == expected, f"chunk_size={chunk_size}"
+
+
+def test_streaming_html_rewriter_emits_body_before_the_document_ends() -> None:
+    rewriter = StreamingHtmlRewriter(agent_id=_TEST_AGENT, server_name=_TEST_SERVER)
+    assert rewriter.feed("<html><he") == ""
+
+    first_output = rewriter.feed("ad><title>T</title></head><body><p>Hello</p>")
+
+    assert first_output.startswith(f'<html><head><base href="/agents/{_TEST_AGENT}/{_TEST_SERVER}/">')
+    assert first_output.endswith("<body><p>Hello</p>")
+    assert rewriter.feed("</body></html>") == "</body></html>"
+    assert rewriter.finish() == ""
+
+
+def test_streaming_html_rewriter_holds_back_only_an_unresolved_attribute() -> None:
+    rewriter = StreamingHtmlRewriter(agent_id=_TEST_AGENT, server_name=_TEST_SERVER)
+    rewriter.feed("<head></head>")
+    prefix = f"/agents/{_TEST_AGENT}/{_TEST_SERVER}"
+
+    assert rewriter.feed("<p>text</p><a href = ") == "<p>text</p><a "
+    # Held until enough of the value has arrived to tell whether it is already prefixed
+    assert rewriter.feed('"/x">') == ""
+    padding = "." * len(prefix)
+    assert rewriter.feed(padding) == f'href = "{prefix}/x">{padding}'
+
+
+def test_streaming_html_rewriter_injects_at_start_when_body_precedes_head() -> None:
+    rewriter = StreamingHtmlRewriter(agent_id=_TEST_AGENT, server_name=_TEST_SERVER)
+
+    output = rewriter.feed("<html><body>Hello")
+
+    assert output.startswith(f'<base href="/agents/{_TEST_AGENT}/{_TEST_SERVER}/">')
+    assert output.endswith("<html><body>Hello")
+    assert rewriter.finish() == ""
+
+
+def test_streaming_html_rewriter_injects_at_start_of_fragment_without_head_or_body() -> None:
+    result = _rewrite_in_chunks("<p>fragment</p>", chunk_size=4)
+
+    assert result == rewrite_proxied_html(
+        html_content="<p>fragment</p>", agent_id=_TEST_AGENT, server_name=_TEST_SERVER
+    )
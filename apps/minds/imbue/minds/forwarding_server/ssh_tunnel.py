@@ -1,9 +1,12 @@
 import os
-import select
+import queue
+import selectors
 import socket
 import tempfile
 import threading
+import time
 from pathlib import Path
+from typing import Callable
 from typing import Final
 from urllib.parse import urlparse
 
@@ -14,14 +17,30 @@ from pydantic import PrivateAttr
 
 from imbue.imbue_common.frozen_model import FrozenModel
 from imbue.imbue_common.mutable_model import MutableModel
+from imbue.imbue_common.pure import pure
 
-_BUFFER_SIZE: Final[int] = 65536
+# Reads start at this size and grow (doubling) while reads keep filling the buffer
+_MIN_READ_SIZE: Final[int] = 65536
 
-_SELECT_TIMEOUT_SECONDS: Final[float] = 1.0
+_MAX_READ_SIZE: Final[int] = 1024 * 1024
 
-_ACCEPT_TIMEOUT_SECONDS: Final[float] = 1.0
+# Stop reading from one side of a connection while this much data is still queued
+# for the other side, so a slow reader applies backpressure instead of growing memory
+_MAX_PENDING_BYTES: Final[int] = 4 * 1024 * 1024
 
-_SOCKET_POLL_SECONDS: Final[float] = 0.01
+_IDLE_SELECT_TIMEOUT_SECONDS: Final[float] = 1.0
+
+# paramiko channels only expose read readiness to select, so writes that could not
+# complete because the SSH window is full are retried on this interval
+_CHANNEL_WRITE_RETRY_SECONDS: Final[float] = 0.005
+
+# Opening a direct-tcpip channel is a blocking SSH round trip, so it happens on a
+# small fixed set of worker threads rather than on the relay loop
+_CHANNEL_OPEN_WORKER_COUNT: Final[int] = 4
+
+_LISTEN_BACKLOG: Final[int] = 64
+
+_THREAD_JOIN_TIMEOUT_SECONDS: Final[float] = 5.0
 
 
 class RemoteSSHInfo(FrozenModel):
@@ -39,6 +58,12 @@ class SSHTunnelError(Exception):
     ...
 
 
+# Errors from a bug or an unexpected selector state rather than from a connection going
+# away. The relay loop catches them per connection and per task, so that one of them
+# cannot stop the loop thread that every tunnel shares.
+_UNEXPECTED_RELAY_ERRORS: Final = (ValueError, KeyError, SSHTunnelError)
+
+
 def _ssh_connection_is_active(client: paramiko.SSHClient) -> bool:
     """Check whether the SSH client's transport is active."""
     transport = client.get_transport()
@@ -53,13 +78,537 @@ def _ssh_connection_transport(client: paramiko.SSHClient) -> paramiko.Transport:
     return transport
 
 
+class TunnelStats(FrozenModel):
+    """Snapshot of the traffic relayed through one SSH tunnel since it was opened."""
+
+    tunnel_key: str = Field(description="Identifies the tunnel as 'ssh_host:ssh_port->remote_host:remote_port'")
+    active_connection_count: int = Field(description="Connections currently being relayed")
+    total_connection_count: int = Field(description="Connections relayed since the tunnel was opened")
+    failed_connection_count: int = Field(description="Accepted connections whose SSH channel could not be opened")
+    bytes_to_remote: int = Field(description="Bytes forwarded from local clients to the remote endpoint")
+    bytes_from_remote: int = Field(description="Bytes forwarded from the remote endpoint to local clients")
+    elapsed_seconds: float = Field(description="Seconds since the tunnel was opened")
+    to_remote_bytes_per_second: float = Field(description="Average upload throughput over the tunnel's lifetime")
+    from_remote_bytes_per_second: float = Field(description="Average download throughput over the tunnel's lifetime")
+
+
+@pure
+def _next_read_size(current_read_size: int, bytes_read: int) -> int:
+    """Adapt a connection's read size to its traffic.
+
+    Doubles (up to _MAX_READ_SIZE) when a read filled the whole buffer, since
+    more data is likely waiting, and halves (down to _MIN_READ_SIZE) when a
+    read used less than a quarter of it.
+    """
+    if bytes_read >= current_read_size:
+        return min(current_read_size * 2, _MAX_READ_SIZE)
+    if bytes_read < current_read_size // 4:
+        return max(current_read_size // 2, _MIN_READ_SIZE)
+    return current_read_size
+
+
+class _TunnelListener:
+    """A tunnel's listening Unix socket, its SSH transport and its traffic counters.
+
+    Counters are only mutated on the relay loop thread.
+
+    Use the create() factory method to instantiate.
+    """
+
+    tunnel_key: str
+    socket_path: Path
+    server_socket: socket.socket
+    transport: paramiko.Transport
+    remote_host: str
+    remote_port: int
+    opened_at: float
+    active_connection_count: int
+    total_connection_count: int
+    failed_connection_count: int
+    bytes_to_remote: int
+    bytes_from_remote: int
+
+    @classmethod
+    def create(
+        cls,
+        tunnel_key: str,
+        socket_path: Path,
+        server_socket: socket.socket,
+        transport: paramiko.Transport,
+        remote_host: str,
+        remote_port: int,
+    ) -> "_TunnelListener":
+        instance = object.__new__(cls)
+        instance.tunnel_key = tunnel_key
+        instance.socket_path = socket_path
+        instance.server_socket = server_socket
+        instance.transport = transport
+        instance.remote_host = remote_host
+        instance.remote_port = remote_port
+        instance.opened_at = time.monotonic()
+        instance.active_connection_count = 0
+        instance.total_connection_count = 0
+        instance.failed_connection_count = 0
+        instance.bytes_to_remote = 0
+        instance.bytes_from_remote = 0
+        return instance
+
+    def get_stats(self) -> TunnelStats:
+        elapsed_seconds = max(time.monotonic() - self.opened_at, 1e-9)
+        return TunnelStats(
+            tunnel_key=self.tunnel_key,
+            active_connection_count=self.active_connection_count,
+            total_connection_count=self.total_connection_count,
+            failed_connection_count=self.failed_connection_count,
+            bytes_to_remote=self.bytes_to_remote,
+            bytes_from_remote=self.bytes_from_remote,
+            elapsed_seconds=elapsed_seconds,
+            to_remote_bytes_per_second=self.bytes_to_remote / elapsed_seconds,
+            from_remote_bytes_per_second=self.bytes_from_remote / elapsed_seconds,
+        )
+
+
+class _RelayConnection:
+    """State of one local client connection relayed over an SSH channel.
+
+    Only touched by the relay loop thread.
+
+    Use the create() factory method to instantiate.
+    """
+
+    listener: _TunnelListener
+    sock: socket.socket
+    channel: paramiko.Channel
+    to_channel: bytearray
+    to_sock: bytearray
+    sock_read_size: int
+    channel_read_size: int
+    is_closing: bool
+    sock_events: int
+    channel_events: int
+
+    @classmethod
+    def create(cls, listener: _TunnelListener, sock: socket.socket, channel: paramiko.Channel) -> "_RelayConnection":
+        instance = object.__new__(cls)
+        instance.listener = listener
+        instance.sock = sock
+        instance.channel = channel
+        instance.to_channel = bytearray()
+        instance.to_sock = bytearray()
+        instance.sock_read_size = _MIN_READ_SIZE
+        instance.channel_read_size = _MIN_READ_SIZE
+        instance.is_closing = False
+        instance.sock_events = 0
+        instance.channel_events = 0
+        return instance
+
+
+class SSHTunnelRelay(MutableModel):
+    """Relays every tunnel connection on a single selector loop thread.
+
+    Each tunnel is a listening Unix socket. Accepted connections are handed to a
+    small fixed pool of worker threads that open the SSH direct-tcpip channel
+    (a blocking round trip); the resulting (socket, channel) pairs are then
+    multiplexed on the loop thread, which moves data in both directions with
+    per-connection buffers that grow with the traffic.
+
+    Listeners and connections are only mutated on the loop thread; other threads
+    schedule work on it via _call_soon().
+    """
+
+    _selector: selectors.BaseSelector = PrivateAttr(default_factory=selectors.DefaultSelector)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _shutdown_event: threading.Event = PrivateAttr(default_factory=threading.Event)
+    _threads: list[threading.Thread] = PrivateAttr(default_factory=list)
+    _loop_thread: threading.Thread | None = PrivateAttr(default=None)
+    _wakeup_reader: socket.socket | None = PrivateAttr(default=None)
+    _wakeup_writer: socket.socket | None = PrivateAttr(default=None)
+    _loop_tasks: queue.Queue[Callable[[], None]] = PrivateAttr(default_factory=queue.Queue)
+    _accepted_sockets: queue.Queue[tuple[_TunnelListener, socket.socket] | None] = PrivateAttr(
+        default_factory=queue.Queue
+    )
+    _listener_by_tunnel_key: dict[str, _TunnelListener] = PrivateAttr(default_factory=dict)
+    _connections: set[_RelayConnection] = PrivateAttr(default_factory=set)
+    _connections_with_blocked_channel_writes: set[_RelayConnection] = PrivateAttr(default_factory=set)
+
+    def start(self) -> None:
+        """Start the relay loop and the channel-opening workers."""
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._wakeup_reader.setblocking(False)
+        self._wakeup_writer.setblocking(False)
+        self._selector.register(self._wakeup_reader, selectors.EVENT_READ, None)
+        self._loop_thread = threading.Thread(target=self._run_loop, daemon=True, name="ssh-tunnel-relay")
+        self._threads.append(self._loop_thread)
+        for worker_index in range(_CHANNEL_OPEN_WORKER_COUNT):
+            self._threads.append(
+                threading.Thread(target=self._open_channels, daemon=True, name=f"ssh-tunnel-opener-{worker_index}")
+            )
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Close all tunnels and connections and wait for the relay threads to exit."""
+        self._shutdown_event.set()
+        for _ in range(_CHANNEL_OPEN_WORKER_COUNT):
+            self._accepted_sockets.put(None)
+        self._wake()
+        for thread in self._threads:
+            thread.join(timeout=_THREAD_JOIN_TIMEOUT_SECONDS)
+        self._threads.clear()
+
+    def is_running(self) -> bool:
+        """Whether the relay loop thread is still running, so that its tunnels are still served."""
+        return self._loop_thread is not None and self._loop_thread.is_alive() and not self._shutdown_event.is_set()
+
+    def add_tunnel(
+        self,
+        tunnel_key: str,
+        socket_path: Path,
+        transport: paramiko.Transport,
+        remote_host: str,
+        remote_port: int,
+    ) -> None:
+        """Listen on socket_path and forward each connection to (remote_host, remote_port) via transport.
+
+        The socket is bound and listening by the time this returns.
+        """
+        if socket_path.exists():
+            socket_path.unlink()
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server_socket.bind(str(socket_path))
+            os.chmod(str(socket_path), 0o600)
+            server_socket.listen(_LISTEN_BACKLOG)
+            server_socket.setblocking(False)
+        except OSError as e:
+            server_socket.close()
+            raise SSHTunnelError(f"Failed to listen on tunnel socket {socket_path}: {e}") from e
+        listener = _TunnelListener.create(tunnel_key, socket_path, server_socket, transport, remote_host, remote_port)
+        with self._lock:
+            self._listener_by_tunnel_key[tunnel_key] = listener
+        self._call_soon(lambda: self._register_listener(listener))
+
+    def get_tunnel_socket_path(self, tunnel_key: str) -> Path | None:
+        """Return the socket path of an open tunnel that is still being served over an active SSH transport, or None."""
+        with self._lock:
+            listener = self._listener_by_tunnel_key.get(tunnel_key)
+        if listener is None or not listener.transport.is_active() or not self.is_running():
+            return None
+        return listener.socket_path
+
+    def remove_tunnel(self, tunnel_key: str) -> None:
+        """Stop listening for a tunnel. Connections already being relayed are left to finish."""
+        with self._lock:
+            listener = self._listener_by_tunnel_key.pop(tunnel_key, None)
+        if listener is not None:
+            # Unlink now so a replacement tunnel can bind the same path immediately
+            _unlink_socket_path(listener.socket_path)
+            self._call_soon(lambda: self._close_listener(listener))
+
+    def get_stats(self) -> list[TunnelStats]:
+        """Return a traffic snapshot for each open tunnel."""
+        with self._lock:
+            listeners = list(self._listener_by_tunnel_key.values())
+        return [listener.get_stats() for listener in listeners]
+
+    def _call_soon(self, task: Callable[[], None]) -> None:
+        """Schedule task to run on the relay loop thread."""
+        self._loop_tasks.put(task)
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup_writer is None:
+            return
+        try:
+            self._wakeup_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            # Either a wakeup is already pending or the relay has shut down
+            pass
+
+    def _run_loop(self) -> None:
+        try:
+            while not self._shutdown_event.is_set():
+                timeout = (
+                    _CHANNEL_WRITE_RETRY_SECONDS
+                    if self._connections_with_blocked_channel_writes
+                    else _IDLE_SELECT_TIMEOUT_SECONDS
+                )
+                for key, events in self._selector.select(timeout):
+                    self._dispatch(key, events)
+                self._run_loop_tasks()
+                for connection in list(self._connections_with_blocked_channel_writes):
+                    self._service_connection(connection, self._flush_to_channel)
+        finally:
+            if not self._shutdown_event.is_set():
+                logger.error("SSH tunnel relay loop stopped unexpectedly, closing all of its tunnels")
+            self._close_everything()
+
+    def _dispatch(self, key: selectors.SelectorKey, events: int) -> None:
+        data = key.data
+        if data is None:
+            self._drain_wakeups()
+        elif isinstance(data, _TunnelListener):
+            self._accept_connections(data)
+        elif isinstance(data, _RelayConnection):
+            if key.fileobj is data.sock:
+                self._service_connection(data, lambda c: self._handle_sock_events(c, events))
+            else:
+                self._service_connection(data, self._read_from_channel)
+        else:
+            logger.warning("Dropping unexpected SSH tunnel relay selector registration: {!r}", data)
+            self._selector.unregister(key.fileobj)
+
+    def _drain_wakeups(self) -> None:
+        assert self._wakeup_reader is not None
+        try:
+            self._wakeup_reader.recv(4096)
+        except BlockingIOError:
+            pass
+
+    def _run_loop_tasks(self) -> None:
+        for _ in range(self._loop_tasks.qsize()):
+            task = self._loop_tasks.get_nowait()
+            try:
+                task()
+            except (OSError, EOFError, paramiko.SSHException, *_UNEXPECTED_RELAY_ERRORS) as e:
+                logger.opt(exception=e).warning("SSH tunnel relay task failed: {}", e)
+
+    def _register_listener(self, listener: _TunnelListener) -> None:
+        try:
+            self._selector.register(listener.server_socket, selectors.EVENT_READ, listener)
+        except (OSError, *_UNEXPECTED_RELAY_ERRORS) as e:
+            logger.warning("Failed to listen for connections on tunnel {}, closing it: {}", listener.tunnel_key, e)
+            self._drop_listener(listener)
+
+    def _accept_connections(self, listener: _TunnelListener) -> None:
+        for _ in range(_LISTEN_BACKLOG):
+            try:
+                client_sock, _ = listener.server_socket.accept()
+            except BlockingIOError:
+                return
+            except OSError as e:
+                logger.warning("Accept error on tunnel {}, closing it: {}", listener.tunnel_key, e)
+                self._drop_listener(listener)
+                return
+            client_sock.setblocking(False)
+            self._accepted_sockets.put((listener, client_sock))
+
+    def _open_channels(self) -> None:
+        """Worker: open an SSH channel for each accepted socket and hand the pair to the loop."""
+        for accepted in iter(self._accepted_sockets.get, None):
+            listener, client_sock = accepted
+            try:
+                channel = listener.transport.open_channel(
+                    "direct-tcpip",
+                    (listener.remote_host, listener.remote_port),
+                    ("127.0.0.1", 0),
+                )
+            except (paramiko.SSHException, OSError) as e:
+                logger.warning(
+                    "Failed to open SSH channel to {}:{}: {}", listener.remote_host, listener.remote_port, e
+                )
+                self._hand_off_rejection(listener, client_sock)
+            else:
+                self._hand_off_connection(_RelayConnection.create(listener, client_sock, channel))
+
+    def _hand_off_connection(self, connection: _RelayConnection) -> None:
+        self._call_soon(lambda: self._start_connection(connection))
+
+    def _hand_off_rejection(self, listener: _TunnelListener, client_sock: socket.socket) -> None:
+        self._call_soon(lambda: self._reject_connection(listener, client_sock))
+
+    def _reject_connection(self, listener: _TunnelListener, client_sock: socket.socket) -> None:
+        listener.failed_connection_count += 1
+        _close_quietly(client_sock)
+
+    def _start_connection(self, connection: _RelayConnection) -> None:
+        if self._shutdown_event.is_set():
+            _close_quietly(connection.channel)
+            _close_quietly(connection.sock)
+            return
+        connection.listener.active_connection_count += 1
+        connection.listener.total_connection_count += 1
+        self._connections.add(connection)
+        # Nothing to transfer yet: this only registers the connection with the selector
+        self._service_connection(connection, lambda _: None)
+
+    def _service_connection(self, connection: _RelayConnection, operation: Callable[[_RelayConnection], None]) -> None:
+        """Run an I/O operation on a connection, then close it or update what the loop waits for.
+
+        Any error closes just this connection; the loop carries on relaying the others.
+        """
+        if connection not in self._connections:
+            return
+        try:
+            operation(connection)
+            if connection.is_closing and not connection.to_channel and not connection.to_sock:
+                self._close_connection(connection)
+            else:
+                self._update_registrations(connection)
+        except (OSError, EOFError, paramiko.SSHException) as e:
+            logger.trace("SSH tunnel relay ended for {}: {}", connection.listener.tunnel_key, e)
+            self._close_connection(connection)
+        except _UNEXPECTED_RELAY_ERRORS as e:
+            logger.opt(exception=e).warning(
+                "Unexpected error relaying a connection on tunnel {}, closing it: {}",
+                connection.listener.tunnel_key,
+                e,
+            )
+            self._close_connection(connection)
+
+    def _handle_sock_events(self, connection: _RelayConnection, events: int) -> None:
+        if events & selectors.EVENT_WRITE:
+            self._flush_to_sock(connection)
+        if events & selectors.EVENT_READ:
+            self._read_from_sock(connection)
+
+    def _read_from_sock(self, connection: _RelayConnection) -> None:
+        try:
+            data = connection.sock.recv(connection.sock_read_size)
+        except BlockingIOError:
+            return
+        if not data:
+            connection.is_closing = True
+            return
+        connection.sock_read_size = _next_read_size(connection.sock_read_size, len(data))
+        connection.to_channel += data
+        self._flush_to_channel(connection)
+
+    def _read_from_channel(self, connection: _RelayConnection) -> None:
+        data = connection.channel.recv(connection.channel_read_size)
+        if not data:
+            connection.is_closing = True
+            return
+        connection.channel_read_size = _next_read_size(connection.channel_read_size, len(data))
+        connection.to_sock += data
+        self._flush_to_sock(connection)
+
+    def _flush_to_channel(self, connection: _RelayConnection) -> None:
+        while connection.to_channel and connection.channel.send_ready():
+            sent = connection.channel.send(bytes(connection.to_channel[:_MAX_READ_SIZE]))
+            if sent == 0:
+                raise EOFError("SSH channel closed")
+            del connection.to_channel[:sent]
+            connection.listener.bytes_to_remote += sent
+        if connection.to_channel:
+            self._connections_with_blocked_channel_writes.add(connection)
+        else:
+            self._connections_with_blocked_channel_writes.discard(connection)
+
+    def _flush_to_sock(self, connection: _RelayConnection) -> None:
+        while connection.to_sock:
+            try:
+                sent = connection.sock.send(connection.to_sock)
+            except BlockingIOError:
+                return
+            del connection.to_sock[:sent]
+            connection.listener.bytes_from_remote += sent
+
+    def _update_registrations(self, connection: _RelayConnection) -> None:
+        """Wait for reads only while the other side's queue has room, and for socket writes while data is queued."""
+        sock_events = 0
+        channel_events = 0
+        if not connection.is_closing and len(connection.to_channel) < _MAX_PENDING_BYTES:
+            sock_events |= selectors.EVENT_READ
+        if connection.to_sock:
+            sock_events |= selectors.EVENT_WRITE
+        if not connection.is_closing and len(connection.to_sock) < _MAX_PENDING_BYTES:
+            channel_events |= selectors.EVENT_READ
+        connection.sock_events = self._set_interest(connection.sock, connection.sock_events, sock_events, connection)
+        connection.channel_events = self._set_interest(
+            connection.channel, connection.channel_events, channel_events, connection
+        )
+
+    def _set_interest(
+        self,
+        fileobj: socket.socket | paramiko.Channel,
+        current_events: int,
+        new_events: int,
+        connection: _RelayConnection,
+    ) -> int:
+        if new_events == current_events:
+            pass
+        elif current_events == 0:
+            self._selector.register(fileobj, new_events, connection)
+        elif new_events == 0:
+            self._selector.unregister(fileobj)
+        else:
+            self._selector.modify(fileobj, new_events, connection)
+        return new_events
+
+    def _close_connection(self, connection: _RelayConnection) -> None:
+        if connection not in self._connections:
+            return
+        self._connections.discard(connection)
+        self._connections_with_blocked_channel_writes.discard(connection)
+        connection.listener.active_connection_count -= 1
+        for fileobj, events in (
+            (connection.sock, connection.sock_events),
+            (connection.channel, connection.channel_events),
+        ):
+            if events:
+                self._unregister_quietly(fileobj)
+        connection.sock_events = 0
+        connection.channel_events = 0
+        _close_quietly(connection.channel)
+        _close_quietly(connection.sock)
+
+    def _unregister_quietly(self, fileobj: socket.socket | paramiko.Channel) -> None:
+        try:
+            self._selector.unregister(fileobj)
+        except (KeyError, ValueError) as e:
+            logger.trace("Error unregistering SSH tunnel endpoint: {}", e)
+
+    def _drop_listener(self, listener: _TunnelListener) -> None:
+        """Stop serving a tunnel whose listening socket failed, unless it was already replaced."""
+        with self._lock:
+            if self._listener_by_tunnel_key.get(listener.tunnel_key) is listener:
+                del self._listener_by_tunnel_key[listener.tunnel_key]
+                _unlink_socket_path(listener.socket_path)
+        self._close_listener(listener)
+
+    def _close_listener(self, listener: _TunnelListener) -> None:
+        if listener.server_socket.fileno() != -1 and listener.server_socket in self._selector.get_map():
+            self._selector.unregister(listener.server_socket)
+        _close_quietly(listener.server_socket)
+
+    def _close_everything(self) -> None:
+        for connection in list(self._connections):
+            self._close_connection(connection)
+        with self._lock:
+            listeners = list(self._listener_by_tunnel_key.values())
+            self._listener_by_tunnel_key.clear()
+        for listener in listeners:
+            _unlink_socket_path(listener.socket_path)
+            _close_quietly(listener.server_socket)
+        self._selector.close()
+        for wakeup_socket in (self._wakeup_reader, self._wakeup_writer):
+            if wakeup_socket is not None:
+                _close_quietly(wakeup_socket)
+
+
+def _close_quietly(closeable: socket.socket | paramiko.Channel) -> None:
+    try:
+        closeable.close()
+    except (OSError, paramiko.SSHException) as e:
+        logger.trace("Error closing SSH tunnel endpoint: {}", e)
+
+
+def _unlink_socket_path(socket_path: Path) -> None:
+    try:
+        socket_path.unlink()
+    except OSError as e:
+        logger.trace("Error unlinking tunnel socket: {}", e)
+
+
 class SSHTunnelManager(MutableModel):
     """Manages SSH tunnels to remote agent backends via paramiko.
 
     For each unique SSH host, maintains a paramiko SSHClient connection.
     For each unique (SSH host, remote endpoint) pair, creates a Unix domain
     socket in a secure temporary directory that forwards connections through
-    SSH direct-tcpip channels.
+    SSH direct-tcpip channels. All tunnels share one SSHTunnelRelay, so many
+    concurrent browser requests and websockets do not each pin a thread.
 
     The Unix sockets are created in a temporary directory with 0o700 permissions.
     Other users cannot access the sockets, and same-user processes would need
@@ -69,9 +618,7 @@ class SSHTunnelManager(MutableModel):
     _tmpdir: tempfile.TemporaryDirectory[str] | None = PrivateAttr(default=None)
     _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     _connections: dict[str, paramiko.SSHClient] = PrivateAttr(default_factory=dict)
-    _tunnel_socket_paths: dict[str, Path] = PrivateAttr(default_factory=dict)
-    _tunnel_threads: dict[str, threading.Thread] = PrivateAttr(default_factory=dict)
-    _shutdown_event: threading.Event = PrivateAttr(default_factory=threading.Event)
+    _relay: SSHTunnelRelay | None = PrivateAttr(default=None)
 
     def _get_tmpdir(self) -> Path:
         """Get or create the secure temporary directory for Unix sockets."""
@@ -80,6 +627,17 @@ class SSHTunnelManager(MutableModel):
             os.chmod(self._tmpdir.name, 0o700)
         return Path(self._tmpdir.name)
 
+    def _get_relay(self) -> SSHTunnelRelay:
+        """Get the relay, starting it on first use and replacing it if its loop thread has died."""
+        if self._relay is not None and not self._relay.is_running():
+            logger.warning("SSH tunnel relay is no longer running, starting a new one")
+            self._relay.stop()
+            self._relay = None
+        if self._relay is None:
+            self._relay = SSHTunnelRelay()
+            self._relay.start()
+        return self._relay
+
     def _get_or_create_connection(self, ssh_info: RemoteSSHInfo) -> paramiko.SSHClient:
         """Get or create an SSH connection to the given host.
 
@@ -112,43 +670,46 @@ class SSHTunnelManager(MutableModel):
 
         Returns the path to a Unix domain socket. Connecting to this socket
         will forward traffic through an SSH tunnel to (remote_host, remote_port)
-        on the remote host identified by ssh_info.
+        on the remote host identified by ssh_info. A tunnel whose SSH connection
+        has dropped is replaced by one on a fresh connection.
         """
         tunnel_key = f"{ssh_info.host}:{ssh_info.port}->{remote_host}:{remote_port}"
 
         with self._lock:
-            existing_path = self._tunnel_socket_paths.get(tunnel_key)
-            existing_thread = self._tunnel_threads.get(tunnel_key)
-            if existing_path is not None and existing_thread is not None and existing_thread.is_alive():
+            relay = self._get_relay()
+            existing_path = relay.get_tunnel_socket_path(tunnel_key)
+            if existing_path is not None:
                 return existing_path
+            relay.remove_tunnel(tunnel_key)
 
             client = self._get_or_create_connection(ssh_info)
             transport = _ssh_connection_transport(client)
             socket_path = self._get_tmpdir() / f"tunnel-{tunnel_key.replace(':', '-').replace('>', '')}.sock"
-
-            if socket_path.exists():
-                socket_path.unlink()
-
-            thread = threading.Thread(
-                target=_tunnel_accept_loop,
-                args=(socket_path, transport, remote_host, remote_port, self._shutdown_event),
-                daemon=True,
-                name=f"ssh-tunnel-{tunnel_key}",
-            )
-            thread.start()
-
-            _wait_for_socket(socket_path)
-
-            self._tunnel_socket_paths[tunnel_key] = socket_path
-            self._tunnel_threads[tunnel_key] = thread
+            relay.add_tunnel(tunnel_key, socket_path, transport, remote_host, remote_port)
             return socket_path
 
+    def get_tunnel_stats(self) -> list[TunnelStats]:
+        """Return per-tunnel connection counts and throughput for all open tunnels."""
+        with self._lock:
+            relay = self._relay
+        return relay.get_stats() if relay is not None else []
+
     def cleanup(self) -> None:
         """Shut down all tunnels and SSH connections."""
-        self._shutdown_event.set()
-
-        for thread in self._tunnel_threads.values():
-            thread.join(timeout=5.0)
+        with self._lock:
+            relay = self._relay
+            self._relay = None
+        if relay is not None:
+            for stats in relay.get_stats():
+                logger.debug(
+                    "SSH tunnel {}: {} connections ({} failed), {} bytes up, {} bytes down",
+                    stats.tunnel_key,
+                    stats.total_connection_count,
+                    stats.failed_connection_count,
+                    stats.bytes_to_remote,
+                    stats.bytes_from_remote,
+                )
+            relay.stop()
 
         for client in self._connections.values():
             try:
@@ -157,8 +718,6 @@ class SSHTunnelManager(MutableModel):
                 logger.trace("Error closing SSH connection during cleanup: {}", e)
 
         self._connections.clear()
-        self._tunnel_socket_paths.clear()
-        self._tunnel_threads.clear()
 
         if self._tmpdir is not None:
             try:
@@ -196,125 +755,6 @@ def _create_ssh_client(ssh_info: RemoteSSHInfo) -> paramiko.SSHClient:
     return client
 
 
-def _wait_for_socket(socket_path: Path, timeout: float = 2.0) -> None:
-    """Wait for a Unix domain socket file to appear.
-
-    Raises SSHTunnelError if the socket does not appear within the timeout.
-    Uses threading.Event.wait for polling instead of time.sleep.
-    """
-    poll_event = threading.Event()
-    deadline = threading.Event()
-    timer = threading.Timer(timeout, deadline.set)
-    timer.start()
-    try:
-        while not deadline.is_set():
-            if socket_path.exists():
-                return
-            poll_event.wait(timeout=_SOCKET_POLL_SECONDS)
-    finally:
-        timer.cancel()
-    raise SSHTunnelError(f"SSH tunnel socket did not appear within {timeout}s at {socket_path}")
-
-
-def _tunnel_accept_loop(
-    sock_path: Path,
-    transport: paramiko.Transport,
-    remote_host: str,
-    remote_port: int,
-    shutdown_event: threading.Event,
-) -> None:
-    """Accept connections on a Unix domain socket and forward them via SSH.
-
-    For each accepted connection, opens a paramiko direct-tcpip channel to
-    (remote_host, remote_port) on the remote SSH host, then relays data
-    bidirectionally between the local socket and the SSH channel.
-    """
-    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    try:
-        server.bind(str(sock_path))
-        os.chmod(str(sock_path), 0o600)
-        server.listen(8)
-        server.settimeout(_ACCEPT_TIMEOUT_SECONDS)
-
-        while not shutdown_event.is_set():
-            try:
-                client_sock, _ = server.accept()
-            except socket.timeout:
-                continue
-            except OSError as e:
-                logger.warning("Accept loop socket error, stopping tunnel: {}", e)
-                break
-
-            try:
-                channel = transport.open_channel(
-                    "direct-tcpip",
-                    (remote_host, remote_port),
-                    ("127.0.0.1", 0),
-                )
-            except (paramiko.SSHException, OSError) as e:
-                logger.warning("Failed to open SSH channel to {}:{}: {}", remote_host, remote_port, e)
-                client_sock.close()
-                continue
-
-            threading.Thread(
-                target=_relay_data,
-                args=(client_sock, channel),
-                daemon=True,
-                name=f"ssh-relay-{remote_host}:{remote_port}",
-            ).start()
-    finally:
-        server.close()
-        try:
-            os.unlink(str(sock_path))
-        except OSError as e:
-            logger.trace("Error unlinking tunnel socket: {}", e)
-
-
-def _relay_step(sock: socket.socket, channel: paramiko.Channel) -> bool:
-    """Perform one relay step: transfer available data between sock and channel.
-
-    Returns True to continue relaying, False when either end has closed.
-    """
-    r, _, _ = select.select([sock, channel], [], [], _SELECT_TIMEOUT_SECONDS)
-
-    if sock in r:
-        data = sock.recv(_BUFFER_SIZE)
-        if not data:
-            return False
-        channel.sendall(data)
-
-    if channel in r:
-        if channel.recv_ready():
-            data = channel.recv(_BUFFER_SIZE)
-            if not data:
-                return False
-            sock.sendall(data)
-
-    return True
-
-
-def _relay_data(sock: socket.socket, channel: paramiko.Channel) -> None:
-    """Relay data bidirectionally between a local socket and a paramiko channel.
-
-    Uses select() to multiplex reads from both ends. Terminates when either
-    end closes or an error occurs.
-    """
-    try:
-        while _relay_step(sock, channel):
-            pass
-    except (OSError, EOFError, paramiko.SSHException) as e:
-        logger.trace("SSH tunnel relay ended: {}", e)
-    finally:
-        try:
-            channel.close()
-        except (OSError, paramiko.SSHException) as e:
-            logger.trace("Error closing SSH channel in relay: {}", e)
-        try:
-            sock.close()
-        except OSError as e:
-            logger.trace("Error closing socket in relay: {}", e)
-
-
 def parse_url_host_port(url: str) -> tuple[str, int]:
     """Extract host and port from a URL.
 
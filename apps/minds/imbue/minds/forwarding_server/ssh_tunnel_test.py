@@ -1,6 +1,5 @@
 import socket
 import threading
-import time
 from pathlib import Path
 
 import paramiko
@@ -10,39 +9,40 @@ from pydantic import ValidationError
 from imbue.minds.forwarding_server.ssh_tunnel import RemoteSSHInfo
 from imbue.minds.forwarding_server.ssh_tunnel import SSHTunnelError
 from imbue.minds.forwarding_server.ssh_tunnel import SSHTunnelManager
-from imbue.minds.forwarding_server.ssh_tunnel import _relay_data
+from imbue.minds.forwarding_server.ssh_tunnel import SSHTunnelRelay
+from imbue.minds.forwarding_server.ssh_tunnel import TunnelStats
+from imbue.minds.forwarding_server.ssh_tunnel import _MAX_READ_SIZE
+from imbue.minds.forwarding_server.ssh_tunnel import _MIN_READ_SIZE
+from imbue.minds.forwarding_server.ssh_tunnel import _next_read_size
 from imbue.minds.forwarding_server.ssh_tunnel import _ssh_connection_is_active
 from imbue.minds.forwarding_server.ssh_tunnel import _ssh_connection_transport
-from imbue.minds.forwarding_server.ssh_tunnel import _tunnel_accept_loop
-from imbue.minds.forwarding_server.ssh_tunnel import _wait_for_socket
 from imbue.minds.forwarding_server.ssh_tunnel import parse_url_host_port
+from imbue.mngr.utils.polling import wait_for
 
 
-def _connect_with_retry(sock_path: Path, timeout: float = 10.0) -> socket.socket:
-    """Connect to a Unix domain socket, retrying until the server is listening.
+def _connect(sock_path: Path) -> socket.socket:
+    """Connect to a tunnel's Unix domain socket (it is listening as soon as add_tunnel returns)."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(str(sock_path))
+    client.settimeout(3.0)
+    return client
 
-    _wait_for_socket only checks file existence, but the server may not be
-    listening yet (race between bind and listen). This retries connect until
-    it succeeds, then returns the connected socket.
-    """
-    _wait_for_socket(sock_path, timeout=timeout)
-    poll = threading.Event()
-    deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        try:
-            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            client.connect(str(sock_path))
-            return client
-        except (ConnectionRefusedError, OSError):
-            client.close()
-            poll.wait(timeout=0.05)
-    raise SSHTunnelError(f"Socket {sock_path} exists but not accepting connections after {timeout}s")
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    received = bytearray()
+    while len(received) < size:
+        chunk = sock.recv(size - len(received))
+        assert chunk, "connection closed early"
+        received += chunk
+    return bytes(received)
 
 
-class FakeChannelFromSocket:
+class FakeChannelFromSocket(paramiko.Channel):
     """Stub that wraps a real socket to provide a paramiko-Channel-like interface.
 
     Used in tests to simulate paramiko channels without requiring a real SSH connection.
+    Subclasses paramiko.Channel (without running its __init__) only so it type-checks
+    where a Channel is expected.
     """
 
     _sock: socket.socket
@@ -54,14 +54,14 @@ class FakeChannelFromSocket:
         object.__setattr__(instance, "_sock", sock)
         return instance
 
-    def sendall(self, data: bytes) -> None:
-        self._sock.sendall(data)
+    def send_ready(self) -> bool:
+        return True
 
-    def recv(self, size: int) -> bytes:
-        return self._sock.recv(size)
+    def send(self, s: bytes) -> int:
+        return self._sock.send(s)
 
-    def recv_ready(self) -> bool:
-        return True
+    def recv(self, nbytes: int) -> bytes:
+        return self._sock.recv(nbytes)
 
     def fileno(self) -> int:
         return self._sock.fileno()
@@ -70,12 +70,18 @@ class FakeChannelFromSocket:
         self._sock.close()
 
 
-class FakeParamikoTransport:
-    """Stub for paramiko.Transport that tracks open_channel calls."""
+class FakeParamikoTransport(paramiko.Transport):
+    """Stub for paramiko.Transport that tracks open_channel calls (never initialized as a real Transport).
+
+    Hands out the configured channel, or a fresh socket-backed channel per call
+    (collecting the backend ends in backend_sockets) when make_channels is set.
+    """
 
-    channel_to_return: object | None
+    channel_to_return: paramiko.Channel | None
     channel_error: paramiko.SSHException | None
-    open_channel_calls: list[tuple[str, tuple[str, int], tuple[str, int]]]
+    make_channels: bool
+    backend_sockets: list[socket.socket]
+    open_channel_calls: list[tuple[str, tuple[str, int] | None, tuple[str, int] | None]]
 
     @classmethod
     def create(cls) -> "FakeParamikoTransport":
@@ -83,6 +89,8 @@ class FakeParamikoTransport:
         instance = cls.__new__(cls)
         object.__setattr__(instance, "channel_to_return", None)
         object.__setattr__(instance, "channel_error", None)
+        object.__setattr__(instance, "make_channels", False)
+        object.__setattr__(instance, "backend_sockets", [])
         object.__setattr__(instance, "open_channel_calls", [])
         return instance
 
@@ -92,12 +100,20 @@ class FakeParamikoTransport:
     def open_channel(
         self,
         kind: str,
-        dest_addr: tuple[str, int],
-        src_addr: tuple[str, int],
-    ) -> object:
+        dest_addr: tuple[str, int] | None = None,
+        src_addr: tuple[str, int] | None = None,
+        window_size: int | None = None,
+        max_packet_size: int | None = None,
+        timeout: float | None = None,
+    ) -> paramiko.Channel:
         self.open_channel_calls.append((kind, dest_addr, src_addr))
         if self.channel_error is not None:
             raise self.channel_error
+        if self.make_channels:
+            backend_sock, channel_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+            backend_sock.settimeout(3.0)
+            self.backend_sockets.append(backend_sock)
+            return FakeChannelFromSocket.create(channel_sock)
         if self.channel_to_return is None:
             raise paramiko.SSHException("No channel configured")
         return self.channel_to_return
@@ -189,20 +205,6 @@ def test_tunnel_manager_get_tmpdir_returns_same_path() -> None:
         manager.cleanup()
 
 
-def test_wait_for_socket_returns_immediately_when_exists(tmp_path: Path) -> None:
-    """_wait_for_socket returns when the socket file already exists."""
-    sock_path = tmp_path / "test.sock"
-    sock_path.touch()
-    _wait_for_socket(sock_path, timeout=5.0)
-
-
-def test_wait_for_socket_raises_on_timeout(tmp_path: Path) -> None:
-    """_wait_for_socket raises SSHTunnelError when the socket does not appear."""
-    sock_path = tmp_path / "nonexistent.sock"
-    with pytest.raises(SSHTunnelError):
-        _wait_for_socket(sock_path, timeout=0.05)
-
-
 # -- SSH connection helper tests --
 
 
@@ -219,115 +221,235 @@ def test_ssh_connection_transport_raises_when_none() -> None:
         _ssh_connection_transport(client)
 
 
-# -- _relay_data tests --
+# -- _next_read_size tests --
 
 
-def test_relay_data_forwards_between_socket_pair() -> None:
-    """Data sent on one end of a socketpair reaches the other via relay."""
-    app_sock, relay_sock_a = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
-    channel_sock, relay_sock_b = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+def test_next_read_size_grows_when_reads_fill_the_buffer() -> None:
+    assert _next_read_size(_MIN_READ_SIZE, _MIN_READ_SIZE) == _MIN_READ_SIZE * 2
+    assert _next_read_size(_MAX_READ_SIZE, _MAX_READ_SIZE) == _MAX_READ_SIZE
 
-    fake_channel = FakeChannelFromSocket.create(relay_sock_b)
-    relay_thread = threading.Thread(target=_relay_data, args=(relay_sock_a, fake_channel), daemon=True)
-    relay_thread.start()
 
-    app_sock.settimeout(3.0)
-    channel_sock.settimeout(3.0)
+def test_next_read_size_shrinks_when_reads_are_small() -> None:
+    assert _next_read_size(_MIN_READ_SIZE * 4, 100) == _MIN_READ_SIZE * 2
+    assert _next_read_size(_MIN_READ_SIZE, 100) == _MIN_READ_SIZE
 
-    app_sock.sendall(b"hello from client")
-    channel_sock.sendall(b"hello from backend")
-    data = app_sock.recv(4096)
-    assert data == b"hello from backend"
 
-    app_sock.close()
-    channel_sock.close()
-    relay_thread.join(timeout=5.0)
+def test_next_read_size_is_stable_for_moderate_reads() -> None:
+    assert _next_read_size(_MIN_READ_SIZE * 2, _MIN_READ_SIZE) == _MIN_READ_SIZE * 2
 
 
-# -- _tunnel_accept_loop tests --
+# -- SSHTunnelRelay tests --
 
 
-def test_tunnel_accept_loop_forwards_connections(short_tmp_path: Path) -> None:
-    """The accept loop creates Unix sockets and forwards data through a mock transport."""
-    sock_path = short_tmp_path / "test.sock"
-    shutdown_event = threading.Event()
+def _get_only_stats(relay: SSHTunnelRelay) -> TunnelStats:
+    (stats,) = relay.get_stats()
+    return stats
 
-    channel_remote, channel_local = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
 
+def test_relay_forwards_data_in_both_directions(short_tmp_path: Path) -> None:
+    sock_path = short_tmp_path / "test.sock"
     fake_transport = FakeParamikoTransport.create()
-    fake_channel = FakeChannelFromSocket.create(channel_local)
-    fake_transport.channel_to_return = fake_channel
+    fake_transport.make_channels = True
+    relay = SSHTunnelRelay()
+    relay.start()
+    try:
+        relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, fake_transport, "127.0.0.1", 9100)
+        client = _connect(sock_path)
 
-    accept_thread = threading.Thread(
-        target=_tunnel_accept_loop,
-        args=(sock_path, fake_transport, "127.0.0.1", 9100, shutdown_event),
-        daemon=True,
-    )
-    accept_thread.start()
+        client.sendall(b"test request")
+        wait_for(lambda: len(fake_transport.backend_sockets) == 1, error_message="channel was not opened")
+        backend = fake_transport.backend_sockets[0]
+        assert _recv_exactly(backend, 12) == b"test request"
+
+        backend.sendall(b"test response")
+        assert _recv_exactly(client, 13) == b"test response"
+        assert fake_transport.open_channel_calls == [("direct-tcpip", ("127.0.0.1", 9100), ("127.0.0.1", 0))]
+
+        client.close()
+        backend.close()
+    finally:
+        relay.stop()
 
-    client = _connect_with_retry(sock_path, timeout=10.0)
-    client.settimeout(3.0)
-    channel_remote.settimeout(3.0)
 
-    client.sendall(b"test request")
-    data = channel_remote.recv(4096)
-    assert data == b"test request"
+def test_relay_multiplexes_many_connections_and_reports_stats(short_tmp_path: Path) -> None:
+    sock_path = short_tmp_path / "many.sock"
+    fake_transport = FakeParamikoTransport.create()
+    fake_transport.make_channels = True
+    relay = SSHTunnelRelay()
+    relay.start()
+    connection_count = 20
+    payload = b"x" * (3 * _MIN_READ_SIZE)
+    try:
+        relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, fake_transport, "127.0.0.1", 9100)
+        threads_before = threading.active_count()
+        clients = [_connect(sock_path) for _ in range(connection_count)]
+        for client in clients:
+            client.sendall(b"ping")
+        wait_for(
+            lambda: len(fake_transport.backend_sockets) == connection_count,
+            error_message="not all channels were opened",
+        )
+        for backend in fake_transport.backend_sockets:
+            assert _recv_exactly(backend, 4) == b"ping"
+            backend.sendall(payload)
+        for client in clients:
+            assert _recv_exactly(client, len(payload)) == payload
+
+        # No thread is spawned per connection
+        assert threading.active_count() == threads_before
+        # Counters are updated on the loop thread just after each send, so wait for them to settle
+        wait_for(lambda: _get_only_stats(relay).bytes_from_remote == len(payload) * connection_count)
+        stats = _get_only_stats(relay)
+        assert stats.active_connection_count == connection_count
+        assert stats.total_connection_count == connection_count
+        assert stats.bytes_to_remote == 4 * connection_count
+        assert stats.bytes_from_remote == len(payload) * connection_count
+        assert stats.from_remote_bytes_per_second > 0
+
+        for client in clients:
+            client.close()
+        wait_for(lambda: _get_only_stats(relay).active_connection_count == 0)
+    finally:
+        relay.stop()
+
+
+def test_relay_closes_client_when_backend_closes(short_tmp_path: Path) -> None:
+    sock_path = short_tmp_path / "eof.sock"
+    fake_transport = FakeParamikoTransport.create()
+    fake_transport.make_channels = True
+    relay = SSHTunnelRelay()
+    relay.start()
+    try:
+        relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, fake_transport, "127.0.0.1", 9100)
+        client = _connect(sock_path)
+        wait_for(lambda: len(fake_transport.backend_sockets) == 1, error_message="channel was not opened")
+        backend = fake_transport.backend_sockets[0]
 
-    channel_remote.sendall(b"test response")
-    response = client.recv(4096)
-    assert response == b"test response"
+        backend.sendall(b"last words")
+        backend.close()
 
-    client.close()
-    channel_remote.close()
-    shutdown_event.set()
-    accept_thread.join(timeout=5.0)
+        assert _recv_exactly(client, 10) == b"last words"
+        assert client.recv(4096) == b""
+        client.close()
+    finally:
+        relay.stop()
 
 
-def test_tunnel_accept_loop_handles_channel_open_failure(short_tmp_path: Path) -> None:
+def test_relay_counts_and_closes_connections_whose_channel_cannot_be_opened(short_tmp_path: Path) -> None:
     """When open_channel fails, the accepted client socket is closed gracefully."""
     sock_path = short_tmp_path / "fail.sock"
-    shutdown_event = threading.Event()
-
     fake_transport = FakeParamikoTransport.create()
     fake_transport.channel_error = paramiko.SSHException("Channel denied")
+    relay = SSHTunnelRelay()
+    relay.start()
+    try:
+        relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, fake_transport, "127.0.0.1", 9100)
+        client = _connect(sock_path)
 
-    accept_thread = threading.Thread(
-        target=_tunnel_accept_loop,
-        args=(sock_path, fake_transport, "127.0.0.1", 9100, shutdown_event),
-        daemon=True,
-    )
-    accept_thread.start()
+        assert client.recv(4096) == b""
+        client.close()
+        wait_for(lambda: _get_only_stats(relay).failed_connection_count == 1)
+        assert _get_only_stats(relay).active_connection_count == 0
+    finally:
+        relay.stop()
 
-    client = _connect_with_retry(sock_path, timeout=10.0)
-    client.settimeout(3.0)
 
+def test_relay_remove_tunnel_stops_listening(short_tmp_path: Path) -> None:
+    sock_path = short_tmp_path / "remove.sock"
+    relay = SSHTunnelRelay()
+    relay.start()
     try:
-        data = client.recv(4096)
-        assert data == b""
-    except socket.timeout:
-        pass
+        relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, FakeParamikoTransport.create(), "127.0.0.1", 9100)
+        assert relay.get_tunnel_socket_path("host:22->127.0.0.1:9100") == sock_path
 
-    client.close()
-    shutdown_event.set()
-    accept_thread.join(timeout=3.0)
+        relay.remove_tunnel("host:22->127.0.0.1:9100")
+
+        assert relay.get_tunnel_socket_path("host:22->127.0.0.1:9100") is None
+        assert relay.get_stats() == []
+        assert not sock_path.exists()
+    finally:
+        relay.stop()
 
 
-def test_tunnel_accept_loop_shutdown_event_stops_loop(short_tmp_path: Path) -> None:
-    """Setting the shutdown event causes the accept loop to exit."""
+def test_relay_stop_removes_tunnel_sockets(short_tmp_path: Path) -> None:
     sock_path = short_tmp_path / "shutdown.sock"
-    shutdown_event = threading.Event()
+    relay = SSHTunnelRelay()
+    relay.start()
+    relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, FakeParamikoTransport.create(), "127.0.0.1", 9100)
+    assert sock_path.exists()
+
+    relay.stop()
+
+    assert not sock_path.exists()
+    assert relay.get_stats() == []
+
+
+class _UnexpectedlyFailingChannel(FakeChannelFromSocket):
+    """Channel whose reads fail with an error the relay does not expect from a connection going away."""
+
+    def recv(self, nbytes: int) -> bytes:
+        raise ValueError("unexpected channel state")
 
+
+def test_relay_closes_only_the_connection_that_fails_unexpectedly(short_tmp_path: Path) -> None:
+    sock_path = short_tmp_path / "unexpected.sock"
+    backend_sock, channel_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
     fake_transport = FakeParamikoTransport.create()
+    fake_transport.channel_to_return = _UnexpectedlyFailingChannel.create(channel_sock)
+    relay = SSHTunnelRelay()
+    relay.start()
+    try:
+        relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, fake_transport, "127.0.0.1", 9100)
+        failing_client = _connect(sock_path)
+        wait_for(lambda: _get_only_stats(relay).total_connection_count == 1, error_message="channel was not opened")
+
+        # The channel becomes readable, so the relay tries to read from it and fails
+        backend_sock.sendall(b"data")
+        assert failing_client.recv(4096) == b""
+        failing_client.close()
+        backend_sock.close()
+
+        fake_transport.make_channels = True
+        client = _connect(sock_path)
+        client.sendall(b"still relaying")
+        wait_for(lambda: len(fake_transport.backend_sockets) == 1, error_message="channel was not opened")
+        assert _recv_exactly(fake_transport.backend_sockets[0], 14) == b"still relaying"
+        assert relay.is_running()
+        client.close()
+    finally:
+        relay.stop()
+
+
+def test_relay_keeps_running_when_a_loop_task_fails(short_tmp_path: Path) -> None:
+    sock_path = short_tmp_path / "task.sock"
+    relay = SSHTunnelRelay()
+    relay.start()
+    try:
+        relay._call_soon(lambda: {}["missing"])
+        relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, FakeParamikoTransport.create(), "127.0.0.1", 9100)
+
+        assert relay.get_tunnel_socket_path("host:22->127.0.0.1:9100") == sock_path
+        assert relay.is_running()
+    finally:
+        relay.stop()
 
-    accept_thread = threading.Thread(
-        target=_tunnel_accept_loop,
-        args=(sock_path, fake_transport, "127.0.0.1", 9100, shutdown_event),
-        daemon=True,
-    )
-    accept_thread.start()
 
-    _wait_for_socket(sock_path, timeout=10.0)
+# The loop thread is killed on purpose, so its unhandled exception is expected
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_tunnel_manager_replaces_a_relay_whose_loop_thread_died(short_tmp_path: Path) -> None:
+    sock_path = short_tmp_path / "dead.sock"
+    manager = SSHTunnelManager()
+    try:
+        relay = manager._get_relay()
+        relay.add_tunnel("host:22->127.0.0.1:9100", sock_path, FakeParamikoTransport.create(), "127.0.0.1", 9100)
 
-    shutdown_event.set()
-    accept_thread.join(timeout=3.0)
-    assert not accept_thread.is_alive()
+        # An error the loop does not catch kills the loop thread
+        relay._call_soon(lambda: [].pop())
+        wait_for(lambda: not relay.is_running(), error_message="relay loop did not stop")
+
+        assert relay.get_tunnel_socket_path("host:22->127.0.0.1:9100") is None
+        new_relay = manager._get_relay()
+        assert new_relay is not relay
+        assert new_relay.is_running()
+    finally:
+        manager.cleanup()
@@ -1,16 +1,23 @@
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
+import anyio
 import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi import Request as FastAPIRequest
 from fastapi.responses import HTMLResponse
 from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
 from starlette.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
 from imbue.minds.config.data_types import MindPaths
 from imbue.minds.forwarding_server.agent_creator import AgentCreator
+from imbue.minds.forwarding_server.app import _build_proxy_response
 from imbue.minds.forwarding_server.app import create_forwarding_server
 from imbue.minds.forwarding_server.auth import FileAuthStore
 from imbue.minds.forwarding_server.backend_resolver import BackendResolverInterface
@@ -53,6 +60,23 @@ def _create_multi_backend_http_client(
     return httpx.AsyncClient(transport=_RoutingTransport())
 
 
+_DOWNLOAD_CHUNK: bytes = bytes(range(256)) * 256
+_DOWNLOAD_CHUNK_COUNT: int = 64
+
+
+def _iter_download_chunks() -> Iterator[bytes]:
+    for _ in range(_DOWNLOAD_CHUNK_COUNT):
+        yield _DOWNLOAD_CHUNK
+
+
+def _iter_html_chunks() -> Iterator[str]:
+    yield "<html><he"
+    yield "ad><title>Streamed</title></head><body>"
+    for idx in range(200):
+        yield f'<a href="/item/{idx}">{idx}</a>'
+    yield "</body></html>"
+
+
 def _create_test_backend() -> FastAPI:
     """Create a simple backend app for proxy testing."""
     backend = FastAPI()
@@ -65,6 +89,14 @@ def _create_test_backend() -> FastAPI:
     def backend_status() -> JSONResponse:
         return JSONResponse({"status": "ok"})
 
+    @backend.get("/download")
+    def backend_download() -> StreamingResponse:
+        return StreamingResponse(_iter_download_chunks(), media_type="application/octet-stream")
+
+    @backend.get("/streamed.html")
+    def backend_streamed_html() -> StreamingResponse:
+        return StreamingResponse(_iter_html_chunks(), media_type="text/html")
+
     @backend.post("/api/echo")
     async def backend_echo(request: FastAPIRequest) -> JSONResponse:
         body = await request.body()
@@ -393,6 +425,87 @@ def test_agent_proxy_injects_websocket_shim_into_html_responses(tmp_path: Path)
     assert "Hello from backend" in response.text
 
 
+def test_agent_proxy_streams_large_binary_responses_unchanged(tmp_path: Path) -> None:
+    client, auth_store, agent_id = _setup_test_server(tmp_path)
+    _authenticate_client(client=client, auth_store=auth_store)
+
+    client.cookies.set(f"sw_installed_{agent_id}_{DEFAULT_SERVER_NAME}", "1")
+
+    response = client.get(f"/agents/{agent_id}/{DEFAULT_SERVER_NAME}/download")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.content == _DOWNLOAD_CHUNK * _DOWNLOAD_CHUNK_COUNT
+
+
+def test_agent_proxy_rewrites_html_streamed_in_chunks(tmp_path: Path) -> None:
+    client, auth_store, agent_id = _setup_test_server(tmp_path)
+    _authenticate_client(client=client, auth_store=auth_store)
+
+    client.cookies.set(f"sw_installed_{agent_id}_{DEFAULT_SERVER_NAME}", "1")
+
+    response = client.get(f"/agents/{agent_id}/{DEFAULT_SERVER_NAME}/streamed.html")
+    assert response.status_code == 200
+    prefix = f"/agents/{agent_id}/{DEFAULT_SERVER_NAME}"
+    assert response.text.startswith(f'<html><head><base href="{prefix}/">')
+    assert response.text.count(f'href="{prefix}/item/') == 200
+    assert response.text.endswith("</body></html>")
+
+
+async def _disconnected_send(message: object) -> None:
+    raise OSError("client disconnected")
+
+
+async def _receive_nothing() -> dict[str, object]:
+    return {"type": "http.disconnect"}
+
+
+def test_proxy_response_closes_backend_response_when_client_disconnects_before_streaming() -> None:
+    backend_response = httpx.Response(200, headers={"content-type": "text/plain"}, stream=httpx.ByteStream(b"body"))
+    response = _build_proxy_response(
+        backend_response=backend_response, agent_id=AgentId(), server_name=DEFAULT_SERVER_NAME
+    )
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+
+    with pytest.raises(ClientDisconnect):
+        anyio.run(response, scope, _receive_nothing, _disconnected_send)
+
+    assert backend_response.is_closed
+
+
+class _DroppingByteStream(httpx.AsyncByteStream):
+    """Backend body that breaks off after its first chunk."""
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b"partial"
+        raise httpx.ReadError("backend connection dropped")
+
+
+class _RecordingSend:
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        self.messages.append(message)
+
+
+def test_proxy_response_fails_when_the_backend_drops_mid_stream() -> None:
+    backend_response = httpx.Response(200, headers={"content-type": "text/plain"}, stream=_DroppingByteStream())
+    response = _build_proxy_response(
+        backend_response=backend_response, agent_id=AgentId(), server_name=DEFAULT_SERVER_NAME
+    )
+    send = _RecordingSend()
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+
+    with pytest.raises(httpx.ReadError):
+        anyio.run(response, scope, _receive_nothing, send)
+
+    # The body is never ended, so the client sees a failed transfer instead of a truncated body
+    body_messages = [message for message in send.messages if message["type"] == "http.response.body"]
+    assert [message["body"] for message in body_messages] == [b"partial"]
+    assert all(message.get("more_body") for message in body_messages)
+    assert backend_response.is_closed
+
+
 def _setup_test_server_without_backend(
     tmp_path: Path,
 ) -> tuple[TestClient, FileAuthStore, AgentId]:
@@ -73,6 +73,14 @@ class ExporterSettings(FrozenModel):
         default=600,
         description="How long to cache channel/user/identity data before re-fetching (seconds)",
     )
+    max_concurrent_channels: int = Field(
+        default=4,
+        description="Number of channels whose messages and replies are fetched concurrently",
+    )
+    max_concurrent_reply_fetches: int = Field(
+        default=8,
+        description="Number of thread reply fetches that run concurrently, shared across all channels",
+    )
 
 
 class ChannelEvent(EventEnvelope):
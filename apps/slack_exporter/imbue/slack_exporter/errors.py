@@ -17,9 +17,11 @@ class LatchkeyInvocationError(SlackExporterError, RuntimeError):
 class SlackApiError(SlackExporterError, RuntimeError):
     """Raised when the Slack API returns an error response."""
 
-    def __init__(self, method: str, error: str) -> None:
+    def __init__(self, method: str, error: str, retry_after_seconds: float | None = None) -> None:
         self.method = method
         self.error = error
+        # Seconds Slack asked us to wait (its Retry-After header), if it said so
+        self.retry_after_seconds = retry_after_seconds
         super().__init__(f"Slack API error in {method}: {error}")
 
 
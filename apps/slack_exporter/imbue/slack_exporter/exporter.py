@@ -1,6 +1,7 @@
 import logging
 from collections.abc import Callable
 from collections.abc import Sequence
+from concurrent.futures import Future
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
@@ -8,9 +9,13 @@ from typing import Any
 from typing import Final
 from typing import TypeVar
 
+from pydantic import Field
+
 from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
 from imbue.imbue_common.event_envelope import EventSource
 from imbue.imbue_common.event_envelope import EventType
+from imbue.imbue_common.frozen_model import FrozenModel
 from imbue.imbue_common.model_update import to_update
 from imbue.slack_exporter.channels import fetch_channel_info
 from imbue.slack_exporter.channels import fetch_channel_list
@@ -296,22 +301,24 @@ def _deferred_reaction_pass(
 
     logger.info("Checking reactions on %d most recent relevant threads", len(threads_to_check))
 
+    with ConcurrencyGroup(name="slack-reaction-check") as cg:
+        with ConcurrencyGroupExecutor(
+            parent_cg=cg, name="slack-reaction-reply-fetch", max_workers=settings.max_concurrent_reply_fetches
+        ) as executor:
+            reply_futures = [
+                executor.submit(
+                    _fetch_all_replies_for_thread,
+                    channel_id=rt.channel_id,
+                    channel_name=rt.channel_name,
+                    thread_ts=rt.thread_ts,
+                    api_caller=api_caller,
+                )
+                for rt in threads_to_check
+            ]
+
     all_reactions: dict[str, ReactionEvent] = {}
-    for thread_idx, rt in enumerate(threads_to_check):
-        logger.info(
-            "  Checking reactions %d/%d: thread %s in %s",
-            thread_idx + 1,
-            len(threads_to_check),
-            rt.thread_ts,
-            rt.channel_name,
-        )
-        replies = _fetch_all_replies_for_thread(
-            channel_id=rt.channel_id,
-            channel_name=rt.channel_name,
-            thread_ts=rt.thread_ts,
-            api_caller=api_caller,
-        )
-        for reaction in _extract_reactions_from_replies(replies):
+    for reply_future in reply_futures:
+        for reaction in _extract_reactions_from_replies(reply_future.result()):
             all_reactions[f"{reaction.channel_id}:{reaction.message_ts}"] = reaction
 
     if all_reactions:
@@ -476,27 +483,56 @@ def run_export(settings: ExporterSettings, api_caller: SlackApiCaller) -> None:
             name="channel-info",
         )
 
-        # Export messages and replies in the main thread
-        total_export_channels = len(channels_to_export)
-        for channel_idx, channel_config in enumerate(channels_to_export):
-            logger.info("Exporting channel %d/%d: %s", channel_idx + 1, total_export_channels, channel_config.name)
-            channel_id = resolve_channel_id(channel_config.name, fresh_channels, channel_id_by_name)
-            new_relevant = _export_single_channel(
-                channel_config=channel_config,
-                channel_id=channel_id,
-                state_by_channel_id=state_by_channel_id,
-                known_message_keys=known_message_keys,
-                known_reply_keys=known_reply_keys,
-                known_relevant_reply_keys=known_relevant_reply_keys,
-                latest_reply_by_thread=latest_reply_by_thread,
-                channel_export_metadata=channel_export_metadata,
-                existing_reactions=existing_reactions,
-                existing_relevant_threads=existing_relevant_threads,
-                user_id=self_identity.user_id,
-                settings=settings,
-                api_caller=api_caller,
-            )
-            all_new_relevant_threads.extend(new_relevant)
+        channel_ids = [
+            resolve_channel_id(channel_config.name, fresh_channels, channel_id_by_name)
+            for channel_config in channels_to_export
+        ]
+
+        # Messages and replies of several channels are fetched concurrently, but each channel's
+        # results are saved by the main thread in channel order, so every stream is written in
+        # the same order as a serial export would write it.
+        with ConcurrencyGroupExecutor(
+            parent_cg=cg, name="slack-reply-fetch", max_workers=settings.max_concurrent_reply_fetches
+        ) as reply_executor:
+            with ConcurrencyGroupExecutor(
+                parent_cg=cg, name="slack-channel-fetch", max_workers=settings.max_concurrent_channels
+            ) as channel_executor:
+                fetch_futures = [
+                    channel_executor.submit(
+                        _fetch_channel_export,
+                        channel_config=channel_config,
+                        channel_id=channel_id,
+                        state_by_channel_id=state_by_channel_id,
+                        channel_export_metadata=channel_export_metadata,
+                        latest_reply_by_thread=latest_reply_by_thread,
+                        settings=settings,
+                        api_caller=api_caller,
+                        reply_executor=reply_executor,
+                    )
+                    for channel_config, channel_id in zip(channels_to_export, channel_ids, strict=True)
+                ]
+
+                total_export_channels = len(channels_to_export)
+                for channel_idx, (channel_config, channel_id, fetch_future) in enumerate(
+                    zip(channels_to_export, channel_ids, fetch_futures, strict=True)
+                ):
+                    logger.info(
+                        "Exporting channel %d/%d: %s", channel_idx + 1, total_export_channels, channel_config.name
+                    )
+                    new_relevant = _save_channel_export(
+                        channel_config=channel_config,
+                        channel_id=channel_id,
+                        fetch_result=fetch_future.result(),
+                        known_message_keys=known_message_keys,
+                        known_reply_keys=known_reply_keys,
+                        known_relevant_reply_keys=known_relevant_reply_keys,
+                        latest_reply_by_thread=latest_reply_by_thread,
+                        existing_reactions=existing_reactions,
+                        existing_relevant_threads=existing_relevant_threads,
+                        user_id=self_identity.user_id,
+                        settings=settings,
+                    )
+                    all_new_relevant_threads.extend(new_relevant)
 
     # Deferred reaction pass: check reactions on the most recent relevant threads
     _deferred_reaction_pass(
@@ -509,26 +545,30 @@ def run_export(settings: ExporterSettings, api_caller: SlackApiCaller) -> None:
     )
 
 
-def _export_single_channel(
+class ChannelFetchResult(FrozenModel):
+    """Everything fetched from Slack for one channel, before any of it is saved."""
+
+    messages: tuple[MessageEvent, ...] = Field(description="Messages from the forward fetch and any backfill")
+    requested_oldest_ts: SlackMessageTimestamp = Field(description="Oldest timestamp requested for the channel")
+    replies_by_thread_ts: dict[SlackMessageTimestamp, tuple[ReplyEvent, ...]] = Field(
+        description="All replies of each thread whose replies changed, in the order the threads were listed",
+    )
+    skipped_thread_count: int = Field(description="Number of threads skipped because their replies did not change")
+
+
+def _fetch_channel_export(
     channel_config: ChannelConfig,
     channel_id: SlackChannelId,
     state_by_channel_id: dict[SlackChannelId, ChannelExportState],
-    known_message_keys: set[tuple[SlackChannelId, SlackMessageTimestamp]],
-    known_reply_keys: set[tuple[SlackChannelId, SlackMessageTimestamp, SlackMessageTimestamp]],
-    known_relevant_reply_keys: set[tuple[SlackChannelId, SlackMessageTimestamp, SlackMessageTimestamp]],
-    latest_reply_by_thread: dict[tuple[SlackChannelId, SlackMessageTimestamp], SlackMessageTimestamp],
     channel_export_metadata: dict[SlackChannelId, SlackMessageTimestamp],
-    existing_reactions: dict[str, ReactionEvent],
-    existing_relevant_threads: dict[str, RelevantThreadEvent],
-    user_id: SlackUserId,
+    latest_reply_by_thread: dict[tuple[SlackChannelId, SlackMessageTimestamp], SlackMessageTimestamp],
     settings: ExporterSettings,
     api_caller: SlackApiCaller,
-) -> list[RelevantThreadEvent]:
-    """Export messages, replies, relevant threads, and relevant thread replies.
+    reply_executor: ConcurrencyGroupExecutor,
+) -> ChannelFetchResult:
+    """Fetch new and backfilled messages of a channel, and the replies of its changed threads.
 
-    Also extracts reactions from fetched messages (free since data is already loaded).
-    Reply reactions are handled in a deferred pass at the end of the export.
-    Returns newly detected relevant threads.
+    Only reads the shared export state, so several channels can be fetched at once.
     """
     existing_state = state_by_channel_id.get(channel_id)
 
@@ -571,7 +611,44 @@ def _export_single_channel(
         )
         all_fetched = all_fetched + backfill_messages
 
-    save_channel_searched_oldest(settings.output_dir, channel_id, requested_oldest_ts)
+    thread_replies, skipped_thread_count = _fetch_replies_for_channel(
+        channel_id=channel_id,
+        channel_name=channel_config.name,
+        all_message_events=all_fetched,
+        latest_reply_by_thread=latest_reply_by_thread,
+        api_caller=api_caller,
+        reply_executor=reply_executor,
+    )
+
+    return ChannelFetchResult(
+        messages=tuple(all_fetched),
+        requested_oldest_ts=requested_oldest_ts,
+        replies_by_thread_ts={thread_ts: tuple(replies) for thread_ts, replies in thread_replies.items()},
+        skipped_thread_count=skipped_thread_count,
+    )
+
+
+def _save_channel_export(
+    channel_config: ChannelConfig,
+    channel_id: SlackChannelId,
+    fetch_result: ChannelFetchResult,
+    known_message_keys: set[tuple[SlackChannelId, SlackMessageTimestamp]],
+    known_reply_keys: set[tuple[SlackChannelId, SlackMessageTimestamp, SlackMessageTimestamp]],
+    known_relevant_reply_keys: set[tuple[SlackChannelId, SlackMessageTimestamp, SlackMessageTimestamp]],
+    latest_reply_by_thread: dict[tuple[SlackChannelId, SlackMessageTimestamp], SlackMessageTimestamp],
+    existing_reactions: dict[str, ReactionEvent],
+    existing_relevant_threads: dict[str, RelevantThreadEvent],
+    user_id: SlackUserId,
+    settings: ExporterSettings,
+) -> list[RelevantThreadEvent]:
+    """Save messages, replies, relevant threads, and relevant thread replies of a fetched channel.
+
+    Also extracts reactions from fetched messages (free since data is already loaded).
+    Reply reactions are handled in a deferred pass at the end of the export.
+    Returns newly detected relevant threads.
+    """
+    all_fetched = list(fetch_result.messages)
+    save_channel_searched_oldest(settings.output_dir, channel_id, fetch_result.requested_oldest_ts)
 
     new_messages = [m for m in all_fetched if (m.channel_id, m.message_ts) not in known_message_keys]
     if new_messages:
@@ -594,16 +671,17 @@ def _export_single_channel(
             entity_name="reactions",
         )
 
-    # Export replies and detect relevant threads (reply reactions deferred to end of export)
-    relevant_threads, thread_replies = _export_replies_for_channel(
+    # Save replies and detect relevant threads (reply reactions deferred to end of export)
+    thread_replies = {thread_ts: list(replies) for thread_ts, replies in fetch_result.replies_by_thread_ts.items()}
+    relevant_threads = _save_replies_for_channel(
         channel_id=channel_id,
         channel_name=channel_config.name,
-        all_message_events=all_fetched,
+        thread_replies=thread_replies,
+        skipped_thread_count=fetch_result.skipped_thread_count,
         known_reply_keys=known_reply_keys,
         latest_reply_by_thread=latest_reply_by_thread,
         user_id=user_id,
         settings=settings,
-        api_caller=api_caller,
     )
 
     # Save relevant threads
@@ -645,57 +723,68 @@ def _export_single_channel(
     return relevant_threads
 
 
-def _export_replies_for_channel(
+def _fetch_replies_for_channel(
     channel_id: SlackChannelId,
     channel_name: SlackChannelName,
     all_message_events: list[MessageEvent],
-    known_reply_keys: set[tuple[SlackChannelId, SlackMessageTimestamp, SlackMessageTimestamp]],
     latest_reply_by_thread: dict[tuple[SlackChannelId, SlackMessageTimestamp], SlackMessageTimestamp],
-    user_id: SlackUserId,
-    settings: ExporterSettings,
     api_caller: SlackApiCaller,
-) -> tuple[list[RelevantThreadEvent], dict[SlackMessageTimestamp, list[ReplyEvent]]]:
-    """Fetch replies for threaded messages in a channel and detect relevant threads.
+    reply_executor: ConcurrencyGroupExecutor,
+) -> tuple[dict[SlackMessageTimestamp, list[ReplyEvent]], int]:
+    """Fetch replies for the threaded messages of a channel on the shared reply executor.
 
     Uses the latest_reply field from the Slack API to skip threads whose replies
     have not changed since the last export.
 
-    Returns (relevant_threads, thread_replies) where thread_replies maps thread_ts
+    Returns (thread_replies, skipped_thread_count) where thread_replies maps thread_ts
     to all fetched replies for threads that were checked this run.
     """
     thread_parents = [m for m in all_message_events if m.raw.get("reply_count", 0) > 0]
     if not thread_parents:
-        return [], {}
+        return {}, 0
 
-    total_thread_parents = len(thread_parents)
-    logger.info("  Found %d threads to check for replies", total_thread_parents)
-    total_new_replies = 0
-    skipped_threads = 0
-    thread_replies: dict[SlackMessageTimestamp, list[ReplyEvent]] = {}
+    logger.info("  Found %d threads to check for replies in channel %s", len(thread_parents), channel_name)
+    skipped_thread_count = 0
+    reply_future_by_thread_ts: dict[SlackMessageTimestamp, Future[list[ReplyEvent]]] = {}
 
-    for thread_idx, parent in enumerate(thread_parents):
-        if total_thread_parents > 1:
-            logger.info("    Checking thread %d/%d", thread_idx + 1, total_thread_parents)
+    for parent in thread_parents:
         thread_ts = parent.message_ts
-        thread_key = (channel_id, thread_ts)
 
         # Skip threads whose latest_reply hasn't changed since last export
         api_latest_reply = parent.raw.get("latest_reply")
         if api_latest_reply:
-            stored_latest = latest_reply_by_thread.get(thread_key)
+            stored_latest = latest_reply_by_thread.get((channel_id, thread_ts))
             if stored_latest is not None and stored_latest >= SlackMessageTimestamp(api_latest_reply):
-                skipped_threads += 1
+                skipped_thread_count += 1
                 continue
 
-        replies = _fetch_all_replies_for_thread(
+        reply_future_by_thread_ts[thread_ts] = reply_executor.submit(
+            _fetch_all_replies_for_thread,
             channel_id=channel_id,
             channel_name=channel_name,
             thread_ts=thread_ts,
             api_caller=api_caller,
         )
 
-        thread_replies[thread_ts] = replies
+    # Collected in thread order, so the replies are saved in the same order whatever order they arrive in
+    thread_replies = {thread_ts: future.result() for thread_ts, future in reply_future_by_thread_ts.items()}
+    return thread_replies, skipped_thread_count
 
+
+def _save_replies_for_channel(
+    channel_id: SlackChannelId,
+    channel_name: SlackChannelName,
+    thread_replies: dict[SlackMessageTimestamp, list[ReplyEvent]],
+    skipped_thread_count: int,
+    known_reply_keys: set[tuple[SlackChannelId, SlackMessageTimestamp, SlackMessageTimestamp]],
+    latest_reply_by_thread: dict[tuple[SlackChannelId, SlackMessageTimestamp], SlackMessageTimestamp],
+    user_id: SlackUserId,
+    settings: ExporterSettings,
+) -> list[RelevantThreadEvent]:
+    """Save the new replies of a channel's fetched threads and detect relevant threads."""
+    total_new_replies = 0
+    for thread_ts, replies in thread_replies.items():
+        thread_key = (channel_id, thread_ts)
         new_replies = [
             r
             for r in replies
@@ -711,14 +800,13 @@ def _export_replies_for_channel(
                 if thread_key not in latest_reply_by_thread or reply.reply_ts > latest_reply_by_thread[thread_key]:
                     latest_reply_by_thread[thread_key] = reply.reply_ts
 
-    if skipped_threads > 0:
-        logger.info("  Skipped %d threads with unchanged replies", skipped_threads)
+    if skipped_thread_count > 0:
+        logger.info("  Skipped %d threads with unchanged replies", skipped_thread_count)
     if total_new_replies > 0:
         logger.info("  Saved %d new replies from channel %s", total_new_replies, channel_name)
 
     # Detect relevant threads from fetched replies
-    relevant_threads = _detect_relevant_threads(thread_replies, user_id, channel_id, channel_name)
-    return relevant_threads, thread_replies
+    return _detect_relevant_threads(thread_replies, user_id, channel_id, channel_name)
 
 
 def _fetch_all_replies_for_thread(
@@ -1,4 +1,5 @@
 import json
+import threading
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
@@ -388,9 +389,11 @@ def _tracking_api_caller(
     same response every time a method is called, making it safe for multi-run tests.
     """
     call_counts: dict[str, int] = {}
+    lock = threading.Lock()
 
     def caller(method: str, query_params: dict[str, str] | None = None) -> dict[str, Any]:
-        call_counts[method] = call_counts.get(method, 0) + 1
+        with lock:
+            call_counts[method] = call_counts.get(method, 0) + 1
         if method == "auth.test":
             return _DEFAULT_AUTH_RESPONSE
         elif method == "conversations.list":
@@ -950,3 +953,65 @@ def test_run_export_all_channels_when_channels_is_none(temp_output_dir: Path) ->
     assert counts.get("conversations.history", 0) == 2
     # conversations.info called for both channels (no --channels filter)
     assert counts.get("conversations.info", 0) == 2
+
+
+def test_run_export_saves_concurrently_fetched_channels_in_channel_order(temp_output_dir: Path) -> None:
+    """Channels are fetched concurrently, but their messages and replies are saved in channel order."""
+    settings = ExporterSettings(
+        channels=None,
+        default_oldest=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        output_dir=temp_output_dir,
+        max_recent_threads_for_reactions=0,
+        cache_ttl_seconds=0,
+        max_concurrent_channels=3,
+    )
+    channels = [
+        {"id": "C001", "name": "first", "is_member": True},
+        {"id": "C002", "name": "second", "is_member": True},
+        {"id": "C003", "name": "third", "is_member": True},
+    ]
+    last_channel_fetched = threading.Event()
+
+    def caller(method: str, query_params: dict[str, str] | None = None) -> dict[str, Any]:
+        params = query_params or {}
+        if method == "auth.test":
+            return _DEFAULT_AUTH_RESPONSE
+        elif method == "conversations.list":
+            return make_slack_response("channels", channels)
+        elif method == "users.list":
+            return make_slack_response("members", [])
+        elif method == "conversations.history":
+            channel_id = params["channel"]
+            # The first channel only finishes fetching after the last one, so saving in completion
+            # order would write it last
+            if channel_id == "C001":
+                assert last_channel_fetched.wait(timeout=5.0)
+            elif channel_id == "C003":
+                last_channel_fetched.set()
+            else:
+                pass
+            return make_slack_response(
+                "messages",
+                [
+                    {
+                        "ts": "1700000000.000001",
+                        "text": channel_id,
+                        "reply_count": 1,
+                        "latest_reply": "1700000000.000002",
+                    }
+                ],
+            )
+        elif method == "conversations.replies":
+            return make_slack_response(
+                "messages",
+                [{"ts": "1700000000.000002", "thread_ts": "1700000000.000001", "text": params["channel"]}],
+            )
+        else:
+            return {"ok": True}
+
+    run_export(settings, api_caller=caller)
+
+    message_lines = (temp_output_dir / "message" / "created" / "events.jsonl").read_text().strip().splitlines()
+    assert [json.loads(line)["channel_id"] for line in message_lines] == ["C001", "C002", "C003"]
+    reply_lines = (temp_output_dir / "reply" / "created" / "events.jsonl").read_text().strip().splitlines()
+    assert [json.loads(line)["channel_id"] for line in reply_lines] == ["C001", "C002", "C003"]
@@ -33,12 +33,19 @@ def retry_on_transient_error(
     sleep_fn: Callable[[float], None],
     method: str,
     query_params: dict[str, str] | None,
+    is_rate_limit_wait_done_by_api_caller: bool = False,
 ) -> dict[str, Any]:
     """Call an API method with exponential backoff retry on transient errors.
 
     Retries on Slack rate limit errors and transient network errors (SSL resets,
     connection failures, etc.). Retries up to _RATE_LIMIT_MAX_RETRIES times
     (~3 minutes total). Non-transient errors are raised immediately.
+
+    Rate limited calls wait for as long as Slack's Retry-After header asks, falling
+    back to the exponential backoff when it is missing. Set
+    is_rate_limit_wait_done_by_api_caller when the api_caller already waits out
+    rate limits before each attempt (e.g. through a SlackRateLimiter), so that
+    rate limited calls are retried without waiting a second time here.
     """
     backoff = _RATE_LIMIT_INITIAL_BACKOFF_SECONDS
     for attempt in range(_RATE_LIMIT_MAX_RETRIES + 1):
@@ -47,25 +54,35 @@ def retry_on_transient_error(
         except SlackApiError as e:
             if e.error != "ratelimited" or attempt == _RATE_LIMIT_MAX_RETRIES:
                 raise
+            if is_rate_limit_wait_done_by_api_caller:
+                logger.debug(
+                    "Rate limited by Slack API (%s), retrying (attempt %d/%d)",
+                    method,
+                    attempt + 1,
+                    _RATE_LIMIT_MAX_RETRIES,
+                )
+                continue
+            wait_seconds = e.retry_after_seconds if e.retry_after_seconds is not None else backoff
             logger.warning(
                 "Rate limited by Slack API (%s), retrying in %.0fs (attempt %d/%d)",
                 method,
-                backoff,
+                wait_seconds,
                 attempt + 1,
                 _RATE_LIMIT_MAX_RETRIES,
             )
         except LatchkeyInvocationError as e:
             if not _is_transient_latchkey_error(e) or attempt == _RATE_LIMIT_MAX_RETRIES:
                 raise
+            wait_seconds = backoff
             logger.warning(
                 "Transient network error calling %s (exit %d), retrying in %.0fs (attempt %d/%d)",
                 method,
                 e.return_code,
-                backoff,
+                wait_seconds,
                 attempt + 1,
                 _RATE_LIMIT_MAX_RETRIES,
             )
-        sleep_fn(backoff)
+        sleep_fn(wait_seconds)
         backoff = min(backoff * 2, _RATE_LIMIT_MAX_BACKOFF_SECONDS)
     raise AssertionError("unreachable")
 
@@ -80,10 +97,10 @@ def call_slack_api(
     Raises LatchkeyInvocationError if the subprocess fails with a non-transient error,
     or SlackApiError if the Slack API returns a non-rate-limit error.
     """
-    return retry_on_transient_error(_call_slack_api_once, time.sleep, method, query_params)
+    return retry_on_transient_error(call_slack_api_once, time.sleep, method, query_params)
 
 
-def _call_slack_api_once(
+def call_slack_api_once(
     method: str,
     query_params: dict[str, str] | None = None,
 ) -> dict[str, Any]:
@@ -92,7 +109,9 @@ def _call_slack_api_once(
     if query_params:
         url = f"{url}?{urlencode(query_params)}"
 
-    command = ["latchkey", "curl", url]
+    # --include puts the response headers before the body, so that a rate limited
+    # response's Retry-After header can be honoured
+    command = ["latchkey", "curl", "--include", url]
     logger.debug("Running: %s", " ".join(command))
 
     start_time = time.monotonic()
@@ -137,8 +156,9 @@ def parse_latchkey_response(
 ) -> dict[str, Any]:
     """Parse and validate the output from a latchkey curl invocation.
 
-    Raises LatchkeyInvocationError on non-zero exit or invalid JSON.
-    Raises SlackApiError if the Slack API returned ok=false.
+    The output may start with the response headers (curl --include). Raises
+    LatchkeyInvocationError on non-zero exit or invalid JSON. Raises
+    SlackApiError if the Slack API returned ok=false.
     """
     if return_code != 0:
         raise LatchkeyInvocationError(
@@ -147,21 +167,56 @@ def parse_latchkey_response(
             stderr=stderr,
         )
 
+    headers, body = _split_response_headers(stdout)
     try:
-        data: dict[str, Any] = json.loads(stdout)
+        data: dict[str, Any] = json.loads(body)
     except json.JSONDecodeError as e:
         raise LatchkeyInvocationError(
             command=command_str,
             return_code=0,
-            stderr=f"Invalid JSON response: {stdout[:200]}",
+            stderr=f"Invalid JSON response: {body[:200]}",
         ) from e
 
     if not data.get("ok"):
-        raise SlackApiError(method=method, error=data.get("error", "unknown"))
+        raise SlackApiError(
+            method=method,
+            error=data.get("error", "unknown"),
+            retry_after_seconds=_parse_retry_after(headers.get("retry-after")),
+        )
 
     return data
 
 
+def _split_response_headers(stdout: str) -> tuple[dict[str, str], str]:
+    """Split curl --include output into the final response's headers (lowercased names) and its body.
+
+    curl prints a header block for every response it receives (e.g. a proxy's
+    "Connection established"), so only the last block describes the body.
+    Output without headers is returned unchanged as the body. Expects LF line
+    endings, which subprocess text mode turns curl's CRLF line endings into.
+    """
+    headers: dict[str, str] = {}
+    body = stdout
+    while body.startswith("HTTP/"):
+        header_block, _, body = body.partition("\n\n")
+        headers = {}
+        for line in header_block.splitlines()[1:]:
+            name, separator, value = line.partition(":")
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+    return headers, body
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds, ignoring missing or unparseable values."""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
 def fetch_paginated(
     api_caller: Callable[[str, dict[str, str] | None], dict[str, Any]],
     method: str,
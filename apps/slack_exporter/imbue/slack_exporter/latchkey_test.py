@@ -59,6 +59,25 @@ def test_parse_latchkey_response_raises_on_slack_api_error() -> None:
         )
 
 
+def test_parse_latchkey_response_reads_retry_after_from_included_headers() -> None:
+    stdout = (
+        "HTTP/1.1 200 Connection established\n\n"
+        "HTTP/2 429\ncontent-type: application/json\nRetry-After: 30\n\n"
+        '{"ok": false, "error": "ratelimited"}'
+    )
+
+    with pytest.raises(SlackApiError, match="ratelimited") as exc_info:
+        parse_latchkey_response(
+            command_str="latchkey curl --include url",
+            method="conversations.history",
+            return_code=0,
+            stdout=stdout,
+            stderr="",
+        )
+
+    assert exc_info.value.retry_after_seconds == 30.0
+
+
 def test_parse_latchkey_response_raises_on_missing_ok() -> None:
     with pytest.raises(SlackApiError, match="unknown"):
         parse_latchkey_response(
@@ -179,6 +198,43 @@ def test_rate_limit_retry_retries_on_ratelimited() -> None:
     assert call_count == 3
 
 
+def test_rate_limit_retry_waits_for_retry_after() -> None:
+    """Rate-limited responses that carry a Retry-After wait for exactly that long."""
+    sleeps: list[float] = []
+    call_count = 0
+
+    def fake_caller(method: str, query_params: dict[str, str] | None = None) -> dict[str, Any]:
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            raise SlackApiError(method=method, error="ratelimited", retry_after_seconds=12.0)
+        return {"ok": True}
+
+    retry_on_transient_error(fake_caller, sleeps.append, "conversations.list", None)
+
+    assert sleeps == [12.0]
+
+
+def test_rate_limit_retry_skips_waiting_when_the_caller_waits_itself() -> None:
+    """Rate-limited responses are retried without a backoff when the api_caller waits out rate limits."""
+    sleeps: list[float] = []
+    call_count = 0
+
+    def fake_caller(method: str, query_params: dict[str, str] | None = None) -> dict[str, Any]:
+        nonlocal call_count
+        call_count += 1
+        if call_count < 3:
+            raise SlackApiError(method=method, error="ratelimited")
+        return {"ok": True}
+
+    retry_on_transient_error(
+        fake_caller, sleeps.append, "conversations.list", None, is_rate_limit_wait_done_by_api_caller=True
+    )
+
+    assert call_count == 3
+    assert sleeps == []
+
+
 def test_rate_limit_retry_raises_non_ratelimit_errors_immediately() -> None:
     """Non-rate-limit SlackApiErrors are raised without retrying."""
     call_count = 0
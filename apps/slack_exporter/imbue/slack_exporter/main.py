@@ -12,8 +12,10 @@ from imbue.slack_exporter.errors import ChannelNotFoundError
 from imbue.slack_exporter.errors import LatchkeyInvocationError
 from imbue.slack_exporter.errors import SlackApiError
 from imbue.slack_exporter.exporter import run_export
-from imbue.slack_exporter.latchkey import call_slack_api
+from imbue.slack_exporter.latchkey import call_slack_api_once
 from imbue.slack_exporter.primitives import SlackChannelName
+from imbue.slack_exporter.rate_limit import RateLimitedSlackApiCaller
+from imbue.slack_exporter.rate_limit import SlackRateLimiter
 
 
 def _parse_iso_datetime_as_utc(value: str) -> datetime:
@@ -85,6 +87,18 @@ Examples:
         default=50,
         help="Number of most recent relevant threads to check for reaction changes (default: 50)",
     )
+    parser.add_argument(
+        "--max-concurrent-channels",
+        type=int,
+        default=4,
+        help="Number of channels to export concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--max-concurrent-reply-fetches",
+        type=int,
+        default=8,
+        help="Number of thread reply fetches to run concurrently across all channels (default: 8)",
+    )
     parser.add_argument(
         "--refresh",
         action="store_true",
@@ -122,12 +136,16 @@ Examples:
         output_dir=args.output_dir,
         members_only=not args.all_channels,
         max_recent_threads_for_reactions=args.max_recent_threads_for_reactions,
+        max_concurrent_channels=args.max_concurrent_channels,
+        max_concurrent_reply_fetches=args.max_concurrent_reply_fetches,
         refresh=args.refresh,
         cache_ttl_seconds=cache_ttl_seconds,
     )
 
+    # All export threads share one rate limiter, so they back off together when Slack rate limits them
+    api_caller = RateLimitedSlackApiCaller(api_caller=call_slack_api_once, rate_limiter=SlackRateLimiter())
     try:
-        run_export(settings, api_caller=call_slack_api)
+        run_export(settings, api_caller=api_caller.call)
     except ChannelNotFoundError as e:
         logging.error("Channel not found: %s", e.channel_name)
         sys.exit(1)
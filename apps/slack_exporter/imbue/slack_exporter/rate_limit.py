@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from typing import Final
+
+from pydantic import Field
+from pydantic import PrivateAttr
+
+from imbue.imbue_common.mutable_model import MutableModel
+from imbue.slack_exporter.data_types import SlackApiCaller
+from imbue.slack_exporter.errors import SlackApiError
+from imbue.slack_exporter.latchkey import retry_on_transient_error
+
+logger = logging.getLogger(__name__)
+
+# Slack rate limits each API method separately, at the requests per minute of the
+# tier the method belongs to: https://api.slack.com/apis/rate-limits
+_REQUESTS_PER_MINUTE_BY_TIER: Final[dict[int, float]] = {1: 1.0, 2: 20.0, 3: 50.0, 4: 100.0}
+
+_TIER_BY_METHOD: Final[dict[str, int]] = {
+    "auth.test": 4,
+    "conversations.history": 3,
+    "conversations.info": 3,
+    "conversations.list": 2,
+    "conversations.replies": 3,
+    "users.list": 2,
+}
+
+_DEFAULT_TIER: Final[int] = 3
+
+# Calls allowed back to back before the per-minute rate applies
+_BURST_SIZE: Final[int] = 5
+
+_RATE_LIMITED_INITIAL_PAUSE_SECONDS: Final[float] = 2.0
+_RATE_LIMITED_MAX_PAUSE_SECONDS: Final[float] = 60.0
+
+
+def get_slack_api_tier(method: str) -> int:
+    """Return the Slack rate limit tier of an API method, assuming tier 3 for unknown methods."""
+    return _TIER_BY_METHOD.get(method, _DEFAULT_TIER)
+
+
+class TokenBucket(MutableModel):
+    """Token bucket for one Slack API method, shared by every thread calling it.
+
+    Callers reserve a token and are told how long to wait for it, so waiting
+    callers are served in the order they arrived. When Slack reports that the
+    method is rate limited anyway, the whole bucket is paused, so that every
+    caller backs off together instead of each one discovering the limit on
+    its own. The pause lasts as long as Slack's Retry-After asks, or doubles
+    for each consecutive rate limited response when Slack does not say.
+    """
+
+    requests_per_minute: float = Field(frozen=True, description="Sustained rate of calls allowed")
+    burst_size: int = Field(frozen=True, description="Calls allowed back to back when the bucket is full")
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _tokens: float | None = PrivateAttr(default=None)
+    _updated_at: float = PrivateAttr(default=0.0)
+    _paused_until: float = PrivateAttr(default=0.0)
+    _next_pause_seconds: float = PrivateAttr(default=_RATE_LIMITED_INITIAL_PAUSE_SECONDS)
+
+    def reserve(self, now: float) -> float:
+        """Reserve a token and return how many seconds the caller must wait before using it."""
+        refill_per_second = self.requests_per_minute / 60.0
+        with self._lock:
+            if self._tokens is None:
+                self._tokens = float(self.burst_size)
+            else:
+                elapsed = max(now - self._updated_at, 0.0)
+                self._tokens = min(self._tokens + elapsed * refill_per_second, float(self.burst_size))
+            self._updated_at = now
+            self._tokens -= 1.0
+            token_wait_seconds = -self._tokens / refill_per_second if self._tokens < 0 else 0.0
+            return max(token_wait_seconds, self._paused_until - now)
+
+    def pause(self, now: float, retry_after_seconds: float | None) -> float:
+        """Stop handing out tokens after a rate limited response, returning the length of the pause."""
+        with self._lock:
+            if retry_after_seconds is None:
+                pause_seconds = self._next_pause_seconds
+                self._next_pause_seconds = min(pause_seconds * 2, _RATE_LIMITED_MAX_PAUSE_SECONDS)
+            else:
+                pause_seconds = retry_after_seconds
+            self._paused_until = max(self._paused_until, now + pause_seconds)
+            self._tokens = min(self._tokens or 0.0, 0.0)
+            self._updated_at = now
+            return pause_seconds
+
+    def record_success(self) -> None:
+        """Reset the pause length once a call to this method succeeds again."""
+        with self._lock:
+            self._next_pause_seconds = _RATE_LIMITED_INITIAL_PAUSE_SECONDS
+
+
+class SlackRateLimiter(MutableModel):
+    """Client-side rate limiter with one token bucket per Slack API method."""
+
+    time_fn: Callable[[], float] = Field(default=time.monotonic, frozen=True, description="Monotonic clock")
+    sleep_fn: Callable[[float], None] = Field(
+        default=time.sleep, frozen=True, description="Called to wait for a token"
+    )
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _bucket_by_method: dict[str, TokenBucket] = PrivateAttr(default_factory=dict)
+
+    def _get_bucket(self, method: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._bucket_by_method.get(method)
+            if bucket is None:
+                requests_per_minute = _REQUESTS_PER_MINUTE_BY_TIER[get_slack_api_tier(method)]
+                bucket = TokenBucket(requests_per_minute=requests_per_minute, burst_size=_BURST_SIZE)
+                self._bucket_by_method[method] = bucket
+            return bucket
+
+    def acquire(self, method: str) -> None:
+        """Block until a call to the given method fits in its budget."""
+        wait_seconds = self._get_bucket(method).reserve(self.time_fn())
+        if wait_seconds > 0:
+            logger.debug("Waiting %.1fs for the Slack rate limit budget of %s", wait_seconds, method)
+            self.sleep_fn(wait_seconds)
+
+    def record_rate_limited(self, method: str, retry_after_seconds: float | None = None) -> None:
+        """Pause every call to the method after Slack reported it as rate limited."""
+        pause_seconds = self._get_bucket(method).pause(self.time_fn(), retry_after_seconds)
+        logger.warning("Rate limited by Slack API (%s), pausing its calls for %.0fs", method, pause_seconds)
+
+    def record_success(self, method: str) -> None:
+        self._get_bucket(method).record_success()
+
+
+class RateLimitedSlackApiCaller(MutableModel):
+    """Calls Slack API methods through a shared rate limiter, retrying transient errors.
+
+    Use the bound `call` method as the SlackApiCaller. The wrapped api_caller
+    must make a single attempt per call, so that every attempt (including
+    retries) goes through the rate limiter. A rate limited attempt is retried
+    as soon as the rate limiter's pause allows, without a separate backoff.
+    """
+
+    api_caller: SlackApiCaller = Field(frozen=True, description="Makes a single attempt at a Slack API call")
+    rate_limiter: SlackRateLimiter = Field(frozen=True, description="Rate limiter shared by all callers")
+    sleep_fn: Callable[[float], None] = Field(
+        default=time.sleep, frozen=True, description="Called to back off between retries"
+    )
+
+    def call(self, method: str, query_params: dict[str, str] | None = None) -> dict[str, Any]:
+        return retry_on_transient_error(
+            self._call_once, self.sleep_fn, method, query_params, is_rate_limit_wait_done_by_api_caller=True
+        )
+
+    def _call_once(self, method: str, query_params: dict[str, str] | None) -> dict[str, Any]:
+        self.rate_limiter.acquire(method)
+        try:
+            data = self.api_caller(method, query_params)
+        except SlackApiError as e:
+            if e.error == "ratelimited":
+                self.rate_limiter.record_rate_limited(method, e.retry_after_seconds)
+            raise
+        self.rate_limiter.record_success(method)
+        return data
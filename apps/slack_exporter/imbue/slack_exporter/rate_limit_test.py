@@ -0,0 +1,143 @@
+from typing import Any
+
+import pytest
+
+from imbue.slack_exporter.errors import SlackApiError
+from imbue.slack_exporter.rate_limit import RateLimitedSlackApiCaller
+from imbue.slack_exporter.rate_limit import SlackRateLimiter
+from imbue.slack_exporter.rate_limit import TokenBucket
+from imbue.slack_exporter.rate_limit import get_slack_api_tier
+
+
+class _FakeClock:
+    """Clock that only advances when something sleeps on it."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_get_slack_api_tier_defaults_to_tier_3() -> None:
+    assert get_slack_api_tier("conversations.list") == 2
+    assert get_slack_api_tier("conversations.replies") == 3
+    assert get_slack_api_tier("some.new_method") == 3
+
+
+def test_token_bucket_allows_a_burst_then_spaces_out_reservations() -> None:
+    bucket = TokenBucket(requests_per_minute=60.0, burst_size=2)
+
+    waits = [bucket.reserve(now=0.0) for _ in range(4)]
+
+    assert waits == [0.0, 0.0, pytest.approx(1.0), pytest.approx(2.0)]
+
+
+def test_token_bucket_refills_over_time() -> None:
+    bucket = TokenBucket(requests_per_minute=60.0, burst_size=1)
+
+    assert bucket.reserve(now=0.0) == 0.0
+    assert bucket.reserve(now=5.0) == 0.0
+
+
+def test_token_bucket_pause_delays_every_reservation_and_doubles() -> None:
+    bucket = TokenBucket(requests_per_minute=600.0, burst_size=5)
+
+    first_pause = bucket.pause(now=10.0, retry_after_seconds=None)
+    assert bucket.reserve(now=10.0) == pytest.approx(first_pause)
+    assert bucket.reserve(now=11.0) == pytest.approx(first_pause - 1.0)
+
+    assert bucket.pause(now=20.0, retry_after_seconds=None) == pytest.approx(first_pause * 2)
+    bucket.record_success()
+    assert bucket.pause(now=30.0, retry_after_seconds=None) == pytest.approx(first_pause)
+
+
+def test_token_bucket_pause_lasts_as_long_as_retry_after() -> None:
+    bucket = TokenBucket(requests_per_minute=600.0, burst_size=5)
+
+    assert bucket.pause(now=10.0, retry_after_seconds=30.0) == 30.0
+    assert bucket.reserve(now=10.0) == pytest.approx(30.0)
+
+
+def test_rate_limiter_keeps_a_separate_budget_per_method() -> None:
+    clock = _FakeClock()
+    limiter = SlackRateLimiter(time_fn=clock.time, sleep_fn=clock.sleep)
+
+    for _ in range(5):
+        limiter.acquire("conversations.list")
+    assert clock.sleeps == []
+
+    # users.list is also tier 2, but Slack limits each method on its own
+    limiter.acquire("users.list")
+    assert clock.sleeps == []
+
+    # conversations.list used up its burst, so it waits at the tier 2 rate
+    limiter.acquire("conversations.list")
+    assert clock.sleeps == [pytest.approx(3.0)]
+
+
+def test_rate_limited_caller_retries_after_rate_limited_response() -> None:
+    clock = _FakeClock()
+    limiter = SlackRateLimiter(time_fn=clock.time, sleep_fn=clock.sleep)
+    calls: list[str] = []
+
+    def flaky_api_caller(method: str, query_params: dict[str, str] | None) -> dict[str, Any]:
+        calls.append(method)
+        if len(calls) == 1:
+            raise SlackApiError(method=method, error="ratelimited")
+        return {"ok": True}
+
+    caller = RateLimitedSlackApiCaller(api_caller=flaky_api_caller, rate_limiter=limiter, sleep_fn=clock.sleep)
+
+    assert caller.call("conversations.replies", {"ts": "1"}) == {"ok": True}
+    assert calls == ["conversations.replies", "conversations.replies"]
+    assert clock.sleeps == [pytest.approx(2.0)]
+
+
+def test_rate_limited_caller_waits_only_for_retry_after() -> None:
+    clock = _FakeClock()
+    limiter = SlackRateLimiter(time_fn=clock.time, sleep_fn=clock.sleep)
+    calls: list[str] = []
+
+    def flaky_api_caller(method: str, query_params: dict[str, str] | None) -> dict[str, Any]:
+        calls.append(method)
+        if len(calls) == 1:
+            raise SlackApiError(method=method, error="ratelimited", retry_after_seconds=7.0)
+        return {"ok": True}
+
+    caller = RateLimitedSlackApiCaller(api_caller=flaky_api_caller, rate_limiter=limiter, sleep_fn=clock.sleep)
+
+    assert caller.call("conversations.replies", None) == {"ok": True}
+    # The rate limiter's pause is the only wait, with no retry backoff stacked on top
+    assert clock.sleeps == [pytest.approx(7.0)]
+
+
+def test_rate_limited_response_pauses_only_that_method() -> None:
+    clock = _FakeClock()
+    limiter = SlackRateLimiter(time_fn=clock.time, sleep_fn=clock.sleep)
+
+    limiter.record_rate_limited("conversations.replies")
+    limiter.acquire("conversations.history")
+    limiter.acquire("conversations.replies")
+
+    assert clock.sleeps == [pytest.approx(2.0)]
+
+
+def test_rate_limited_caller_raises_non_rate_limit_errors() -> None:
+    def failing_api_caller(method: str, query_params: dict[str, str] | None) -> dict[str, Any]:
+        raise SlackApiError(method=method, error="channel_not_found")
+
+    clock = _FakeClock()
+    caller = RateLimitedSlackApiCaller(
+        api_caller=failing_api_caller,
+        rate_limiter=SlackRateLimiter(time_fn=clock.time, sleep_fn=clock.sleep),
+        sleep_fn=clock.sleep,
+    )
+
+    with pytest.raises(SlackApiError, match="channel_not_found"):
+        caller.call("conversations.history", None)
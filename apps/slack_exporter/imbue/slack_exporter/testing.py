@@ -1,3 +1,4 @@
+import threading
 from typing import Any
 
 from imbue.imbue_common.event_envelope import EventId
@@ -186,11 +187,13 @@ def make_fake_api_caller(
 ) -> SlackApiCaller:
     """Create a fake SlackApiCaller that returns pre-configured responses per method."""
     call_index_by_method: dict[str, int] = {}
+    lock = threading.Lock()
 
     def fake_api_caller(method: str, query_params: dict[str, str] | None = None) -> dict[str, Any]:
         responses = response_by_method.get(method, [])
-        idx = call_index_by_method.get(method, 0)
-        call_index_by_method[method] = idx + 1
+        with lock:
+            idx = call_index_by_method.get(method, 0)
+            call_index_by_method[method] = idx + 1
         return responses[idx]
 
     return fake_api_caller
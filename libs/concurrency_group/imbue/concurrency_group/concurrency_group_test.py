@@ -1,4 +1,5 @@
 import contextlib
+from contextvars import ContextVar
 from pathlib import Path
 from threading import Event
 from time import monotonic
@@ -123,6 +124,20 @@ def test_concurrency_group_does_not_raise_when_within_timeout() -> None:
     assert not thread.is_alive()
 
 
+_TEST_CONTEXT_VAR: ContextVar[str] = ContextVar("test_context_var", default="unset")
+
+
+def test_threads_see_the_context_variables_of_the_thread_that_started_them() -> None:
+    seen_values: list[str] = []
+    token = _TEST_CONTEXT_VAR.set("from parent")
+    try:
+        with ConcurrencyGroup(name="outer") as cg:
+            cg.start_new_thread(target=lambda: seen_values.append(_TEST_CONTEXT_VAR.get())).join()
+    finally:
+        _TEST_CONTEXT_VAR.reset(token)
+    assert seen_values == ["from parent"]
+
+
 @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
 def test_failed_threads_raise_when_probed() -> None:
     i = 0
@@ -1,3 +1,4 @@
+import contextvars
 import threading
 from typing import Any
 from typing import Callable
@@ -23,7 +24,11 @@ def _is_match_for_enumerated_exceptions(
 
 
 class ObservableThread(threading.Thread):
-    """Thread that captures exceptions and returns results."""
+    """Thread that captures exceptions and returns results.
+
+    The target runs in a copy of the context of the thread that created this one, so that
+    context variables (e.g. loguru's contextualize() fields) carry over to it.
+    """
 
     def __init__(
         self,
@@ -46,6 +51,7 @@ class ObservableThread(threading.Thread):
         self._silenced_exceptions = silenced_exceptions or ()
         self._suppressed_exceptions = suppressed_exceptions or ()
         self._on_failure = on_failure
+        self._context = contextvars.copy_context()
 
     @property
     def target_name(self) -> str | None:
@@ -54,7 +60,7 @@ class ObservableThread(threading.Thread):
     def run(self) -> None:
         """Run the target function."""
         try:
-            super().run()
+            self._context.run(super().run)
         except BaseException as e:
             self._exception = e
             if _is_match_for_enumerated_exceptions(e, self._silenced_exceptions):
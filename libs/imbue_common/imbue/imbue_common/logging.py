@@ -2,10 +2,14 @@ import functools
 import inspect
 import json
 import os
+import queue
 import sys
+import threading
 import time
 from collections.abc import Callable
 from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
 from contextlib import contextmanager
 from datetime import datetime
 from datetime import timezone
@@ -13,12 +17,17 @@ from pathlib import Path
 from typing import Any
 from typing import Final
 from typing import ParamSpec
+from typing import TextIO
 from typing import TypeVar
 from uuid import uuid4
 
 from loguru import logger
+from pydantic import Field
+from pydantic import PrivateAttr
 
+from imbue.imbue_common.mutable_model import MutableModel
 from imbue.imbue_common.pure import pure
+from imbue.imbue_common.span_profiling import get_active_span_profiler
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -37,6 +46,10 @@ R = TypeVar("R")
 
 _MAX_LOG_VALUE_REPR_LENGTH: Final[int] = 200
 
+# Loguru's numeric severities for the levels used by the call/span helpers below
+_DEBUG_LEVEL_NO: Final[int] = 10
+_TRACE_LEVEL_NO: Final[int] = 5
+
 
 @pure
 def _format_arg_value(value: Any) -> str:
@@ -47,19 +60,33 @@ def _format_arg_value(value: Any) -> str:
     return str_value
 
 
+def is_log_level_enabled(level_no: int) -> bool:
+    """Return whether any loguru handler currently accepts records at the given severity.
+
+    Loguru tracks the lowest level across its handlers (and skips records below
+    it) but does not expose that publicly, so this reads it from the logger's
+    core. Used to skip building log messages and arguments nobody would see.
+    """
+    return level_no >= logger._core.min_level  # ty: ignore[unresolved-attribute]
+
+
 def log_call(func: Callable[P, R]) -> Callable[P, R]:
     """Decorator that logs function calls with inputs and outputs at debug level.
 
     Logs the function name and binds arguments as structured logging fields.
-    Useful for API entry points to trace execution.
+    Useful for API entry points to trace execution. When no handler accepts
+    debug records, the call goes straight through without formatting anything.
     """
-    # Get the function name once at decoration time
+    # Get the function name and signature once at decoration time
     func_name = getattr(func, "__name__", repr(func))
+    sig = inspect.signature(func)
 
     @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        # Get the function signature to map positional args to names
-        sig = inspect.signature(func)
+        if not is_log_level_enabled(_DEBUG_LEVEL_NO):
+            return func(*args, **kwargs)
+
+        # Map positional args to names
         bound_args = sig.bind(*args, **kwargs)
         bound_args.apply_defaults()
 
@@ -71,15 +98,27 @@ def log_call(func: Callable[P, R]) -> Callable[P, R]:
 
         result = func(*args, **kwargs)
 
-        elapsed = time.monotonic() - start_time
-        done_message = f"Calling {func_name} [done in {elapsed:.5f} sec]"
-        logger.trace(done_message, result=_format_arg_value(result))
+        if is_log_level_enabled(_TRACE_LEVEL_NO):
+            elapsed = time.monotonic() - start_time
+            done_message = f"Calling {func_name} [done in {elapsed:.5f} sec]"
+            logger.trace(done_message, result=_format_arg_value(result))
 
         return result
 
     return wrapper
 
 
+@contextmanager
+def _profile_span(message: str, args: Sequence[Any], context: Mapping[str, Any]) -> Iterator[None]:
+    """Record the enclosed block with the active span profiler, if profiling is on."""
+    profiler = get_active_span_profiler()
+    if profiler is None:
+        yield
+    else:
+        with profiler.span(message, args, context):
+            yield
+
+
 @contextmanager
 def log_span(message: str, *args: Any, **context: Any) -> Iterator[None]:
     """Context manager that logs a debug message on entry and a trace message with timing on exit.
@@ -88,22 +127,28 @@ def log_span(message: str, *args: Any, **context: Any) -> Iterator[None]:
     On exit, emits logger.trace(message + " [done in X.XXXXX sec]", *args, elapsed).
 
     Keyword arguments are passed to logger.contextualize so that all log messages
-    within the span include the extra context fields.
+    within the span include the extra context fields. When there is no context,
+    no handler accepts debug records and span profiling is off, the span does nothing.
     """
-    with logger.contextualize(**context):
-        logger.debug(message, *args)
-        start_time = time.monotonic()
-        try:
-            yield
-        except BaseException:
-            elapsed = time.monotonic() - start_time
-            failed_message = message + " [failed after {:.5f} sec]"
-            logger.trace(failed_message, *args, elapsed)
-            raise
-        else:
-            elapsed = time.monotonic() - start_time
-            done_message = message + " [done in {:.5f} sec]"
-            logger.trace(done_message, *args, elapsed)
+    if not context and not is_log_level_enabled(_DEBUG_LEVEL_NO) and get_active_span_profiler() is None:
+        yield
+    else:
+        with logger.contextualize(**context), _profile_span(message, args, context):
+            logger.debug(message, *args)
+            start_time = time.monotonic()
+            try:
+                yield
+            except BaseException:
+                if is_log_level_enabled(_TRACE_LEVEL_NO):
+                    elapsed = time.monotonic() - start_time
+                    failed_message = message + " [failed after {:.5f} sec]"
+                    logger.trace(failed_message, *args, elapsed)
+                raise
+            else:
+                if is_log_level_enabled(_TRACE_LEVEL_NO):
+                    elapsed = time.monotonic() - start_time
+                    done_message = message + " [done in {:.5f} sec]"
+                    logger.trace(done_message, *args, elapsed)
 
 
 @contextmanager
@@ -116,7 +161,7 @@ def info_span(message: str, *args: Any, **context: Any) -> Iterator[None]:
     Keyword arguments are passed to logger.contextualize so that all log messages
     within the span include the extra context fields.
     """
-    with logger.contextualize(**context):
+    with logger.contextualize(**context), _profile_span(message, args, context):
         logger.info(message, *args)
         start_time = time.monotonic()
         is_success = False
@@ -137,12 +182,15 @@ def trace_span(message: str, *args: Any, _is_trace_span_enabled: bool = True, **
     On exit, emits logger.trace(message + " [done in X.XXXXX sec]", *args, elapsed).
 
     Keyword arguments are passed to logger.contextualize so that all log messages
-    within the span include the extra context fields.
+    within the span include the extra context fields. When there is no context,
+    no handler accepts trace records and span profiling is off, the span does nothing.
     """
-    if not _is_trace_span_enabled:
+    if not _is_trace_span_enabled or (
+        not context and not is_log_level_enabled(_TRACE_LEVEL_NO) and get_active_span_profiler() is None
+    ):
         yield
     else:
-        with logger.contextualize(**context):
+        with logger.contextualize(**context), _profile_span(message, args, context):
             logger.trace(message, *args)
             start_time = time.monotonic()
             try:
@@ -236,6 +284,93 @@ def _build_flat_log_dict(
     return event
 
 
+def find_next_rotation_index(file_path: Path) -> int:
+    """Return the numeric suffix to use for the next rotated copy of file_path.
+
+    Scans the directory once and returns one more than the highest existing
+    suffix (e.g. 3 when events.jsonl.1 and events.jsonl.2 exist), so the cost
+    does not grow with the number of rotated files.
+    """
+    prefix = f"{file_path.name}."
+    highest_index = 0
+    try:
+        with os.scandir(file_path.parent) as entries:
+            for entry in entries:
+                suffix = entry.name[len(prefix) :] if entry.name.startswith(prefix) else ""
+                if suffix.isdigit():
+                    highest_index = max(highest_index, int(suffix))
+    except FileNotFoundError:
+        pass
+    return highest_index + 1
+
+
+def _serialize_flat_log_record(
+    record: Any,
+    event_type: str,
+    event_source: str,
+    command: str | None,
+) -> str:
+    """Serialize a loguru record into a single flat JSON line (including the trailing newline)."""
+    event = _build_flat_log_dict(record, event_type, event_source, command)
+    return json.dumps(event, separators=(",", ":"), default=str) + "\n"
+
+
+class RotatingJsonlFileWriter(MutableModel):
+    """Appends JSON lines to a file, rotating it to a numbered copy when it exceeds a size limit.
+
+    The rotation index is found with a single directory scan on the first
+    rotation and then tracked in memory.
+    """
+
+    file_path: Path = Field(frozen=True, description="Path of the active log file")
+    max_size_bytes: int = Field(frozen=True, description="Rotate once the file reaches this size")
+
+    _file: TextIO | None = PrivateAttr(default=None)
+    _size: int = PrivateAttr(default=0)
+    _next_rotation_index: int | None = PrivateAttr(default=None)
+
+    def write_lines(self, json_lines: Sequence[str]) -> None:
+        """Write the lines (each ending in a newline), then flush once."""
+        for json_line in json_lines:
+            file = self._open_if_needed()
+            if self._size >= self.max_size_bytes:
+                file = self._rotate()
+            file.write(json_line)
+            self._size += len(json_line.encode("utf-8"))
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open_if_needed(self) -> TextIO:
+        if self._file is None:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.file_path, "a")
+            try:
+                self._size = self.file_path.stat().st_size
+            except OSError:
+                self._size = 0
+        return self._file
+
+    def _rotate(self) -> TextIO:
+        self.close()
+        if self._next_rotation_index is None:
+            self._next_rotation_index = find_next_rotation_index(self.file_path)
+        rotated_path = self.file_path.with_name(f"{self.file_path.name}.{self._next_rotation_index}")
+        if rotated_path.exists():
+            # Another process rotated the same file since we last scanned
+            self._next_rotation_index = find_next_rotation_index(self.file_path)
+            rotated_path = self.file_path.with_name(f"{self.file_path.name}.{self._next_rotation_index}")
+        self.file_path.rename(rotated_path)
+        self._next_rotation_index += 1
+        self._file = open(self.file_path, "a")
+        self._size = 0
+        return self._file
+
+
 def make_jsonl_file_sink(
     file_path: str,
     event_type: str,
@@ -247,52 +382,134 @@ def make_jsonl_file_sink(
 
     Bypasses loguru's colorizer entirely by using a callable sink instead of
     a format function. Handles file rotation when the file exceeds max_size_bytes.
+    Each record is written and flushed synchronously; see BufferedJsonlFileSink
+    for a sink that moves this work off the logging thread.
     """
-    bound_type = event_type
-    bound_source = event_source
-    bound_command = command
-    bound_path = file_path
-    bound_max_size = max_size_bytes
-
-    # Mutable state for the file handle
-    state: dict[str, Any] = {"file": None, "size": 0}
-
-    def _ensure_file() -> Any:
-        if state["file"] is None:
-            Path(bound_path).parent.mkdir(parents=True, exist_ok=True)
-            state["file"] = open(bound_path, "a")
-            try:
-                state["size"] = Path(bound_path).stat().st_size
-            except OSError:
-                state["size"] = 0
-        return state["file"]
-
-    def _rotate_if_needed() -> None:
-        if state["size"] >= bound_max_size:
-            if state["file"] is not None:
-                state["file"].close()
-            # Rotate: rename current file with numeric suffix
-            path = Path(bound_path)
-            rotation_idx = 1
-            while True:
-                rotated = path.with_name(f"{path.name}.{rotation_idx}")
-                if not rotated.exists():
-                    break
-                rotation_idx += 1
-            path.rename(rotated)
-            state["file"] = open(bound_path, "a")
-            state["size"] = 0
+    writer = RotatingJsonlFileWriter(file_path=Path(file_path), max_size_bytes=max_size_bytes)
 
     def sink(message: Any) -> None:
-        record = message.record
-        event = _build_flat_log_dict(record, bound_type, bound_source, bound_command)
-        json_line = json.dumps(event, separators=(",", ":"), default=str) + "\n"
-        line_bytes = len(json_line.encode("utf-8"))
-
-        _rotate_if_needed()
-        fh = _ensure_file()
-        fh.write(json_line)
-        fh.flush()
-        state["size"] += line_bytes
+        writer.write_lines([_serialize_flat_log_record(message.record, event_type, event_source, command)])
 
     return sink
+
+
+# Upper bound on the number of records a buffered sink writes before flushing
+_MAX_BUFFERED_BATCH_SIZE: Final[int] = 1000
+
+# How long a logging call that forces a flush (error records, wait_until_written)
+# waits for the background writer before giving up
+_BUFFERED_SINK_FLUSH_TIMEOUT_SECONDS: Final[float] = 5.0
+
+# Records at or above this loguru level number (ERROR) are flushed before the logging call returns
+_SYNCHRONOUS_FLUSH_LEVEL_NO: Final[int] = 40
+
+
+class BufferedJsonlFileSink(MutableModel):
+    """Loguru sink that serializes and writes flat JSONL records on a background thread.
+
+    Logging calls only enqueue the record. The writer thread drains whatever
+    has queued up (at most _MAX_BUFFERED_BATCH_SIZE records), writes it in one
+    batch and flushes, so latency is bounded by the time to write one batch.
+    The queue is bounded, so a caller blocks rather than growing memory
+    without limit when the disk cannot keep up.
+
+    Error-level records are flushed before the logging call returns, so they
+    survive a crash that follows them. Loguru calls stop() when the handler is
+    removed (including at interpreter exit), which writes out everything still
+    queued.
+
+    Deliberately has no flush() method: loguru would call it after every
+    record, defeating the batching.
+
+    Use start() to create an instance.
+    """
+
+    writer: RotatingJsonlFileWriter = Field(frozen=True, description="Destination file writer")
+    event_type: str = Field(frozen=True, description="Envelope type written on each line")
+    event_source: str = Field(frozen=True, description="Envelope source written on each line")
+    command: str | None = Field(frozen=True, description="Command name written on each line, if any")
+    max_queue_size: int = Field(frozen=True, description="Maximum number of records waiting to be written")
+
+    _queue: queue.Queue[Any] = PrivateAttr(default_factory=queue.Queue)
+    _writer_thread: threading.Thread | None = PrivateAttr(default=None)
+    _stop_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _is_stopped: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def start(
+        cls,
+        file_path: str,
+        event_type: str,
+        event_source: str,
+        command: str | None,
+        max_size_bytes: int,
+        max_queue_size: int = 10000,
+    ) -> "BufferedJsonlFileSink":
+        """Create the sink and start its background writer thread."""
+        sink = cls(
+            writer=RotatingJsonlFileWriter(file_path=Path(file_path), max_size_bytes=max_size_bytes),
+            event_type=event_type,
+            event_source=event_source,
+            command=command,
+            max_queue_size=max_queue_size,
+        )
+        sink._queue = queue.Queue(maxsize=max_queue_size)
+        sink._writer_thread = threading.Thread(target=sink._write_queued_records, name="jsonl-log-writer", daemon=True)
+        sink._writer_thread.start()
+        return sink
+
+    def write(self, message: Any) -> None:
+        """Loguru entry point: enqueue the record, flushing synchronously for error-level records."""
+        record = message.record
+        if self._is_stopped or self._writer_thread is None or not self._writer_thread.is_alive():
+            # No background writer (e.g. after fork, or once stopped), so write inline
+            self.writer.write_lines(
+                [_serialize_flat_log_record(record, self.event_type, self.event_source, self.command)]
+            )
+            return
+        self._queue.put(record)
+        if record["level"].no >= _SYNCHRONOUS_FLUSH_LEVEL_NO:
+            self.wait_until_written()
+
+    def wait_until_written(self) -> bool:
+        """Block until every record queued so far is on disk, returning False on timeout."""
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            return True
+        is_written_event = threading.Event()
+        self._queue.put(is_written_event)
+        return is_written_event.wait(timeout=_BUFFERED_SINK_FLUSH_TIMEOUT_SECONDS)
+
+    def stop(self) -> None:
+        """Write out all queued records, stop the writer thread and close the file."""
+        with self._stop_lock:
+            if self._is_stopped:
+                return
+            self._is_stopped = True
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._queue.put(None)
+            self._writer_thread.join(timeout=_BUFFERED_SINK_FLUSH_TIMEOUT_SECONDS)
+        self.writer.close()
+
+    def _write_queued_records(self) -> None:
+        is_stop_requested = False
+        while not is_stop_requested:
+            items = [self._queue.get()]
+            while len(items) < _MAX_BUFFERED_BATCH_SIZE and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            json_lines: list[str] = []
+            written_events: list[threading.Event] = []
+            for item in items:
+                if item is None:
+                    is_stop_requested = True
+                elif isinstance(item, threading.Event):
+                    written_events.append(item)
+                else:
+                    json_lines.append(
+                        _serialize_flat_log_record(item, self.event_type, self.event_source, self.command)
+                    )
+            try:
+                self.writer.write_lines(json_lines)
+            except OSError as e:
+                sys.stderr.write(f"Failed to write {len(json_lines)} log records: {e}\n")
+            for written_event in written_events:
+                written_event.set()
@@ -10,8 +10,10 @@ from typing import Any
 
 from loguru import logger
 
+from imbue.imbue_common.logging import BufferedJsonlFileSink
 from imbue.imbue_common.logging import _build_flat_log_dict
 from imbue.imbue_common.logging import _format_arg_value
+from imbue.imbue_common.logging import find_next_rotation_index
 from imbue.imbue_common.logging import format_nanosecond_iso_timestamp
 from imbue.imbue_common.logging import generate_log_event_id
 from imbue.imbue_common.logging import log_call
@@ -38,16 +40,35 @@ class LogCapture:
 
 
 @contextmanager
-def capture_logs() -> Iterator[LogCapture]:
+def capture_logs(level: str = "TRACE") -> Iterator[LogCapture]:
     """Context manager that installs a loguru sink and yields a LogCapture."""
     cap = LogCapture()
-    handler_id = logger.add(cap.sink, level="TRACE", format="{message}")
+    handler_id = logger.add(cap.sink, level=level, format="{message}")
     try:
         yield cap
     finally:
         logger.remove(handler_id)
 
 
+@contextmanager
+def capture_info_logs_only() -> Iterator[LogCapture]:
+    """Like capture_logs, but with every handler at INFO so that debug and trace are disabled."""
+    setup_logging(level="INFO")
+    with capture_logs(level="INFO") as cap:
+        yield cap
+
+
+class ReprCountingValue:
+    """Argument value that counts how often it is formatted for logging."""
+
+    def __init__(self) -> None:
+        self.repr_count = 0
+
+    def __repr__(self) -> str:
+        self.repr_count += 1
+        return "ReprCountingValue()"
+
+
 def test_setup_logging_does_not_raise() -> None:
     """setup_logging should configure logging without raising."""
     setup_logging()
@@ -372,6 +393,34 @@ def test_log_call_preserves_function_name() -> None:
     assert my_function.__name__ == "my_function"
 
 
+def test_log_call_skips_argument_formatting_when_debug_is_disabled() -> None:
+    @log_call
+    def identity(value: ReprCountingValue) -> ReprCountingValue:
+        return value
+
+    value = ReprCountingValue()
+    with capture_info_logs_only() as cap:
+        assert identity(value) is value
+        assert cap.messages == []
+    assert value.repr_count == 0
+
+    with capture_logs():
+        identity(value)
+    # Once for the argument and once for the result
+    assert value.repr_count == 2
+
+
+def test_log_call_binds_keyword_and_default_arguments() -> None:
+    @log_call
+    def greet(name: str, greeting: str = "hello") -> str:
+        return f"{greeting} {name}"
+
+    with capture_logs() as cap:
+        assert greet(name="world") == "hello world"
+        assert cap.extras[0]["name"] == "'world'"
+        assert cap.extras[0]["greeting"] == "'hello'"
+
+
 # =============================================================================
 # Tests for trace_span
 # =============================================================================
@@ -412,6 +461,26 @@ def test_trace_span_logs_on_exception() -> None:
         assert "risky [failed after " in cap.messages[1]
 
 
+def test_spans_emit_nothing_when_their_levels_are_disabled() -> None:
+    with capture_info_logs_only() as cap:
+        with log_span("debug span"):
+            logger.info("inside log span")
+        with trace_span("trace span"):
+            logger.info("inside trace span")
+
+        assert cap.messages == ["inside log span", "inside trace span"]
+
+
+def test_spans_still_attach_context_when_their_levels_are_disabled() -> None:
+    with capture_info_logs_only() as cap:
+        with log_span("debug span", host="h1"):
+            logger.info("inside log span")
+        with trace_span("trace span", agent="a1"):
+            logger.info("inside trace span")
+
+        assert cap.extras == [{"host": "h1"}, {"agent": "a1"}]
+
+
 # =============================================================================
 # Tests for make_jsonl_file_sink
 # =============================================================================
@@ -466,6 +535,132 @@ def test_make_jsonl_file_sink_rotates_on_size(tmp_path: Path) -> None:
     assert rotated.exists()
 
 
+def test_make_jsonl_file_sink_rotates_past_existing_rotated_files(tmp_path: Path) -> None:
+    """Rotation should continue numbering after the highest existing rotated file."""
+    log_file = tmp_path / "test.jsonl"
+    (tmp_path / "test.jsonl.1").write_text("old\n")
+    (tmp_path / "test.jsonl.4").write_text("old\n")
+    sink = make_jsonl_file_sink(
+        file_path=str(log_file),
+        event_type="mngr",
+        event_source="test",
+        command=None,
+        max_size_bytes=100,
+    )
+
+    handler_id = logger.add(sink, level="TRACE", format="{message}")
+    try:
+        for i in range(3):
+            logger.info("message number {}", i)
+    finally:
+        logger.remove(handler_id)
+
+    assert (tmp_path / "test.jsonl.5").exists()
+    assert (tmp_path / "test.jsonl.6").exists()
+    assert (tmp_path / "test.jsonl.1").read_text() == "old\n"
+
+
+def test_find_next_rotation_index(tmp_path: Path) -> None:
+    log_file = tmp_path / "events.jsonl"
+    assert find_next_rotation_index(log_file) == 1
+    assert find_next_rotation_index(tmp_path / "missing" / "events.jsonl") == 1
+
+    for name in ("events.jsonl.2", "events.jsonl.10", "events.jsonl.bak", "other.jsonl.50"):
+        (tmp_path / name).write_text("")
+    assert find_next_rotation_index(log_file) == 11
+
+
+# =============================================================================
+# Tests for BufferedJsonlFileSink
+# =============================================================================
+
+
+def _start_buffered_sink(log_file: Path, max_size_bytes: int = 10 * 1024 * 1024) -> BufferedJsonlFileSink:
+    return BufferedJsonlFileSink.start(
+        file_path=str(log_file),
+        event_type="mngr",
+        event_source="test",
+        command="list",
+        max_size_bytes=max_size_bytes,
+    )
+
+
+def test_buffered_jsonl_file_sink_writes_all_records_on_stop(tmp_path: Path) -> None:
+    """Removing the handler should write out every queued record."""
+    log_file = tmp_path / "test.jsonl"
+    sink = _start_buffered_sink(log_file)
+
+    handler_id = logger.add(sink, level="TRACE", format="{message}")
+    for i in range(200):
+        logger.debug("message number {}", i)
+    logger.remove(handler_id)
+
+    parsed_lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [parsed["message"] for parsed in parsed_lines] == [f"message number {i}" for i in range(200)]
+    assert parsed_lines[0]["command"] == "list"
+    assert parsed_lines[0]["source"] == "test"
+
+
+def test_buffered_jsonl_file_sink_flushes_error_records_before_returning(tmp_path: Path) -> None:
+    """Error-level records (and everything queued before them) should be on disk when the call returns."""
+    log_file = tmp_path / "test.jsonl"
+    sink = _start_buffered_sink(log_file)
+
+    handler_id = logger.add(sink, level="TRACE", format="{message}")
+    try:
+        logger.info("before the error")
+        logger.error("something broke")
+
+        messages = [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+        assert messages == ["before the error", "something broke"]
+    finally:
+        logger.remove(handler_id)
+
+
+def test_buffered_jsonl_file_sink_wait_until_written(tmp_path: Path) -> None:
+    log_file = tmp_path / "test.jsonl"
+    sink = _start_buffered_sink(log_file)
+
+    handler_id = logger.add(sink, level="TRACE", format="{message}")
+    try:
+        logger.info("queued")
+        assert sink.wait_until_written()
+        assert json.loads(log_file.read_text())["message"] == "queued"
+    finally:
+        logger.remove(handler_id)
+
+
+def test_buffered_jsonl_file_sink_rotates_on_size(tmp_path: Path) -> None:
+    log_file = tmp_path / "test.jsonl"
+    sink = _start_buffered_sink(log_file, max_size_bytes=100)
+
+    handler_id = logger.add(sink, level="TRACE", format="{message}")
+    for i in range(5):
+        logger.info("message number {}", i)
+    logger.remove(handler_id)
+
+    rotated_messages = [
+        json.loads(line)["message"]
+        for index in range(1, 5)
+        for line in (tmp_path / f"test.jsonl.{index}").read_text().splitlines()
+    ]
+    current_messages = [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+    assert rotated_messages + current_messages == [f"message number {i}" for i in range(5)]
+
+
+def test_buffered_jsonl_file_sink_writes_inline_after_stop(tmp_path: Path) -> None:
+    log_file = tmp_path / "test.jsonl"
+    sink = _start_buffered_sink(log_file)
+    sink.stop()
+
+    handler_id = logger.add(sink, level="TRACE", format="{message}")
+    try:
+        logger.info("written inline")
+        assert json.loads(log_file.read_text())["message"] == "written inline"
+    finally:
+        logger.remove(handler_id)
+
+
 # =============================================================================
 # Tests for _build_flat_log_dict exception info
 # =============================================================================
@@ -0,0 +1,172 @@
+"""Capture log_span/info_span/trace_span timings for Chrome trace-event export.
+
+While a SpanProfiler is active, every span records its name, thread, nesting
+depth and timing. The result can be written as Chrome trace-event JSON (open it
+in https://ui.perfetto.dev or chrome://tracing) and summarized as a table of the
+spans that took the most time.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+from typing import Final
+
+from pydantic import Field
+from pydantic import PrivateAttr
+
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.mutable_model import MutableModel
+from imbue.imbue_common.pure import pure
+
+# Number of rows shown by format_span_timing_summary by default
+DEFAULT_SPAN_SUMMARY_ROW_COUNT: Final[int] = 20
+
+# The active profiler, if any. Threads only see it when they run in a copy of the
+# context of the thread that started profiling (as ObservableThreads do).
+_ACTIVE_SPAN_PROFILER: ContextVar["SpanProfiler | None"] = ContextVar("active_span_profiler", default=None)
+
+
+class SpanTiming(FrozenModel):
+    """One completed span."""
+
+    name: str = Field(description="The span message with its format arguments filled in")
+    start_seconds: float = Field(description="Start time, relative to when profiling started")
+    duration_seconds: float = Field(description="How long the span was open")
+    thread_id: int = Field(description="Native id of the thread the span ran on")
+    thread_name: str = Field(description="Name of the thread the span ran on")
+    depth: int = Field(description="Number of enclosing spans on the same thread")
+    is_failed: bool = Field(description="Whether the span exited with an exception")
+    context: dict[str, str] = Field(description="The span's contextualize() fields, as strings")
+
+
+class SpanProfiler(MutableModel):
+    """Collects SpanTiming records from every thread that sees it as the active profiler.
+
+    Use start_span_profiling() to create and activate one.
+    """
+
+    _origin: float = PrivateAttr(default_factory=time.perf_counter)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _timings: list[SpanTiming] = PrivateAttr(default_factory=list)
+    _depth_by_thread_id: dict[int, int] = PrivateAttr(default_factory=dict)
+
+    @contextmanager
+    def span(self, message: str, args: Sequence[Any], context: Mapping[str, Any]) -> Iterator[None]:
+        """Record the time spent inside the with block as one span."""
+        thread_id = threading.get_native_id()
+        with self._lock:
+            depth = self._depth_by_thread_id.get(thread_id, 0)
+            self._depth_by_thread_id[thread_id] = depth + 1
+        start = time.perf_counter()
+        is_failed = True
+        try:
+            yield
+            is_failed = False
+        finally:
+            end = time.perf_counter()
+            timing = SpanTiming(
+                name=_format_span_name(message, args),
+                start_seconds=start - self._origin,
+                duration_seconds=end - start,
+                thread_id=thread_id,
+                thread_name=threading.current_thread().name,
+                depth=depth,
+                is_failed=is_failed,
+                context={key: str(value) for key, value in context.items()},
+            )
+            with self._lock:
+                self._depth_by_thread_id[thread_id] = depth
+                self._timings.append(timing)
+
+    def get_timings(self) -> list[SpanTiming]:
+        """Return the spans completed so far, in the order they finished."""
+        with self._lock:
+            return list(self._timings)
+
+
+def start_span_profiling() -> SpanProfiler:
+    """Activate a new profiler in the current context that records every span from now on (replacing any active one)."""
+    profiler = SpanProfiler()
+    _ACTIVE_SPAN_PROFILER.set(profiler)
+    return profiler
+
+
+def stop_span_profiling() -> None:
+    """Deactivate the active profiler of the current context, if any."""
+    _ACTIVE_SPAN_PROFILER.set(None)
+
+
+def get_active_span_profiler() -> SpanProfiler | None:
+    return _ACTIVE_SPAN_PROFILER.get()
+
+
+@pure
+def _format_span_name(message: str, args: Sequence[Any]) -> str:
+    """Fill in the span message the way loguru would, falling back to the raw template."""
+    if not args:
+        return message
+    try:
+        return message.format(*args)
+    except (IndexError, KeyError, ValueError):
+        return message
+
+
+@pure
+def build_chrome_trace(timings: Sequence[SpanTiming], pid: int) -> dict[str, Any]:
+    """Build a Chrome trace-event document with one complete ("X") event per span.
+
+    Viewers nest spans on each thread track by their start time and duration;
+    the depth and context are also included in each event's args.
+    """
+    trace_events: list[dict[str, Any]] = []
+    thread_name_by_id: dict[int, str] = {}
+    for timing in sorted(timings, key=lambda t: t.start_seconds):
+        thread_name_by_id.setdefault(timing.thread_id, timing.thread_name)
+        trace_events.append(
+            {
+                "name": timing.name,
+                "cat": "failed" if timing.is_failed else "span",
+                "ph": "X",
+                "ts": round(timing.start_seconds * 1_000_000, 3),
+                "dur": round(timing.duration_seconds * 1_000_000, 3),
+                "pid": pid,
+                "tid": timing.thread_id,
+                "args": {"depth": timing.depth, "is_failed": timing.is_failed, **timing.context},
+            }
+        )
+    for thread_id, thread_name in thread_name_by_id.items():
+        trace_events.append(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}}
+        )
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+@pure
+def format_span_timing_summary(timings: Sequence[SpanTiming], row_count: int = DEFAULT_SPAN_SUMMARY_ROW_COUNT) -> str:
+    """Format a table of the span names with the most total time, slowest first."""
+    total_by_name: dict[str, float] = {}
+    max_by_name: dict[str, float] = {}
+    count_by_name: dict[str, int] = {}
+    for timing in timings:
+        total_by_name[timing.name] = total_by_name.get(timing.name, 0.0) + timing.duration_seconds
+        max_by_name[timing.name] = max(max_by_name.get(timing.name, 0.0), timing.duration_seconds)
+        count_by_name[timing.name] = count_by_name.get(timing.name, 0) + 1
+    top_names = sorted(total_by_name, key=lambda name: total_by_name[name], reverse=True)[:row_count]
+    lines = [f"{'total (s)':>10}  {'max (s)':>10}  {'count':>6}  span"]
+    for name in top_names:
+        lines.append(f"{total_by_name[name]:>10.3f}  {max_by_name[name]:>10.3f}  {count_by_name[name]:>6}  {name}")
+    return "\n".join(lines)
+
+
+def write_chrome_trace(timings: Sequence[SpanTiming], path: Path) -> None:
+    """Write the spans to path as Chrome trace-event JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(build_chrome_trace(timings, os.getpid()), default=str))
@@ -0,0 +1,138 @@
+import contextvars
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from imbue.imbue_common.logging import info_span
+from imbue.imbue_common.logging import log_span
+from imbue.imbue_common.logging import setup_logging
+from imbue.imbue_common.logging import trace_span
+from imbue.imbue_common.span_profiling import SpanTiming
+from imbue.imbue_common.span_profiling import build_chrome_trace
+from imbue.imbue_common.span_profiling import format_span_timing_summary
+from imbue.imbue_common.span_profiling import get_active_span_profiler
+from imbue.imbue_common.span_profiling import start_span_profiling
+from imbue.imbue_common.span_profiling import stop_span_profiling
+from imbue.imbue_common.span_profiling import write_chrome_trace
+
+
+def _make_timing(name: str, duration_seconds: float, thread_id: int = 1, depth: int = 0) -> SpanTiming:
+    return SpanTiming(
+        name=name,
+        start_seconds=0.5,
+        duration_seconds=duration_seconds,
+        thread_id=thread_id,
+        thread_name=f"thread-{thread_id}",
+        depth=depth,
+        is_failed=False,
+        context={},
+    )
+
+
+def test_profiler_records_nested_spans_with_depth_and_formatted_names() -> None:
+    # Debug and trace are disabled, which must not stop spans from being profiled
+    setup_logging(level="INFO")
+    profiler = start_span_profiling()
+    try:
+        with log_span("Listing agents on {}", "host-1", host="host-1"):
+            with trace_span("Running {}", "ls"):
+                pass
+            with info_span("Copying files"):
+                pass
+    finally:
+        stop_span_profiling()
+
+    timings_by_name = {timing.name: timing for timing in profiler.get_timings()}
+    assert set(timings_by_name) == {"Listing agents on host-1", "Running ls", "Copying files"}
+    assert timings_by_name["Listing agents on host-1"].depth == 0
+    assert timings_by_name["Listing agents on host-1"].context == {"host": "host-1"}
+    assert timings_by_name["Running ls"].depth == 1
+    assert timings_by_name["Copying files"].depth == 1
+    outer = timings_by_name["Listing agents on host-1"]
+    inner = timings_by_name["Running ls"]
+    assert outer.start_seconds <= inner.start_seconds
+    assert inner.start_seconds + inner.duration_seconds <= outer.start_seconds + outer.duration_seconds
+
+
+def _run_worker_span() -> None:
+    with log_span("in worker"):
+        pass
+
+
+def test_profiler_records_failed_spans_and_spans_from_other_threads() -> None:
+    profiler = start_span_profiling()
+    try:
+        with pytest.raises(ValueError):
+            with log_span("failing"):
+                raise ValueError("boom")
+        with log_span("on main thread"):
+            # Threads see the profiler when they run in a copy of the context that started it
+            context = contextvars.copy_context()
+            worker = threading.Thread(target=lambda: context.run(_run_worker_span), name="span-worker")
+            worker.start()
+            worker.join()
+    finally:
+        stop_span_profiling()
+
+    timings_by_name = {timing.name: timing for timing in profiler.get_timings()}
+    assert timings_by_name["failing"].is_failed
+    assert not timings_by_name["on main thread"].is_failed
+    # Nesting is tracked per thread
+    assert timings_by_name["in worker"].depth == 0
+    assert timings_by_name["in worker"].thread_name == "span-worker"
+    assert timings_by_name["in worker"].thread_id != timings_by_name["on main thread"].thread_id
+
+
+def test_spans_on_threads_outside_the_profiling_context_are_not_recorded() -> None:
+    profiler = start_span_profiling()
+    try:
+        worker = threading.Thread(target=_run_worker_span)
+        worker.start()
+        worker.join()
+    finally:
+        stop_span_profiling()
+
+    assert profiler.get_timings() == []
+
+
+def test_spans_are_not_recorded_when_profiling_is_off() -> None:
+    profiler = start_span_profiling()
+    stop_span_profiling()
+    assert get_active_span_profiler() is None
+
+    with log_span("not recorded"):
+        pass
+
+    assert profiler.get_timings() == []
+
+
+def test_build_chrome_trace_emits_complete_events_and_thread_names() -> None:
+    trace = build_chrome_trace([_make_timing("outer", 2.0), _make_timing("other", 0.25, thread_id=2)], pid=42)
+
+    complete_events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert complete_events[0]["name"] == "outer"
+    assert complete_events[0]["ts"] == 500000
+    assert complete_events[0]["dur"] == 2000000
+    assert complete_events[0]["pid"] == 42
+    assert complete_events[0]["tid"] == 1
+    metadata_events = [event for event in trace["traceEvents"] if event["ph"] == "M"]
+    assert {event["tid"]: event["args"]["name"] for event in metadata_events} == {1: "thread-1", 2: "thread-2"}
+
+
+def test_format_span_timing_summary_orders_by_total_time() -> None:
+    summary = format_span_timing_summary(
+        [_make_timing("fast", 0.1), _make_timing("repeated", 0.3), _make_timing("repeated", 0.3)], row_count=1
+    )
+
+    lines = summary.splitlines()
+    assert len(lines) == 2
+    assert lines[1].split() == ["0.600", "0.300", "2", "repeated"]
+
+
+def test_write_chrome_trace_writes_json(tmp_path: Path) -> None:
+    trace_path = tmp_path / "profiles" / "trace.json"
+    write_chrome_trace([_make_timing("outer", 1.0)], trace_path)
+
+    assert json.loads(trace_path.read_text())["traceEvents"][0]["name"] == "outer"
@@ -19,6 +19,7 @@ from imbue.imbue_common.logging import log_span
 from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import HostConnectionError
 from imbue.mngr.errors import SendMessageError
+from imbue.mngr.errors import TmuxControlModeError
 from imbue.mngr.hosts.common import check_agent_type_known
 from imbue.mngr.hosts.common import determine_lifecycle_state
 from imbue.mngr.hosts.tmux import LONG_MESSAGE_THRESHOLD
@@ -116,13 +117,13 @@ class BaseAgent(AgentInterface[AgentConfigT]):
         logger.trace("Assembled command: {}", command)
         return command
 
-    def _get_agent_dir(self) -> Path:
+    def get_agent_dir(self) -> Path:
         """Get the agent's state directory path."""
         return self.host.host_dir / "agents" / str(self.id)
 
     def _get_data_path(self) -> Path:
         """Get the path to the agent's data.json file."""
-        return self._get_agent_dir() / "data.json"
+        return self.get_agent_dir() / "data.json"
 
     def _read_data(self) -> dict[str, Any]:
         """Read the agent's data.json file."""
@@ -221,7 +222,7 @@ class BaseAgent(AgentInterface[AgentConfigT]):
             ps_output = ps_result.stdout if ps_result.success else ""
 
             # Check if the active file exists
-            is_active = self._check_file_exists(self._get_agent_dir() / "active")
+            is_active = self._check_file_exists(self.get_agent_dir() / "active")
 
             expected_process_name = self.get_expected_process_name()
             is_type_known = check_agent_type_known(str(self.agent_type), self.mngr_ctx.config)
@@ -456,9 +457,10 @@ class BaseAgent(AgentInterface[AgentConfigT]):
         instead of being processed by the application's input handler.
         """
         with log_span("Waiting for TUI to be ready (looking for: {})", indicator):
-            if not poll_until(
-                lambda: self._check_pane_contains(tmux_target, indicator),
-                timeout=_TUI_READY_TIMEOUT_SECONDS,
+            if not self._wait_for_pane_condition(
+                tmux_target,
+                lambda content: indicator in content,
+                timeout_seconds=_TUI_READY_TIMEOUT_SECONDS,
             ):
                 pane_content = self._capture_pane_content(tmux_target)
                 if pane_content is not None:
@@ -485,31 +487,49 @@ class BaseAgent(AgentInterface[AgentConfigT]):
            (similarly normalized) is present.
         """
         with log_span("Waiting for pasted content to appear"):
-            if not poll_until(
-                lambda: self._is_paste_visible(tmux_target, message),
-                timeout=_SEND_MESSAGE_TIMEOUT_SECONDS,
+            if not self._wait_for_pane_condition(
+                tmux_target,
+                lambda content: _check_paste_content(content, message),
+                timeout_seconds=_SEND_MESSAGE_TIMEOUT_SECONDS,
             ):
                 self._raise_send_timeout(
                     tmux_target,
                     f"Timeout waiting for pasted content to appear (waited {_SEND_MESSAGE_TIMEOUT_SECONDS:.1f}s)",
                 )
 
-    def _is_paste_visible(self, tmux_target: str, message: str) -> bool:
-        """Check whether the pasted message is visible in the pane.
-
-        Delegates to the pure ``_check_paste_content`` function after
-        capturing the pane. Returns False if the pane cannot be captured.
+    def _wait_for_pane_condition(
+        self,
+        tmux_target: str,
+        condition: Callable[[str], bool],
+        timeout_seconds: float,
+    ) -> bool:
+        """Wait until the pane content satisfies condition, returning False on timeout.
+
+        When the host can stream pane output (a tmux control-mode client over the
+        existing SSH connection), the pane is only re-captured after it produces
+        output, instead of issuing a capture-pane command every poll interval.
+        Otherwise, or if the stream is lost mid-wait, falls back to polling.
         """
+        deadline = time.monotonic() + timeout_seconds
+        watcher = self.host.get_tmux_pane_watcher(self.session_name)
+        if watcher is not None:
+            try:
+                return watcher.wait_for_pane_content(tmux_target, condition, timeout_seconds)
+            except TmuxControlModeError as e:
+                logger.debug("Lost tmux pane output stream, falling back to polling: {}", e)
+        return poll_until(
+            lambda: self._check_pane_condition(tmux_target, condition),
+            timeout=max(deadline - time.monotonic(), 0.0),
+        )
+
+    def _check_pane_condition(self, tmux_target: str, condition: Callable[[str], bool]) -> bool:
+        """Capture the pane and check condition, returning False if the pane cannot be captured."""
         content = self._capture_pane_content(tmux_target)
-        if content is None:
-            return False
-        return _check_paste_content(content, message)
+        return content is not None and condition(content)
 
     def _check_pane_contains(self, tmux_target: str, text: str) -> bool:
         """Check if the pane content contains the given text."""
-        content = self._capture_pane_content(tmux_target)
-        found = content is not None and text in content
-        return found
+        return self._check_pane_condition(tmux_target, lambda content: text in content)
 
     def _send_enter_and_wait(self, tmux_target: str) -> None:
         """Send Enter to submit the message and wait for the submission signal.
@@ -625,14 +645,14 @@ class BaseAgent(AgentInterface[AgentConfigT]):
     # =========================================================================
 
     def get_reported_url(self) -> str | None:
-        status_path = self._get_agent_dir() / "status" / "url"
+        status_path = self.get_agent_dir() / "status" / "url"
         try:
             return self.host.read_text_file(status_path).strip()
         except FileNotFoundError:
             return None
 
     def get_reported_start_time(self) -> datetime | None:
-        status_path = self._get_agent_dir() / "status" / "start_time"
+        status_path = self.get_agent_dir() / "status" / "start_time"
         try:
             content = self.host.read_text_file(status_path).strip()
             return datetime.fromisoformat(content)
@@ -650,7 +670,7 @@ class BaseAgent(AgentInterface[AgentConfigT]):
         This ensures consistency across all activity writers (Python, bash, lua)
         and allows simple scripts to just touch files without writing JSON.
         """
-        activity_path = self._get_agent_dir() / "activity" / activity_type.value.lower()
+        activity_path = self.get_agent_dir() / "activity" / activity_type.value.lower()
         return self.host.get_file_mtime(activity_path)
 
     def record_activity(self, activity_type: ActivitySource) -> None:
@@ -664,7 +684,7 @@ class BaseAgent(AgentInterface[AgentConfigT]):
         Note: The authoritative activity time is the file's mtime, not the
         JSON content. The JSON is for debugging/auditing purposes.
         """
-        activity_path = self._get_agent_dir() / "activity" / activity_type.value.lower()
+        activity_path = self.get_agent_dir() / "activity" / activity_type.value.lower()
         now = datetime.now(timezone.utc)
         data = {
             "time": int(now.timestamp() * 1000),
@@ -675,7 +695,7 @@ class BaseAgent(AgentInterface[AgentConfigT]):
         logger.trace("Recorded {} activity for agent {}", activity_type, self.name)
 
     def get_reported_activity_record(self, activity_type: ActivitySource) -> str | None:
-        activity_path = self._get_agent_dir() / "activity" / activity_type.value.lower()
+        activity_path = self.get_agent_dir() / "activity" / activity_type.value.lower()
         try:
             return self.host.read_text_file(activity_path)
         except FileNotFoundError:
@@ -702,15 +722,15 @@ class BaseAgent(AgentInterface[AgentConfigT]):
     # =========================================================================
 
     def get_reported_plugin_file(self, plugin_name: str, filename: str) -> str:
-        plugin_path = self._get_agent_dir() / "plugin" / plugin_name / filename
+        plugin_path = self.get_agent_dir() / "plugin" / plugin_name / filename
         return self.host.read_text_file(plugin_path)
 
     def set_reported_plugin_file(self, plugin_name: str, filename: str, data: str) -> None:
-        plugin_path = self._get_agent_dir() / "plugin" / plugin_name / filename
+        plugin_path = self.get_agent_dir() / "plugin" / plugin_name / filename
         self.host.write_text_file(plugin_path, data)
 
     def list_reported_plugin_files(self, plugin_name: str) -> list[str]:
-        plugin_dir = self._get_agent_dir() / "plugin" / plugin_name
+        plugin_dir = self.get_agent_dir() / "plugin" / plugin_name
         try:
             result = self.host.execute_idempotent_command(f"ls -1 '{plugin_dir}'", timeout_seconds=5.0)
             if result.success:
@@ -724,7 +744,7 @@ class BaseAgent(AgentInterface[AgentConfigT]):
     # =========================================================================
 
     def get_env_vars(self) -> dict[str, str]:
-        env_path = self._get_agent_dir() / "env"
+        env_path = self.get_agent_dir() / "env"
         try:
             content = self.host.read_text_file(env_path)
             return parse_env_file(content)
@@ -734,7 +754,7 @@ class BaseAgent(AgentInterface[AgentConfigT]):
     def set_env_vars(self, env: Mapping[str, str]) -> None:
         lines = [f"{key}={value}" for key, value in env.items()]
         content = "\n".join(lines) + "\n" if lines else ""
-        env_path = self._get_agent_dir() / "env"
+        env_path = self.get_agent_dir() / "env"
         self.host.write_text_file(env_path, content)
 
     def get_env_var(self, key: str) -> str | None:
@@ -7,9 +7,13 @@ from imbue.imbue_common.logging import log_span
 from imbue.mngr.api.data_types import CreateAgentResult
 from imbue.mngr.api.discovery_events import emit_discovery_events_for_host
 from imbue.mngr.api.providers import get_provider_instance
+from imbue.mngr.api.warm_pool import claim_warm_pool_host
+from imbue.mngr.api.warm_pool import make_warm_pool_host_template
+from imbue.mngr.api.warm_pool import start_warm_pool_top_up
 from imbue.mngr.config.agent_config_registry import resolve_agent_type
 from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import DuplicateAgentNameError
+from imbue.mngr.errors import MngrError
 from imbue.mngr.hosts.host import HostLocation
 from imbue.mngr.interfaces.agent import AgentInterface
 from imbue.mngr.interfaces.host import CreateAgentOptions
@@ -79,6 +83,7 @@ def create(
     - Creates the agent state directory
     - Runs provisioning for the agent
     - Starts the agent process
+    - Tops up the provider's warm pool (for new hosts)
     - Returns information about the running agent and host.
     """
     # Allow plugins to modify the create arguments before we do anything else
@@ -183,9 +188,23 @@ def create(
         # Emit discovery events for the host and newly created agent
         emit_discovery_events_for_host(mngr_ctx.config, host)
 
+    # Replace the warm pool host this create claimed (or prepare one for the next create) in a detached
+    # process, so that the create returns as soon as the agent is up
+    if isinstance(target_host, NewHostOptions):
+        _start_warm_pool_top_up(target_host, mngr_ctx)
+
     return result
 
 
+def _start_warm_pool_top_up(target_host: NewHostOptions, mngr_ctx: MngrContext) -> None:
+    """Start topping up the warm pool that a new host was taken from, logging (rather than raising) any failure."""
+    provider = get_provider_instance(target_host.provider, mngr_ctx)
+    try:
+        start_warm_pool_top_up(provider, make_warm_pool_host_template(target_host))
+    except (MngrError, OSError) as e:
+        logger.warning("Failed to top up the warm pool of provider {}: {}", provider.name, e)
+
+
 def _write_host_env_vars(
     host: OnlineHostInterface,
     environment: HostEnvironmentOptions,
@@ -228,28 +247,31 @@ def resolve_target_host(
 
         with log_span("Calling on_before_host_create hooks"):
             mngr_ctx.pm.hook.on_before_host_create(name=host_name, provider_name=target_host.provider)
-        with log_span(
-            "Creating new host '{}' using provider '{}'",
-            host_name,
-            target_host.provider,
-            tags=target_host.tags,
-            build_args=target_host.build.build_args,
-            start_args=target_host.build.start_args,
-            lifecycle=target_host.lifecycle,
-            known_hosts_count=len(target_host.environment.known_hosts),
-            authorized_keys_count=len(target_host.environment.authorized_keys),
-        ):
-            new_host = provider.create_host(
-                name=host_name,
+
+        # Hand out an idle, pre-provisioned host when the provider keeps a warm pool of them
+        new_host = claim_warm_pool_host(provider, make_warm_pool_host_template(target_host), host_name)
+        if new_host is None:
+            with log_span(
+                "Creating new host '{}' using provider '{}'",
+                host_name,
+                target_host.provider,
                 tags=target_host.tags,
                 build_args=target_host.build.build_args,
                 start_args=target_host.build.start_args,
                 lifecycle=target_host.lifecycle,
-                known_hosts=target_host.environment.known_hosts,
-                authorized_keys=target_host.environment.authorized_keys,
-                snapshot=target_host.build.snapshot,
-            )
-
+                known_hosts_count=len(target_host.environment.known_hosts),
+                authorized_keys_count=len(target_host.environment.authorized_keys),
+            ):
+                new_host = provider.create_host(
+                    name=host_name,
+                    tags=target_host.tags,
+                    build_args=target_host.build.build_args,
+                    start_args=target_host.build.start_args,
+                    lifecycle=target_host.lifecycle,
+                    known_hosts=target_host.environment.known_hosts,
+                    authorized_keys=target_host.environment.authorized_keys,
+                    snapshot=target_host.build.snapshot,
+                )
         # Write host environment variables to the host env file (if creating a new host)
         if isinstance(target_host, NewHostOptions):
             _write_host_env_vars(new_host, target_host.environment)
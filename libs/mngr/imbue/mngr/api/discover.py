@@ -9,6 +9,10 @@ from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
 from imbue.imbue_common.logging import log_call
 from imbue.imbue_common.logging import log_span
 from imbue.imbue_common.pure import pure
+from imbue.mngr.api.discovery_cache import discover_and_save
+from imbue.mngr.api.discovery_cache import is_discovery_cache_configured
+from imbue.mngr.api.discovery_cache import load_cached_discovery
+from imbue.mngr.api.discovery_cache import start_cached_discovery_revalidation
 from imbue.mngr.api.discovery_events import resolve_provider_names_for_identifiers
 from imbue.mngr.api.providers import get_all_provider_instances
 from imbue.mngr.config.data_types import MngrContext
@@ -57,13 +61,22 @@ def _discover_provider_hosts_and_agents(
     include_destroyed: bool,
     results_lock: Lock,
     cg: ConcurrencyGroup,
+    is_cache_allowed: bool,
 ) -> None:
     """Discover hosts and agents from a single provider.
 
     This function is run in a thread by discover_hosts_and_agents.
     Results are merged into the shared agents_by_host dict under the results_lock.
+
+    When is_cache_allowed is set and the provider has cached results, those are used
+    right away and revalidated in the background (stale-while-revalidate). Fresh
+    results are always written back to the cache (if it is enabled for the provider).
     """
-    provider_results = provider.discover_hosts_and_agents(cg=cg, include_destroyed=include_destroyed)
+    provider_results = load_cached_discovery(provider, include_destroyed) if is_cache_allowed else None
+    if provider_results is not None:
+        start_cached_discovery_revalidation(provider, include_destroyed)
+    else:
+        provider_results = discover_and_save(provider, include_destroyed, cg)
 
     # Merge results into the main dict under lock
     with results_lock:
@@ -75,6 +88,7 @@ def _run_discovery(
     provider_names: tuple[str, ...] | None,
     include_destroyed: bool,
     reset_caches: bool,
+    is_cache_allowed: bool = False,
 ) -> tuple[dict[DiscoveredHost, list[DiscoveredAgent]], list[BaseProviderInstance]]:
     """Run the actual discovery against providers. Shared implementation for discover_hosts_and_agents."""
     agents_by_host: dict[DiscoveredHost, list[DiscoveredAgent]] = {}
@@ -102,6 +116,7 @@ def _run_discovery(
                     include_destroyed,
                     results_lock,
                     mngr_ctx.concurrency_group,
+                    is_cache_allowed,
                 )
             )
 
@@ -150,8 +165,20 @@ def discover_hosts_and_agents(
 
     When provider_names is explicitly provided, agent_identifiers is ignored (the caller
     already knows which providers to query).
+
+    When agent_identifiers is provided, providers with the on-disk discovery cache enabled
+    serve their cached results (revalidating them in the background) unless reset_caches
+    or safe mode is set. If the cached results do not contain every identifier, discovery
+    is run again without the cache.
     """
     with log_span("Discovering hosts and agents from providers"):
+        is_cache_allowed = not reset_caches and not mngr_ctx.is_full_discovery
+        if agent_identifiers is not None and is_cache_allowed and is_discovery_cache_configured(mngr_ctx.config):
+            cached_result = _discover_targeted_agents(mngr_ctx, provider_names, agent_identifiers, include_destroyed)
+            if _all_identifiers_found(agent_identifiers, cached_result[0]):
+                return cached_result
+            logger.debug("Discovery cache did not contain every agent identifier, discovering without the cache")
+
         # When the caller already specified providers, or no identifiers given,
         # or safe mode is enabled, skip the optimization
         if provider_names is not None or agent_identifiers is None or mngr_ctx.is_full_discovery:
@@ -177,3 +204,17 @@ def discover_hosts_and_agents(
 
         logger.debug("Event stream was stale (not all identifiers found), falling back to full scan")
         return _run_discovery(mngr_ctx, None, include_destroyed, reset_caches)
+
+
+def _discover_targeted_agents(
+    mngr_ctx: MngrContext,
+    provider_names: tuple[str, ...] | None,
+    agent_identifiers: Sequence[str],
+    include_destroyed: bool,
+) -> tuple[dict[DiscoveredHost, list[DiscoveredAgent]], list[BaseProviderInstance]]:
+    """Discover hosts and agents for targeting specific agents, using cached discovery results where possible."""
+    if provider_names is None:
+        resolved_providers = resolve_provider_names_for_identifiers(mngr_ctx.config, agent_identifiers)
+        if resolved_providers is not None:
+            provider_names = resolved_providers
+    return _run_discovery(mngr_ctx, provider_names, include_destroyed, reset_caches=False, is_cache_allowed=True)
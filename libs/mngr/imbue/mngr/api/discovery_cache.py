@@ -0,0 +1,220 @@
+import threading
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+from typing import Final
+
+from loguru import logger
+from pydantic import Field
+from pydantic import ValidationError
+
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.pure import pure
+from imbue.mngr.config.data_types import MngrConfig
+from imbue.mngr.errors import MngrError
+from imbue.mngr.interfaces.provider_instance import ProviderInstanceInterface
+from imbue.mngr.primitives import DiscoveredAgent
+from imbue.mngr.primitives import DiscoveredHost
+from imbue.mngr.primitives import ProviderInstanceName
+from imbue.mngr.utils.file_utils import atomic_write
+
+# Marker file whose modification time records when every provider's cached results were last invalidated
+_ALL_PROVIDERS_INVALIDATION_MARKER_NAME: Final[str] = "all.invalidated"
+
+
+class CachedHostAgents(FrozenModel):
+    """One host from a provider's discovery results, along with its agents."""
+
+    host: DiscoveredHost = Field(description="The discovered host")
+    agents: tuple[DiscoveredAgent, ...] = Field(description="The agents discovered on the host")
+
+
+class ProviderDiscoveryCacheEntry(FrozenModel):
+    """The discovery results of one provider, as cached on disk."""
+
+    provider_name: ProviderInstanceName = Field(description="Name of the provider instance")
+    is_destroyed_included: bool = Field(description="Whether the results include destroyed hosts")
+    discovered_at: datetime = Field(description="When the discovery that produced these results started")
+    hosts: tuple[CachedHostAgents, ...] = Field(description="The discovered hosts and their agents")
+
+    def get_agents_by_host(self) -> dict[DiscoveredHost, list[DiscoveredAgent]]:
+        return {cached_host.host: list(cached_host.agents) for cached_host in self.hosts}
+
+
+@pure
+def get_discovery_cache_dir(config: MngrConfig) -> Path:
+    """Return the directory holding the cached discovery results of each provider."""
+    return Path(config.default_host_dir).expanduser() / "discovery_cache"
+
+
+@pure
+def is_discovery_cache_configured(config: MngrConfig) -> bool:
+    """Whether the discovery cache is enabled for any provider."""
+    if config.default_discovery_cache_ttl_seconds > 0:
+        return True
+    return any(
+        provider_config.discovery_cache_ttl_seconds is not None and provider_config.discovery_cache_ttl_seconds > 0
+        for provider_config in config.providers.values()
+    )
+
+
+@pure
+def _get_entry_path(config: MngrConfig, provider_name: ProviderInstanceName, include_destroyed: bool) -> Path:
+    suffix = "-with-destroyed" if include_destroyed else ""
+    return get_discovery_cache_dir(config) / f"{provider_name}{suffix}.json"
+
+
+@pure
+def _get_invalidation_marker_path(config: MngrConfig, provider_name: ProviderInstanceName) -> Path:
+    return get_discovery_cache_dir(config) / f"{provider_name}.invalidated"
+
+
+def _get_last_invalidated_at(config: MngrConfig, provider_name: ProviderInstanceName) -> datetime | None:
+    """Return when the provider's cached results were last invalidated, if ever."""
+    marker_paths = (
+        _get_invalidation_marker_path(config, provider_name),
+        get_discovery_cache_dir(config) / _ALL_PROVIDERS_INVALIDATION_MARKER_NAME,
+    )
+    last_invalidated_at: datetime | None = None
+    for marker_path in marker_paths:
+        try:
+            invalidated_at = datetime.fromtimestamp(marker_path.stat().st_mtime, timezone.utc)
+        except FileNotFoundError:
+            continue
+        if last_invalidated_at is None or invalidated_at > last_invalidated_at:
+            last_invalidated_at = invalidated_at
+    return last_invalidated_at
+
+
+def load_cached_discovery(
+    provider: ProviderInstanceInterface,
+    include_destroyed: bool,
+) -> dict[DiscoveredHost, list[DiscoveredAgent]] | None:
+    """Return the provider's cached discovery results, or None if they are missing, expired or invalidated.
+
+    Results are served for up to the provider's discovery cache TTL, and never when
+    the cache is disabled for the provider (the default).
+    """
+    ttl_seconds = provider.get_discovery_cache_ttl_seconds()
+    if ttl_seconds <= 0:
+        return None
+    config = provider.mngr_ctx.config
+    entry_path = _get_entry_path(config, provider.name, include_destroyed)
+    try:
+        entry = ProviderDiscoveryCacheEntry.model_validate_json(entry_path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as e:
+        # An unreadable or outdated cache file is simply rebuilt by the next discovery
+        logger.debug("Ignored invalid discovery cache file {}: {}", entry_path, e)
+        return None
+
+    if entry.discovered_at < datetime.now(timezone.utc) - timedelta(seconds=ttl_seconds):
+        logger.trace("Cached discovery results of provider {} have expired", provider.name)
+        return None
+    last_invalidated_at = _get_last_invalidated_at(config, provider.name)
+    if last_invalidated_at is not None and entry.discovered_at <= last_invalidated_at:
+        logger.trace("Cached discovery results of provider {} were invalidated", provider.name)
+        return None
+    logger.trace("Using cached discovery results of provider {}", provider.name)
+    return entry.get_agents_by_host()
+
+
+def save_discovery(
+    provider: ProviderInstanceInterface,
+    include_destroyed: bool,
+    # When the discovery that produced the results started
+    discovered_at: datetime,
+    agents_by_host: dict[DiscoveredHost, list[DiscoveredAgent]],
+) -> None:
+    """Cache the provider's discovery results, if the cache is enabled for the provider.
+
+    Results are not saved when the cache was invalidated after the discovery started,
+    since they may predate the change that caused the invalidation.
+    """
+    if provider.get_discovery_cache_ttl_seconds() <= 0:
+        return
+    config = provider.mngr_ctx.config
+    last_invalidated_at = _get_last_invalidated_at(config, provider.name)
+    if last_invalidated_at is not None and discovered_at <= last_invalidated_at:
+        logger.trace("Not caching discovery results of provider {} that predate an invalidation", provider.name)
+        return
+    entry = ProviderDiscoveryCacheEntry(
+        provider_name=provider.name,
+        is_destroyed_included=include_destroyed,
+        discovered_at=discovered_at,
+        hosts=tuple(
+            CachedHostAgents(host=host_ref, agents=tuple(agent_refs))
+            for host_ref, agent_refs in agents_by_host.items()
+        ),
+    )
+    entry_path = _get_entry_path(config, provider.name, include_destroyed)
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(entry_path, entry.model_dump_json())
+    except OSError as e:
+        logger.debug("Failed to write discovery cache file {}: {}", entry_path, e)
+
+
+def invalidate_discovery_cache(config: MngrConfig, provider_name: ProviderInstanceName | None) -> None:
+    """Invalidate the cached discovery results of a provider, or of every provider when provider_name is None.
+
+    Called whenever mngr itself changes which hosts and agents exist (create, destroy,
+    rename, ...). The invalidation is recorded as the modification time of a marker
+    file, so that it also applies to results that are being revalidated concurrently.
+    """
+    cache_dir = get_discovery_cache_dir(config)
+    if not cache_dir.exists():
+        # Nothing has been cached yet, so there is nothing to invalidate
+        return
+    if provider_name is None:
+        marker_path = cache_dir / _ALL_PROVIDERS_INVALIDATION_MARKER_NAME
+    else:
+        marker_path = _get_invalidation_marker_path(config, provider_name)
+    try:
+        marker_path.touch()
+    except OSError as e:
+        logger.warning("Failed to invalidate the discovery cache: {}", e)
+
+
+def discover_and_save(
+    provider: ProviderInstanceInterface,
+    include_destroyed: bool,
+    cg: ConcurrencyGroup,
+) -> dict[DiscoveredHost, list[DiscoveredAgent]]:
+    """Run the provider's discovery and cache its results."""
+    discovered_at = datetime.now(timezone.utc)
+    agents_by_host = provider.discover_hosts_and_agents(cg=cg, include_destroyed=include_destroyed)
+    save_discovery(provider, include_destroyed, discovered_at, agents_by_host)
+    return agents_by_host
+
+
+def _revalidate_cached_discovery(provider: ProviderInstanceInterface, include_destroyed: bool) -> None:
+    try:
+        # A separate concurrency group, so that the command's own group can finish without waiting for this
+        with ConcurrencyGroup(name=f"revalidate_discovery_cache_{provider.name}") as cg:
+            discover_and_save(provider, include_destroyed, cg)
+    except (MngrError, OSError) as e:
+        logger.debug("Failed to revalidate cached discovery results of provider {}: {}", provider.name, e)
+
+
+def start_cached_discovery_revalidation(
+    provider: ProviderInstanceInterface,
+    include_destroyed: bool,
+) -> threading.Thread:
+    """Refresh the provider's cached discovery results in a background thread.
+
+    The thread is a daemon, so a short command does not wait for it on exit; the
+    cached results then stay as they were, and are revalidated by a later command
+    (or discarded once they expire).
+    """
+    thread = threading.Thread(
+        target=_revalidate_cached_discovery,
+        args=(provider, include_destroyed),
+        name=f"revalidate-discovery-cache-{provider.name}",
+        daemon=True,
+    )
+    thread.start()
+    return thread
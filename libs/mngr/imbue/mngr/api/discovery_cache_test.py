@@ -0,0 +1,148 @@
+from collections.abc import Generator
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+
+import pluggy
+import pytest
+
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.imbue_common.model_update import to_update
+from imbue.mngr.api.discover import discover_hosts_and_agents
+from imbue.mngr.api.discovery_cache import get_discovery_cache_dir
+from imbue.mngr.api.discovery_cache import is_discovery_cache_configured
+from imbue.mngr.api.discovery_cache import load_cached_discovery
+from imbue.mngr.api.discovery_cache import save_discovery
+from imbue.mngr.api.discovery_events import emit_agent_destroyed
+from imbue.mngr.api.discovery_events import emit_host_discovered
+from imbue.mngr.config.data_types import MngrConfig
+from imbue.mngr.config.data_types import MngrContext
+from imbue.mngr.config.data_types import ProviderInstanceConfig
+from imbue.mngr.primitives import AgentId
+from imbue.mngr.primitives import AgentName
+from imbue.mngr.primitives import DiscoveredAgent
+from imbue.mngr.primitives import DiscoveredHost
+from imbue.mngr.primitives import HostId
+from imbue.mngr.primitives import HostName
+from imbue.mngr.primitives import ProviderBackendName
+from imbue.mngr.primitives import ProviderInstanceName
+from imbue.mngr.providers.local.instance import LocalProviderInstance
+from imbue.mngr.utils.polling import poll_until
+from imbue.mngr.utils.testing import make_mngr_ctx
+
+_LOCAL: ProviderInstanceName = ProviderInstanceName("local")
+
+
+@pytest.fixture
+def cached_mngr_ctx(
+    temp_config: MngrConfig,
+    temp_profile_dir: Path,
+    plugin_manager: pluggy.PluginManager,
+) -> Generator[MngrContext, None, None]:
+    """A MngrContext with the discovery cache enabled for every provider."""
+    config = temp_config.model_copy_update(
+        to_update(temp_config.field_ref().default_discovery_cache_ttl_seconds, 60.0)
+    )
+    with ConcurrencyGroup(name="test") as cg:
+        yield make_mngr_ctx(config, plugin_manager, temp_profile_dir, concurrency_group=cg)
+
+
+def _make_local_provider(mngr_ctx: MngrContext, temp_host_dir: Path) -> LocalProviderInstance:
+    return LocalProviderInstance(name=_LOCAL, host_dir=temp_host_dir, mngr_ctx=mngr_ctx)
+
+
+def _make_cached_results(agent_name: str) -> dict[DiscoveredHost, list[DiscoveredAgent]]:
+    host_ref = DiscoveredHost(host_id=HostId.generate(), host_name=HostName("cached-host"), provider_name=_LOCAL)
+    agent_ref = DiscoveredAgent(
+        host_id=host_ref.host_id,
+        agent_id=AgentId.generate(),
+        agent_name=AgentName(agent_name),
+        provider_name=_LOCAL,
+    )
+    return {host_ref: [agent_ref]}
+
+
+def test_discovery_cache_is_disabled_by_default(temp_mngr_ctx: MngrContext, temp_host_dir: Path) -> None:
+    provider = _make_local_provider(temp_mngr_ctx, temp_host_dir)
+
+    save_discovery(provider, False, datetime.now(timezone.utc), _make_cached_results("agent"))
+
+    assert not is_discovery_cache_configured(temp_mngr_ctx.config)
+    assert not get_discovery_cache_dir(temp_mngr_ctx.config).exists()
+    assert load_cached_discovery(provider, False) is None
+
+
+def test_discovery_cache_can_be_enabled_for_a_single_provider(temp_config: MngrConfig) -> None:
+    provider_config = ProviderInstanceConfig(backend=ProviderBackendName("local"), discovery_cache_ttl_seconds=30.0)
+    config = temp_config.model_copy_update(to_update(temp_config.field_ref().providers, {_LOCAL: provider_config}))
+
+    assert is_discovery_cache_configured(config)
+
+
+def test_discovery_cache_round_trips_results(cached_mngr_ctx: MngrContext, temp_host_dir: Path) -> None:
+    provider = _make_local_provider(cached_mngr_ctx, temp_host_dir)
+    results = _make_cached_results("agent")
+
+    save_discovery(provider, False, datetime.now(timezone.utc), results)
+
+    assert load_cached_discovery(provider, False) == results
+    # Results without destroyed hosts are not used when destroyed hosts were asked for
+    assert load_cached_discovery(provider, True) is None
+
+
+def test_discovery_cache_ignores_expired_results(cached_mngr_ctx: MngrContext, temp_host_dir: Path) -> None:
+    provider = _make_local_provider(cached_mngr_ctx, temp_host_dir)
+
+    save_discovery(provider, False, datetime.now(timezone.utc) - timedelta(minutes=5), _make_cached_results("agent"))
+
+    assert load_cached_discovery(provider, False) is None
+
+
+def test_discovery_events_invalidate_cached_results(cached_mngr_ctx: MngrContext, temp_host_dir: Path) -> None:
+    provider = _make_local_provider(cached_mngr_ctx, temp_host_dir)
+    other_provider_host = DiscoveredHost(
+        host_id=HostId.generate(), host_name=HostName("other"), provider_name=ProviderInstanceName("other")
+    )
+    save_discovery(provider, False, datetime.now(timezone.utc), _make_cached_results("agent"))
+
+    # Events about other providers leave the cached results alone
+    emit_host_discovered(cached_mngr_ctx.config, other_provider_host)
+    assert load_cached_discovery(provider, False) is not None
+
+    emit_agent_destroyed(cached_mngr_ctx.config, AgentId.generate(), HostId.generate())
+    assert load_cached_discovery(provider, False) is None
+
+
+def test_discovery_cache_does_not_save_results_that_predate_an_invalidation(
+    cached_mngr_ctx: MngrContext, temp_host_dir: Path
+) -> None:
+    provider = _make_local_provider(cached_mngr_ctx, temp_host_dir)
+    save_discovery(provider, False, datetime.now(timezone.utc), _make_cached_results("agent"))
+    discovery_started_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+    emit_agent_destroyed(cached_mngr_ctx.config, AgentId.generate(), HostId.generate())
+    save_discovery(provider, False, discovery_started_at, _make_cached_results("agent"))
+
+    assert load_cached_discovery(provider, False) is None
+
+
+def test_discover_hosts_and_agents_serves_cached_results_and_revalidates_them(
+    cached_mngr_ctx: MngrContext, temp_host_dir: Path
+) -> None:
+    provider = _make_local_provider(cached_mngr_ctx, temp_host_dir)
+    cached_results = _make_cached_results("cached-agent")
+    save_discovery(provider, False, datetime.now(timezone.utc), cached_results)
+
+    agents_by_host, _ = discover_hosts_and_agents(
+        cached_mngr_ctx,
+        provider_names=("local",),
+        agent_identifiers=("cached-agent",),
+        include_destroyed=False,
+        reset_caches=False,
+    )
+
+    # The cached agent does not exist, so it can only have come from the cache
+    assert agents_by_host == cached_results
+    # The background revalidation then replaces the cached results with what the provider reports
+    assert poll_until(lambda: load_cached_discovery(provider, False) != cached_results, timeout=10.0)
@@ -22,6 +22,7 @@ from imbue.imbue_common.event_envelope import IsoTimestamp
 from imbue.imbue_common.logging import format_nanosecond_iso_timestamp
 from imbue.imbue_common.logging import generate_log_event_id
 from imbue.imbue_common.pure import pure
+from imbue.mngr.api.discovery_cache import invalidate_discovery_cache
 from imbue.mngr.config.data_types import MngrConfig
 from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import MngrError
@@ -240,6 +241,7 @@ def emit_agent_discovered(config: MngrConfig, agent: DiscoveredAgent) -> None:
     """Build and append an agent discovery event."""
     event = make_agent_discovery_event(agent)
     append_discovery_event(config, event)
+    invalidate_discovery_cache(config, agent.provider_name)
     logger.trace("Emitted agent_discovered event for {}", agent.agent_name)
 
 
@@ -247,6 +249,7 @@ def emit_host_discovered(config: MngrConfig, host: DiscoveredHost) -> None:
     """Build and append a host discovery event."""
     event = make_host_discovery_event(host)
     append_discovery_event(config, event)
+    invalidate_discovery_cache(config, host.provider_name)
     logger.trace("Emitted host_discovered event for {}", host.host_name)
 
 
@@ -262,6 +265,8 @@ def emit_agent_destroyed(config: MngrConfig, agent_id: AgentId, host_id: HostId)
         host_id=host_id,
     )
     append_discovery_event(config, event)
+    # The event does not name the provider, so the cached results of every provider are invalidated
+    invalidate_discovery_cache(config, None)
     logger.trace("Emitted agent_destroyed event for {}", agent_id)
 
 
@@ -281,6 +286,7 @@ def emit_host_destroyed(
         agent_ids=tuple(agent_ids),
     )
     append_discovery_event(config, event)
+    invalidate_discovery_cache(config, None)
     logger.trace("Emitted host_destroyed event for {}", host_id)
 
 
@@ -1,4 +1,10 @@
+import base64
+import binascii
+import gzip
 import hashlib
+import heapq
+import io
+import itertools
 import json
 import queue
 import re
@@ -6,7 +12,11 @@ import shlex
 import tempfile
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
 from collections.abc import Sequence
 from datetime import datetime
 from datetime import timezone
@@ -103,6 +113,16 @@ class EventSourceInfo(FrozenModel):
     is_current_file_present: bool = Field(default=True, description="Whether events.jsonl exists in this source")
 
 
+class _EventFileContent(FrozenModel):
+    """Content of an event file from a start offset, along with the size of the whole file."""
+
+    content: str = Field(description="Decoded content of the file from start_offset to file_size")
+    start_offset: int = Field(
+        description="Byte offset the content starts at (0 if the file is shorter than the requested offset)"
+    )
+    file_size: int = Field(description="Size of the whole file in bytes when it was read")
+
+
 class _AllEventsStreamState(MutableModel):
     """Mutable state for the all-events streaming loop."""
 
@@ -291,7 +311,7 @@ def _read_event_content_via_host(
     """Read event content by executing cat on the online host."""
     with log_span("Reading event file '{}' for {} via host", event_file_name, display_name):
         file_path = events_path / event_file_name
-        result = online_host.execute_idempotent_command(
+        result = online_host.execute_bulk_read_command(
             f"cat {shlex.quote(str(file_path))}",
             timeout_seconds=30.0,
         )
@@ -300,6 +320,168 @@ def _read_event_content_via_host(
         return result.stdout
 
 
+# Prints, for each existing file, its relative path, its size, the offset its content
+# starts at, and then that content. Arguments are (relative path, absolute path, start
+# offset) triples. The file size is captured first and exactly that many bytes are
+# printed, so the output stays consistent if the file is appended to meanwhile.
+_BULK_EVENT_READ_SCRIPT: Final[str] = (
+    "while [ $# -ge 3 ]; do"
+    ' if [ -f "$2" ]; then'
+    ' s=$(wc -c < "$2" | tr -d " "); o=$3; if [ "$s" -lt "$o" ]; then o=0; fi;'
+    ' printf "%s\\n%s\\n%s\\n" "$1" "$s" "$o";'
+    ' tail -c +$((o + 1)) "$2" | head -c $((s - o));'
+    " fi; shift 3; done"
+)
+
+
+# Printed after the uncompressed output of _BULK_EVENT_READ_SCRIPT, to mark where it ends
+_UNCOMPRESSED_EVENT_READ_SENTINEL: Final[str] = "."
+
+
+@pure
+def _build_event_read_command(
+    events_path: Path, start_offset_by_relative_path: Mapping[str, int], is_compressed: bool
+) -> str:
+    """Build a command that prints several event files as one stream, optionally gzip-compressed and base64-encoded."""
+    args: list[str] = []
+    for relative_path, start_offset in start_offset_by_relative_path.items():
+        args.extend((relative_path, str(events_path / relative_path), str(start_offset)))
+    quoted_args = " ".join(shlex.quote(arg) for arg in args)
+    read_command = f"sh -c {shlex.quote(_BULK_EVENT_READ_SCRIPT)} sh {quoted_args}"
+    if not is_compressed:
+        # Followed by a sentinel, since the host drops the trailing newline of the output (which may belong to a file)
+        return f"{read_command} && printf {_UNCOMPRESSED_EVENT_READ_SENTINEL}"
+    return f"command -v gzip >/dev/null && command -v base64 >/dev/null || exit 127; {read_command} | gzip -c | base64"
+
+
+@pure
+def _parse_event_read_output(stdout: str, is_compressed: bool) -> dict[str, _EventFileContent]:
+    """Decode and parse the output of _build_event_read_command into file contents by relative path."""
+    if is_compressed:
+        try:
+            output = gzip.decompress(base64.b64decode(stdout))
+        except (binascii.Error, OSError, EOFError) as e:
+            raise MngrError(f"Failed to decode bulk event file read output: {e}") from e
+    elif stdout.endswith(_UNCOMPRESSED_EVENT_READ_SENTINEL):
+        output = stdout.removesuffix(_UNCOMPRESSED_EVENT_READ_SENTINEL).encode("utf-8")
+    else:
+        raise MngrError("Truncated event file read output")
+
+    content_by_relative_path: dict[str, _EventFileContent] = {}
+    offset = 0
+    while offset < len(output):
+        header_lines = output[offset:].split(b"\n", 3)
+        if len(header_lines) != 4 or not header_lines[1].isdigit() or not header_lines[2].isdigit():
+            raise MngrError(f"Unexpected bulk event file read output at byte {offset}")
+        relative_path = header_lines[0].decode("utf-8")
+        file_size = int(header_lines[1])
+        start_offset = int(header_lines[2])
+        content_start = offset + sum(len(line) + 1 for line in header_lines[:3])
+        content_end = content_start + file_size - start_offset
+        if content_end > len(output):
+            raise MngrError(f"Truncated bulk event file read output for '{relative_path}'")
+        content_by_relative_path[relative_path] = _EventFileContent(
+            content=output[content_start:content_end].decode("utf-8", errors="replace"),
+            start_offset=start_offset,
+            file_size=file_size,
+        )
+        offset = content_end
+    return content_by_relative_path
+
+
+def _read_event_files_via_host(
+    online_host: OnlineHostInterface,
+    events_path: Path,
+    start_offset_by_relative_path: Mapping[str, int],
+    display_name: str,
+    is_compressed: bool = True,
+) -> dict[str, _EventFileContent]:
+    """Read several event files from their start offsets with a single command on the host.
+
+    The files are shipped back as one (by default compressed) stream, which replaces
+    a round trip per file (and the uncompressed transfer of each) for remote hosts.
+    Files that do not exist are omitted from the result.
+    """
+    if not start_offset_by_relative_path:
+        return {}
+    with log_span("Reading {} event file(s) for {} via host", len(start_offset_by_relative_path), display_name):
+        result = online_host.execute_idempotent_command(
+            _build_event_read_command(events_path, start_offset_by_relative_path, is_compressed),
+            timeout_seconds=60.0,
+        )
+        if not result.success:
+            raise MngrError(f"Failed to read event files: {result.stderr}")
+        return _parse_event_read_output(result.stdout, is_compressed)
+
+
+def _is_remote_host_target(target: EventsTarget) -> bool:
+    """Whether the target is read through an online host that is not the local machine."""
+    return target.online_host is not None and target.events_path is not None and not target.online_host.is_local
+
+
+def _prefetch_event_files(target: EventsTarget, relative_paths: Sequence[str]) -> dict[str, _EventFileContent] | None:
+    """Fetch whole event files from a remote host in one transfer.
+
+    Returns None for targets that are not on a remote host, or if the bulk read
+    fails (e.g. gzip is missing on the host), in which case callers read each
+    file on its own.
+    """
+    if not relative_paths or not _is_remote_host_target(target):
+        return None
+    assert target.online_host is not None and target.events_path is not None
+    try:
+        return _read_event_files_via_host(
+            target.online_host,
+            target.events_path,
+            {relative_path: 0 for relative_path in relative_paths},
+            target.display_name,
+        )
+    except MngrError as e:
+        logger.debug("Bulk read of event files failed for {}, reading them one by one: {}", target.display_name, e)
+        return None
+
+
+def _read_event_file_from_offset(target: EventsTarget, relative_file_path: str, byte_offset: int) -> _EventFileContent:
+    """Read an event file from a byte offset, starting over from 0 if the file is now shorter than the offset.
+
+    On remote hosts only the bytes after the offset are transferred, compressed
+    unless that fails (e.g. because gzip is missing on the host).
+    """
+    if _is_remote_host_target(target):
+        assert target.online_host is not None and target.events_path is not None
+        start_offset_by_relative_path = {relative_file_path: byte_offset}
+        try:
+            file_contents = _read_event_files_via_host(
+                target.online_host, target.events_path, start_offset_by_relative_path, target.display_name
+            )
+        except MngrError as e:
+            logger.debug(
+                "Compressed read of '{}' failed for {}, reading it as is: {}",
+                relative_file_path,
+                target.display_name,
+                e,
+            )
+            file_contents = _read_event_files_via_host(
+                target.online_host,
+                target.events_path,
+                start_offset_by_relative_path,
+                target.display_name,
+                is_compressed=False,
+            )
+        file_content = file_contents.get(relative_file_path)
+        if file_content is None:
+            raise MngrError(f"Event file '{relative_file_path}' does not exist")
+        return file_content
+
+    content_bytes = read_event_content(target, relative_file_path).encode("utf-8")
+    start_offset = byte_offset if len(content_bytes) >= byte_offset else 0
+    return _EventFileContent(
+        content=content_bytes[start_offset:].decode("utf-8", errors="replace"),
+        start_offset=start_offset,
+        file_size=len(content_bytes),
+    )
+
+
 # =============================================================================
 # Source filtering
 # =============================================================================
@@ -488,7 +670,7 @@ def _discover_event_sources_via_host(
     """Find all events.jsonl files recursively under events_path via host commands."""
     with log_span("Discovering event sources via host"):
         cmd = f"find {shlex.quote(str(events_path))} -name 'events.jsonl*' -type f 2>/dev/null | sort; true"
-        result = online_host.execute_idempotent_command(cmd, timeout_seconds=15.0)
+        result = online_host.execute_bulk_read_command(cmd, timeout_seconds=15.0)
         if not result.stdout.strip():
             return []
 
@@ -605,29 +787,97 @@ def _group_volume_files_into_sources(files: Sequence[tuple[str, str]]) -> list[E
 # =============================================================================
 
 
-def _read_events_from_file(
+def _read_event_file(
     target: EventsTarget,
-    # Path to the file relative to the events directory (e.g. "messages/events.jsonl")
     relative_file_path: str,
-    source_hint: str,
-) -> tuple[list[EventRecord], int]:
-    """Read and parse all events from a single JSONL file.
-
-    Returns (events, byte_length) where byte_length is the size of the raw content.
-    """
+    prefetched_content_by_path: Mapping[str, _EventFileContent] | None,
+) -> _EventFileContent | None:
+    """Read a whole event file (or take it from a bulk prefetch), returning None if it cannot be read."""
+    if prefetched_content_by_path is not None:
+        return prefetched_content_by_path.get(relative_file_path)
     try:
         content = read_event_content(target, relative_file_path)
     except (MngrError, OSError) as e:
         logger.trace("Failed to read event file '{}': {}", relative_file_path, e)
-        return [], 0
+        return None
+    return _EventFileContent(content=content, start_offset=0, file_size=len(content.encode("utf-8")))
+
 
-    events: list[EventRecord] = []
-    for line in content.split("\n"):
+def _iter_events_in_content(content: str, source_hint: str) -> Iterator[EventRecord]:
+    """Parse the events of one JSONL file lazily, skipping lines that cannot be parsed."""
+    for line in io.StringIO(content):
         record = parse_event_line(line, source_hint)
         if record is not None:
-            events.append(record)
+            yield record
+
+
+@pure
+def _get_source_file_paths(source: EventSourceInfo) -> list[str]:
+    """Paths of a source's files relative to the events directory: rotated files oldest first, then the current file."""
+    file_names = list(source.rotated_files)
+    if source.is_current_file_present:
+        file_names.append(_EVENTS_JSONL_FILENAME)
+    return [f"{source.source_path}/{file_name}" if source.source_path else file_name for file_name in file_names]
 
-    return events, len(content.encode("utf-8"))
+
+def _iter_source_events(
+    target: EventsTarget,
+    source: EventSourceInfo,
+    cel_include_filters: Sequence[Any],
+    cel_exclude_filters: Sequence[Any],
+    byte_offsets: dict[str, int],
+    prefetched_content_by_path: Mapping[str, _EventFileContent] | None,
+) -> Iterator[EventRecord]:
+    """Yield the events of one source that pass the CEL filters, in file order.
+
+    Rotated files are read oldest first, followed by the current events.jsonl.
+    Unless the files were prefetched, each file is only read once the previous
+    one is exhausted, so at most one file of the source is held in memory. The
+    byte length of the current file is recorded in byte_offsets when it is read.
+    """
+    for relative_path in _get_source_file_paths(source):
+        file_content = _read_event_file(target, relative_path, prefetched_content_by_path)
+        if file_content is None:
+            continue
+        if _extract_filename(relative_path) == _EVENTS_JSONL_FILENAME:
+            byte_offsets[source.source_path] = file_content.file_size
+        for event in _iter_events_in_content(file_content.content, source.source_path):
+            if _event_passes_cel_filters(event, cel_include_filters, cel_exclude_filters):
+                yield event
+
+
+def iter_historical_events(
+    target: EventsTarget,
+    sources: Sequence[EventSourceInfo],
+    cel_include_filters: Sequence[Any],
+    cel_exclude_filters: Sequence[Any],
+    byte_offsets: dict[str, int],
+) -> Iterator[EventRecord]:
+    """Yield the events of all sources (rotated files and current files) in timestamp order.
+
+    Every events file is appended to in timestamp order, so the sources are
+    combined with a k-way merge instead of a sort: the first events are
+    available as soon as the oldest file of each source has been read, and
+    only one file per source is held in memory at a time. Ties keep the order
+    of the sources. For remote hosts, all files are instead fetched up front in
+    a single compressed transfer, since a round trip per file costs far more.
+
+    byte_offsets is filled in as the iterator is consumed, mapping each
+    source_path to the byte length of its current events.jsonl (for
+    subsequent tailing). It is complete once the iterator is exhausted.
+    """
+    for source in sources:
+        byte_offsets[source.source_path] = 0
+    prefetched_content_by_path = _prefetch_event_files(
+        target, [relative_path for source in sources for relative_path in _get_source_file_paths(source)]
+    )
+    source_iterators = [
+        _iter_source_events(
+            target, source, cel_include_filters, cel_exclude_filters, byte_offsets, prefetched_content_by_path
+        )
+        for source in sources
+    ]
+    return heapq.merge(*source_iterators, key=lambda e: e.timestamp)
 
 
 def read_all_historical_events(
@@ -641,37 +891,10 @@ def read_all_historical_events(
     Returns (sorted_events, byte_offsets) where byte_offsets maps source_path to the
     byte length of the current events.jsonl (for subsequent tailing).
     """
-    all_events: list[EventRecord] = []
     byte_offsets: dict[str, int] = {}
-
-    for source in sources:
-        source_hint = source.source_path
-
-        # Read rotated files (oldest first)
-        for rotated_file in source.rotated_files:
-            relative_path = f"{source.source_path}/{rotated_file}" if source.source_path else rotated_file
-            events, _ = _read_events_from_file(target, relative_path, source_hint)
-            all_events.extend(events)
-
-        # Read current file
-        if source.is_current_file_present:
-            relative_path = (
-                f"{source.source_path}/{_EVENTS_JSONL_FILENAME}" if source.source_path else _EVENTS_JSONL_FILENAME
-            )
-            events, byte_length = _read_events_from_file(target, relative_path, source_hint)
-            all_events.extend(events)
-            byte_offsets[source.source_path] = byte_length
-        else:
-            byte_offsets[source.source_path] = 0
-
-    # Sort by timestamp
-    sorted_events = sort_events_by_timestamp(all_events)
-
-    # Apply CEL filters
-    sorted_events = [
-        e for e in sorted_events if _event_passes_cel_filters(e, cel_include_filters, cel_exclude_filters)
-    ]
-
+    sorted_events = list(
+        iter_historical_events(target, sources, cel_include_filters, cel_exclude_filters, byte_offsets)
+    )
     return sorted_events, byte_offsets
 
 
@@ -680,24 +903,17 @@ def read_all_historical_events(
 # =============================================================================
 
 
-def _collect_historical_events(
+def _discover_historical_sources(
     target: EventsTarget,
     state: _AllEventsStreamState,
-    cel_include_filters: Sequence[Any],
-    cel_exclude_filters: Sequence[Any],
     source_filters: Sequence[str],
-) -> tuple[list[EventRecord], list[EventSourceInfo], dict[str, int]]:
-    """Discover sources and read all historical/archived events (Phases 1 and 3)."""
-    with log_span("Reading historical events for {}", target.display_name):
-        sources = filter_sources_by_name(discover_event_sources(target), source_filters)
-        all_events, initial_byte_offsets = read_all_historical_events(
-            target, sources, cel_include_filters, cel_exclude_filters
-        )
-        for source in sources:
-            state.known_source_paths.add(source.source_path)
-            state.known_rotated_files[source.source_path] = set(source.rotated_files)
-
-    return all_events, sources, initial_byte_offsets
+) -> list[EventSourceInfo]:
+    """Discover the event sources to read and record them (and their rotated files) as known."""
+    sources = filter_sources_by_name(discover_event_sources(target), source_filters)
+    for source in sources:
+        state.known_source_paths.add(source.source_path)
+        state.known_rotated_files[source.source_path] = set(source.rotated_files)
+    return sources
 
 
 def _start_tail_threads_for_sources(
@@ -729,21 +945,25 @@ def _start_tail_threads_for_sources(
 
 
 def _emit_historical_events(
-    all_events: list[EventRecord],
+    events: Iterable[EventRecord],
     state: _AllEventsStreamState,
     on_event: Callable[[EventRecord], None],
     head_count: int | None,
     tail_count: int | None,
 ) -> None:
-    """Apply head/tail truncation and emit historical events, deduplicating by event_id."""
+    """Apply head/tail truncation and emit historical events, deduplicating by event_id.
+
+    Events are emitted as they are produced by the iterable, except in tail
+    mode, where only the last tail_count events are kept until it is exhausted.
+    """
     if head_count is not None:
-        all_events = all_events[:head_count]
+        events = itertools.islice(events, head_count)
     elif tail_count is not None:
-        all_events = all_events[-tail_count:]
+        events = deque(events, maxlen=tail_count)
     else:
         pass
 
-    for event in all_events:
+    for event in events:
         if event.event_id in state.emitted_event_ids:
             continue
         state.emitted_event_ids.add(event.event_id)
@@ -772,12 +992,29 @@ def stream_all_events(
     offset_dir: tempfile.TemporaryDirectory[str] | None = None
 
     try:
-        # Discover sources and read all historical events
-        all_events, sources, initial_byte_offsets = _collect_historical_events(
-            target, state, cel_include_filters, cel_exclude_filters, source_filters
+        with log_span("Discovering event sources for {}", target.display_name):
+            sources = _discover_historical_sources(target, state, source_filters)
+
+        # Historical events are merged from all sources as they are read. Without a
+        # tail count they are emitted right away; with one, only the last tail_count
+        # are held until every source has been read.
+        initial_byte_offsets: dict[str, int] = {}
+        historical_events = iter_historical_events(
+            target, sources, cel_include_filters, cel_exclude_filters, initial_byte_offsets
         )
+        if head_count is not None:
+            with log_span("Reading the first {} historical events for {}", head_count, target.display_name):
+                _emit_historical_events(historical_events, state, on_event, head_count, None)
+            return
+
+        with log_span("Reading historical events for {}", target.display_name):
+            if tail_count is None:
+                _emit_historical_events(historical_events, state, on_event, None, None)
+                last_historical_events: list[EventRecord] = []
+            else:
+                last_historical_events = list(deque(historical_events, maxlen=tail_count))
 
-        # Start tail threads for follow mode
+        # Start tail threads for follow mode, from where the historical read of each current file ended
         if is_follow:
             offset_dir = tempfile.TemporaryDirectory(prefix="mngr-events-offsets-")
             tail_threads = _start_tail_threads_for_sources(
@@ -791,18 +1028,24 @@ def stream_all_events(
                 Path(offset_dir.name),
             )
 
-        # Rotation guard: re-scan for newly rotated files that appeared during startup
+        # Rotation guard: re-scan for newly rotated files that appeared during startup.
+        # Their events are mostly duplicates of ones already read (dropped by event_id);
+        # the rest were appended after the historical read, so emitting them last keeps
+        # the output in timestamp order.
         with log_span("Checking for newly rotated files"):
             rotation_guard_events = _check_for_new_archived_events(
                 target, state, cel_include_filters, cel_exclude_filters, source_filters
             )
-            all_events.extend(rotation_guard_events)
-            all_events = sort_events_by_timestamp(all_events)
 
-        # Emit historical events
-        _emit_historical_events(all_events, state, on_event, head_count, tail_count)
+        _emit_historical_events(
+            sort_events_by_timestamp([*last_historical_events, *rotation_guard_events]),
+            state,
+            on_event,
+            None,
+            tail_count,
+        )
 
-        if head_count is not None or not is_follow:
+        if not is_follow:
             return
 
         # Follow mode: consume events from queue
@@ -846,20 +1089,28 @@ def _check_for_new_archived_events(
         logger.trace("Failed to re-scan for rotated files: {}", e)
         return []
 
-    new_events: list[EventRecord] = []
+    new_rotated_file_paths: list[tuple[str, str]] = []
     for source in current_sources:
         known_rotated = state.known_rotated_files.get(source.source_path, set())
         for rotated_file in source.rotated_files:
             if rotated_file not in known_rotated:
                 logger.debug("Found new rotated file during rotation guard: {}/{}", source.source_path, rotated_file)
                 relative_path = f"{source.source_path}/{rotated_file}" if source.source_path else rotated_file
-                events, _ = _read_events_from_file(target, relative_path, source.source_path)
-                new_events.extend(events)
+                new_rotated_file_paths.append((source.source_path, relative_path))
                 # Record that we've now read this rotated file
                 if source.source_path not in state.known_rotated_files:
                     state.known_rotated_files[source.source_path] = set()
                 state.known_rotated_files[source.source_path].add(rotated_file)
 
+    prefetched_content_by_path = _prefetch_event_files(
+        target, [relative_path for _, relative_path in new_rotated_file_paths]
+    )
+    new_events: list[EventRecord] = []
+    for source_path, relative_path in new_rotated_file_paths:
+        file_content = _read_event_file(target, relative_path, prefetched_content_by_path)
+        if file_content is not None:
+            new_events.extend(_iter_events_in_content(file_content.content, source_path))
+
     # Apply CEL filters
     new_events = [e for e in new_events if _event_passes_cel_filters(e, cel_include_filters, cel_exclude_filters)]
 
@@ -1001,30 +1252,21 @@ def _tail_source_thread_remote(
 
     while not stop_event.is_set():
         try:
-            content = read_event_content(target, relative_file_path)
+            file_content = _read_event_file_from_offset(target, relative_file_path, byte_offset)
         except (MngrError, OSError) as e:
             logger.trace("Failed to read remote source '{}' during follow: {}", source_path, e)
             stop_event.wait(timeout=FOLLOW_POLL_INTERVAL_SECONDS)
             continue
 
-        content_bytes = content.encode("utf-8")
-        current_length = len(content_bytes)
-
-        if current_length < byte_offset:
+        if file_content.start_offset < byte_offset:
             # File was rotated -- re-read from beginning, dedup via event_ids
             logger.debug("Remote event file for source '{}' was rotated", source_path)
-            byte_offset = 0
 
-        if current_length > byte_offset:
-            new_content = content_bytes[byte_offset:].decode("utf-8", errors="replace")
-            for line in new_content.split("\n"):
-                record = parse_event_line(line, source_path)
-                if record is None:
-                    continue
-                if not _event_passes_cel_filters(record, cel_include_filters, cel_exclude_filters):
-                    continue
-                event_queue.put(record)
-            byte_offset = current_length
+        for record in _iter_events_in_content(file_content.content, source_path):
+            if not _event_passes_cel_filters(record, cel_include_filters, cel_exclude_filters):
+                continue
+            event_queue.put(record)
+        byte_offset = file_content.file_size
 
         stop_event.wait(timeout=FOLLOW_POLL_INTERVAL_SECONDS)
 
@@ -20,11 +20,15 @@ from imbue.mngr.api.events import _group_volume_files_into_sources
 from imbue.mngr.api.events import _handle_online_offline_transition
 from imbue.mngr.api.events import _maybe_emit_source_mismatch_warning
 from imbue.mngr.api.events import _parse_discovered_files
+from imbue.mngr.api.events import _parse_event_read_output
 from imbue.mngr.api.events import _pygtail_offset_file_path
+from imbue.mngr.api.events import _read_event_file_from_offset
+from imbue.mngr.api.events import _read_event_files_via_host
 from imbue.mngr.api.events import _sort_rotated_files_oldest_first
 from imbue.mngr.api.events import _start_tail_thread
 from imbue.mngr.api.events import _tail_source_thread_local
 from imbue.mngr.api.events import filter_sources_by_name
+from imbue.mngr.api.events import iter_historical_events
 from imbue.mngr.api.events import parse_event_line
 from imbue.mngr.api.events import read_all_historical_events
 from imbue.mngr.api.events import read_event_content
@@ -220,6 +224,62 @@ def test_read_event_content_via_host_raises_for_missing_file(events_host_target:
         read_event_content(target, "nonexistent-file-58291.log")
 
 
+@pytest.mark.parametrize("is_compressed", [True, False])
+def test_read_event_files_via_host_reads_several_files_from_offsets(
+    events_host_target: tuple[EventsTarget, Path], is_compressed: bool
+) -> None:
+    target, events_dir = events_host_target
+    assert target.online_host is not None
+    (events_dir / "messages").mkdir()
+    (events_dir / "messages" / "events.jsonl.1").write_text("old line\n")
+    (events_dir / "messages" / "events.jsonl").write_text("first line\nsecond line\n")
+    (events_dir / "logs").mkdir()
+    (events_dir / "logs" / "events.jsonl").write_text("short\n")
+
+    file_contents = _read_event_files_via_host(
+        target.online_host,
+        events_dir,
+        {
+            "messages/events.jsonl.1": 0,
+            "messages/events.jsonl": len("first line\n"),
+            "logs/events.jsonl": 1000,
+            "missing/events.jsonl": 0,
+        },
+        target.display_name,
+        is_compressed=is_compressed,
+    )
+
+    assert {path: (c.content, c.start_offset, c.file_size) for path, c in file_contents.items()} == {
+        "messages/events.jsonl.1": ("old line\n", 0, 9),
+        "messages/events.jsonl": ("second line\n", 11, 23),
+        # Shorter than the requested offset (rotated), so read from the start
+        "logs/events.jsonl": ("short\n", 0, 6),
+    }
+
+
+def test_parse_event_read_output_rejects_output_that_is_not_a_compressed_stream() -> None:
+    with pytest.raises(MngrError, match="Failed to decode"):
+        _parse_event_read_output("not base64 gzip!", is_compressed=True)
+
+
+def test_parse_event_read_output_rejects_uncompressed_output_without_sentinel() -> None:
+    with pytest.raises(MngrError, match="Truncated"):
+        _parse_event_read_output("events.jsonl\n6\n0\nshort\n", is_compressed=False)
+
+
+def test_read_event_file_from_offset_restarts_when_file_is_shorter(
+    events_volume_target: tuple[EventsTarget, Path],
+) -> None:
+    target, events_dir = events_volume_target
+    (events_dir / "events.jsonl").write_text("abc\ndef\n")
+
+    from_offset = _read_event_file_from_offset(target, "events.jsonl", 4)
+    after_rotation = _read_event_file_from_offset(target, "events.jsonl", 100)
+
+    assert (from_offset.content, from_offset.start_offset, from_offset.file_size) == ("def\n", 4, 8)
+    assert (after_rotation.content, after_rotation.start_offset) == ("abc\ndef\n", 0)
+
+
 def test_read_event_content_raises_when_no_volume_or_host() -> None:
     """Verify read_event_content raises MngrError when neither volume nor host is available."""
     target = EventsTarget(display_name="test-empty")
@@ -559,6 +619,58 @@ def test_read_all_historical_events_with_cel_filter(tmp_path: Path) -> None:
     assert events[0].event_id == "m1"
 
 
+def test_iter_historical_events_merges_rotated_and_current_files_across_sources(tmp_path: Path) -> None:
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+
+    (events_dir / "alpha").mkdir()
+    (events_dir / "alpha" / "events.jsonl.1").write_text(
+        '{"timestamp":"2026-01-01T00:00:00Z","event_id":"a1","source":"alpha"}\n'
+        '{"timestamp":"2026-01-04T00:00:00Z","event_id":"a4","source":"alpha"}\n'
+    )
+    (events_dir / "alpha" / "events.jsonl").write_text(
+        '{"timestamp":"2026-01-05T00:00:00Z","event_id":"a5","source":"alpha"}\n'
+    )
+    (events_dir / "beta").mkdir()
+    (events_dir / "beta" / "events.jsonl").write_text(
+        '{"timestamp":"2026-01-02T00:00:00Z","event_id":"b2","source":"beta"}\n'
+        '{"timestamp":"2026-01-06T00:00:00Z","event_id":"b6","source":"beta"}\n'
+    )
+
+    target = EventsTarget(volume=LocalVolume(root_path=events_dir), display_name="test")
+    sources = [
+        EventSourceInfo(source_path="alpha", rotated_files=("events.jsonl.1",), is_current_file_present=True),
+        EventSourceInfo(source_path="beta", rotated_files=(), is_current_file_present=True),
+    ]
+
+    events = list(iter_historical_events(target, sources, [], [], {}))
+
+    assert [e.event_id for e in events] == ["a1", "b2", "a4", "a5", "b6"]
+
+
+def test_iter_historical_events_reads_the_current_file_only_when_rotated_files_are_exhausted(tmp_path: Path) -> None:
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+
+    current_content = '{"timestamp":"2026-01-02T00:00:00Z","event_id":"new","source":"src"}\n'
+    (events_dir / "src").mkdir()
+    (events_dir / "src" / "events.jsonl.1").write_text(
+        '{"timestamp":"2026-01-01T00:00:00Z","event_id":"old","source":"src"}\n'
+    )
+    (events_dir / "src" / "events.jsonl").write_text(current_content)
+
+    target = EventsTarget(volume=LocalVolume(root_path=events_dir), display_name="test")
+    sources = [EventSourceInfo(source_path="src", rotated_files=("events.jsonl.1",), is_current_file_present=True)]
+    byte_offsets: dict[str, int] = {}
+
+    events = iter_historical_events(target, sources, [], [], byte_offsets)
+
+    assert next(events).event_id == "old"
+    assert byte_offsets == {"src": 0}
+    assert [e.event_id for e in events] == ["new"]
+    assert byte_offsets == {"src": len(current_content)}
+
+
 # =============================================================================
 # stream_all_events tests
 # =============================================================================
@@ -629,6 +741,37 @@ def test_stream_all_events_head_mode(tmp_path: Path) -> None:
     assert captured == ["e1", "e2"]
 
 
+def test_stream_all_events_tail_mode_keeps_the_last_events_across_sources(tmp_path: Path) -> None:
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+
+    (events_dir / "alpha").mkdir()
+    (events_dir / "alpha" / "events.jsonl").write_text(
+        '{"timestamp":"2026-01-01T00:00:00Z","event_id":"a1","source":"alpha"}\n'
+        '{"timestamp":"2026-01-03T00:00:00Z","event_id":"a3","source":"alpha"}\n'
+    )
+    (events_dir / "beta").mkdir()
+    (events_dir / "beta" / "events.jsonl").write_text(
+        '{"timestamp":"2026-01-02T00:00:00Z","event_id":"b2","source":"beta"}\n'
+        '{"timestamp":"2026-01-04T00:00:00Z","event_id":"b4","source":"beta"}\n'
+    )
+
+    target = EventsTarget(volume=LocalVolume(root_path=events_dir), display_name="test")
+    captured: list[str] = []
+
+    stream_all_events(
+        target=target,
+        on_event=lambda e: captured.append(e.event_id),
+        cel_include_filters=[],
+        cel_exclude_filters=[],
+        tail_count=3,
+        head_count=None,
+        is_follow=False,
+    )
+
+    assert captured == ["b2", "a3", "b4"]
+
+
 def test_stream_all_events_with_source_filters(tmp_path: Path) -> None:
     """Verify source_filters restricts which sources are included."""
     events_dir = tmp_path / "events"
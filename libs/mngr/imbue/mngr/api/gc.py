@@ -1,3 +1,4 @@
+import os
 import shlex
 import shutil
 from collections.abc import Callable
@@ -11,8 +12,10 @@ from typing import Final
 from typing import assert_never
 
 from loguru import logger
+from pydantic import Field
 
 from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
+from imbue.imbue_common.frozen_model import FrozenModel
 from imbue.imbue_common.logging import log_call
 from imbue.imbue_common.logging import log_span
 from imbue.imbue_common.model_update import to_update
@@ -20,6 +23,8 @@ from imbue.imbue_common.pure import pure
 from imbue.mngr.api.data_types import GcResourceTypes
 from imbue.mngr.api.data_types import GcResult
 from imbue.mngr.api.discovery_events import emit_host_destroyed
+from imbue.mngr.api.warm_pool import is_warm_pool_host
+from imbue.mngr.api.warm_pool import reap_warm_pools
 from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import HostAuthenticationError
 from imbue.mngr.errors import HostConnectionError
@@ -175,21 +180,31 @@ def _gc_single_host_work_dir(
     else:
         # otherwise is online
         try:
-            orphaned_dirs = _get_orphaned_work_dirs(host=host, provider_name=provider_instance.name)
+            orphaned_dirs = _get_orphaned_work_dirs(host=host)
         except HostOfflineError:
             logger.trace("Skipped work dir GC because host is offline", host_id=host.id)
         except HostAuthenticationError:
             logger.trace("Skipped work dir GC because host authentication failed", host_id=host.id)
         else:
-            for work_dir_info in orphaned_dirs:
+            if not orphaned_dirs:
+                return
+            error_message_by_path: dict[Path, str] = {}
+            if not dry_run:
                 try:
-                    if not dry_run:
-                        _clean_work_dir(host=host, work_dir_path=work_dir_info.path, dry_run=False)
-                    result.work_dirs_destroyed.append(work_dir_info)
+                    error_message_by_path = _clean_work_dirs(host=host, probes=orphaned_dirs)
                 except MngrError as e:
-                    error_msg = f"Failed to clean {work_dir_info.path}: {e}"
+                    error_msg = f"Failed to clean work directories on host {host.id}: {e}"
                     result.errors.append(error_msg)
                     _handle_error(error_msg, error_behavior, exc=e)
+                    return
+            for probe in orphaned_dirs:
+                if probe.path not in error_message_by_path:
+                    result.work_dirs_destroyed.append(
+                        _build_work_dir_info(probe, host=host, provider_name=provider_instance.name)
+                    )
+            for error_msg in error_message_by_path.values():
+                result.errors.append(error_msg)
+                _handle_error(error_msg, error_behavior)
 
 
 def gc_machines(
@@ -204,6 +219,9 @@ def gc_machines(
 
     for provider in providers:
         try:
+            if not dry_run:
+                reap_warm_pools(provider)
+
             host_refs = provider.discover_hosts(include_destroyed=True, cg=provider.mngr_ctx.concurrency_group)
 
             # Process hosts in parallel to avoid sequential SSH timeouts for offline hosts
@@ -290,6 +308,10 @@ def _gc_single_host(
         if host.is_local:
             return
 
+        # Idle warm pool hosts have no agents by design, and are destroyed by reap_warm_pools once they expire
+        if is_warm_pool_host(provider, host_ref.host_name):
+            return
+
         try:
             # Only consider online hosts with no agents
             agent_refs = host.discover_agents()
@@ -455,17 +477,13 @@ def gc_logs(
 
     now = datetime.now(timezone.utc)
 
-    for log_file in logs_dir.rglob("*"):
-        if not log_file.is_file():
-            continue
-
+    for log_file, stat in _scan_files_with_stats(logs_dir):
         # Only delete rotated files (e.g., events.jsonl.1, events.jsonl.2).
         # Never delete the current log file (events.jsonl) or other non-rotated files.
         if not _is_rotated_log_file(log_file):
             continue
 
         try:
-            stat = log_file.stat()
             file_size = SizeBytes(stat.st_size)
             modified_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
 
@@ -488,6 +506,31 @@ def gc_logs(
             _handle_error(error_msg, error_behavior, exc=e)
 
 
+def _scan_files_with_stats(root: Path) -> list[tuple[Path, os.stat_result]]:
+    """List every regular file under root together with its stat result.
+
+    Walks the tree once with os.scandir, so each directory is listed once and
+    each file is stat'ed once. Symlinks are not followed, and directories that
+    disappear or cannot be read are skipped.
+    """
+    files: list[tuple[Path, os.stat_result]] = []
+    pending_dirs = [root]
+    while pending_dirs:
+        directory = pending_dirs.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append((Path(entry.path), entry.stat(follow_symlinks=False)))
+                    else:
+                        pass
+        except OSError as e:
+            logger.trace("Skipped unreadable directory {}: {}", directory, e)
+    return files
+
+
 @pure
 def _is_rotated_log_file(path: Path) -> bool:
     """Check if a file is a rotated log file (e.g., events.jsonl.1, events.jsonl.2).
@@ -512,7 +555,12 @@ def gc_build_cache(
     error_behavior: ErrorBehavior,
     result: GcResult,
 ) -> None:
-    """Garbage collect build cache entries."""
+    """Garbage collect build cache entries.
+
+    Each provider's cache directory is handled concurrently. Only the top-level
+    entries of a cache directory are collected, and each is walked once to
+    compute its size.
+    """
     # Construct providers directory from profile
     base_cache_dir = mngr_ctx.profile_dir / "providers"
 
@@ -520,141 +568,255 @@ def gc_build_cache(
         logger.trace("Skipped build cache directory {} (does not exist)", base_cache_dir)
         return
 
-    for provider_dir in base_cache_dir.iterdir():
-        if not provider_dir.is_dir():
-            continue
+    cache_dirs = [provider_dir / "cache" for provider_dir in sorted(base_cache_dir.iterdir()) if provider_dir.is_dir()]
+    results_lock = Lock()
+    futures: list[Future[None]] = []
+    with ConcurrencyGroupExecutor(
+        parent_cg=mngr_ctx.concurrency_group, name="gc_build_cache", max_workers=8
+    ) as executor:
+        for cache_dir in cache_dirs:
+            if cache_dir.is_dir():
+                futures.append(
+                    executor.submit(_gc_build_cache_dir, cache_dir, dry_run, error_behavior, result, results_lock)
+                )
 
-        cache_dir = provider_dir / "cache"
-        if not cache_dir.exists():
-            continue
+    # Re-raise any thread exceptions
+    for future in futures:
+        future.result()
 
-        # Clean up build cache entries
-        for cache_entry in cache_dir.rglob("*"):
-            if not cache_entry.is_dir():
-                continue
 
-            try:
-                # Calculate size
-                cache_entry_size = SizeBytes(sum(f.stat().st_size for f in cache_entry.rglob("*") if f.is_file()))
-                # Get creation time
-                created_at = datetime.fromtimestamp(cache_entry.stat().st_ctime, tz=timezone.utc)
-                build_cache_info = BuildCacheInfo(path=cache_entry, size_bytes=cache_entry_size, created_at=created_at)
+def _gc_build_cache_dir(
+    cache_dir: Path,
+    dry_run: bool,
+    error_behavior: ErrorBehavior,
+    result: GcResult,
+    results_lock: Lock,
+) -> None:
+    """Garbage collect the top-level entries of a single provider's build cache directory."""
+    with os.scandir(cache_dir) as entries:
+        cache_entries = sorted(
+            (Path(entry.path) for entry in entries if entry.is_dir(follow_symlinks=False)), key=lambda p: p.name
+        )
+
+    for cache_entry in cache_entries:
+        try:
+            cache_entry_size = SizeBytes(sum(stat.st_size for _, stat in _scan_files_with_stats(cache_entry)))
+            # Get creation time
+            created_at = datetime.fromtimestamp(cache_entry.stat().st_ctime, tz=timezone.utc)
+            build_cache_info = BuildCacheInfo(path=cache_entry, size_bytes=cache_entry_size, created_at=created_at)
 
-                if not dry_run:
-                    # Remove the cache entry directory
-                    shutil.rmtree(cache_entry)
+            if not dry_run:
+                # Remove the cache entry directory
+                shutil.rmtree(cache_entry)
 
+            with results_lock:
                 result.build_cache_destroyed.append(build_cache_info)
 
-            except MngrError as e:
-                error_msg = f"Failed to delete cache entry {cache_entry}: {e}"
+        except (MngrError, OSError) as e:
+            error_msg = f"Failed to delete cache entry {cache_entry}: {e}"
+            with results_lock:
                 result.errors.append(error_msg)
-                _handle_error(error_msg, error_behavior, exc=e)
+            _handle_error(error_msg, error_behavior, exc=e)
 
 
-def _get_orphaned_work_dirs(host: OnlineHostInterface, provider_name: ProviderInstanceName) -> list[WorkDirInfo]:
-    """Get list of orphaned work directories for a host."""
-    certified_data = host.get_certified_data()
-    generated_work_dirs = set(certified_data.generated_work_dirs)
+# Line prefixes emitted by the batched work dir probe and removal scripts
+_WORK_DIR_FOUND_MARKER: Final[str] = "MNGR_WORK_DIR_FOUND"
+_WORK_DIR_MISSING_MARKER: Final[str] = "MNGR_WORK_DIR_MISSING"
+_WORKTREE_REMOVE_FAILED_MARKER: Final[str] = "MNGR_WORKTREE_REMOVE_FAILED"
+_WORK_DIR_REMOVE_FAILED_MARKER: Final[str] = "MNGR_WORK_DIR_REMOVE_FAILED"
 
-    active_work_dirs = set()
-    for agent in host.get_agents():
-        active_work_dirs.add(str(agent.work_dir))
 
-    orphaned_work_dirs = generated_work_dirs - active_work_dirs
+class WorkDirProbe(FrozenModel):
+    """What a single batched probe found out about one work directory."""
 
-    work_dir_infos = []
-    for work_dir_str in orphaned_work_dirs:
-        work_dir_path = Path(work_dir_str)
-        # Get size if possible
-        size = SizeBytes(0)
-        try:
-            result = host.execute_idempotent_command(f"du -sb {shlex.quote(str(work_dir_path))} | cut -f1")
-            if result.success and result.stdout.strip():
-                size = SizeBytes(int(result.stdout.strip()))
-        except (ValueError, OSError):
-            # If we can't get the size, use 0
-            pass
+    path: Path = Field(description="The probed work directory")
+    is_present: bool = Field(description="Whether the directory exists on the host")
+    size_bytes: SizeBytes = Field(description="Disk usage of the directory (0 if unknown)")
+    modified_at: datetime | None = Field(description="Modification time of the directory, if known")
+    is_git_worktree: bool = Field(description="Whether the directory has a .git file (i.e. is a git worktree)")
+    main_repo: Path | None = Field(description="The repository the worktree belongs to, if it could be determined")
 
-        # Get creation time from the directory
-        created_at = datetime.now(timezone.utc)
-        try:
-            stat_result = host.execute_idempotent_command(f"stat -c %Y {shlex.quote(str(work_dir_path))}")
-            if stat_result.success and stat_result.stdout.strip():
-                created_at = datetime.fromtimestamp(int(stat_result.stdout.strip()), tz=timezone.utc)
-        except (ValueError, OSError):
-            pass
 
-        work_dir_infos.append(
-            WorkDirInfo(
-                path=work_dir_path,
-                size_bytes=size,
-                host_id=host.id,
-                provider_name=provider_name,
-                is_local=host.is_local,
-                created_at=created_at,
-            )
-        )
+@pure
+def build_work_dir_probe_command(paths: Sequence[Path]) -> str:
+    """Build one shell command that reports size, mtime and worktree status for every path.
 
-    return work_dir_infos
+    Emits one tab-separated line per path, keyed by the path's index:
+    FOUND lines carry size, mtime, a worktree flag and the first line of the
+    .git file; MISSING lines are emitted for paths that do not exist.
+    """
+    quoted_paths = " ".join(shlex.quote(str(path)) for path in paths)
+    return (
+        f"i=0; for p in {quoted_paths}; do "
+        'if [ -e "$p" ]; then '
+        'size=$(du -sb "$p" 2>/dev/null | cut -f1); '
+        'mtime=$(stat -c %Y "$p" 2>/dev/null); '
+        'if [ -f "$p/.git" ]; then wt=1; gitfile=$(head -n 1 "$p/.git" 2>/dev/null); else wt=0; gitfile=""; fi; '
+        f'printf \'{_WORK_DIR_FOUND_MARKER}\\t%s\\t%s\\t%s\\t%s\\t%s\\n\' "$i" "$size" "$mtime" "$wt" "$gitfile"; '
+        f"else printf '{_WORK_DIR_MISSING_MARKER}\\t%s\\n' \"$i\"; fi; "
+        "i=$((i+1)); done"
+    )
 
 
-def _clean_work_dir(host: OnlineHostInterface, work_dir_path: Path, dry_run: bool) -> None:
-    """Clean up a single work directory."""
-    if not dry_run:
-        with host.lock_cooperatively():
-            if _is_git_worktree(host, work_dir_path):
-                _remove_git_worktree(host, work_dir_path)
-            else:
-                _remove_directory(host, work_dir_path)
+@pure
+def parse_work_dir_probe_output(paths: Sequence[Path], output: str) -> list[WorkDirProbe]:
+    """Parse the output of build_work_dir_probe_command into one WorkDirProbe per path (in order).
 
-            _remove_work_dir_from_certified_data(host, work_dir_path)
+    Paths with no (or an unparseable) line are reported as present with unknown size and mtime.
+    """
+    probe_by_index: dict[int, WorkDirProbe] = {}
+    for line in output.splitlines():
+        fields = line.split("\t", 5)
+        if len(fields) < 2 or not fields[1].isdigit() or int(fields[1]) >= len(paths):
+            continue
+        index = int(fields[1])
+        path = paths[index]
+        if fields[0] == _WORK_DIR_MISSING_MARKER:
+            probe_by_index[index] = WorkDirProbe(
+                path=path,
+                is_present=False,
+                size_bytes=SizeBytes(0),
+                modified_at=None,
+                is_git_worktree=False,
+                main_repo=None,
+            )
+        elif fields[0] == _WORK_DIR_FOUND_MARKER and len(fields) == 6:
+            _, _, size, mtime, worktree_flag, git_file_line = fields
+            probe_by_index[index] = WorkDirProbe(
+                path=path,
+                is_present=True,
+                size_bytes=SizeBytes(int(size)) if size.isdigit() else SizeBytes(0),
+                modified_at=datetime.fromtimestamp(int(mtime), tz=timezone.utc) if mtime.isdigit() else None,
+                is_git_worktree=worktree_flag == "1",
+                main_repo=parse_worktree_git_file(git_file_line) if worktree_flag == "1" else None,
+            )
+        else:
+            logger.trace("Ignored unexpected work dir probe line: {}", line)
+    return [
+        probe_by_index.get(
+            index,
+            WorkDirProbe(
+                path=path,
+                is_present=True,
+                size_bytes=SizeBytes(0),
+                modified_at=None,
+                is_git_worktree=False,
+                main_repo=None,
+            ),
+        )
+        for index, path in enumerate(paths)
+    ]
 
 
-def _is_git_worktree(host: OnlineHostInterface, path: Path) -> bool:
-    """Check if a path is a git worktree.
+@pure
+def build_work_dir_removal_command(probes: Sequence[WorkDirProbe]) -> str:
+    """Build one shell command that removes every present work directory.
 
-    A git worktree has a .git file (not directory) that points to the main git directory.
+    Git worktrees are removed with `git worktree remove` (run from their main
+    repo when known, so that git unregisters them) and fall back to rm -rf.
+    Failures are reported as tab-separated marker lines keyed by probe index.
     """
-    git_path = path / ".git"
+    commands: list[str] = []
+    for index, probe in enumerate(probes):
+        if not probe.is_present:
+            continue
+        quoted_path = shlex.quote(str(probe.path))
+        remove_directory = f"rm -rf {quoted_path} || printf '{_WORK_DIR_REMOVE_FAILED_MARKER}\\t{index}\\n'"
+        if probe.is_git_worktree:
+            git_prefix = f"git -C {shlex.quote(str(probe.main_repo))}" if probe.main_repo is not None else "git"
+            commands.append(
+                f"{git_prefix} worktree remove --force {quoted_path} >/dev/null 2>&1 || "
+                f"{{ printf '{_WORKTREE_REMOVE_FAILED_MARKER}\\t{index}\\n'; {remove_directory}; }}"
+            )
+        else:
+            commands.append(remove_directory)
+    return "; ".join(commands) if commands else "true"
 
-    result = host.execute_idempotent_command(f"test -f {shlex.quote(str(git_path))}")
-    return result.success
 
+@pure
+def parse_work_dir_removal_failures(output: str) -> tuple[set[int], set[int]]:
+    """Return (indices whose git worktree removal fell back to rm, indices that could not be removed)."""
+    worktree_fallback_indices: set[int] = set()
+    failed_indices: set[int] = set()
+    for line in output.splitlines():
+        fields = line.split("\t")
+        if len(fields) != 2 or not fields[1].isdigit():
+            continue
+        if fields[0] == _WORKTREE_REMOVE_FAILED_MARKER:
+            worktree_fallback_indices.add(int(fields[1]))
+        elif fields[0] == _WORK_DIR_REMOVE_FAILED_MARKER:
+            failed_indices.add(int(fields[1]))
+        else:
+            pass
+    return worktree_fallback_indices, failed_indices
 
-def _remove_git_worktree(host: OnlineHostInterface, work_dir_path: Path) -> None:
-    """Remove a git worktree using git worktree remove.
 
-    Reads the .git file to find the main repo and runs the removal from there,
-    which is required for git to properly unregister the worktree.
-    """
-    main_repo: Path | None = None
-    git_file = work_dir_path / ".git"
-    try:
-        content = host.read_text_file(git_file)
-        main_repo = parse_worktree_git_file(content)
-    except (FileNotFoundError, OSError):
-        pass
+def _get_orphaned_work_dirs(host: OnlineHostInterface) -> list[WorkDirProbe]:
+    """Probe every orphaned work directory on a host with a single command."""
+    certified_data = host.get_certified_data()
+    generated_work_dirs = set(certified_data.generated_work_dirs)
 
-    if main_repo is not None:
-        cmd = f"git -C {shlex.quote(str(main_repo))} worktree remove --force {shlex.quote(str(work_dir_path))}"
-    else:
-        cmd = f"git worktree remove --force {shlex.quote(str(work_dir_path))}"
+    active_work_dirs = set()
+    for agent in host.get_agents():
+        active_work_dirs.add(str(agent.work_dir))
 
-    result = host.execute_idempotent_command(cmd)
+    orphaned_paths = [Path(work_dir_str) for work_dir_str in sorted(generated_work_dirs - active_work_dirs)]
+    if not orphaned_paths:
+        return []
 
+    result = host.execute_idempotent_command(build_work_dir_probe_command(orphaned_paths))
     if not result.success:
-        logger.warning("git worktree remove failed, falling back to directory removal: {}", result.stderr)
-        _remove_directory(host, work_dir_path)
-    else:
-        logger.debug("Removed git worktree: {}", work_dir_path)
+        logger.debug("Work dir probe failed on host {}: {}", host.id, result.stderr)
+    return parse_work_dir_probe_output(orphaned_paths, result.stdout)
+
+
+def _build_work_dir_info(
+    probe: WorkDirProbe, host: OnlineHostInterface, provider_name: ProviderInstanceName
+) -> WorkDirInfo:
+    return WorkDirInfo(
+        path=probe.path,
+        size_bytes=probe.size_bytes,
+        host_id=host.id,
+        provider_name=provider_name,
+        is_local=host.is_local,
+        created_at=probe.modified_at if probe.modified_at is not None else datetime.now(timezone.utc),
+    )
+
 
+def _clean_work_dirs(host: OnlineHostInterface, probes: Sequence[WorkDirProbe]) -> dict[Path, str]:
+    """Remove the work directories with one command and drop them from the host's certified data.
 
-def _remove_work_dir_from_certified_data(host: OnlineHostInterface, work_dir_path: Path) -> None:
-    """Remove a work directory from the host's certified data."""
+    Returns an error message for each directory that could not be removed;
+    those directories stay in the certified data.
+    """
+    with host.lock_cooperatively():
+        result = host.execute_idempotent_command(build_work_dir_removal_command(probes))
+        worktree_fallback_indices, failed_indices = parse_work_dir_removal_failures(result.stdout)
+        if not result.success and not failed_indices:
+            # The script itself failed, so nothing it was meant to do can be trusted
+            failed_indices = set(range(len(probes)))
+
+        for index in sorted(worktree_fallback_indices):
+            logger.warning("git worktree remove failed, fell back to directory removal: {}", probes[index].path)
+
+        removed_paths = {str(probe.path) for index, probe in enumerate(probes) if index not in failed_indices}
+        _remove_work_dirs_from_certified_data(host, removed_paths)
+
+    for probe in probes:
+        if str(probe.path) in removed_paths:
+            logger.debug("Removed work directory: {}", probe.path)
+    return {
+        probes[index].path: f"Failed to remove directory {probes[index].path}: {result.stderr.strip()}"
+        for index in sorted(failed_indices)
+    }
+
+
+def _remove_work_dirs_from_certified_data(host: OnlineHostInterface, work_dir_paths: set[str]) -> None:
+    """Remove work directories from the host's certified data."""
+    if not work_dir_paths:
+        return
     certified_data = host.get_certified_data()
-    existing_dirs = set(certified_data.generated_work_dirs)
-    existing_dirs.discard(str(work_dir_path))
+    existing_dirs = set(certified_data.generated_work_dirs) - work_dir_paths
 
     updated_data = certified_data.model_copy_update(
         to_update(certified_data.field_ref().generated_work_dirs, tuple(sorted(existing_dirs))),
@@ -663,19 +825,6 @@ def _remove_work_dir_from_certified_data(host: OnlineHostInterface, work_dir_pat
     host.set_certified_data(updated_data)
 
 
-def _remove_directory(host: OnlineHostInterface, path: Path) -> None:
-    """Remove a directory and all its contents."""
-    result = host.execute_idempotent_command(f"test -e {shlex.quote(str(path))}")
-    if result.success:
-        cmd = f"rm -rf {shlex.quote(str(path))}"
-        result = host.execute_idempotent_command(cmd)
-
-        if not result.success:
-            raise MngrError(f"Failed to remove directory {path}: {result.stderr}")
-
-        logger.debug("Removed directory: {}", path)
-
-
 def _handle_error(error_msg: str, error_behavior: ErrorBehavior, exc: Exception | None = None) -> None:
     """Handle an error according to the specified error behavior."""
     match error_behavior:
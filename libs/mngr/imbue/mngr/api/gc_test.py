@@ -1,6 +1,7 @@
 """Unit tests for gc API functions."""
 
 import os
+import subprocess
 import time
 from datetime import datetime
 from datetime import timedelta
@@ -11,9 +12,13 @@ import pytest
 
 from imbue.mngr.api.data_types import GcResourceTypes
 from imbue.mngr.api.data_types import GcResult
+from imbue.mngr.api.gc import WorkDirProbe
 from imbue.mngr.api.gc import _LOG_MAX_AGE_DAYS
 from imbue.mngr.api.gc import _handle_error
 from imbue.mngr.api.gc import _is_rotated_log_file
+from imbue.mngr.api.gc import _scan_files_with_stats
+from imbue.mngr.api.gc import build_work_dir_probe_command
+from imbue.mngr.api.gc import build_work_dir_removal_command
 from imbue.mngr.api.gc import gc
 from imbue.mngr.api.gc import gc_build_cache
 from imbue.mngr.api.gc import gc_logs
@@ -21,10 +26,13 @@ from imbue.mngr.api.gc import gc_machines
 from imbue.mngr.api.gc import gc_snapshots
 from imbue.mngr.api.gc import gc_volumes
 from imbue.mngr.api.gc import gc_work_dirs
+from imbue.mngr.api.gc import parse_work_dir_probe_output
+from imbue.mngr.api.gc import parse_work_dir_removal_failures
 from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import MngrError
 from imbue.mngr.hosts.offline_host import OfflineHost
 from imbue.mngr.interfaces.data_types import CertifiedHostData
+from imbue.mngr.interfaces.data_types import SizeBytes
 from imbue.mngr.interfaces.data_types import SnapshotInfo
 from imbue.mngr.primitives import AgentId
 from imbue.mngr.primitives import ErrorBehavior
@@ -874,3 +882,115 @@ def test_gc_with_machines_flag(temp_mngr_ctx: MngrContext, local_provider: Local
         error_behavior=ErrorBehavior.ABORT,
     )
     assert len(result.machines_destroyed) == 0
+
+
+def test_gc_build_cache_collects_only_top_level_entries_with_nested_sizes(
+    temp_mngr_ctx: MngrContext, local_provider: LocalProviderInstance
+) -> None:
+    """Nested directories are counted toward their top-level entry, not collected separately."""
+    providers_dir = temp_mngr_ctx.profile_dir / "providers"
+    nested_dir = providers_dir / "provider-a" / "cache" / "entry-1" / "layers" / "deep"
+    nested_dir.mkdir(parents=True)
+    (nested_dir / "blob").write_bytes(b"x" * 100)
+    (providers_dir / "provider-a" / "cache" / "entry-1" / "manifest").write_bytes(b"y" * 10)
+    other_entry = providers_dir / "provider-b" / "cache" / "entry-2"
+    other_entry.mkdir(parents=True)
+    (other_entry / "data").write_bytes(b"z" * 5)
+
+    result = GcResult()
+    gc_build_cache(
+        mngr_ctx=temp_mngr_ctx,
+        providers=[local_provider],
+        dry_run=False,
+        error_behavior=ErrorBehavior.ABORT,
+        result=result,
+    )
+
+    size_by_name = {info.path.name: info.size_bytes for info in result.build_cache_destroyed}
+    assert size_by_name == {"entry-1": 110, "entry-2": 5}
+    assert result.errors == []
+    assert list((providers_dir / "provider-a" / "cache").iterdir()) == []
+    assert list((providers_dir / "provider-b" / "cache").iterdir()) == []
+
+
+def test_scan_files_with_stats_walks_nested_directories_once(tmp_path: Path) -> None:
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.txt").write_text("1")
+    (tmp_path / "a" / "middle.txt").write_text("22")
+    (tmp_path / "a" / "b" / "bottom.txt").write_text("333")
+    (tmp_path / "link").symlink_to(tmp_path / "a")
+
+    size_by_name = {path.name: stat.st_size for path, stat in _scan_files_with_stats(tmp_path)}
+
+    assert size_by_name == {"top.txt": 1, "middle.txt": 2, "bottom.txt": 3}
+    assert _scan_files_with_stats(tmp_path / "missing") == []
+
+
+# =========================================================================
+# Batched work dir probe and removal
+# =========================================================================
+
+
+def _run_shell(command: str) -> str:
+    return subprocess.run(["sh", "-c", command], capture_output=True, text=True, check=True).stdout
+
+
+def test_parse_work_dir_probe_output_handles_found_missing_and_unreported_paths() -> None:
+    paths = [Path("/work/plain"), Path("/work/tree"), Path("/work/gone"), Path("/work/unreported")]
+    output = "\n".join(
+        [
+            "MNGR_WORK_DIR_FOUND\t0\t4096\t1700000000\t0\t",
+            "MNGR_WORK_DIR_FOUND\t1\t10\t\t1\tgitdir: /repo/.git/worktrees/tree",
+            "MNGR_WORK_DIR_MISSING\t2",
+            "some unrelated noise",
+            "MNGR_WORK_DIR_MISSING\t99",
+        ]
+    )
+
+    plain, tree, gone, unreported = parse_work_dir_probe_output(paths, output)
+
+    assert plain.is_present and plain.size_bytes == 4096 and not plain.is_git_worktree
+    assert plain.modified_at == datetime.fromtimestamp(1700000000, tz=timezone.utc)
+    assert tree.is_git_worktree and tree.main_repo == Path("/repo") and tree.modified_at is None
+    assert not gone.is_present
+    assert unreported.is_present and unreported.size_bytes == 0
+
+
+def test_work_dir_probe_and_removal_commands_round_trip(tmp_path: Path) -> None:
+    plain_dir = tmp_path / "plain dir"
+    plain_dir.mkdir()
+    (plain_dir / "data").write_bytes(b"x" * 5000)
+    worktree_dir = tmp_path / "worktree"
+    worktree_dir.mkdir()
+    # Points at a repo that does not exist, so git worktree remove fails and rm -rf takes over
+    (worktree_dir / ".git").write_text(f"gitdir: {tmp_path}/repo/.git/worktrees/worktree\n")
+    missing_dir = tmp_path / "missing"
+    paths = [plain_dir, worktree_dir, missing_dir]
+
+    probes = parse_work_dir_probe_output(paths, _run_shell(build_work_dir_probe_command(paths)))
+
+    assert [probe.is_present for probe in probes] == [True, True, False]
+    assert probes[0].size_bytes >= 5000
+    assert probes[0].modified_at is not None
+    assert [probe.is_git_worktree for probe in probes] == [False, True, False]
+    assert probes[1].main_repo == tmp_path / "repo"
+
+    removal_output = _run_shell(build_work_dir_removal_command(probes))
+    worktree_fallback_indices, failed_indices = parse_work_dir_removal_failures(removal_output)
+
+    assert worktree_fallback_indices == {1}
+    assert failed_indices == set()
+    assert not plain_dir.exists()
+    assert not worktree_dir.exists()
+
+
+def test_build_work_dir_removal_command_is_a_no_op_without_present_dirs() -> None:
+    probe = WorkDirProbe(
+        path=Path("/gone"),
+        is_present=False,
+        size_bytes=SizeBytes(0),
+        modified_at=None,
+        is_git_worktree=False,
+        main_repo=None,
+    )
+    assert build_work_dir_removal_command([probe]) == "true"
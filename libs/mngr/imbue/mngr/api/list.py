@@ -5,6 +5,7 @@ from datetime import datetime
 from datetime import timezone
 from threading import Lock
 from typing import Any
+from typing import Final
 
 from loguru import logger
 from pydantic import Field
@@ -24,6 +25,7 @@ from imbue.mngr.api.discovery_events import write_full_discovery_snapshot
 from imbue.mngr.api.providers import get_all_provider_instances
 from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import BaseMngrError
+from imbue.mngr.errors import HostNotFoundError
 from imbue.mngr.errors import MngrError
 from imbue.mngr.errors import ProviderInstanceNotFoundError
 from imbue.mngr.interfaces.agent import AgentInterface
@@ -37,8 +39,10 @@ from imbue.mngr.primitives import ErrorBehavior
 from imbue.mngr.primitives import HostId
 from imbue.mngr.primitives import ProviderInstanceName
 from imbue.mngr.providers.base_provider import BaseProviderInstance
+from imbue.mngr.utils.cel_utils import CompiledCelExpression
 from imbue.mngr.utils.cel_utils import apply_cel_filters_to_context
 from imbue.mngr.utils.cel_utils import compile_cel_filters
+from imbue.mngr.utils.cel_utils import get_referenced_cel_names
 
 
 class ErrorInfo(FrozenModel):
@@ -112,8 +116,8 @@ class _ListAgentsParams(FrozenModel):
     """Shared parameters for the internal agent listing pipeline."""
 
     model_config = {"arbitrary_types_allowed": True}
-    compiled_include_filters: list[Any]
-    compiled_exclude_filters: list[Any]
+    compiled_include_filters: list[CompiledCelExpression]
+    compiled_exclude_filters: list[CompiledCelExpression]
     error_behavior: ErrorBehavior
     on_agent: Callable[[AgentDetails], None] | None
     on_error: Callable[[ErrorInfo], None] | None
@@ -149,8 +153,8 @@ def list_agents(
 
     # Compile CEL filters if provided
     # Note: compilation errors always abort - bad filters should never silently continue
-    compiled_include_filters: list[Any] = []
-    compiled_exclude_filters: list[Any] = []
+    compiled_include_filters: list[CompiledCelExpression] = []
+    compiled_exclude_filters: list[CompiledCelExpression] = []
     if include_filters or exclude_filters:
         with log_span("Compiling CEL filters", include_filters=include_filters, exclude_filters=exclude_filters):
             compiled_include_filters, compiled_exclude_filters = compile_cel_filters(include_filters, exclude_filters)
@@ -158,19 +162,13 @@ def list_agents(
     try:
         results_lock = Lock()
 
-        field_generators: dict[str, dict[str, Callable[[AgentInterface, OnlineHostInterface], Any]]] = {}
-        for hook_result in mngr_ctx.pm.hook.agent_field_generators():
-            if hook_result is not None:
-                plugin_name, generators = hook_result
-                field_generators[plugin_name] = generators
-
         params = _ListAgentsParams(
             compiled_include_filters=compiled_include_filters,
             compiled_exclude_filters=compiled_exclude_filters,
             error_behavior=error_behavior,
             on_agent=on_agent,
             on_error=on_error,
-            field_generators=field_generators,
+            field_generators=_get_agent_field_generators(mngr_ctx),
         )
 
         if is_streaming:
@@ -208,6 +206,112 @@ def list_agents(
     return result
 
 
+@log_call
+def list_agents_on_hosts(
+    mngr_ctx: MngrContext,
+    # The hosts to list agents from, e.g. the hosts named by new discovery events
+    host_refs: Sequence[DiscoveredHost],
+    # CEL expressions - only include agents matching these
+    include_filters: tuple[str, ...] = (),
+    # CEL expressions - exclude agents matching these
+    exclude_filters: tuple[str, ...] = (),
+    # How to handle errors (abort or continue)
+    error_behavior: ErrorBehavior = ErrorBehavior.ABORT,
+) -> ListResult:
+    """List the agents on the given hosts only.
+
+    This is the host-scoped counterpart of list_agents for callers that already hold a
+    full listing and only need to bring a few hosts up to date (e.g. `mngr list --watch`
+    after a discovery event). Only the providers that own the given hosts are loaded,
+    and hosts that no longer exist yield no agents instead of an error. No discovery
+    snapshot is written, since the result is partial by construction.
+    """
+    result = ListResult()
+    if not host_refs:
+        return result
+
+    compiled_include_filters: list[CompiledCelExpression] = []
+    compiled_exclude_filters: list[CompiledCelExpression] = []
+    if include_filters or exclude_filters:
+        compiled_include_filters, compiled_exclude_filters = compile_cel_filters(include_filters, exclude_filters)
+
+    results_lock = Lock()
+    params = _ListAgentsParams(
+        compiled_include_filters=compiled_include_filters,
+        compiled_exclude_filters=compiled_exclude_filters,
+        error_behavior=error_behavior,
+        on_agent=None,
+        on_error=None,
+        field_generators=_get_agent_field_generators(mngr_ctx),
+    )
+
+    try:
+        provider_names = tuple(sorted({str(host_ref.provider_name) for host_ref in host_refs}))
+        providers = get_all_provider_instances(mngr_ctx, provider_names, reset_caches=True)
+        provider_map = {provider.name: provider for provider in providers}
+
+        futures: list[Future[None]] = []
+        with ConcurrencyGroupExecutor(
+            parent_cg=mngr_ctx.concurrency_group, name="list_agents_on_hosts", max_workers=32
+        ) as executor:
+            for host_ref in host_refs:
+                provider = provider_map.get(host_ref.provider_name)
+                if not provider:
+                    exception = ProviderInstanceNotFoundError(host_ref.provider_name)
+                    if error_behavior == ErrorBehavior.ABORT:
+                        raise exception
+                    result.errors.append(ProviderErrorInfo.build_for_provider(exception, host_ref.provider_name))
+                    continue
+                futures.append(
+                    executor.submit(_discover_and_process_host, host_ref, provider, params, result, results_lock)
+                )
+
+        for future in futures:
+            future.result()
+
+    except MngrError as e:
+        if error_behavior == ErrorBehavior.ABORT:
+            raise
+        result.errors.append(ErrorInfo.build(e))
+
+    return result
+
+
+def _get_agent_field_generators(
+    mngr_ctx: MngrContext,
+) -> dict[str, dict[str, Callable[[AgentInterface, OnlineHostInterface], Any]]]:
+    """Collect the plugin-provided agent field generators, keyed by plugin name."""
+    field_generators: dict[str, dict[str, Callable[[AgentInterface, OnlineHostInterface], Any]]] = {}
+    for hook_result in mngr_ctx.pm.hook.agent_field_generators():
+        if hook_result is not None:
+            plugin_name, generators = hook_result
+            field_generators[plugin_name] = generators
+    return field_generators
+
+
+def _discover_and_process_host(
+    host_ref: DiscoveredHost,
+    provider: ProviderInstanceInterface,
+    params: _ListAgentsParams,
+    result: ListResult,
+    results_lock: Lock,
+) -> None:
+    """Fetch the agent references of a single host, then collect its agents.
+
+    This function is run in a thread by list_agents_on_hosts.
+    """
+    try:
+        agent_refs = provider.get_host(host_ref.host_id).discover_agents()
+    except HostNotFoundError as e:
+        logger.trace("Host {} no longer exists, so it has no agents to list: {}", host_ref.host_id, e)
+        return
+    except (MngrError, BaseMngrError) as e:
+        _handle_listing_error(host_ref, e, params, result, results_lock)
+        return
+    if agent_refs:
+        _process_host_with_error_handling(host_ref, agent_refs, provider, params, result, results_lock)
+
+
 def _maybe_write_full_discovery_snapshot(
     mngr_ctx: MngrContext,
     result: ListResult,
@@ -463,14 +567,33 @@ def _process_host_with_error_handling(
             params.on_error(error_info)
 
 
+# Computed CEL fields and the AgentDetails fields they are derived from
+_CEL_COMPUTED_FIELD_SOURCES: Final[dict[str, tuple[str, ...]]] = {
+    "age": ("create_time",),
+    "runtime": ("runtime_seconds",),
+    "idle": ("user_activity_time", "agent_activity_time", "ssh_activity_time"),
+}
+
+
 @pure
-def agent_details_to_cel_context(agent: AgentDetails) -> dict[str, Any]:
+def agent_details_to_cel_context(
+    agent: AgentDetails,
+    # When given, only these top-level names (and the fields the computed ones derive from) are dumped
+    field_names: frozenset[str] | None = None,
+) -> dict[str, Any]:
     """Convert an AgentDetails object to a CEL-friendly dict.
 
     Converts the agent into a flat dictionary suitable for CEL evaluation,
     adding computed fields and type information.
     """
-    result = agent.model_dump(mode="json")
+    if field_names is None:
+        result = agent.model_dump(mode="json")
+    else:
+        source_field_names = set(field_names)
+        for computed_name, computed_from in _CEL_COMPUTED_FIELD_SOURCES.items():
+            if computed_name in field_names:
+                source_field_names.update(computed_from)
+        result = agent.model_dump(mode="json", include=source_field_names)
 
     # Add age from create_time
     if result.get("create_time"):
@@ -510,15 +633,17 @@ def agent_details_to_cel_context(agent: AgentDetails) -> dict[str, Any]:
 
 def _apply_cel_filters(
     agent: AgentDetails,
-    include_filters: Sequence[Any],
-    exclude_filters: Sequence[Any],
+    include_filters: Sequence[CompiledCelExpression],
+    exclude_filters: Sequence[CompiledCelExpression],
 ) -> bool:
     """Apply CEL filters to an agent.
 
     Returns True if the agent should be included (matches all include filters
     and doesn't match any exclude filters).
     """
-    context = agent_details_to_cel_context(agent)
+    # Only dump the fields the filters actually reference
+    field_names = get_referenced_cel_names([*include_filters, *exclude_filters])
+    context = agent_details_to_cel_context(agent, field_names)
     return apply_cel_filters_to_context(
         context=context,
         include_filters=include_filters,
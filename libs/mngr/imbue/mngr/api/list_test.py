@@ -378,6 +378,24 @@ def test_agent_details_to_cel_context_normalizes_host_provider() -> None:
     assert host["provider"] == "modal"
 
 
+def test_agent_details_to_cel_context_with_field_names_dumps_only_those_fields() -> None:
+    """agent_details_to_cel_context should limit the dump to the given names, keeping computed fields."""
+    host_details = HostDetails(
+        id=HostId.generate(),
+        name="test-host",
+        provider_name=ProviderInstanceName("modal"),
+    )
+    agent = _make_agent_details("test-agent", host_details)
+    full_context = agent_details_to_cel_context(agent)
+    context = agent_details_to_cel_context(agent, frozenset({"name", "host", "age"}))
+
+    assert context["name"] == "test-agent"
+    assert context["host"] == full_context["host"]
+    assert "age" in context
+    assert "command" not in context
+    assert "state" not in context
+
+
 # =============================================================================
 # _apply_cel_filters Tests
 # =============================================================================
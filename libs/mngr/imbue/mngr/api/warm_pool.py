@@ -0,0 +1,385 @@
+import fcntl
+import hashlib
+import json
+import os
+import shlex
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+from typing import Final
+from uuid import uuid4
+
+from loguru import logger
+from pydantic import Field
+from pydantic import ValidationError
+
+from imbue.concurrency_group.errors import ProcessError
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.logging import log_span
+from imbue.imbue_common.model_update import to_update
+from imbue.imbue_common.pure import pure
+from imbue.mngr.config.data_types import MngrConfig
+from imbue.mngr.errors import HostNotFoundError
+from imbue.mngr.errors import MngrError
+from imbue.mngr.interfaces.data_types import HostLifecycleOptions
+from imbue.mngr.interfaces.host import NewHostOptions
+from imbue.mngr.interfaces.host import OnlineHostInterface
+from imbue.mngr.interfaces.provider_instance import ProviderInstanceInterface
+from imbue.mngr.primitives import HostId
+from imbue.mngr.primitives import HostName
+from imbue.mngr.primitives import ProviderInstanceName
+from imbue.mngr.primitives import SnapshotName
+from imbue.mngr.utils.file_utils import atomic_write
+
+# Prefix of the names that pre-provisioned hosts carry until they are claimed (and renamed) by a create
+_POOLED_HOST_NAME_PREFIX: Final[str] = "warm-pool-"
+
+_TEMPLATE_FILE_NAME: Final[str] = "template.json"
+_TOP_UP_LOCK_FILE_NAME: Final[str] = "top_up.lock"
+# Output of the detached `mngr warmpool` processes that top up the pool
+_TOP_UP_LOG_FILE_NAME: Final[str] = "top_up.log"
+# Holds one record per idle host that is ready to be claimed
+_READY_DIR_NAME: Final[str] = "ready"
+# Holds one record per host that is being created, so that hosts left behind by an interrupted top-up can be found
+_PROVISIONING_DIR_NAME: Final[str] = "provisioning"
+
+# How long to keep looking for a host whose creation was interrupted, in case the provider does not list it right away
+_INTERRUPTED_HOST_LOOKUP_SECONDS: Final[float] = 3600.0
+
+
+class WarmPoolHostTemplate(FrozenModel):
+    """The options that the hosts of a warm pool are created with.
+
+    A pooled host is only handed out to a create that asked for a host with exactly
+    these options. Host env vars are not part of the template, since they are written
+    to the host after it has been created (or claimed).
+    """
+
+    tags: dict[str, str] = Field(default_factory=dict, description="Metadata tags for the host")
+    build_args: tuple[str, ...] = Field(default=(), description="Arguments for the build command")
+    start_args: tuple[str, ...] = Field(default=(), description="Arguments for the start command")
+    snapshot: SnapshotName | None = Field(default=None, description="Snapshot to create the host from")
+    lifecycle: HostLifecycleOptions = Field(
+        default_factory=HostLifecycleOptions, description="Lifecycle and idle detection options"
+    )
+    known_hosts: tuple[str, ...] = Field(default=(), description="SSH known_hosts entries to add to the host")
+    authorized_keys: tuple[str, ...] = Field(default=(), description="SSH authorized_keys entries to add to the host")
+
+    def get_fingerprint(self) -> str:
+        """Return a short, stable identifier of these options."""
+        canonical_json = json.dumps(self.model_dump(mode="json"), sort_keys=True)
+        return hashlib.sha256(canonical_json.encode()).hexdigest()[:16]
+
+
+class WarmPoolHostRecord(FrozenModel):
+    """A host that was created for a warm pool and has not been claimed yet."""
+
+    host_name: HostName = Field(description="Name the host was created with")
+    host_id: HostId | None = Field(description="ID of the host (None while the host is still being created)")
+    created_at: datetime = Field(description="When creation of the host started")
+
+
+@pure
+def make_warm_pool_host_template(options: NewHostOptions) -> WarmPoolHostTemplate:
+    """Return the warm pool template matching the options of a new host."""
+    return WarmPoolHostTemplate(
+        tags=options.tags,
+        build_args=options.build.build_args,
+        start_args=options.build.start_args,
+        snapshot=options.build.snapshot,
+        lifecycle=options.lifecycle,
+        known_hosts=options.environment.known_hosts,
+        authorized_keys=options.environment.authorized_keys,
+    )
+
+
+@pure
+def get_warm_pool_dir(config: MngrConfig) -> Path:
+    """Return the directory holding the warm pool records of each provider."""
+    return Path(config.default_host_dir).expanduser() / "warm_pool"
+
+
+@pure
+def _get_provider_pool_dir(config: MngrConfig, provider_name: ProviderInstanceName) -> Path:
+    return get_warm_pool_dir(config) / str(provider_name)
+
+
+@pure
+def _get_template_pool_dir(
+    config: MngrConfig, provider_name: ProviderInstanceName, template: WarmPoolHostTemplate
+) -> Path:
+    return _get_provider_pool_dir(config, provider_name) / template.get_fingerprint()
+
+
+def _load_records(records_dir: Path) -> list[tuple[Path, WarmPoolHostRecord]]:
+    """Load the host records in a directory, oldest first."""
+    if not records_dir.is_dir():
+        return []
+    records: list[tuple[Path, WarmPoolHostRecord]] = []
+    for record_path in records_dir.glob("*.json"):
+        try:
+            record = WarmPoolHostRecord.model_validate_json(record_path.read_text())
+        except FileNotFoundError:
+            # Claimed by another process since the directory was listed
+            continue
+        except (OSError, ValidationError) as e:
+            logger.warning("Ignored invalid warm pool record {}: {}", record_path, e)
+            continue
+        records.append((record_path, record))
+    return sorted(records, key=lambda path_and_record: path_and_record[1].created_at)
+
+
+def _is_record_expired(record: WarmPoolHostRecord, max_idle_seconds: float) -> bool:
+    return record.created_at < datetime.now(timezone.utc) - timedelta(seconds=max_idle_seconds)
+
+
+def _take_record(record_path: Path) -> bool:
+    """Remove a record, returning whether this call was the one that removed it.
+
+    Removing the record is what claims its host, so exactly one process gets each host.
+    """
+    try:
+        record_path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _destroy_pooled_host(provider: ProviderInstanceInterface, record: WarmPoolHostRecord) -> bool:
+    """Destroy a pooled host that will never be claimed, returning False if the provider does not know the host.
+
+    Any other failure is logged rather than raised.
+    """
+    host_ref = record.host_id if record.host_id is not None else record.host_name
+    with log_span("Destroying warm pool host {} of provider {}", record.host_name, provider.name):
+        try:
+            host = provider.get_host(host_ref)
+            provider.destroy_host(host)
+        except HostNotFoundError:
+            logger.debug("Warm pool host {} was not found", record.host_name)
+            return False
+        except MngrError as e:
+            logger.warning("Failed to destroy warm pool host {}: {}", record.host_name, e)
+    return True
+
+
+def claim_warm_pool_host(
+    provider: ProviderInstanceInterface,
+    template: WarmPoolHostTemplate,
+    name: HostName,
+) -> OnlineHostInterface | None:
+    """Claim an idle, pre-provisioned host that was created with the given template, renaming it to name.
+
+    Returns None when the provider has no warm pool, or no usable host is ready, in
+    which case the caller should create the host itself. Hosts that sat in the pool for
+    longer than the provider's warm pool max idle time, or that are no longer online,
+    are destroyed instead of being handed out.
+    """
+    if provider.get_warm_pool_size() <= 0:
+        return None
+    config = provider.mngr_ctx.config
+    ready_dir = _get_template_pool_dir(config, provider.name, template) / _READY_DIR_NAME
+    max_idle_seconds = provider.get_warm_pool_max_idle_seconds()
+    # Hand out the most recently created hosts first, since they are the least likely to have gone idle
+    for record_path, record in reversed(_load_records(ready_dir)):
+        if not _take_record(record_path):
+            continue
+        if record.host_id is None or _is_record_expired(record, max_idle_seconds):
+            _destroy_pooled_host(provider, record)
+            continue
+        try:
+            host = provider.rename_host(record.host_id, name)
+        except MngrError as e:
+            logger.warning("Failed to claim warm pool host {}: {}", record.host_name, e)
+            _destroy_pooled_host(provider, record)
+            continue
+        if not isinstance(host, OnlineHostInterface):
+            logger.debug("Warm pool host {} is no longer online", record.host_name)
+            _destroy_pooled_host(provider, record)
+            continue
+        logger.debug("Claimed warm pool host {} as {}", record.host_name, name)
+        return host
+    return None
+
+
+def _recycle_expired_hosts(provider: ProviderInstanceInterface) -> None:
+    """Destroy the hosts of every one of the provider's pools that sat unclaimed for too long."""
+    provider_pool_dir = _get_provider_pool_dir(provider.mngr_ctx.config, provider.name)
+    if not provider_pool_dir.is_dir():
+        return
+    max_idle_seconds = provider.get_warm_pool_max_idle_seconds()
+    for template_pool_dir in provider_pool_dir.iterdir():
+        for record_path, record in _load_records(template_pool_dir / _READY_DIR_NAME):
+            if _is_record_expired(record, max_idle_seconds) and _take_record(record_path):
+                _destroy_pooled_host(provider, record)
+
+
+def _destroy_interrupted_hosts(provider: ProviderInstanceInterface, template_pool_dir: Path) -> None:
+    """Destroy the hosts of a pool whose creation was interrupted.
+
+    Must only be called while holding the pool's top-up lock, since nothing else is creating
+    hosts for the pool then, so any host still marked as provisioning was left behind.
+    """
+    for record_path, record in _load_records(template_pool_dir / _PROVISIONING_DIR_NAME):
+        if _destroy_pooled_host(provider, record):
+            record_path.unlink(missing_ok=True)
+        elif _is_record_expired(record, _INTERRUPTED_HOST_LOOKUP_SECONDS):
+            logger.warning(
+                "Gave up looking for warm pool host {} of provider {}, whose creation was interrupted",
+                record.host_name,
+                provider.name,
+            )
+            record_path.unlink(missing_ok=True)
+        else:
+            # The host may have been created without the provider listing it yet, so look for it again next time
+            logger.debug("Will look for interrupted warm pool host {} again later", record.host_name)
+
+
+@contextmanager
+def _top_up_lock(template_pool_dir: Path) -> Iterator[bool]:
+    """Hold the lock that allows topping up a pool, yielding False if another process already holds it."""
+    lock_path = template_pool_dir / _TOP_UP_LOCK_FILE_NAME
+    fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        yield True
+    finally:
+        # Closing the file descriptor also releases the lock
+        os.close(fd)
+
+
+def _provision_pooled_host(
+    provider: ProviderInstanceInterface,
+    template: WarmPoolHostTemplate,
+    template_pool_dir: Path,
+) -> None:
+    host_name = HostName(f"{_POOLED_HOST_NAME_PREFIX}{uuid4().hex[:12]}")
+    with log_span("Calling on_before_host_create hooks"):
+        provider.mngr_ctx.pm.hook.on_before_host_create(name=host_name, provider_name=provider.name)
+    record = WarmPoolHostRecord(host_name=host_name, host_id=None, created_at=datetime.now(timezone.utc))
+    provisioning_path = template_pool_dir / _PROVISIONING_DIR_NAME / f"{host_name}.json"
+    atomic_write(provisioning_path, record.model_dump_json())
+    with log_span("Creating warm pool host {} using provider {}", host_name, provider.name):
+        host = provider.create_host(
+            name=host_name,
+            tags=template.tags,
+            build_args=template.build_args,
+            start_args=template.start_args,
+            lifecycle=template.lifecycle,
+            known_hosts=template.known_hosts,
+            authorized_keys=template.authorized_keys,
+            snapshot=template.snapshot,
+        )
+    ready_record = record.model_copy_update(to_update(record.field_ref().host_id, host.id))
+    atomic_write(template_pool_dir / _READY_DIR_NAME / f"{host_name}.json", ready_record.model_dump_json())
+    provisioning_path.unlink()
+
+
+def _save_template(provider: ProviderInstanceInterface, template: WarmPoolHostTemplate) -> Path:
+    """Record the template of a pool in the pool's directory, returning that directory."""
+    template_pool_dir = _get_template_pool_dir(provider.mngr_ctx.config, provider.name, template)
+    template_pool_dir.mkdir(parents=True, exist_ok=True)
+    atomic_write(template_pool_dir / _TEMPLATE_FILE_NAME, template.model_dump_json())
+    return template_pool_dir
+
+
+def load_warm_pool_host_template(provider: ProviderInstanceInterface, fingerprint: str) -> WarmPoolHostTemplate:
+    """Load the template of one of the provider's pools, given the template's fingerprint."""
+    template_path = _get_provider_pool_dir(provider.mngr_ctx.config, provider.name) / fingerprint / _TEMPLATE_FILE_NAME
+    try:
+        return WarmPoolHostTemplate.model_validate_json(template_path.read_text())
+    except FileNotFoundError as e:
+        raise MngrError(f"Provider {provider.name} has no warm pool with template {fingerprint}") from e
+    except ValidationError as e:
+        raise MngrError(f"Invalid warm pool template {template_path}: {e}") from e
+
+
+def build_warm_pool_top_up_command(provider_name: ProviderInstanceName, fingerprint: str) -> list[str]:
+    """Return the `mngr warmpool` command that tops up the provider's pool for a template.
+
+    Uses the mngr script installed next to the running interpreter when there is one,
+    so that the top-up runs the same mngr (and plugins) as the create that started it.
+    """
+    installed_mngr_path = Path(sys.executable).parent / "mngr"
+    mngr_executable = str(installed_mngr_path) if installed_mngr_path.exists() else "mngr"
+    return [mngr_executable, "warmpool", "--provider", str(provider_name), "--template", fingerprint]
+
+
+def start_warm_pool_top_up(provider: ProviderInstanceInterface, template: WarmPoolHostTemplate) -> None:
+    """Top up the provider's pool for the template in a detached `mngr warmpool` process, without waiting for it.
+
+    The process outlives the current one, so the pool keeps being topped up after a
+    create returns. Its output is appended to a log file in the pool's directory.
+    Does nothing when the provider has no warm pool.
+    """
+    if provider.get_warm_pool_size() <= 0:
+        return
+    template_pool_dir = _save_template(provider, template)
+    top_up_command = shlex.join(build_warm_pool_top_up_command(provider.name, template.get_fingerprint()))
+    log_path = shlex.quote(str(template_pool_dir / _TOP_UP_LOG_FILE_NAME))
+    # Launch in a subshell so the & only backgrounds the nohup, and the shell exits right away
+    detached_command = f"(nohup {top_up_command} </dev/null >>{log_path} 2>&1 &)"
+    with log_span("Starting top-up of warm pool {} of provider {}", template.get_fingerprint(), provider.name):
+        try:
+            provider.mngr_ctx.concurrency_group.run_process_to_completion(["sh", "-c", detached_command])
+        except ProcessError as e:
+            raise MngrError(f"Failed to start topping up the warm pool of provider {provider.name}: {e}") from e
+
+
+def top_up_warm_pool(provider: ProviderInstanceInterface, template: WarmPoolHostTemplate) -> None:
+    """Create hosts until the provider's pool for the template holds its configured number of idle hosts.
+
+    Also recycles the hosts of the provider's pools that sat unclaimed for too long.
+    Does nothing when another process is already topping up the same pool.
+    """
+    pool_size = provider.get_warm_pool_size()
+    if pool_size <= 0:
+        return
+    _recycle_expired_hosts(provider)
+
+    template_pool_dir = _save_template(provider, template)
+    with _top_up_lock(template_pool_dir) as is_locked:
+        if not is_locked:
+            logger.debug("Warm pool {} of provider {} is already being topped up", template_pool_dir, provider.name)
+            return
+        _destroy_interrupted_hosts(provider, template_pool_dir)
+
+        missing_count = pool_size - len(_load_records(template_pool_dir / _READY_DIR_NAME))
+        for _ in range(missing_count):
+            _provision_pooled_host(provider, template, template_pool_dir)
+
+
+def reap_warm_pools(provider: ProviderInstanceInterface) -> None:
+    """Destroy the provider's pooled hosts that sat unclaimed for too long, or whose creation was interrupted.
+
+    Top-ups do this as well, but they only happen after hosts are created, so gc calls this too.
+    """
+    provider_pool_dir = _get_provider_pool_dir(provider.mngr_ctx.config, provider.name)
+    if not provider_pool_dir.is_dir():
+        return
+    _recycle_expired_hosts(provider)
+    for template_pool_dir in provider_pool_dir.iterdir():
+        with _top_up_lock(template_pool_dir) as is_locked:
+            if is_locked:
+                _destroy_interrupted_hosts(provider, template_pool_dir)
+
+
+def is_warm_pool_host(provider: ProviderInstanceInterface, host_name: HostName) -> bool:
+    """Return whether a host is idle in, or being created for, one of the provider's warm pools."""
+    if not host_name.startswith(_POOLED_HOST_NAME_PREFIX):
+        return False
+    provider_pool_dir = _get_provider_pool_dir(provider.mngr_ctx.config, provider.name)
+    record_file_name = f"{host_name}.json"
+    return any(
+        (template_pool_dir / records_dir_name / record_file_name).exists()
+        for template_pool_dir in provider_pool_dir.glob("*")
+        for records_dir_name in (_READY_DIR_NAME, _PROVISIONING_DIR_NAME)
+    )
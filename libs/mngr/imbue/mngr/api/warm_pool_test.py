@@ -0,0 +1,301 @@
+from collections.abc import Generator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+
+import pluggy
+import pytest
+from pydantic import Field
+
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.imbue_common.model_update import to_update
+from imbue.mngr import hookimpl
+from imbue.mngr.api.warm_pool import WarmPoolHostRecord
+from imbue.mngr.api.warm_pool import WarmPoolHostTemplate
+from imbue.mngr.api.warm_pool import build_warm_pool_top_up_command
+from imbue.mngr.api.warm_pool import claim_warm_pool_host
+from imbue.mngr.api.warm_pool import get_warm_pool_dir
+from imbue.mngr.api.warm_pool import is_warm_pool_host
+from imbue.mngr.api.warm_pool import load_warm_pool_host_template
+from imbue.mngr.api.warm_pool import reap_warm_pools
+from imbue.mngr.api.warm_pool import start_warm_pool_top_up
+from imbue.mngr.api.warm_pool import top_up_warm_pool
+from imbue.mngr.config.data_types import MngrConfig
+from imbue.mngr.config.data_types import MngrContext
+from imbue.mngr.config.data_types import ProviderInstanceConfig
+from imbue.mngr.errors import HostNotFoundError
+from imbue.mngr.errors import MngrError
+from imbue.mngr.hosts.host import Host
+from imbue.mngr.interfaces.data_types import HostLifecycleOptions
+from imbue.mngr.interfaces.data_types import PyinfraConnector
+from imbue.mngr.interfaces.host import HostInterface
+from imbue.mngr.primitives import HostId
+from imbue.mngr.primitives import HostName
+from imbue.mngr.primitives import ImageReference
+from imbue.mngr.primitives import ProviderBackendName
+from imbue.mngr.primitives import ProviderInstanceName
+from imbue.mngr.primitives import SnapshotName
+from imbue.mngr.providers.local.instance import LocalProviderInstance
+from imbue.mngr.providers.mock_provider_test import MockProviderInstance
+from imbue.mngr.utils.testing import make_mngr_ctx
+
+_POOLED: ProviderInstanceName = ProviderInstanceName("pooled")
+
+_TEMPLATE: WarmPoolHostTemplate = WarmPoolHostTemplate(build_args=("--cpu", "2"))
+
+
+class _FakeHostCreatingProvider(MockProviderInstance):
+    """Provider that creates in-memory hosts, all backed by a local connector."""
+
+    local_provider: LocalProviderInstance = Field(description="Provides the connector of every created host")
+    host_by_id: dict[HostId, Host] = Field(default_factory=dict)
+    name_by_host_id: dict[HostId, HostName] = Field(default_factory=dict)
+    created_host_ids: list[HostId] = Field(default_factory=list)
+    destroyed_host_ids: list[HostId] = Field(default_factory=list)
+
+    def create_host(
+        self,
+        name: HostName,
+        image: ImageReference | None = None,
+        tags: Mapping[str, str] | None = None,
+        build_args: Sequence[str] | None = None,
+        start_args: Sequence[str] | None = None,
+        lifecycle: HostLifecycleOptions | None = None,
+        known_hosts: Sequence[str] | None = None,
+        authorized_keys: Sequence[str] | None = None,
+        snapshot: SnapshotName | None = None,
+    ) -> Host:
+        host = Host(
+            id=HostId.generate(),
+            connector=PyinfraConnector(self.local_provider.get_connector(self.local_provider.host_id)),
+            provider_instance=self,
+            mngr_ctx=self.mngr_ctx,
+        )
+        self.host_by_id[host.id] = host
+        self.name_by_host_id[host.id] = name
+        self.created_host_ids.append(host.id)
+        return host
+
+    def get_host(self, host: HostId | HostName) -> HostInterface:
+        for host_id, host_name in self.name_by_host_id.items():
+            if host in (host_id, host_name):
+                return self.host_by_id[host_id]
+        raise HostNotFoundError(host)
+
+    def rename_host(self, host: HostInterface | HostId, name: HostName) -> HostInterface:
+        host_obj = self.get_host(host.id if isinstance(host, HostInterface) else host)
+        self.name_by_host_id[host_obj.id] = name
+        return host_obj
+
+    def destroy_host(self, host: HostInterface | HostId) -> None:
+        host_id = host.id if isinstance(host, HostInterface) else host
+        self.host_by_id.pop(host_id)
+        self.name_by_host_id.pop(host_id)
+        self.destroyed_host_ids.append(host_id)
+
+
+def _make_pooled_config(temp_config: MngrConfig, warm_pool_max_idle_seconds: float | None) -> MngrConfig:
+    provider_config = ProviderInstanceConfig(
+        backend=ProviderBackendName("pooled"),
+        warm_pool_size=2,
+        warm_pool_max_idle_seconds=warm_pool_max_idle_seconds,
+    )
+    return temp_config.model_copy_update(to_update(temp_config.field_ref().providers, {_POOLED: provider_config}))
+
+
+@pytest.fixture
+def pooled_mngr_ctx(
+    temp_config: MngrConfig,
+    temp_profile_dir: Path,
+    plugin_manager: pluggy.PluginManager,
+) -> Generator[MngrContext, None, None]:
+    """A MngrContext in which the pooled provider keeps two hosts per template ready."""
+    with ConcurrencyGroup(name="test") as cg:
+        yield make_mngr_ctx(
+            _make_pooled_config(temp_config, None), plugin_manager, temp_profile_dir, concurrency_group=cg
+        )
+
+
+def _make_provider(mngr_ctx: MngrContext, local_provider: LocalProviderInstance) -> _FakeHostCreatingProvider:
+    return _FakeHostCreatingProvider(
+        name=_POOLED, host_dir=local_provider.host_dir, mngr_ctx=mngr_ctx, local_provider=local_provider
+    )
+
+
+def test_warm_pool_is_disabled_by_default(temp_mngr_ctx: MngrContext, local_provider: LocalProviderInstance) -> None:
+    provider = _make_provider(temp_mngr_ctx, local_provider)
+
+    top_up_warm_pool(provider, _TEMPLATE)
+
+    assert provider.created_host_ids == []
+    assert not get_warm_pool_dir(temp_mngr_ctx.config).exists()
+    assert claim_warm_pool_host(provider, _TEMPLATE, HostName("my-host")) is None
+
+
+def test_claims_hand_out_each_pooled_host_once(
+    pooled_mngr_ctx: MngrContext, local_provider: LocalProviderInstance
+) -> None:
+    provider = _make_provider(pooled_mngr_ctx, local_provider)
+
+    top_up_warm_pool(provider, _TEMPLATE)
+    assert len(provider.created_host_ids) == 2
+    assert all(name.startswith("warm-pool-") for name in provider.name_by_host_id.values())
+
+    pooled_host_names = list(provider.name_by_host_id.values())
+    assert all(is_warm_pool_host(provider, name) for name in pooled_host_names)
+
+    first_host = claim_warm_pool_host(provider, _TEMPLATE, HostName("first"))
+    second_host = claim_warm_pool_host(provider, _TEMPLATE, HostName("second"))
+
+    assert first_host is not None and second_host is not None
+    assert not any(is_warm_pool_host(provider, name) for name in pooled_host_names)
+    assert {first_host.id, second_host.id} == set(provider.created_host_ids)
+    assert provider.name_by_host_id[first_host.id] == HostName("first")
+    assert provider.name_by_host_id[second_host.id] == HostName("second")
+    assert claim_warm_pool_host(provider, _TEMPLATE, HostName("third")) is None
+
+    # Topping up again replaces the claimed hosts
+    top_up_warm_pool(provider, _TEMPLATE)
+    assert len(provider.created_host_ids) == 4
+
+
+class _HostCreateHookTracker:
+    """Test plugin that records the names of the hosts about to be created."""
+
+    def __init__(self) -> None:
+        self.host_names: list[HostName] = []
+
+    @hookimpl
+    def on_before_host_create(self, name: HostName, provider_name: ProviderInstanceName) -> None:
+        self.host_names.append(name)
+
+
+def test_pooled_host_creation_calls_on_before_host_create_hooks(
+    pooled_mngr_ctx: MngrContext, local_provider: LocalProviderInstance
+) -> None:
+    provider = _make_provider(pooled_mngr_ctx, local_provider)
+    tracker = _HostCreateHookTracker()
+    pooled_mngr_ctx.pm.register(tracker)
+
+    top_up_warm_pool(provider, _TEMPLATE)
+
+    assert tracker.host_names == list(provider.name_by_host_id.values())
+
+
+def test_top_up_command_loads_the_template_of_the_pool(
+    pooled_mngr_ctx: MngrContext, local_provider: LocalProviderInstance
+) -> None:
+    provider = _make_provider(pooled_mngr_ctx, local_provider)
+    top_up_warm_pool(provider, _TEMPLATE)
+
+    command = build_warm_pool_top_up_command(provider.name, _TEMPLATE.get_fingerprint())
+
+    assert command[1:] == ["warmpool", "--provider", "pooled", "--template", _TEMPLATE.get_fingerprint()]
+    assert load_warm_pool_host_template(provider, _TEMPLATE.get_fingerprint()) == _TEMPLATE
+    with pytest.raises(MngrError, match="no warm pool"):
+        load_warm_pool_host_template(provider, "0" * 16)
+
+
+def test_starting_a_top_up_does_nothing_without_a_warm_pool(
+    temp_mngr_ctx: MngrContext, local_provider: LocalProviderInstance
+) -> None:
+    provider = _make_provider(temp_mngr_ctx, local_provider)
+
+    start_warm_pool_top_up(provider, _TEMPLATE)
+
+    assert not get_warm_pool_dir(temp_mngr_ctx.config).exists()
+
+
+def test_claims_only_hand_out_hosts_created_with_the_same_template(
+    pooled_mngr_ctx: MngrContext, local_provider: LocalProviderInstance
+) -> None:
+    provider = _make_provider(pooled_mngr_ctx, local_provider)
+    top_up_warm_pool(provider, _TEMPLATE)
+
+    other_template = WarmPoolHostTemplate(build_args=("--cpu", "4"))
+
+    assert claim_warm_pool_host(provider, other_template, HostName("my-host")) is None
+    assert claim_warm_pool_host(provider, _TEMPLATE, HostName("my-host")) is not None
+
+
+def test_hosts_idle_past_the_max_idle_time_are_recycled(
+    temp_config: MngrConfig,
+    temp_profile_dir: Path,
+    plugin_manager: pluggy.PluginManager,
+    local_provider: LocalProviderInstance,
+) -> None:
+    config = _make_pooled_config(temp_config, warm_pool_max_idle_seconds=0.0)
+    with ConcurrencyGroup(name="test") as cg:
+        provider = _make_provider(
+            make_mngr_ctx(config, plugin_manager, temp_profile_dir, concurrency_group=cg), local_provider
+        )
+        top_up_warm_pool(provider, _TEMPLATE)
+        expired_host_ids = list(provider.created_host_ids)
+
+        top_up_warm_pool(provider, _TEMPLATE)
+
+        assert provider.destroyed_host_ids == expired_host_ids
+        assert len(provider.host_by_id) == 2
+        # Expired hosts are never handed out either
+        assert claim_warm_pool_host(provider, _TEMPLATE, HostName("my-host")) is None
+        assert provider.host_by_id == {}
+
+
+def test_expired_hosts_are_reaped_without_a_top_up(
+    temp_config: MngrConfig,
+    temp_profile_dir: Path,
+    plugin_manager: pluggy.PluginManager,
+    local_provider: LocalProviderInstance,
+) -> None:
+    config = _make_pooled_config(temp_config, warm_pool_max_idle_seconds=0.0)
+    with ConcurrencyGroup(name="test") as cg:
+        provider = _make_provider(
+            make_mngr_ctx(config, plugin_manager, temp_profile_dir, concurrency_group=cg), local_provider
+        )
+        top_up_warm_pool(provider, _TEMPLATE)
+
+        reap_warm_pools(provider)
+
+        assert provider.destroyed_host_ids == provider.created_host_ids
+        assert provider.host_by_id == {}
+
+
+def _write_provisioning_record(mngr_ctx: MngrContext, host_name: HostName) -> Path:
+    record = WarmPoolHostRecord(host_name=host_name, host_id=None, created_at=datetime.now(timezone.utc))
+    provisioning_dir = get_warm_pool_dir(mngr_ctx.config) / _POOLED / _TEMPLATE.get_fingerprint() / "provisioning"
+    provisioning_dir.mkdir(parents=True, exist_ok=True)
+    (provisioning_dir / f"{host_name}.json").write_text(record.model_dump_json())
+    return provisioning_dir
+
+
+def test_top_up_destroys_hosts_left_behind_by_an_interrupted_top_up(
+    pooled_mngr_ctx: MngrContext, local_provider: LocalProviderInstance
+) -> None:
+    provider = _make_provider(pooled_mngr_ctx, local_provider)
+    abandoned_host = provider.create_host(HostName("warm-pool-abandoned"))
+    provisioning_dir = _write_provisioning_record(pooled_mngr_ctx, HostName("warm-pool-abandoned"))
+    assert is_warm_pool_host(provider, HostName("warm-pool-abandoned"))
+
+    top_up_warm_pool(provider, _TEMPLATE)
+
+    assert provider.destroyed_host_ids == [abandoned_host.id]
+    assert list(provisioning_dir.iterdir()) == []
+    assert claim_warm_pool_host(provider, _TEMPLATE, HostName("my-host")) is not None
+
+
+def test_interrupted_hosts_unknown_to_the_provider_are_looked_for_again(
+    pooled_mngr_ctx: MngrContext, local_provider: LocalProviderInstance
+) -> None:
+    provider = _make_provider(pooled_mngr_ctx, local_provider)
+    provisioning_dir = _write_provisioning_record(pooled_mngr_ctx, HostName("warm-pool-not-listed-yet"))
+
+    reap_warm_pools(provider)
+    assert [path.name for path in provisioning_dir.iterdir()] == ["warm-pool-not-listed-yet.json"]
+
+    late_host = provider.create_host(HostName("warm-pool-not-listed-yet"))
+    reap_warm_pools(provider)
+
+    assert provider.destroyed_host_ids == [late_host.id]
+    assert list(provisioning_dir.iterdir()) == []
@@ -0,0 +1,408 @@
+import json
+import threading
+import time
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Final
+
+import pluggy
+from pydantic import Field
+from pydantic import PrivateAttr
+
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.logging import format_nanosecond_iso_timestamp
+from imbue.imbue_common.logging import generate_log_event_id
+from imbue.imbue_common.mutable_model import MutableModel
+from imbue.imbue_common.pure import pure
+from imbue.mngr.agents.agent_registry import load_agents_from_plugins
+from imbue.mngr.api.discovery_events import get_discovery_events_path
+from imbue.mngr.api.discovery_events import resolve_provider_names_for_identifiers
+from imbue.mngr.api.events import EventRecord
+from imbue.mngr.api.events import EventsTarget
+from imbue.mngr.api.events import discover_event_sources
+from imbue.mngr.api.events import read_all_historical_events
+from imbue.mngr.api.events import stream_all_events
+from imbue.mngr.api.list import agent_details_to_cel_context
+from imbue.mngr.api.list import list_agents
+from imbue.mngr.api.providers import get_provider_instance
+from imbue.mngr.benchmarks import synthetic_provider
+from imbue.mngr.benchmarks.synthetic_fleet import SyntheticFleet
+from imbue.mngr.benchmarks.synthetic_fleet import SyntheticFleetSpec
+from imbue.mngr.benchmarks.synthetic_fleet import write_synthetic_fleet
+from imbue.mngr.benchmarks.synthetic_provider import RoundTripCounter
+from imbue.mngr.benchmarks.synthetic_provider import RoundTripKind
+from imbue.mngr.benchmarks.synthetic_provider import SYNTHETIC_BACKEND_NAME
+from imbue.mngr.benchmarks.synthetic_provider import SyntheticProviderConfig
+from imbue.mngr.benchmarks.synthetic_provider import get_round_trip_counter
+from imbue.mngr.config.data_types import MngrConfig
+from imbue.mngr.config.data_types import MngrContext
+from imbue.mngr.errors import MngrError
+from imbue.mngr.interfaces.data_types import AgentDetails
+from imbue.mngr.interfaces.host import OnlineHostInterface
+from imbue.mngr.plugins import hookspecs
+from imbue.mngr.primitives import ErrorBehavior
+from imbue.mngr.primitives import ProviderInstanceName
+from imbue.mngr.providers.registry import load_local_backend_only
+from imbue.mngr.providers.registry import reset_backend_registry
+from imbue.mngr.utils.cel_utils import apply_cel_filters_to_context
+from imbue.mngr.utils.cel_utils import compile_cel_filters
+from imbue.mngr.utils.cel_utils import get_referenced_cel_names
+
+SYNTHETIC_PROVIDER_NAME: Final[ProviderInstanceName] = ProviderInstanceName(str(SYNTHETIC_BACKEND_NAME))
+
+DEFAULT_CEL_INCLUDE_FILTERS: Final[tuple[str, ...]] = ('labels.team == "infra"', 'state != "RUNNING"')
+
+
+class FleetBenchmarkOptions(FrozenModel):
+    """What to measure against a synthetic fleet."""
+
+    simulated_round_trip_seconds: float = Field(
+        default=0.0, ge=0.0, description="Latency added to every host round trip, to approximate remote hosts"
+    )
+    cel_include_filters: tuple[str, ...] = Field(
+        default=DEFAULT_CEL_INCLUDE_FILTERS, description="CEL include filters evaluated against the listed agents"
+    )
+    discovery_lookup_count: int = Field(
+        default=100, ge=1, description="Number of agent names resolved by replaying the discovery events"
+    )
+    events_agent_count: int = Field(default=10, ge=1, description="Number of agents whose full event history is read")
+    follow_timeout_seconds: float = Field(
+        default=30.0, gt=0.0, description="How long to wait for a followed event before giving up"
+    )
+
+
+class BenchmarkPhaseResult(FrozenModel):
+    """Timing and cost of one benchmark phase."""
+
+    name: str = Field(description="Name of the phase")
+    duration_seconds: float = Field(description="Wall-clock duration of the phase")
+    item_count: int = Field(description="Number of items (agents, events, identifiers) the phase produced")
+    round_trips: dict[RoundTripKind, int] = Field(description="Round trips made during the phase, by kind")
+    first_item_seconds: float | None = Field(
+        default=None, description="Time until the first item was produced, for streaming phases"
+    )
+    error_count: int = Field(default=0, description="Number of errors reported during the phase")
+
+    @property
+    def total_round_trips(self) -> int:
+        return sum(self.round_trips.values())
+
+
+class FleetBenchmarkReport(FrozenModel):
+    """Results of running every benchmark phase against a synthetic fleet."""
+
+    spec: SyntheticFleetSpec = Field(description="The spec of the benchmarked fleet")
+    online_host_count: int = Field(description="Number of hosts served as online hosts")
+    setup_seconds: float = Field(description="Time taken to write the fleet to disk")
+    phases: tuple[BenchmarkPhaseResult, ...] = Field(description="Results of each phase, in the order they ran")
+
+
+class _PhaseTimer(MutableModel):
+    """Measures the duration and round trips of a single phase."""
+
+    counter: RoundTripCounter = Field(frozen=True, description="The fleet's round trip counter")
+
+    _started_at: float = PrivateAttr(default_factory=time.perf_counter)
+    _round_trips_before: dict[RoundTripKind, int] = PrivateAttr(default_factory=dict)
+    _first_item_at: float | None = PrivateAttr(default=None)
+
+    def start(self) -> "_PhaseTimer":
+        self._round_trips_before = self.counter.snapshot()
+        self._first_item_at = None
+        self._started_at = time.perf_counter()
+        return self
+
+    def record_item(self, _item: object) -> None:
+        if self._first_item_at is None:
+            self._first_item_at = time.perf_counter()
+
+    def finish(self, name: str, item_count: int, error_count: int = 0) -> BenchmarkPhaseResult:
+        duration_seconds = time.perf_counter() - self._started_at
+        round_trips_after = self.counter.snapshot()
+        round_trips = {
+            kind: count - self._round_trips_before.get(kind, 0)
+            for kind, count in round_trips_after.items()
+            if count != self._round_trips_before.get(kind, 0)
+        }
+        return BenchmarkPhaseResult(
+            name=name,
+            duration_seconds=duration_seconds,
+            item_count=item_count,
+            round_trips=round_trips,
+            first_item_seconds=None if self._first_item_at is None else self._first_item_at - self._started_at,
+            error_count=error_count,
+        )
+
+
+class _FollowStopped(Exception):
+    """Raised from the follow callback to end stream_all_events."""
+
+
+class _FollowProbe(MutableModel):
+    """Watches a followed event stream for a probe event appended by the benchmark."""
+
+    probe_event_id: str = Field(frozen=True, description="Event ID of the probe event")
+
+    _probe_received: threading.Event = PrivateAttr(default_factory=threading.Event)
+    _is_stop_requested: bool = PrivateAttr(default=False)
+
+    def on_event(self, event: EventRecord) -> None:
+        if event.event_id == self.probe_event_id:
+            self._probe_received.set()
+            raise _FollowStopped()
+        if self._is_stop_requested:
+            raise _FollowStopped()
+
+    def wait_for_probe(self, timeout_seconds: float) -> bool:
+        return self._probe_received.wait(timeout=timeout_seconds)
+
+    def request_stop(self) -> None:
+        self._is_stop_requested = True
+
+
+def build_benchmark_mngr_ctx(
+    fleet_root: Path,
+    cg: ConcurrencyGroup,
+    simulated_round_trip_seconds: float,
+) -> MngrContext:
+    """Build a mngr context whose only provider serves the synthetic fleet at fleet_root.
+
+    This replaces the process-wide provider backend registry, so it is meant for
+    benchmark processes (and tests, whose fixtures reset the registry afterwards).
+    """
+    mngr_dir = fleet_root / "mngr"
+    profile_dir = mngr_dir / "profiles" / "benchmark"
+    profile_dir.mkdir(parents=True, exist_ok=True)
+
+    pm = pluggy.PluginManager("mngr")
+    pm.add_hookspecs(hookspecs)
+    pm.register(synthetic_provider, name=str(SYNTHETIC_BACKEND_NAME))
+    reset_backend_registry()
+    load_local_backend_only(pm)
+    load_agents_from_plugins(pm)
+
+    config = MngrConfig(
+        prefix="mngr-bench-",
+        default_host_dir=mngr_dir,
+        enabled_backends=[SYNTHETIC_BACKEND_NAME],
+        providers={
+            SYNTHETIC_PROVIDER_NAME: SyntheticProviderConfig(
+                fleet_root=fleet_root,
+                simulated_round_trip_seconds=simulated_round_trip_seconds,
+            )
+        },
+    )
+    return MngrContext(config=config, pm=pm, profile_dir=profile_dir, concurrency_group=cg)
+
+
+def run_fleet_benchmark(
+    fleet_root: Path,
+    spec: SyntheticFleetSpec,
+    options: FleetBenchmarkOptions,
+    cg: ConcurrencyGroup,
+) -> FleetBenchmarkReport:
+    """Fabricate a synthetic fleet under fleet_root and time the listing, discovery and events paths against it.
+
+    Phases run in order: discovery event replay, batch listing, streaming
+    listing, CEL filtering of the listed agents, reading the full event
+    history of some agents, and following one agent's events until a newly
+    appended event arrives.
+    """
+    mngr_ctx = build_benchmark_mngr_ctx(fleet_root, cg, options.simulated_round_trip_seconds)
+
+    setup_started_at = time.perf_counter()
+    fleet = write_synthetic_fleet(
+        fleet_root, spec, SYNTHETIC_PROVIDER_NAME, get_discovery_events_path(mngr_ctx.config)
+    )
+    setup_seconds = time.perf_counter() - setup_started_at
+
+    timer = _PhaseTimer(counter=get_round_trip_counter(fleet_root))
+    phases: list[BenchmarkPhaseResult] = [_run_discovery_replay_phase(mngr_ctx, fleet, options, timer)]
+    batch_phase, listed_agents = _run_list_phase("list_batch", mngr_ctx, False, timer)
+    phases.append(batch_phase)
+    phases.append(_run_list_phase("list_streaming", mngr_ctx, True, timer)[0])
+    phases.append(_run_cel_filter_phase(listed_agents, options, timer))
+    phases.append(_run_historical_events_phase(mngr_ctx, fleet, options, timer))
+    phases.append(_run_events_follow_phase(mngr_ctx, fleet, options, timer, cg))
+
+    return FleetBenchmarkReport(
+        spec=spec,
+        online_host_count=sum(1 for host in fleet.hosts if host.is_online),
+        setup_seconds=setup_seconds,
+        phases=tuple(phases),
+    )
+
+
+def _run_discovery_replay_phase(
+    mngr_ctx: MngrContext,
+    fleet: SyntheticFleet,
+    options: FleetBenchmarkOptions,
+    timer: _PhaseTimer,
+) -> BenchmarkPhaseResult:
+    """Resolve agent names to providers by replaying the discovery events file."""
+    all_agent_names = [str(name) for host in fleet.hosts for name in host.agent_names]
+    identifiers = all_agent_names[: options.discovery_lookup_count]
+    timer.start()
+    resolved_provider_names = resolve_provider_names_for_identifiers(mngr_ctx.config, identifiers)
+    return timer.finish(
+        "discovery_replay",
+        item_count=len(identifiers) if resolved_provider_names is not None else 0,
+        error_count=0 if resolved_provider_names is not None or not identifiers else 1,
+    )
+
+
+def _run_list_phase(
+    name: str,
+    mngr_ctx: MngrContext,
+    is_streaming: bool,
+    timer: _PhaseTimer,
+) -> tuple[BenchmarkPhaseResult, list[AgentDetails]]:
+    timer.start()
+    result = list_agents(
+        mngr_ctx=mngr_ctx,
+        is_streaming=is_streaming,
+        error_behavior=ErrorBehavior.CONTINUE,
+        on_agent=timer.record_item,
+        reset_caches=True,
+    )
+    phase = timer.finish(name, item_count=len(result.agents), error_count=len(result.errors))
+    return phase, result.agents
+
+
+def _run_cel_filter_phase(
+    agents: list[AgentDetails],
+    options: FleetBenchmarkOptions,
+    timer: _PhaseTimer,
+) -> BenchmarkPhaseResult:
+    """Evaluate the CEL filters against every listed agent, the way list_agents filters them."""
+    timer.start()
+    include_filters, exclude_filters = compile_cel_filters(options.cel_include_filters, ())
+    field_names = get_referenced_cel_names(include_filters)
+    matched_count = 0
+    for agent in agents:
+        context = agent_details_to_cel_context(agent, field_names)
+        if apply_cel_filters_to_context(context, include_filters, exclude_filters, f"agent {agent.name}"):
+            matched_count += 1
+    return timer.finish("cel_filter", item_count=matched_count)
+
+
+def _get_online_agent_event_targets(
+    mngr_ctx: MngrContext,
+    fleet: SyntheticFleet,
+    limit: int,
+) -> list[EventsTarget]:
+    """Build events targets for the first agents on online hosts."""
+    provider = get_provider_instance(SYNTHETIC_PROVIDER_NAME, mngr_ctx)
+    targets: list[EventsTarget] = []
+    for host_record in fleet.hosts:
+        if not host_record.is_online:
+            continue
+        host = provider.get_host(host_record.host_id)
+        if not isinstance(host, OnlineHostInterface):
+            raise MngrError(f"Synthetic host {host_record.host_name} should be online")
+        for agent_id, agent_name in zip(host_record.agent_ids, host_record.agent_names, strict=True):
+            if len(targets) >= limit:
+                return targets
+            events_subpath = Path("agents") / str(agent_id) / "events"
+            targets.append(
+                EventsTarget(
+                    online_host=host,
+                    events_path=host.host_dir / events_subpath,
+                    display_name=f"agent '{agent_name}'",
+                    provider=provider,
+                    host_id=host_record.host_id,
+                    events_subpath=events_subpath,
+                )
+            )
+    return targets
+
+
+def _run_historical_events_phase(
+    mngr_ctx: MngrContext,
+    fleet: SyntheticFleet,
+    options: FleetBenchmarkOptions,
+    timer: _PhaseTimer,
+) -> BenchmarkPhaseResult:
+    """Discover the event sources of some agents and read their full (rotated and current) history."""
+    targets = _get_online_agent_event_targets(mngr_ctx, fleet, options.events_agent_count)
+    timer.start()
+    event_count = 0
+    for target in targets:
+        sources = discover_event_sources(target)
+        events, _byte_offsets = read_all_historical_events(target, sources, (), ())
+        event_count += len(events)
+    return timer.finish("historical_events", item_count=event_count)
+
+
+def _run_events_follow_phase(
+    mngr_ctx: MngrContext,
+    fleet: SyntheticFleet,
+    options: FleetBenchmarkOptions,
+    timer: _PhaseTimer,
+    cg: ConcurrencyGroup,
+) -> BenchmarkPhaseResult:
+    """Follow one agent's events and time how long a newly appended event takes to arrive.
+
+    The phase covers replaying the agent's history and then waiting for the
+    probe event, which is appended as soon as the stream has started.
+    """
+    targets = _get_online_agent_event_targets(mngr_ctx, fleet, 1)
+    if not targets or not fleet.spec.event_sources or targets[0].events_path is None:
+        return timer.start().finish("events_follow", item_count=0)
+    target = targets[0]
+    source = fleet.spec.event_sources[0]
+    # Synthetic hosts are local, so the probe is appended straight to the host's events file
+    events_file_path = targets[0].events_path / source / "events.jsonl"
+    probe = _FollowProbe(probe_event_id=generate_log_event_id())
+
+    timer.start()
+    with ConcurrencyGroupExecutor(parent_cg=cg, name="benchmark_events_follow", max_workers=1) as executor:
+        future = executor.submit(stream_all_events, target, probe.on_event, (), (), None, None, True)
+        _append_probe_event(events_file_path, source, probe.probe_event_id)
+        is_received = probe.wait_for_probe(options.follow_timeout_seconds)
+        if not is_received:
+            # Nothing else will arrive on its own, so append one more event to let the stream stop
+            probe.request_stop()
+            _append_probe_event(events_file_path, source, generate_log_event_id())
+        try:
+            future.result()
+        except _FollowStopped:
+            pass
+    return timer.finish("events_follow", item_count=1 if is_received else 0, error_count=0 if is_received else 1)
+
+
+def _append_probe_event(events_file_path: Path, source: str, event_id: str) -> None:
+    event = {
+        "timestamp": format_nanosecond_iso_timestamp(datetime.now(timezone.utc)),
+        "type": "benchmark_probe",
+        "event_id": event_id,
+        "source": source,
+    }
+    with open(events_file_path, "a") as f:
+        f.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+
+@pure
+def format_fleet_benchmark_report(report: FleetBenchmarkReport) -> str:
+    """Render a benchmark report as a plain-text table."""
+    spec = report.spec
+    lines = [
+        f"Synthetic fleet: {spec.host_count} hosts ({report.online_host_count} online), "
+        f"{spec.agent_count} agents, {spec.events_per_file} events per file",
+        f"Setup: {report.setup_seconds:.3f}s",
+        "",
+        f"{'PHASE':<20} {'SECONDS':>10} {'FIRST':>10} {'ITEMS':>8} {'ERRORS':>7} {'ROUND TRIPS':>12}  BREAKDOWN",
+    ]
+    for phase in report.phases:
+        first_item = "-" if phase.first_item_seconds is None else f"{phase.first_item_seconds:.3f}"
+        breakdown = ", ".join(
+            f"{kind.lower()}={count}" for kind, count in sorted(phase.round_trips.items(), key=lambda item: item[0])
+        )
+        lines.append(
+            f"{phase.name:<20} {phase.duration_seconds:>10.3f} {first_item:>10} {phase.item_count:>8} "
+            f"{phase.error_count:>7} {phase.total_round_trips:>12}  {breakdown}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.mngr.benchmarks.harness import FleetBenchmarkOptions
+from imbue.mngr.benchmarks.harness import format_fleet_benchmark_report
+from imbue.mngr.benchmarks.harness import run_fleet_benchmark
+from imbue.mngr.benchmarks.synthetic_fleet import SyntheticFleetSpec
+from imbue.mngr.benchmarks.synthetic_provider import RoundTripKind
+
+
+@pytest.mark.tmux
+def test_run_fleet_benchmark_measures_every_phase(tmp_path: Path, cg: ConcurrencyGroup) -> None:
+    spec = SyntheticFleetSpec(
+        host_count=4,
+        agents_per_host=2,
+        offline_host_fraction=0.25,
+        events_per_file=5,
+        discovery_incremental_events=10,
+    )
+    options = FleetBenchmarkOptions(
+        cel_include_filters=('labels.team == "infra"',),
+        discovery_lookup_count=3,
+        events_agent_count=2,
+        follow_timeout_seconds=30.0,
+    )
+
+    report = run_fleet_benchmark(tmp_path / "fleet", spec, options, cg)
+
+    phase_by_name = {phase.name: phase for phase in report.phases}
+    assert list(phase_by_name) == [
+        "discovery_replay",
+        "list_batch",
+        "list_streaming",
+        "cel_filter",
+        "historical_events",
+        "events_follow",
+    ]
+    assert report.online_host_count == 3
+    assert phase_by_name["discovery_replay"].item_count == 3
+    for name in ("list_batch", "list_streaming"):
+        assert phase_by_name[name].item_count == spec.agent_count
+        assert phase_by_name[name].error_count == 0
+        assert phase_by_name[name].round_trips[RoundTripKind.PROVIDER_API] >= 1
+    assert phase_by_name["list_streaming"].first_item_seconds is not None
+    assert 0 < phase_by_name["cel_filter"].item_count <= spec.agent_count
+    assert phase_by_name["historical_events"].item_count >= 2 * spec.events_per_file
+    assert phase_by_name["historical_events"].round_trips[RoundTripKind.COMMAND] >= 2
+    assert phase_by_name["events_follow"].item_count == 1
+    assert phase_by_name["events_follow"].error_count == 0
+
+    formatted = format_fleet_benchmark_report(report)
+    assert "list_batch" in formatted
+    assert "events_follow" in formatted
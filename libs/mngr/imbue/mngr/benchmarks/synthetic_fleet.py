@@ -0,0 +1,297 @@
+import json
+import os
+import random
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+from typing import Final
+from uuid import UUID
+
+from pydantic import Field
+
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.logging import format_nanosecond_iso_timestamp
+from imbue.mngr.api.discovery_events import make_agent_discovery_event
+from imbue.mngr.api.discovery_events import make_full_discovery_snapshot_event
+from imbue.mngr.interfaces.data_types import CertifiedHostData
+from imbue.mngr.primitives import AgentId
+from imbue.mngr.primitives import AgentName
+from imbue.mngr.primitives import DiscoveredAgent
+from imbue.mngr.primitives import DiscoveredHost
+from imbue.mngr.primitives import HostId
+from imbue.mngr.primitives import HostName
+from imbue.mngr.primitives import ProviderInstanceName
+
+# Layout of a synthetic fleet directory:
+#   <root>/hosts/<host_id>/...   one mngr host_dir per synthetic host
+#   <root>/mngr/...              default_host_dir for the benchmark's own mngr context
+FLEET_HOSTS_SUBDIR: Final[str] = "hosts"
+FLEET_MNGR_SUBDIR: Final[str] = "mngr"
+
+# Offline hosts are marked the way a provider would after a controlled shutdown
+OFFLINE_HOST_STOP_REASON: Final[str] = "STOPPED"
+
+_TEAM_LABELS: Final[tuple[str, ...]] = ("infra", "web", "data", "ml")
+_AGENT_ACTIVITY_SOURCES: Final[tuple[str, ...]] = ("start", "user", "agent")
+_FLEET_HISTORY: Final[timedelta] = timedelta(days=1)
+
+
+class SyntheticFleetSpec(FrozenModel):
+    """Shape of a synthetic fleet to fabricate for benchmarking."""
+
+    host_count: int = Field(default=200, ge=1, description="Number of hosts in the fleet")
+    agents_per_host: int = Field(default=10, ge=0, description="Number of agents on each host")
+    offline_host_fraction: float = Field(
+        default=0.25, ge=0.0, le=1.0, description="Fraction of hosts that are offline (listed from persisted data)"
+    )
+    event_sources: tuple[str, ...] = Field(
+        default=("messages", "logs/mngr"), description="Event sources written for every agent"
+    )
+    events_per_file: int = Field(default=50, ge=0, description="Number of events in each events.jsonl file")
+    rotated_files_per_source: int = Field(
+        default=1, ge=0, description="Number of rotated events.jsonl.N files per event source"
+    )
+    discovery_incremental_events: int = Field(
+        default=1000, ge=0, description="AGENT_DISCOVERED events appended after the full discovery snapshot"
+    )
+    seed: int = Field(default=0, description="Seed for the generated IDs, names, labels and timestamps")
+
+    @property
+    def agent_count(self) -> int:
+        return self.host_count * self.agents_per_host
+
+
+class SyntheticHostRecord(FrozenModel):
+    """A host written to a synthetic fleet."""
+
+    host_id: HostId = Field(description="ID of the host")
+    host_name: HostName = Field(description="Name of the host")
+    is_online: bool = Field(description="Whether the host is served as an online host")
+    agent_ids: tuple[AgentId, ...] = Field(description="IDs of the agents on the host")
+    agent_names: tuple[AgentName, ...] = Field(description="Names of the agents on the host, matching agent_ids")
+
+
+class SyntheticFleet(FrozenModel):
+    """A synthetic fleet that has been written to disk."""
+
+    root: Path = Field(description="Root directory of the fleet")
+    spec: SyntheticFleetSpec = Field(description="The spec the fleet was generated from")
+    hosts: tuple[SyntheticHostRecord, ...] = Field(description="All hosts in the fleet")
+
+    @property
+    def mngr_dir(self) -> Path:
+        """The default_host_dir to use for the mngr context that benchmarks this fleet."""
+        return self.root / FLEET_MNGR_SUBDIR
+
+    def get_host_dir(self, host_id: HostId) -> Path:
+        return get_synthetic_host_dir(self.root, host_id)
+
+
+def get_synthetic_host_dir(fleet_root: Path, host_id: HostId) -> Path:
+    """Return the host_dir of a synthetic host."""
+    return fleet_root / FLEET_HOSTS_SUBDIR / str(host_id)
+
+
+def write_synthetic_fleet(
+    root: Path,
+    spec: SyntheticFleetSpec,
+    provider_name: ProviderInstanceName,
+    # The discovery events file to seed with a full snapshot and incremental events
+    discovery_events_path: Path,
+) -> SyntheticFleet:
+    """Fabricate a fleet on the local filesystem.
+
+    Every host gets a real mngr host_dir (data.json, activity files and one
+    state directory per agent with data.json, activity files and event logs),
+    so the listing and events code paths read exactly what they would read on
+    a real host. The discovery events file is seeded with a full snapshot of
+    the fleet followed by incremental agent events.
+    """
+    rng = random.Random(spec.seed)
+    now = datetime.now(timezone.utc)
+    offline_host_count = round(spec.host_count * spec.offline_host_fraction)
+
+    host_records: list[SyntheticHostRecord] = []
+    discovered_hosts: list[DiscoveredHost] = []
+    discovered_agents: list[DiscoveredAgent] = []
+    for host_index in range(spec.host_count):
+        host_id = HostId(f"host-{_random_hex(rng)}")
+        host_name = HostName(f"bench-host-{host_index:05d}")
+        # Spread the offline hosts evenly through the fleet rather than bunching them together
+        is_online = (host_index + 1) * offline_host_count // spec.host_count == (
+            host_index * offline_host_count // spec.host_count
+        )
+        host_dir = get_synthetic_host_dir(root, host_id)
+        _write_host(host_dir, host_id, host_name, is_online, rng, now)
+
+        agent_ids: list[AgentId] = []
+        agent_names: list[AgentName] = []
+        for agent_index in range(spec.agents_per_host):
+            agent_id = AgentId(f"agent-{_random_hex(rng)}")
+            agent_name = AgentName(f"bench-{host_index:05d}-{agent_index:03d}")
+            agent_data = _write_agent(host_dir, agent_id, agent_name, host_index, agent_index, spec, rng, now)
+            agent_ids.append(agent_id)
+            agent_names.append(agent_name)
+            discovered_agents.append(
+                DiscoveredAgent(
+                    host_id=host_id,
+                    agent_id=agent_id,
+                    agent_name=agent_name,
+                    provider_name=provider_name,
+                    certified_data=agent_data,
+                )
+            )
+        host_records.append(
+            SyntheticHostRecord(
+                host_id=host_id,
+                host_name=host_name,
+                is_online=is_online,
+                agent_ids=tuple(agent_ids),
+                agent_names=tuple(agent_names),
+            )
+        )
+        discovered_hosts.append(DiscoveredHost(host_id=host_id, host_name=host_name, provider_name=provider_name))
+
+    _write_discovery_events(discovery_events_path, discovered_hosts, discovered_agents, spec, rng)
+    return SyntheticFleet(root=root, spec=spec, hosts=tuple(host_records))
+
+
+def _random_hex(rng: random.Random) -> str:
+    return UUID(int=rng.getrandbits(128), version=4).hex
+
+
+def _write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
+
+
+def _touch_with_mtime(path: Path, mtime: datetime) -> None:
+    """Write an activity file whose mtime (the authoritative activity time) is the given time."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"time": int(mtime.timestamp() * 1000)}))
+    os.utime(path, (mtime.timestamp(), mtime.timestamp()))
+
+
+def _random_time_in_history(rng: random.Random, now: datetime) -> datetime:
+    return now - timedelta(seconds=rng.uniform(0, _FLEET_HISTORY.total_seconds()))
+
+
+def _write_host(
+    host_dir: Path,
+    host_id: HostId,
+    host_name: HostName,
+    is_online: bool,
+    rng: random.Random,
+    now: datetime,
+) -> None:
+    created_at = _random_time_in_history(rng, now)
+    certified_data = CertifiedHostData(
+        host_id=str(host_id),
+        host_name=str(host_name),
+        created_at=created_at,
+        updated_at=created_at,
+        image="bench-image:latest",
+        user_tags={"team": rng.choice(_TEAM_LABELS)},
+        tmux_session_prefix="mngr-bench-",
+        stop_reason=None if is_online else OFFLINE_HOST_STOP_REASON,
+    )
+    _write_json(host_dir / "data.json", certified_data.model_dump(mode="json"))
+    _touch_with_mtime(host_dir / "activity" / "boot", created_at)
+
+
+def _write_agent(
+    host_dir: Path,
+    agent_id: AgentId,
+    agent_name: AgentName,
+    host_index: int,
+    agent_index: int,
+    spec: SyntheticFleetSpec,
+    rng: random.Random,
+    now: datetime,
+) -> dict[str, Any]:
+    agent_dir = host_dir / "agents" / str(agent_id)
+    create_time = _random_time_in_history(rng, now)
+    agent_data: dict[str, Any] = {
+        "id": str(agent_id),
+        "name": str(agent_name),
+        "type": "generic",
+        "work_dir": f"/bench/work/{host_index:05d}/{agent_index:03d}",
+        "create_time": create_time.isoformat(),
+        "command": f"sleep {rng.randint(100000, 999999)}",
+        "additional_commands": [],
+        "initial_message": None,
+        "resume_message": None,
+        "ready_timeout_seconds": 10.0,
+        "permissions": [],
+        "start_on_boot": False,
+        # Teams rotate across the whole fleet so every filter on them matches a predictable share of agents
+        "labels": {"team": _TEAM_LABELS[(host_index + agent_index) % len(_TEAM_LABELS)], "tier": str(agent_index % 3)},
+        "created_branch_name": f"mngr/{agent_name}",
+    }
+    _write_json(agent_dir / "data.json", agent_data)
+    for activity_source in _AGENT_ACTIVITY_SOURCES:
+        _touch_with_mtime(agent_dir / "activity" / activity_source, _random_time_in_history(rng, now))
+    for source in spec.event_sources:
+        _write_event_source(agent_dir / "events" / source, source, spec, rng, now)
+    return agent_data
+
+
+def _write_event_source(
+    source_dir: Path,
+    source: str,
+    spec: SyntheticFleetSpec,
+    rng: random.Random,
+    now: datetime,
+) -> None:
+    """Write the rotated files (oldest first) and the current events.jsonl for one source."""
+    source_dir.mkdir(parents=True, exist_ok=True)
+    file_count = spec.rotated_files_per_source + 1
+    total_events = file_count * spec.events_per_file
+    # Timestamps increase through the files and are jittered so sources interleave when merged
+    step_seconds = _FLEET_HISTORY.total_seconds() / max(total_events, 1)
+    start = now - _FLEET_HISTORY
+    for file_index in range(file_count):
+        rotation_number = file_count - 1 - file_index
+        file_name = "events.jsonl" if rotation_number == 0 else f"events.jsonl.{rotation_number}"
+        lines: list[str] = []
+        for event_index in range(spec.events_per_file):
+            sequence_number = file_index * spec.events_per_file + event_index
+            timestamp = start + timedelta(seconds=(sequence_number + rng.random()) * step_seconds)
+            lines.append(json.dumps(_make_event(source, timestamp, sequence_number, rng), separators=(",", ":")))
+        (source_dir / file_name).write_text("".join(line + "\n" for line in lines))
+
+
+def _make_event(source: str, timestamp: datetime, sequence_number: int, rng: random.Random) -> dict[str, Any]:
+    event: dict[str, Any] = {
+        "timestamp": format_nanosecond_iso_timestamp(timestamp),
+        "type": "message" if source == "messages" else "log",
+        "event_id": f"evt-{_random_hex(rng)}",
+        "source": source,
+    }
+    if source == "messages":
+        event["role"] = "user" if sequence_number % 2 == 0 else "assistant"
+        event["content"] = f"synthetic message {sequence_number} " + "lorem ipsum " * rng.randint(1, 20)
+    else:
+        event["level"] = rng.choice(("DEBUG", "INFO", "INFO", "WARNING"))
+        event["message"] = f"synthetic log line {sequence_number}"
+    return event
+
+
+def _write_discovery_events(
+    discovery_events_path: Path,
+    discovered_hosts: list[DiscoveredHost],
+    discovered_agents: list[DiscoveredAgent],
+    spec: SyntheticFleetSpec,
+    rng: random.Random,
+) -> None:
+    """Seed the discovery events file with a full snapshot followed by incremental agent events."""
+    events: list[FrozenModel] = [make_full_discovery_snapshot_event(discovered_agents, discovered_hosts)]
+    if discovered_agents:
+        for _ in range(spec.discovery_incremental_events):
+            events.append(make_agent_discovery_event(rng.choice(discovered_agents)))
+    discovery_events_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(discovery_events_path, "a") as f:
+        for event in events:
+            f.write(json.dumps(event.model_dump(mode="json"), separators=(",", ":")) + "\n")
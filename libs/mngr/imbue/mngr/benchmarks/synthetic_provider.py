@@ -0,0 +1,386 @@
+import json
+import threading
+from datetime import datetime
+from enum import auto
+from pathlib import Path
+from typing import Final
+from typing import Mapping
+from typing import Sequence
+
+from pydantic import Field
+from pydantic import PrivateAttr
+from pyinfra.api import Host as PyinfraHost
+from pyinfra.api import State
+from pyinfra.api.inventory import Inventory
+
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.imbue_common.enums import UpperCaseStrEnum
+from imbue.imbue_common.mutable_model import MutableModel
+from imbue.mngr import hookimpl
+from imbue.mngr.benchmarks.synthetic_fleet import FLEET_HOSTS_SUBDIR
+from imbue.mngr.benchmarks.synthetic_fleet import get_synthetic_host_dir
+from imbue.mngr.config.data_types import MngrContext
+from imbue.mngr.config.data_types import ProviderInstanceConfig
+from imbue.mngr.errors import ConfigStructureError
+from imbue.mngr.errors import HostNotFoundError
+from imbue.mngr.errors import MngrError
+from imbue.mngr.hosts.host import Host
+from imbue.mngr.hosts.offline_host import OfflineHost
+from imbue.mngr.interfaces.data_types import CertifiedHostData
+from imbue.mngr.interfaces.data_types import CommandResult
+from imbue.mngr.interfaces.data_types import CpuResources
+from imbue.mngr.interfaces.data_types import HostResources
+from imbue.mngr.interfaces.data_types import PyinfraConnector
+from imbue.mngr.interfaces.data_types import SnapshotInfo
+from imbue.mngr.interfaces.data_types import VolumeInfo
+from imbue.mngr.interfaces.host import HostInterface
+from imbue.mngr.interfaces.provider_backend import ProviderBackendInterface
+from imbue.mngr.interfaces.provider_instance import ProviderInstanceInterface
+from imbue.mngr.primitives import DiscoveredHost
+from imbue.mngr.primitives import HostId
+from imbue.mngr.primitives import HostName
+from imbue.mngr.primitives import ProviderBackendName
+from imbue.mngr.primitives import ProviderInstanceName
+from imbue.mngr.primitives import SnapshotId
+from imbue.mngr.primitives import SnapshotName
+from imbue.mngr.primitives import VolumeId
+from imbue.mngr.providers.base_provider import BaseProviderInstance
+
+SYNTHETIC_BACKEND_NAME: Final[ProviderBackendName] = ProviderBackendName("synthetic")
+
+
+class RoundTripKind(UpperCaseStrEnum):
+    """Kinds of operations that would each cost one round trip to a remote host or provider."""
+
+    COMMAND = auto()
+    FILE_READ = auto()
+    BATCH_READ = auto()
+    STAT = auto()
+    LIST_DIR = auto()
+    PROVIDER_API = auto()
+
+
+class RoundTripCounter(MutableModel):
+    """Thread-safe tally of round trips made against a synthetic fleet."""
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _count_by_kind: dict[RoundTripKind, int] = PrivateAttr(default_factory=dict)
+
+    def record(self, kind: RoundTripKind) -> None:
+        with self._lock:
+            self._count_by_kind[kind] = self._count_by_kind.get(kind, 0) + 1
+
+    def snapshot(self) -> dict[RoundTripKind, int]:
+        with self._lock:
+            return dict(self._count_by_kind)
+
+
+# Provider instances are rebuilt from config on every lookup, so the counter for each
+# fleet lives here and is shared by every instance serving that fleet.
+_round_trip_counter_by_fleet_root: dict[Path, RoundTripCounter] = {}
+_round_trip_counter_lock: Final[threading.Lock] = threading.Lock()
+
+
+def get_round_trip_counter(fleet_root: Path) -> RoundTripCounter:
+    """Return the round trip counter shared by all synthetic provider instances serving a fleet."""
+    with _round_trip_counter_lock:
+        return _round_trip_counter_by_fleet_root.setdefault(fleet_root.resolve(), RoundTripCounter())
+
+
+def wait_simulated_round_trip(seconds: float) -> None:
+    """Block for the simulated latency of one round trip."""
+    if seconds > 0:
+        threading.Event().wait(timeout=seconds)
+
+
+class SyntheticProviderConfig(ProviderInstanceConfig):
+    """Configuration for the synthetic provider backend used by the fleet benchmarks."""
+
+    backend: ProviderBackendName = Field(
+        default=SYNTHETIC_BACKEND_NAME,
+        description="Provider backend (always 'synthetic' for this type)",
+    )
+    fleet_root: Path | None = Field(
+        default=None,
+        description="Root directory of the synthetic fleet written by write_synthetic_fleet",
+    )
+    simulated_round_trip_seconds: float | None = Field(
+        default=None,
+        description="Latency added to every host round trip, to approximate remote hosts (defaults to 0)",
+    )
+
+
+class SyntheticHost(Host):
+    """An online host of a synthetic fleet.
+
+    Runs everything locally against the host's own directory in the fleet, and
+    records every operation that would be a round trip on a remote host (commands,
+    file reads, stats and directory listings) in the fleet's RoundTripCounter.
+    """
+
+    synthetic_host_dir: Path = Field(frozen=True, description="The host's directory within the fleet")
+    synthetic_host_name: HostName = Field(frozen=True, description="The host's name")
+    round_trip_counter: RoundTripCounter = Field(frozen=True, description="Where round trips are recorded")
+    simulated_round_trip_seconds: float = Field(frozen=True, description="Latency added to every round trip")
+
+    @property
+    def host_dir(self) -> Path:
+        return self.synthetic_host_dir
+
+    def get_name(self) -> HostName:
+        return self.synthetic_host_name
+
+    def _record_round_trip(self, kind: RoundTripKind) -> None:
+        self.round_trip_counter.record(kind)
+        wait_simulated_round_trip(self.simulated_round_trip_seconds)
+
+    def execute_idempotent_command(
+        self,
+        command: str,
+        user: str | None = None,
+        cwd: Path | None = None,
+        env: Mapping[str, str] | None = None,
+        timeout_seconds: float | None = None,
+    ) -> CommandResult:
+        self._record_round_trip(RoundTripKind.COMMAND)
+        return super().execute_idempotent_command(
+            command, user=user, cwd=cwd, env=env, timeout_seconds=timeout_seconds
+        )
+
+    def read_file(self, path: Path) -> bytes:
+        self._record_round_trip(RoundTripKind.FILE_READ)
+        return super().read_file(path)
+
+    def read_text_files(self, paths: Sequence[Path], encoding: str = "utf-8") -> dict[Path, str | None]:
+        if paths:
+            self._record_round_trip(RoundTripKind.BATCH_READ)
+        return super().read_text_files(paths, encoding)
+
+    def _get_file_mtime(self, path: Path) -> datetime | None:
+        self._record_round_trip(RoundTripKind.STAT)
+        return super()._get_file_mtime(path)
+
+    def _path_exists(self, path: Path) -> bool:
+        self._record_round_trip(RoundTripKind.STAT)
+        return super()._path_exists(path)
+
+    def _is_directory(self, path: Path) -> bool:
+        self._record_round_trip(RoundTripKind.STAT)
+        return super()._is_directory(path)
+
+    def _list_directory(self, path: Path) -> list[str]:
+        self._record_round_trip(RoundTripKind.LIST_DIR)
+        return super()._list_directory(path)
+
+
+class SyntheticProviderInstance(BaseProviderInstance):
+    """Provider instance that serves a synthetic fleet from the local filesystem.
+
+    Hosts whose data.json has a stop_reason are served as offline hosts, with
+    their agents listed from persisted data; all others are SyntheticHosts.
+    """
+
+    fleet_root: Path = Field(frozen=True, description="Root directory of the synthetic fleet")
+    simulated_round_trip_seconds: float = Field(frozen=True, description="Latency added to every round trip")
+    round_trip_counter: RoundTripCounter = Field(frozen=True, description="Where round trips are recorded")
+
+    _certified_data_by_host_id: dict[HostId, CertifiedHostData] | None = PrivateAttr(default=None)
+
+    @property
+    def supports_snapshots(self) -> bool:
+        return False
+
+    @property
+    def supports_shutdown_hosts(self) -> bool:
+        return False
+
+    @property
+    def supports_volumes(self) -> bool:
+        return False
+
+    @property
+    def supports_mutable_tags(self) -> bool:
+        return False
+
+    def reset_caches(self) -> None:
+        self._certified_data_by_host_id = None
+
+    def _record_round_trip(self, kind: RoundTripKind) -> None:
+        self.round_trip_counter.record(kind)
+        wait_simulated_round_trip(self.simulated_round_trip_seconds)
+
+    def _get_certified_data_by_host_id(self) -> dict[HostId, CertifiedHostData]:
+        """Load the data.json of every host in the fleet, as one provider API call."""
+        if self._certified_data_by_host_id is None:
+            self._record_round_trip(RoundTripKind.PROVIDER_API)
+            certified_data_by_host_id: dict[HostId, CertifiedHostData] = {}
+            hosts_dir = self.fleet_root / FLEET_HOSTS_SUBDIR
+            if hosts_dir.is_dir():
+                for host_dir in sorted(hosts_dir.iterdir()):
+                    data_path = host_dir / "data.json"
+                    if data_path.is_file():
+                        certified_data = CertifiedHostData.model_validate_json(data_path.read_text())
+                        certified_data_by_host_id[HostId(certified_data.host_id)] = certified_data
+            self._certified_data_by_host_id = certified_data_by_host_id
+        return self._certified_data_by_host_id
+
+    def _get_certified_data(self, host: HostId | HostName) -> CertifiedHostData:
+        for host_id, certified_data in self._get_certified_data_by_host_id().items():
+            if host == host_id or host == HostName(certified_data.host_name):
+                return certified_data
+        raise HostNotFoundError(host)
+
+    def _create_local_pyinfra_host(self) -> PyinfraHost:
+        names_data = (["@local"], {})
+        inventory = Inventory(names_data)
+        state = State(inventory=inventory)
+        pyinfra_host = inventory.get_host("@local")
+        pyinfra_host.init(state)
+        return pyinfra_host
+
+    def get_host(self, host: HostId | HostName) -> HostInterface:
+        certified_data = self._get_certified_data(host)
+        host_id = HostId(certified_data.host_id)
+        if certified_data.stop_reason is not None:
+            return self.to_offline_host(host_id)
+        return SyntheticHost(
+            id=host_id,
+            connector=PyinfraConnector(self._create_local_pyinfra_host()),
+            provider_instance=self,
+            mngr_ctx=self.mngr_ctx,
+            synthetic_host_dir=get_synthetic_host_dir(self.fleet_root, host_id),
+            synthetic_host_name=HostName(certified_data.host_name),
+            round_trip_counter=self.round_trip_counter,
+            simulated_round_trip_seconds=self.simulated_round_trip_seconds,
+        )
+
+    def to_offline_host(self, host_id: HostId) -> OfflineHost:
+        return OfflineHost(
+            id=host_id,
+            certified_host_data=self._get_certified_data(host_id),
+            provider_instance=self,
+            mngr_ctx=self.mngr_ctx,
+        )
+
+    def discover_hosts(
+        self,
+        cg: ConcurrencyGroup,
+        include_destroyed: bool = False,
+    ) -> list[DiscoveredHost]:
+        return [
+            DiscoveredHost(host_id=host_id, host_name=HostName(certified_data.host_name), provider_name=self.name)
+            for host_id, certified_data in self._get_certified_data_by_host_id().items()
+        ]
+
+    def list_persisted_agent_data_for_host(self, host_id: HostId) -> list[dict]:
+        agents_dir = get_synthetic_host_dir(self.fleet_root, host_id) / "agents"
+        self._record_round_trip(RoundTripKind.LIST_DIR)
+        agent_records: list[dict] = []
+        for data_path in sorted(agents_dir.glob("*/data.json")):
+            self._record_round_trip(RoundTripKind.FILE_READ)
+            agent_records.append(json.loads(data_path.read_text()))
+        return agent_records
+
+    def get_host_resources(self, host: HostInterface) -> HostResources:
+        return HostResources(cpu=CpuResources(count=4), memory_gb=16.0, disk_gb=100.0)
+
+    def get_host_tags(self, host: HostInterface | HostId) -> dict[str, str]:
+        host_id = host.id if isinstance(host, HostInterface) else host
+        return dict(self._get_certified_data(host_id).user_tags)
+
+    def list_snapshots(self, host: HostInterface | HostId) -> list[SnapshotInfo]:
+        return []
+
+    def list_volumes(self) -> list[VolumeInfo]:
+        return []
+
+    def on_connection_error(self, host_id: HostId) -> None:
+        pass
+
+    def stop_host(
+        self,
+        host: HostInterface | HostId,
+        create_snapshot: bool = True,
+        timeout_seconds: float = 60.0,
+    ) -> None:
+        raise MngrError("Synthetic fleet hosts cannot be stopped")
+
+    def destroy_host(self, host: HostInterface | HostId) -> None:
+        raise MngrError("Synthetic fleet hosts cannot be destroyed")
+
+    def delete_host(self, host: HostInterface) -> None:
+        raise MngrError("Synthetic fleet hosts cannot be deleted")
+
+    def create_snapshot(self, host: HostInterface | HostId, name: SnapshotName | None = None) -> SnapshotId:
+        raise MngrError("Synthetic fleet hosts do not support snapshots")
+
+    def delete_snapshot(self, host: HostInterface | HostId, snapshot_id: SnapshotId) -> None:
+        raise MngrError("Synthetic fleet hosts do not support snapshots")
+
+    def delete_volume(self, volume_id: VolumeId) -> None:
+        raise MngrError("Synthetic fleet hosts do not support volumes")
+
+    def set_host_tags(self, host: HostInterface | HostId, tags: Mapping[str, str]) -> None:
+        raise MngrError("Synthetic fleet hosts do not support changing tags")
+
+    def add_tags_to_host(self, host: HostInterface | HostId, tags: Mapping[str, str]) -> None:
+        raise MngrError("Synthetic fleet hosts do not support changing tags")
+
+    def remove_tags_from_host(self, host: HostInterface | HostId, keys: Sequence[str]) -> None:
+        raise MngrError("Synthetic fleet hosts do not support changing tags")
+
+    def get_connector(self, host: HostInterface | HostId) -> PyinfraHost:
+        return self._create_local_pyinfra_host()
+
+
+class SyntheticProviderBackend(ProviderBackendInterface):
+    """Backend for the synthetic fleets used by the benchmark harness.
+
+    Not registered by default: the harness registers this module with its own
+    plugin manager so that the synthetic fleet is the only thing it lists.
+    """
+
+    @staticmethod
+    def get_name() -> ProviderBackendName:
+        return SYNTHETIC_BACKEND_NAME
+
+    @staticmethod
+    def get_description() -> str:
+        return "Serves a synthetic fleet from the local filesystem (for benchmarks)"
+
+    @staticmethod
+    def get_config_class() -> type[ProviderInstanceConfig]:
+        return SyntheticProviderConfig
+
+    @staticmethod
+    def get_build_args_help() -> str:
+        return "No build arguments are supported for the synthetic provider."
+
+    @staticmethod
+    def get_start_args_help() -> str:
+        return "No start arguments are supported for the synthetic provider."
+
+    @staticmethod
+    def build_provider_instance(
+        name: ProviderInstanceName,
+        config: ProviderInstanceConfig,
+        mngr_ctx: MngrContext,
+    ) -> ProviderInstanceInterface:
+        if not isinstance(config, SyntheticProviderConfig):
+            raise ConfigStructureError(f"Expected SyntheticProviderConfig, got {type(config).__name__}")
+        if config.fleet_root is None:
+            raise ConfigStructureError(f"Provider {name} needs a fleet_root")
+        return SyntheticProviderInstance(
+            name=name,
+            host_dir=config.fleet_root / FLEET_HOSTS_SUBDIR,
+            mngr_ctx=mngr_ctx,
+            fleet_root=config.fleet_root,
+            simulated_round_trip_seconds=config.simulated_round_trip_seconds or 0.0,
+            round_trip_counter=get_round_trip_counter(config.fleet_root),
+        )
+
+
+@hookimpl
+def register_provider_backend() -> tuple[type[ProviderBackendInterface], type[ProviderInstanceConfig]]:
+    """Register the synthetic provider backend."""
+    return (SyntheticProviderBackend, SyntheticProviderConfig)
@@ -20,6 +20,7 @@ def test_archive_cli_options_fields() -> None:
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
@@ -63,6 +63,7 @@ def _make_opts(
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
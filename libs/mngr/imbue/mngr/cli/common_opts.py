@@ -13,6 +13,7 @@ from click.core import ParameterSource
 from click_option_group import GroupedOption
 from click_option_group import OptionGroup
 from click_option_group import optgroup
+from loguru import logger
 
 from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
 from imbue.concurrency_group.errors import ProcessError
@@ -20,6 +21,11 @@ from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
 from imbue.imbue_common.logging import log_span
 from imbue.imbue_common.model_update import to_update
 from imbue.imbue_common.pure import pure
+from imbue.imbue_common.span_profiling import SpanProfiler
+from imbue.imbue_common.span_profiling import format_span_timing_summary
+from imbue.imbue_common.span_profiling import start_span_profiling
+from imbue.imbue_common.span_profiling import stop_span_profiling
+from imbue.imbue_common.span_profiling import write_chrome_trace
 from imbue.mngr.config.data_types import CommonCliOptions
 from imbue.mngr.config.data_types import CreateTemplateName
 from imbue.mngr.config.data_types import MngrConfig
@@ -56,6 +62,7 @@ def add_common_options(command: TDecorated) -> TDecorated:
     - --log-commands: Log executed commands
     - --log-command-output: Log command output
     - --log-env-vars: Log environment variables
+    - --profile: Write span timings as a Chrome trace
     - --headless: Disable all interactive behavior
     - --context: Project context directory
     - --plugin: Enable plugins
@@ -86,6 +93,14 @@ def add_common_options(command: TDecorated) -> TDecorated:
         default=False,
         help="Disable all interactive behavior (prompts, TUI, editor). Also settable via MNGR_HEADLESS env var or 'headless' config key.",
     )(command)
+    command = optgroup.option(
+        "--profile",
+        "profile",
+        type=click.Path(dir_okay=False, path_type=Path),
+        default=None,
+        help="Record the timing of every logged span and write it to this path as a Chrome trace "
+        "(open in https://ui.perfetto.dev), then print the slowest spans",
+    )(command)
     command = optgroup.option(
         "--log-env-vars/--no-log-env-vars", default=None, help="Log environment variables (security risk)"
     )(command)
@@ -147,6 +162,13 @@ def setup_command_context(
     # First parse options from CLI args to extract common parameters
     initial_opts = command_class(**known_params)
 
+    # Start profiling before anything else so that config loading is captured too. Registered
+    # first, so the trace is written last (after the command span and all threads have finished).
+    if initial_opts.profile is not None:
+        profile_path = initial_opts.profile.expanduser()
+        profiler = start_span_profiling()
+        ctx.call_on_close(lambda: write_span_profile(profiler, profile_path))
+
     # Create a top-level ConcurrencyGroup for process management
     cg = ConcurrencyGroup(name=f"mngr-{command_name}")
     cg.__enter__()
@@ -316,6 +338,7 @@ def parse_output_options(
         file_level=config.logging.file_level,
         log_dir=config.logging.log_dir,
         max_log_size_mb=config.logging.max_log_size_mb,
+        is_file_logging_buffered=config.logging.is_file_logging_buffered,
         console_level=console_level,
         log_file_path=log_file_path,
         is_logging_commands=is_log_commands,
@@ -597,3 +620,16 @@ def find_last_option_index_in_group(command: click.Command, group: OptionGroup)
         if isinstance(param, GroupedOption) and param.group is group:
             last_index = i
     return last_index
+
+
+def write_span_profile(profiler: SpanProfiler, profile_path: Path) -> None:
+    """Stop span profiling, write the profiler's Chrome trace and log a summary of the slowest spans."""
+    stop_span_profiling()
+    timings = profiler.get_timings()
+    write_chrome_trace(timings, profile_path)
+    logger.info(
+        "Wrote {} spans to {} (open in https://ui.perfetto.dev)\n{}",
+        len(timings),
+        profile_path,
+        format_span_timing_summary(timings),
+    )
@@ -562,6 +562,7 @@ def test_split_known_and_plugin_params_separates_known_from_extra() -> None:
         "log_commands": None,
         "log_command_output": None,
         "log_env_vars": None,
+        "profile": None,
         "project_context_path": None,
         "plugin": (),
         "disable_plugin": (),
@@ -593,6 +594,7 @@ def test_split_known_and_plugin_params_all_known() -> None:
         "log_commands": None,
         "log_command_output": None,
         "log_env_vars": None,
+        "profile": None,
         "project_context_path": None,
         "plugin": (),
         "disable_plugin": (),
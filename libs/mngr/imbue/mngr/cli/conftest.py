@@ -51,6 +51,7 @@ def default_create_cli_opts() -> CreateCliOptions:
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
@@ -136,6 +137,7 @@ def default_connect_cli_opts() -> ConnectCliOptions:
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
@@ -1,5 +1,7 @@
 """Unit tests for the connect CLI command."""
 
+from pathlib import Path
+
 from imbue.mngr.cli.connect import ConnectCliOptions
 from imbue.mngr.cli.connect import _build_connection_options
 from imbue.mngr.cli.connect import build_status_text
@@ -29,6 +31,7 @@ def _make_connect_opts(
     log_commands: bool | None = None,
     log_command_output: bool | None = None,
     log_env_vars: bool | None = None,
+    profile: Path | None = None,
     project_context_path: str | None = None,
     plugin: tuple[str, ...] = (),
     disable_plugin: tuple[str, ...] = (),
@@ -49,6 +52,7 @@ def _make_connect_opts(
         log_commands=log_commands,
         log_command_output=log_command_output,
         log_env_vars=log_env_vars,
+        profile=profile,
         project_context_path=project_context_path,
         plugin=plugin,
         disable_plugin=disable_plugin,
@@ -53,6 +53,7 @@ def _make_limit_opts(
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
@@ -83,6 +84,7 @@ def test_limit_cli_options_fields() -> None:
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
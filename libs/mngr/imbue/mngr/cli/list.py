@@ -1,3 +1,5 @@
+import io
+import json
 import re
 import shutil
 import string
@@ -21,10 +23,21 @@ from tabulate import tabulate
 from imbue.imbue_common.mutable_model import MutableModel
 from imbue.imbue_common.pure import pure
 from imbue.mngr.agents.agent_registry import list_registered_agent_types
+from imbue.mngr.api.discovery_events import AgentDestroyedEvent
+from imbue.mngr.api.discovery_events import AgentDiscoveryEvent
+from imbue.mngr.api.discovery_events import DiscoveryEvent
+from imbue.mngr.api.discovery_events import FullDiscoverySnapshotEvent
+from imbue.mngr.api.discovery_events import HostDestroyedEvent
+from imbue.mngr.api.discovery_events import HostDiscoveryEvent
+from imbue.mngr.api.discovery_events import discovered_host_from_agent_details
 from imbue.mngr.api.discovery_events import get_discovery_events_path
+from imbue.mngr.api.discovery_events import parse_discovery_event_line
+from imbue.mngr.api.list import AgentErrorInfo
 from imbue.mngr.api.list import ErrorInfo
+from imbue.mngr.api.list import HostErrorInfo
 from imbue.mngr.api.list import agent_details_to_cel_context
 from imbue.mngr.api.list import list_agents as api_list_agents
+from imbue.mngr.api.list import list_agents_on_hosts
 from imbue.mngr.cli.common_opts import add_common_options
 from imbue.mngr.cli.common_opts import setup_command_context
 from imbue.mngr.cli.help_formatter import CommandHelpMetadata
@@ -39,13 +52,17 @@ from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.config.data_types import OutputOptions
 from imbue.mngr.errors import MngrError
 from imbue.mngr.interfaces.data_types import AgentDetails
+from imbue.mngr.primitives import AgentId
 from imbue.mngr.primitives import AgentLifecycleState
+from imbue.mngr.primitives import DiscoveredHost
 from imbue.mngr.primitives import ErrorBehavior
+from imbue.mngr.primitives import HostId
 from imbue.mngr.primitives import HostState
 from imbue.mngr.primitives import OutputFormat
-from imbue.mngr.utils.cel_utils import build_cel_context
+from imbue.mngr.utils.cel_utils import CompiledCelExpression
 from imbue.mngr.utils.cel_utils import compile_cel_sort_keys
 from imbue.mngr.utils.cel_utils import evaluate_cel_sort_key
+from imbue.mngr.utils.cel_utils import get_referenced_cel_names
 from imbue.mngr.utils.terminal import ANSI_DIM_GRAY
 from imbue.mngr.utils.terminal import ANSI_ERASE_LINE
 from imbue.mngr.utils.terminal import ANSI_RESET
@@ -818,7 +835,7 @@ class _ListIterationParams(BaseModel):
     provider_names: tuple[str, ...] | None
     error_behavior: ErrorBehavior
     # Compiled CEL sort keys: list of (program, is_descending) pairs
-    compiled_sort_keys: list[tuple[Any, bool]]
+    compiled_sort_keys: list[tuple[CompiledCelExpression, bool]]
     limit: int | None
     fields: list[str] | None
     format_template: str | None = None
@@ -1006,7 +1023,7 @@ _BRACKET_PATTERN = re.compile(r"^([^\[]+)(?:\[([^\]]+)\])?$")
 class _CelSortKeyExtractor:
     """Extracts a sort key from an (agent, cel_context) pair for a single CEL expression."""
 
-    program: Any
+    program: CompiledCelExpression
     is_descending: bool
 
     def __call__(self, pair: tuple[AgentDetails, dict[str, Any]]) -> tuple[int, str]:
@@ -1021,7 +1038,7 @@ class _CelSortKeyExtractor:
 
 def _sort_agents_by_cel(
     agents: list[AgentDetails],
-    compiled_sort_keys: Sequence[tuple[Any, bool]],
+    compiled_sort_keys: Sequence[tuple[CompiledCelExpression, bool]],
 ) -> list[AgentDetails]:
     """Sort agents using compiled CEL sort key expressions.
 
@@ -1032,8 +1049,9 @@ def _sort_agents_by_cel(
     if not compiled_sort_keys or not agents:
         return agents
 
-    # Precompute CEL contexts once for all agents
-    cel_contexts = [build_cel_context(agent_details_to_cel_context(agent)) for agent in agents]
+    # Precompute raw CEL contexts once for all agents, dumping only the fields the sort keys reference
+    field_names = get_referenced_cel_names(program for program, _ in compiled_sort_keys)
+    cel_contexts = [agent_details_to_cel_context(agent, field_names) for agent in agents]
 
     # Pair agents with their precomputed contexts for sorting
     paired: list[tuple[AgentDetails, dict[str, Any]]] = list(zip(agents, cel_contexts, strict=True))
@@ -1252,6 +1270,9 @@ add_pager_help_option(list_command)
 # === Watch Mode (stream-backed) ===
 
 
+_ANSI_CURSOR_UP_TEMPLATE: Final[str] = "\x1b[{}A"
+
+
 def _list_watch_with_stream(
     iteration_params: _ListIterationParams,
     ctx: click.Context,
@@ -1262,57 +1283,358 @@ def _list_watch_with_stream(
 
     Does an initial full list and display, then monitors the discovery events
     file for changes. When a change is detected (from create, destroy, etc.),
-    re-polls immediately. Also re-polls at max_interval_seconds as a safety net.
+    only the hosts named by the new events are re-polled, and only the rows that
+    changed are redrawn. A full re-poll still happens every max_interval_seconds
+    as a safety net (and to pick up activity changes, which emit no events).
     """
     logger.info("Starting watch mode (stream-backed): refreshing on changes or every {} seconds", max_interval_seconds)
     logger.info("Press Ctrl+C to stop")
 
-    events_path = get_discovery_events_path(mngr_ctx.config)
+    is_redrawn_in_place = sys.stdout.isatty() and (
+        iteration_params.format_template is not None
+        or iteration_params.output_opts.output_format == OutputFormat.HUMAN
+    )
+    table = _WatchedAgentTable(
+        params=iteration_params,
+        events_path=get_discovery_events_path(mngr_ctx.config),
+        display=_WatchDisplay(output=sys.stdout, is_redrawn_in_place=is_redrawn_in_place),
+    )
 
     # Initial display
-    _run_list_iteration(iteration_params, ctx)
+    table.start()
 
-    # Tail the events file and re-render when changes arrive.
+    # Tail the events file and apply the changes as they arrive.
     # Use a stop_event to allow clean shutdown on KeyboardInterrupt.
     stop_event = threading.Event()
     try:
-        _run_watch_loop_with_event_tailing(
-            iteration_params=iteration_params,
-            ctx=ctx,
-            events_path=events_path,
+        _run_event_driven_watch(
+            events_path=table.events_path,
             max_interval_seconds=max_interval_seconds,
             stop_event=stop_event,
+            on_refresh=table.refresh_from_events_file,
         )
     finally:
         stop_event.set()
 
 
-def _run_watch_loop_with_event_tailing(
-    iteration_params: _ListIterationParams,
-    ctx: click.Context,
-    events_path: Path,
-    max_interval_seconds: int,
-    stop_event: threading.Event,
-) -> None:
-    """Repeatedly refresh the list display, triggered by event file changes or a timeout."""
-    _run_event_driven_watch(
-        events_path=events_path,
-        max_interval_seconds=max_interval_seconds,
-        stop_event=stop_event,
-        on_refresh=lambda: _refresh_watch_display(iteration_params, ctx),
-    )
-
+def _read_new_discovery_events(events_path: Path, offset: int) -> tuple[list[DiscoveryEvent], int] | None:
+    """Read the complete discovery event lines appended to the events file since offset.
 
-def _refresh_watch_display(
-    iteration_params: _ListIterationParams,
-    ctx: click.Context,
-) -> None:
-    """Run a single refresh cycle for watch mode."""
-    logger.info("\nRefreshing...")
+    Returns the parsed events along with the offset just past the last complete line
+    (a partially written trailing line is left for the next read), or None when the
+    file is now shorter than offset because it was rotated or truncated.
+    """
     try:
-        _run_list_iteration(iteration_params, ctx)
-    except MngrError as e:
-        logger.error("Error in watch iteration (continuing): {}", e)
+        with events_path.open("rb") as f:
+            if f.seek(0, io.SEEK_END) < offset:
+                return None
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return ([], 0) if offset == 0 else None
+    complete_length = data.rfind(b"\n") + 1
+    events: list[DiscoveryEvent] = []
+    for line in data[:complete_length].decode("utf-8", errors="replace").splitlines():
+        event = parse_discovery_event_line(line)
+        if event is not None:
+            events.append(event)
+    return events, offset + complete_length
+
+
+class _CachedSortKeyGetter:
+    """Returns one of the precomputed sort keys of an agent, for re-sorting the watch table."""
+
+    key_index: int
+    sort_keys_by_agent_id: dict[AgentId, tuple[tuple[int, str], ...]]
+
+    def __call__(self, agent_id: AgentId) -> tuple[int, str]:
+        return self.sort_keys_by_agent_id[agent_id][self.key_index]
+
+
+class _WatchDisplay(MutableModel):
+    """Keeps the watch mode output up to date, writing only the lines that changed.
+
+    When redrawing in place (a TTY), the cursor is moved back to the first line of the
+    previous output and only the lines whose text changed are rewritten; lines are cut
+    to the terminal width so that wrapping cannot throw off the cursor arithmetic.
+    Otherwise, or when the output does not fit on the screen, the whole output is
+    written again below the previous one, but only when it changed.
+    """
+
+    output: Any
+    is_redrawn_in_place: bool
+    _drawn_lines: list[str] = PrivateAttr(default_factory=list)
+    _is_cursor_below_drawn_lines: bool = PrivateAttr(default=False)
+
+    def invalidate(self) -> None:
+        """Forget the previous output, e.g. because log messages were written below it."""
+        self._drawn_lines = []
+        self._is_cursor_below_drawn_lines = False
+
+    def draw(self, lines: Sequence[str]) -> int:
+        """Show the given lines, returning how many lines were written."""
+        terminal_size = shutil.get_terminal_size((120, 24))
+        is_in_place = self.is_redrawn_in_place and len(lines) < terminal_size.lines
+        new_lines = [line[: terminal_size.columns] for line in lines] if is_in_place else list(lines)
+        if new_lines == self._drawn_lines:
+            return 0
+
+        if not is_in_place or not self._is_cursor_below_drawn_lines:
+            for line in new_lines:
+                self.output.write(line + "\n")
+            self.output.flush()
+            self._drawn_lines = new_lines
+            self._is_cursor_below_drawn_lines = is_in_place
+            return len(new_lines)
+
+        previous_lines = self._drawn_lines
+        if previous_lines:
+            self.output.write(_ANSI_CURSOR_UP_TEMPLATE.format(len(previous_lines)))
+        written_count = 0
+        for idx in range(max(len(previous_lines), len(new_lines))):
+            if idx >= len(new_lines):
+                # Clear the lines left over from a longer previous output
+                self.output.write(ANSI_ERASE_LINE + "\n")
+            elif idx < len(previous_lines) and previous_lines[idx] == new_lines[idx]:
+                self.output.write("\n")
+            else:
+                self.output.write(ANSI_ERASE_LINE + new_lines[idx] + "\n")
+                written_count += 1
+        leftover_count = len(previous_lines) - len(new_lines)
+        if leftover_count > 0:
+            self.output.write(_ANSI_CURSOR_UP_TEMPLATE.format(leftover_count))
+        self.output.flush()
+        self._drawn_lines = new_lines
+        return written_count
+
+
+class _WatchedAgentTable(MutableModel):
+    """In-memory table of the agents shown by watch mode, keyed by agent ID.
+
+    The initial display and the periodic safety-net refresh list every agent. In
+    between, each batch of discovery events is applied as a delta: destroyed agents
+    and hosts are dropped from the table, and only the hosts named by the other
+    events are listed again. Sort keys are cached per agent, so re-sorting only
+    evaluates the CEL sort expressions of agents that changed.
+    """
+
+    params: _ListIterationParams
+    events_path: Path
+    display: _WatchDisplay
+    _agent_by_id: dict[AgentId, AgentDetails] = PrivateAttr(default_factory=dict)
+    _sort_keys_by_agent_id: dict[AgentId, tuple[tuple[int, str], ...]] = PrivateAttr(default_factory=dict)
+    # The previous sort order, kept so that re-sorting a mostly sorted table is close to linear
+    _sorted_agent_ids: list[AgentId] = PrivateAttr(default_factory=list)
+    _events_offset: int = PrivateAttr(default=0)
+
+    def get_displayed_agents(self) -> list[AgentDetails]:
+        """Return the agents in the table, sorted and limited the way they are displayed."""
+        self._sort()
+        agent_ids = self._sorted_agent_ids
+        if self.params.limit is not None:
+            agent_ids = agent_ids[: self.params.limit]
+        return [self._agent_by_id[agent_id] for agent_id in agent_ids]
+
+    def start(self) -> None:
+        """Remember the end of the events file, then list every agent and draw the table."""
+        self._events_offset = self.events_path.stat().st_size if self.events_path.exists() else 0
+        self.reload_all()
+
+    def reload_all(self) -> None:
+        """List every agent again and redraw the rows that changed."""
+        result = api_list_agents(
+            mngr_ctx=self.params.mngr_ctx,
+            include_filters=self.params.include_filters,
+            exclude_filters=self.params.exclude_filters,
+            provider_names=self.params.provider_names,
+            error_behavior=self.params.error_behavior,
+            is_streaming=False,
+        )
+        self.replace_agents(result.agents)
+        self._redraw(result.errors)
+
+    def replace_agents(self, agents: Sequence[AgentDetails]) -> None:
+        """Replace the whole content of the table."""
+        for agent_id in set(self._agent_by_id) - {agent.id for agent in agents}:
+            self._remove_agent(agent_id)
+        for agent in agents:
+            self._upsert_agent(agent)
+
+    def refresh_from_events_file(self) -> None:
+        """Apply the discovery events appended since the last call, or reload everything if there are none.
+
+        Called by the watch loop both when the events file changed and when the
+        maximum interval elapsed; the latter shows up here as no new events.
+        """
+        try:
+            read_result = _read_new_discovery_events(self.events_path, self._events_offset)
+            if read_result is None:
+                logger.debug("Discovery events file was rotated, reloading every agent")
+                self._events_offset = 0
+                self.reload_all()
+                return
+            events, new_offset = read_result
+            is_interval_elapsed = new_offset == self._events_offset
+            self._events_offset = new_offset
+            if is_interval_elapsed:
+                self.reload_all()
+            else:
+                self.apply_discovery_events(events)
+        except MngrError as e:
+            logger.error("Error in watch iteration (continuing): {}", e)
+            self.display.invalidate()
+
+    def apply_discovery_events(self, events: Sequence[DiscoveryEvent]) -> None:
+        """Update the table for a batch of discovery events, listing only the hosts they name."""
+        host_ref_by_id: dict[HostId, DiscoveredHost] = {}
+        stale_host_ids: set[HostId] = set()
+        destroyed_host_ids: set[HostId] = set()
+        destroyed_agent_ids: set[AgentId] = set()
+        for event in events:
+            if isinstance(event, AgentDiscoveryEvent):
+                stale_host_ids.add(event.agent.host_id)
+            elif isinstance(event, HostDiscoveryEvent):
+                host_ref_by_id[event.host.host_id] = event.host
+                stale_host_ids.add(event.host.host_id)
+                destroyed_host_ids.discard(event.host.host_id)
+            elif isinstance(event, AgentDestroyedEvent):
+                destroyed_agent_ids.add(event.agent_id)
+            elif isinstance(event, HostDestroyedEvent):
+                destroyed_host_ids.add(event.host_id)
+                stale_host_ids.discard(event.host_id)
+            elif isinstance(event, FullDiscoverySnapshotEvent):
+                # Usually written by a listing that saw exactly what the table holds; only differences matter
+                host_ref_by_id.update({host.host_id: host for host in event.hosts})
+                snapshot_agent_ids = {agent.agent_id for agent in event.agents}
+                destroyed_agent_ids.update(set(self._agent_by_id) - snapshot_agent_ids)
+                # A filtered table is expected to miss some of the snapshot's agents
+                if self._is_unfiltered():
+                    stale_host_ids.update(
+                        agent.host_id for agent in event.agents if agent.agent_id not in self._agent_by_id
+                    )
+            else:
+                # Other events (like SSH info) do not change what is displayed
+                pass
+
+        for agent_id, agent in list(self._agent_by_id.items()):
+            if agent.id in destroyed_agent_ids or agent.host.id in destroyed_host_ids:
+                self._remove_agent(agent_id)
+
+        # Hosts the events did not describe are looked up from their agents already in the table
+        for agent in self._agent_by_id.values():
+            if agent.host.id in stale_host_ids and agent.host.id not in host_ref_by_id:
+                host_ref_by_id[agent.host.id] = discovered_host_from_agent_details(agent)
+        if any(host_id not in host_ref_by_id for host_id in stale_host_ids):
+            logger.debug("Discovery events named a host that is not in the table, reloading every agent")
+            self.reload_all()
+            return
+
+        host_refs = [host_ref_by_id[host_id] for host_id in sorted(stale_host_ids)]
+        if self.params.provider_names is not None:
+            host_refs = [host_ref for host_ref in host_refs if host_ref.provider_name in self.params.provider_names]
+        errors: list[ErrorInfo] = []
+        if host_refs:
+            errors = self._refresh_hosts(host_refs)
+        self._redraw(errors)
+
+    def _is_unfiltered(self) -> bool:
+        return (
+            self.params.provider_names is None and not self.params.include_filters and not self.params.exclude_filters
+        )
+
+    def _refresh_hosts(self, host_refs: Sequence[DiscoveredHost]) -> list[ErrorInfo]:
+        result = list_agents_on_hosts(
+            mngr_ctx=self.params.mngr_ctx,
+            host_refs=host_refs,
+            include_filters=self.params.include_filters,
+            exclude_filters=self.params.exclude_filters,
+            error_behavior=self.params.error_behavior,
+        )
+        # Keep the previous rows of hosts that could not be listed, rather than dropping their agents
+        is_failure_scoped_to_hosts = all(isinstance(error, HostErrorInfo | AgentErrorInfo) for error in result.errors)
+        failed_host_ids = {error.host_id for error in result.errors if isinstance(error, HostErrorInfo)}
+        refreshed_host_ids = (
+            {host_ref.host_id for host_ref in host_refs} - failed_host_ids if is_failure_scoped_to_hosts else set()
+        )
+        listed_agent_ids = {agent.id for agent in result.agents}
+        for agent_id, agent in list(self._agent_by_id.items()):
+            if agent.host.id in refreshed_host_ids and agent_id not in listed_agent_ids:
+                self._remove_agent(agent_id)
+        for agent in result.agents:
+            self._upsert_agent(agent)
+        return result.errors
+
+    def _upsert_agent(self, agent: AgentDetails) -> None:
+        if self._agent_by_id.get(agent.id) == agent:
+            return
+        if agent.id not in self._agent_by_id:
+            self._sorted_agent_ids.append(agent.id)
+        self._agent_by_id[agent.id] = agent
+        self._sort_keys_by_agent_id[agent.id] = self._compute_sort_keys(agent)
+
+    def _remove_agent(self, agent_id: AgentId) -> None:
+        # The ID is dropped from the sort order the next time the table is sorted
+        self._agent_by_id.pop(agent_id, None)
+        self._sort_keys_by_agent_id.pop(agent_id, None)
+
+    def _compute_sort_keys(self, agent: AgentDetails) -> tuple[tuple[int, str], ...]:
+        compiled_sort_keys = self.params.compiled_sort_keys
+        if not compiled_sort_keys:
+            return ()
+        field_names = get_referenced_cel_names(program for program, _ in compiled_sort_keys)
+        pair = (agent, agent_details_to_cel_context(agent, field_names))
+        sort_keys: list[tuple[int, str]] = []
+        for program, is_descending in compiled_sort_keys:
+            extractor = _CelSortKeyExtractor()
+            extractor.program = program
+            extractor.is_descending = is_descending
+            sort_keys.append(extractor(pair))
+        return tuple(sort_keys)
+
+    def _sort(self) -> None:
+        self._sorted_agent_ids = [
+            agent_id for agent_id in dict.fromkeys(self._sorted_agent_ids) if agent_id in self._agent_by_id
+        ]
+        # Same stable multi-pass sort as _sort_agents_by_cel, but on the cached keys
+        for key_index in reversed(range(len(self.params.compiled_sort_keys))):
+            getter = _CachedSortKeyGetter()
+            getter.key_index = key_index
+            getter.sort_keys_by_agent_id = self._sort_keys_by_agent_id
+            self._sorted_agent_ids.sort(key=getter, reverse=self.params.compiled_sort_keys[key_index][1])
+
+    def _redraw(self, errors: Sequence[ErrorInfo]) -> None:
+        if errors:
+            for error in errors:
+                logger.warning("{}: {}", error.exception_type, error.message)
+            # The warnings were written below the table, so it has to be drawn again from scratch
+            self.display.invalidate()
+        self.display.draw(_format_watch_lines(self.get_displayed_agents(), errors, self.params))
+
+
+def _format_watch_lines(
+    agents: Sequence[AgentDetails],
+    errors: Sequence[ErrorInfo],
+    params: _ListIterationParams,
+) -> list[str]:
+    """Render the watch mode output as lines, in the same format as a single list iteration."""
+    if params.format_template is not None:
+        return [_render_format_template(params.format_template, agent) for agent in agents]
+    elif params.output_opts.output_format == OutputFormat.HUMAN:
+        if not agents:
+            return ["No agents found"]
+        fields = params.fields if params.fields is not None else list(_DEFAULT_HUMAN_DISPLAY_FIELDS)
+        headers = [_get_header_label(field, params.custom_headers) for field in fields]
+        rows = [[_get_field_value(agent, field) for field in fields] for agent in agents]
+        return ["", *tabulate(rows, headers=headers, tablefmt="plain").split("\n")]
+    elif params.output_opts.output_format == OutputFormat.JSON:
+        output_data = {
+            "agents": [agent.model_dump(mode="json") for agent in agents],
+            "errors": [error.model_dump(mode="json") for error in errors],
+        }
+        return [json.dumps(output_data)]
+    else:
+        # JSONL is handled above with streaming, so this should be unreachable
+        raise AssertionError(f"Unexpected output format: {params.output_opts.output_format}")
 
 
 def _poll_events_file_for_changes(
@@ -6,6 +6,7 @@ from collections.abc import Callable
 from datetime import datetime
 from datetime import timezone
 from io import StringIO
+from pathlib import Path
 from typing import Any
 
 import pluggy
@@ -1152,6 +1153,25 @@ def test_project_option_generates_cel_filter(
     assert "No agents found" in result.output
 
 
+def test_profile_option_writes_chrome_trace(
+    cli_runner: CliRunner,
+    plugin_manager: pluggy.PluginManager,
+    tmp_path: Path,
+) -> None:
+    """--profile should write the command's spans as Chrome trace events."""
+    profile_path = tmp_path / "list-profile.json"
+    result = cli_runner.invoke(
+        list_command,
+        ["--profile", str(profile_path)],
+        obj=plugin_manager,
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+
+    span_names = [event["name"] for event in json.loads(profile_path.read_text())["traceEvents"]]
+    assert "Started list command" in span_names
+
+
 def test_host_label_option_generates_cel_filter(
     cli_runner: CliRunner,
     plugin_manager: pluggy.PluginManager,
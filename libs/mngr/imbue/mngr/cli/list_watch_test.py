@@ -1,11 +1,30 @@
 import threading
+from io import StringIO
 from pathlib import Path
 
 import pytest
 
+from imbue.mngr.api.discovery_events import emit_agent_destroyed
+from imbue.mngr.api.discovery_events import emit_host_destroyed
+from imbue.mngr.api.discovery_events import emit_host_discovered
+from imbue.mngr.api.discovery_events import get_discovery_events_path
+from imbue.mngr.cli.list import _ListIterationParams
+from imbue.mngr.cli.list import _WatchDisplay
+from imbue.mngr.cli.list import _WatchedAgentTable
 from imbue.mngr.cli.list import _poll_events_file_for_changes
+from imbue.mngr.cli.list import _read_new_discovery_events
 from imbue.mngr.cli.list import _run_event_driven_watch
+from imbue.mngr.config.data_types import MngrContext
+from imbue.mngr.config.data_types import OutputOptions
+from imbue.mngr.hosts.host import Host
+from imbue.mngr.interfaces.data_types import AgentDetails
+from imbue.mngr.primitives import DiscoveredHost
+from imbue.mngr.primitives import ErrorBehavior
+from imbue.mngr.primitives import HostId
+from imbue.mngr.primitives import ProviderInstanceName
+from imbue.mngr.utils.cel_utils import compile_cel_sort_keys
 from imbue.mngr.utils.polling import poll_until
+from imbue.mngr.utils.testing import make_test_agent_details
 
 # === Watch mode (event-driven) tests ===
 
@@ -111,3 +130,147 @@ def test_run_event_driven_watch_respects_stop_event(tmp_path: Path) -> None:
     _run_event_driven_watch(events_path, 60, stop_event, on_refresh)
 
     assert refresh_count[0] == 0
+
+
+# === Incremental watch display tests ===
+
+
+def test_watch_display_redraws_only_changed_lines_in_place() -> None:
+    output = StringIO()
+    display = _WatchDisplay(output=output, is_redrawn_in_place=True)
+
+    assert display.draw(["header", "agent-a", "agent-b"]) == 3
+    output.truncate(0)
+    output.seek(0)
+
+    assert display.draw(["header", "agent-a", "agent-c"]) == 1
+    redraw = output.getvalue()
+    assert redraw.startswith("\x1b[3A")
+    assert "agent-c" in redraw
+    assert "header" not in redraw
+    assert "agent-a" not in redraw
+
+
+def test_watch_display_clears_leftover_lines_when_output_shrinks() -> None:
+    output = StringIO()
+    display = _WatchDisplay(output=output, is_redrawn_in_place=True)
+    display.draw(["header", "agent-a", "agent-b"])
+    output.truncate(0)
+    output.seek(0)
+
+    assert display.draw(["header", "agent-a"]) == 0
+
+    # The last line is erased, then the cursor returns to just below the new output
+    assert output.getvalue() == "\x1b[3A\n\n\r\x1b[K\n\x1b[1A"
+
+
+def test_watch_display_without_redraw_writes_only_when_output_changes() -> None:
+    output = StringIO()
+    display = _WatchDisplay(output=output, is_redrawn_in_place=False)
+
+    display.draw(["header", "agent-a"])
+    display.draw(["header", "agent-a"])
+    display.draw(["header", "agent-b"])
+
+    assert output.getvalue() == "header\nagent-a\nheader\nagent-b\n"
+
+
+def test_read_new_discovery_events_leaves_partial_lines_for_the_next_read(
+    temp_mngr_ctx: MngrContext,
+) -> None:
+    events_path = get_discovery_events_path(temp_mngr_ctx.config)
+    emit_agent_destroyed(temp_mngr_ctx.config, make_test_agent_details().id, HostId.generate())
+    complete_size = events_path.stat().st_size
+    with events_path.open("a") as f:
+        f.write('{"partial": ')
+
+    read_result = _read_new_discovery_events(events_path, 0)
+
+    assert read_result is not None
+    events, offset = read_result
+    assert len(events) == 1
+    assert offset == complete_size
+    assert _read_new_discovery_events(events_path, events_path.stat().st_size + 1) is None
+
+
+def _make_watched_agent_table(mngr_ctx: MngrContext, output: StringIO) -> _WatchedAgentTable:
+    params = _ListIterationParams(
+        mngr_ctx=mngr_ctx,
+        output_opts=OutputOptions(),
+        include_filters=(),
+        exclude_filters=(),
+        provider_names=None,
+        error_behavior=ErrorBehavior.CONTINUE,
+        compiled_sort_keys=compile_cel_sort_keys("name"),
+        limit=None,
+        fields=["name"],
+    )
+    return _WatchedAgentTable(
+        params=params,
+        events_path=get_discovery_events_path(mngr_ctx.config),
+        display=_WatchDisplay(output=output, is_redrawn_in_place=False),
+    )
+
+
+def _get_displayed_names(table: _WatchedAgentTable) -> list[str]:
+    return [str(agent.name) for agent in table.get_displayed_agents()]
+
+
+def test_watched_agent_table_keeps_agents_sorted_as_they_change(temp_mngr_ctx: MngrContext) -> None:
+    table = _make_watched_agent_table(temp_mngr_ctx, StringIO())
+    agent_b = make_test_agent_details(name="bravo")
+    agent_c = make_test_agent_details(name="charlie")
+    table.replace_agents([agent_c, agent_b])
+    assert _get_displayed_names(table) == ["bravo", "charlie"]
+
+    renamed_agent_c = AgentDetails.model_validate({**agent_c.model_dump(), "name": "alpha"})
+    table.replace_agents([agent_b, renamed_agent_c])
+
+    assert _get_displayed_names(table) == ["alpha", "bravo"]
+
+
+def test_watched_agent_table_applies_destroy_events_without_listing(temp_mngr_ctx: MngrContext) -> None:
+    output = StringIO()
+    table = _make_watched_agent_table(temp_mngr_ctx, output)
+    kept_agent = make_test_agent_details(name="kept")
+    destroyed_agent = make_test_agent_details(name="destroyed-agent")
+    destroyed_host_agent = make_test_agent_details(name="destroyed-host")
+    table.start()
+    # Consume the discovery snapshot written by the initial listing
+    table.refresh_from_events_file()
+    table.replace_agents([kept_agent, destroyed_agent, destroyed_host_agent])
+
+    emit_agent_destroyed(temp_mngr_ctx.config, destroyed_agent.id, destroyed_agent.host.id)
+    emit_host_destroyed(temp_mngr_ctx.config, destroyed_host_agent.host.id, [destroyed_host_agent.id])
+    table.refresh_from_events_file()
+
+    assert _get_displayed_names(table) == ["kept"]
+    assert output.getvalue().endswith("kept\n")
+
+
+def test_watched_agent_table_relists_only_the_hosts_named_by_events(
+    temp_mngr_ctx: MngrContext,
+    local_host: Host,
+) -> None:
+    table = _make_watched_agent_table(temp_mngr_ctx, StringIO())
+    other_host_agent = make_test_agent_details(name="other-host")
+    stale_local_agent = make_test_agent_details(
+        name="stale-local", host_id=local_host.id, provider_name=ProviderInstanceName("local")
+    )
+    table.start()
+    # Consume the discovery snapshot written by the initial listing
+    table.refresh_from_events_file()
+    table.replace_agents([other_host_agent, stale_local_agent])
+
+    emit_host_discovered(
+        temp_mngr_ctx.config,
+        DiscoveredHost(
+            host_id=local_host.id,
+            host_name=local_host.get_name(),
+            provider_name=ProviderInstanceName("local"),
+        ),
+    )
+    table.refresh_from_events_file()
+
+    # The local host has no agents, so its stale row is dropped; the other host is not listed again
+    assert _get_displayed_names(table) == ["other-host"]
@@ -33,6 +33,7 @@ _DEFAULT_OPTS = MessageCliOptions(
     log_commands=None,
     log_command_output=None,
     log_env_vars=None,
+    profile=None,
     project_context_path=None,
     plugin=(),
     disable_plugin=(),
@@ -56,6 +57,7 @@ def test_message_cli_options_has_expected_fields() -> None:
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
@@ -593,6 +593,7 @@ def _make_plugin_cli_options(
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
@@ -41,6 +41,7 @@ def test_provision_cli_options_can_be_instantiated() -> None:
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
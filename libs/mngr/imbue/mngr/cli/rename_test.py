@@ -21,6 +21,7 @@ def test_rename_cli_options_parsing_creates_valid_options() -> None:
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
@@ -44,6 +45,7 @@ def test_rename_cli_options_with_dry_run() -> None:
         log_commands=None,
         log_command_output=None,
         log_env_vars=None,
+        profile=None,
         project_context_path=None,
         plugin=(),
         disable_plugin=(),
@@ -0,0 +1,38 @@
+from typing import Any
+
+import click
+from loguru import logger
+
+from imbue.mngr.api.providers import get_provider_instance
+from imbue.mngr.api.warm_pool import load_warm_pool_host_template
+from imbue.mngr.api.warm_pool import top_up_warm_pool
+from imbue.mngr.cli.common_opts import add_common_options
+from imbue.mngr.cli.common_opts import setup_command_context
+from imbue.mngr.config.data_types import CommonCliOptions
+from imbue.mngr.primitives import ProviderInstanceName
+
+
+class WarmPoolCliOptions(CommonCliOptions):
+    """Options passed from the CLI to the warmpool command."""
+
+    provider: str
+    template: str
+
+
+# Internal command that `mngr create` runs in a detached process to top up the warm pool
+# a host was taken from, so it is hidden from the help output.
+@click.command(name="warmpool", hidden=True)
+@click.option("--provider", required=True, help="Provider whose warm pool to top up")
+@click.option("--template", required=True, help="Fingerprint of the host template of the warm pool")
+@add_common_options
+@click.pass_context
+def warm_pool(ctx: click.Context, **kwargs: Any) -> None:
+    mngr_ctx, _, opts = setup_command_context(
+        ctx=ctx,
+        command_name="warmpool",
+        command_class=WarmPoolCliOptions,
+    )
+    logger.debug("Started warmpool command")
+
+    provider = get_provider_instance(ProviderInstanceName(opts.provider), mngr_ctx)
+    top_up_warm_pool(provider, load_warm_pool_host_template(provider, opts.template))
@@ -231,6 +231,21 @@ class ProviderInstanceConfig(FrozenModel):
         description="How long (in seconds) a destroyed host's records are kept before permanent deletion. "
         "Overrides the global default_destroyed_host_persisted_seconds when set.",
     )
+    discovery_cache_ttl_seconds: float | None = Field(
+        default=None,
+        description="How long (in seconds) this provider's cached discovery results may be served while they are "
+        "revalidated in the background. Overrides the global default_discovery_cache_ttl_seconds when set.",
+    )
+    warm_pool_size: int | None = Field(
+        default=None,
+        description="Number of idle, pre-provisioned hosts to keep ready for `mngr create`, for each host template "
+        "(build args, start args, tags, ...) that has been used with this provider. Disabled when unset or 0.",
+    )
+    warm_pool_max_idle_seconds: float | None = Field(
+        default=None,
+        description="How long (in seconds) a pre-provisioned host may sit unclaimed in the warm pool before it is "
+        "destroyed and replaced. Defaults to one hour when unset.",
+    )
 
     def merge_with(self, override: "ProviderInstanceConfig") -> "ProviderInstanceConfig":
         """Merge this config with an override config.
@@ -447,6 +462,12 @@ class MngrConfig(FrozenModel):
         default=False,
         description="Allow attaching to tmux sessions from within an existing tmux session by unsetting $TMUX",
     )
+    is_remote_compression_enabled: bool = Field(
+        default=False,
+        description="Compress the output of bulk reads from remote hosts (file reads, event logs, transcripts) "
+        "on the host before it is sent back, when the host has gzip. Saves bandwidth on slow links at the cost "
+        "of some CPU on both ends.",
+    )
     headless: bool = Field(
         default=False,
         description="When true, disables all interactive behavior (prompts, TUI, editor). "
@@ -465,6 +486,12 @@ class MngrConfig(FrozenModel):
         description="Default number of seconds a destroyed host's records are kept before permanent deletion. "
         "Can be overridden per provider via destroyed_host_persisted_seconds in the provider config.",
     )
+    default_discovery_cache_ttl_seconds: float = Field(
+        default=0.0,
+        description="Default number of seconds that a provider's discovery results are cached on disk, so that "
+        "commands targeting known agents can skip provider discovery (0 disables the cache). "
+        "Can be overridden per provider via discovery_cache_ttl_seconds in the provider config.",
+    )
 
     def merge_with(self, override: Self) -> Self:
         """Merge this config with an override config.
@@ -587,6 +614,11 @@ class MngrConfig(FrozenModel):
         if override.is_nested_tmux_allowed is not None:
             merged_is_nested_tmux_allowed = override.is_nested_tmux_allowed
 
+        # Merge is_remote_compression_enabled (scalar - override wins if not None)
+        merged_is_remote_compression_enabled = self.is_remote_compression_enabled
+        if override.is_remote_compression_enabled is not None:
+            merged_is_remote_compression_enabled = override.is_remote_compression_enabled
+
         # Merge headless (scalar - override wins if not None)
         merged_headless = self.headless
         if override.headless is not None:
@@ -606,6 +638,11 @@ class MngrConfig(FrozenModel):
         if override.default_destroyed_host_persisted_seconds is not None:
             default_destroyed_host_persisted_seconds = override.default_destroyed_host_persisted_seconds
 
+        # Merge default_discovery_cache_ttl_seconds (scalar - override wins if not None)
+        default_discovery_cache_ttl_seconds = self.default_discovery_cache_ttl_seconds
+        if override.default_discovery_cache_ttl_seconds is not None:
+            default_discovery_cache_ttl_seconds = override.default_discovery_cache_ttl_seconds
+
         # Merge logging (nested config - use merge_with if override.logging is not None)
         merged_logging = self.logging
         if override.logging is not None:
@@ -629,10 +666,12 @@ class MngrConfig(FrozenModel):
             connect_command=merged_connect_command,
             logging=merged_logging,
             is_nested_tmux_allowed=merged_is_nested_tmux_allowed,
+            is_remote_compression_enabled=merged_is_remote_compression_enabled,
             headless=merged_headless,
             is_error_reporting_enabled=merged_is_error_reporting_enabled,
             is_allowed_in_pytest=is_allowed_in_pytest,
             default_destroyed_host_persisted_seconds=default_destroyed_host_persisted_seconds,
+            default_discovery_cache_ttl_seconds=default_discovery_cache_ttl_seconds,
         )
 
 
@@ -752,6 +791,7 @@ class CommonCliOptions(FrozenModel):
     log_commands: bool | None
     log_command_output: bool | None
     log_env_vars: bool | None
+    profile: Path | None
     project_context_path: str | None
     plugin: tuple[str, ...]
     disable_plugin: tuple[str, ...]
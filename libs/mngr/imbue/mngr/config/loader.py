@@ -191,6 +191,7 @@ def load_config(
     config_dict["connect_command"] = config.connect_command
     config_dict["is_remote_agent_installation_allowed"] = config.is_remote_agent_installation_allowed
     config_dict["is_nested_tmux_allowed"] = config.is_nested_tmux_allowed
+    config_dict["is_remote_compression_enabled"] = config.is_remote_compression_enabled
     # Apply MNGR_HEADLESS env var override (env var > config file > default)
     headless_env = os.environ.get("MNGR_HEADLESS")
     if headless_env is not None:
@@ -202,6 +203,7 @@ def load_config(
     config_dict["pre_command_scripts"] = config.pre_command_scripts
     config_dict["work_dir_extra_paths"] = config.work_dir_extra_paths
     config_dict["default_destroyed_host_persisted_seconds"] = config.default_destroyed_host_persisted_seconds
+    config_dict["default_discovery_cache_ttl_seconds"] = config.default_discovery_cache_ttl_seconds
 
     # Allow plugins to modify config_dict before validation
     pm.hook.on_load_config(config_dict=config_dict)
@@ -567,12 +569,14 @@ def parse_config(
     )
     kwargs["logging"] = _parse_logging_config(raw.pop("logging", {}), strict=strict) if "logging" in raw else None
     kwargs["is_nested_tmux_allowed"] = raw.pop("is_nested_tmux_allowed", None)
+    kwargs["is_remote_compression_enabled"] = raw.pop("is_remote_compression_enabled", None)
     kwargs["headless"] = raw.pop("headless", None)
     kwargs["is_error_reporting_enabled"] = raw.pop("is_error_reporting_enabled", None)
     kwargs["is_allowed_in_pytest"] = raw.pop("is_allowed_in_pytest", None)
     kwargs["pre_command_scripts"] = raw.pop("pre_command_scripts", None)
     kwargs["work_dir_extra_paths"] = raw.pop("work_dir_extra_paths", None)
     kwargs["default_destroyed_host_persisted_seconds"] = raw.pop("default_destroyed_host_persisted_seconds", None)
+    kwargs["default_discovery_cache_ttl_seconds"] = raw.pop("default_discovery_cache_ttl_seconds", None)
 
     if len(raw) > 0:
         if strict:
@@ -694,8 +694,10 @@ def test_load_config_threads_every_field_from_toml(
     assert config.is_remote_agent_installation_allowed is False
     assert config.headless is True
     assert config.is_nested_tmux_allowed is True
+    assert config.is_remote_compression_enabled is True
     assert config.is_error_reporting_enabled is False
     assert config.default_destroyed_host_persisted_seconds == 12345.0
+    assert config.default_discovery_cache_ttl_seconds == 30.0
     assert "TEST_VAR" in config.unset_vars
     assert ProviderBackendName("local") in config.enabled_backends
     assert ".venv" in config.work_dir_extra_paths
@@ -721,10 +723,12 @@ _SAMPLE_CONFIG_VALUES: dict[str, Any] = {
     "is_remote_agent_installation_allowed": False,
     "connect_command": "my-connect",
     "is_nested_tmux_allowed": True,
+    "is_remote_compression_enabled": True,
     "headless": True,
     "is_error_reporting_enabled": False,
     "is_allowed_in_pytest": True,
     "default_destroyed_host_persisted_seconds": 12345.0,
+    "default_discovery_cache_ttl_seconds": 30.0,
 }
 
 _SAMPLE_TOML = """\
@@ -736,10 +740,12 @@ enabled_backends = ["local"]
 connect_command = "my-connect"
 is_remote_agent_installation_allowed = false
 is_nested_tmux_allowed = true
+is_remote_compression_enabled = true
 headless = true
 is_error_reporting_enabled = false
 is_allowed_in_pytest = true
 default_destroyed_host_persisted_seconds = 12345.0
+default_discovery_cache_ttl_seconds = 30.0
 
 [commands.create]
 name = "test"
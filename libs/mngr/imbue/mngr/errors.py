@@ -62,6 +62,10 @@ class HostConnectionError(HostError):
     """Raised when unable to connect to a host."""
 
 
+class TmuxControlModeError(HostError):
+    """Raised when a tmux control-mode client fails or its connection is lost."""
+
+
 class HostOfflineError(HostConnectionError):
     """Raised when unable to connect to a host because it is offline."""
 
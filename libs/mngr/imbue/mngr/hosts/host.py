@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import base64
+import binascii
 import fcntl
+import gzip
 import importlib.resources
 import io
 import json
 import os
 import shlex
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
 from typing import Any
+from typing import Final
 from typing import IO
 from typing import Iterator
 from typing import Mapping
@@ -27,6 +32,7 @@ from paramiko import SFTPClient
 from paramiko import SSHException
 from paramiko import Transport
 from pydantic import Field
+from pydantic import PrivateAttr
 from pydantic import ValidationError
 from pyinfra.api.command import StringCommand
 from pyinfra.api.exceptions import ConnectError
@@ -59,9 +65,13 @@ from imbue.mngr.errors import InvalidActivityTypeError
 from imbue.mngr.errors import LockNotHeldError
 from imbue.mngr.errors import MngrError
 from imbue.mngr.errors import NoCommandDefinedError
+from imbue.mngr.errors import TmuxControlModeError
 from imbue.mngr.errors import UserInputError
 from imbue.mngr.hosts.common import LOCAL_CONNECTOR_NAME
 from imbue.mngr.hosts.offline_host import BaseHost
+from imbue.mngr.hosts.tmux_control import ParamikoTmuxControlChannel
+from imbue.mngr.hosts.tmux_control import TmuxControlClient
+from imbue.mngr.hosts.tmux_control import build_tmux_control_attach_command
 from imbue.mngr.interfaces.agent import AgentInterface
 from imbue.mngr.interfaces.data_types import CertifiedHostData
 from imbue.mngr.interfaces.data_types import CommandResult
@@ -73,6 +83,7 @@ from imbue.mngr.interfaces.host import CreateWorkDirResult
 from imbue.mngr.interfaces.host import HostInterface
 from imbue.mngr.interfaces.host import NamedCommand
 from imbue.mngr.interfaces.host import OnlineHostInterface
+from imbue.mngr.interfaces.host import TmuxPaneWatcherInterface
 from imbue.mngr.interfaces.provider_instance import ProviderInstanceInterface
 from imbue.mngr.primitives import ActivitySource
 from imbue.mngr.primitives import AgentId
@@ -152,6 +163,87 @@ def get_agent_state_dir_path(host_dir: Path, agent_id: AgentId) -> Path:
     return host_dir / "agents" / str(agent_id)
 
 
+# Line printed before the base64-encoded contents of each file that exists
+_BATCHED_READ_FOUND_MARKER: Final[str] = "MNGR_FILE_FOUND"
+
+# Line printed in place of the contents of each file that does not exist
+_BATCHED_READ_MISSING_MARKER: Final[str] = "MNGR_FILE_MISSING"
+
+
+@pure
+def build_batched_file_read_command(paths: Sequence[Path]) -> str:
+    """Build a shell command that prints the contents of several files in order.
+
+    Each existing file produces a found marker line followed by its contents,
+    base64-encoded on a single line; each missing file produces a missing marker line.
+    """
+    file_commands: list[str] = []
+    for path in paths:
+        quoted_path = shlex.quote(str(path))
+        file_commands.append(
+            f"if [ -f {quoted_path} ]; then echo {_BATCHED_READ_FOUND_MARKER}; base64 < {quoted_path} | tr -d '\\n'; echo;"
+            f" else echo {_BATCHED_READ_MISSING_MARKER}; fi"
+        )
+    return "; ".join(file_commands)
+
+
+@pure
+def parse_batched_file_read_output(stdout: str, paths: Sequence[Path], encoding: str) -> dict[Path, str | None]:
+    """Parse the output of build_batched_file_read_command into file contents by path.
+
+    Raises MngrError if the output is malformed or a file cannot be decoded.
+    """
+    lines = iter(stdout.splitlines())
+    content_by_path: dict[Path, str | None] = {}
+    for path in paths:
+        marker = next(lines, None)
+        if marker == _BATCHED_READ_FOUND_MARKER:
+            try:
+                content_by_path[path] = base64.b64decode(next(lines, "")).decode(encoding)
+            except (binascii.Error, UnicodeDecodeError) as e:
+                raise MngrError(f"Failed to decode the contents of {path}: {e}") from e
+        elif marker == _BATCHED_READ_MISSING_MARKER:
+            content_by_path[path] = None
+        else:
+            raise MngrError(f"Unexpected output while reading {path}: {marker!r}")
+    return content_by_path
+
+
+# Prints "gzip" if the host has the tools needed to compress command output
+_OUTPUT_COMPRESSION_PROBE_COMMAND: Final[str] = (
+    "command -v gzip >/dev/null && command -v base64 >/dev/null && echo gzip"
+)
+
+# Appended to the compressed output of a command, followed by the command's exit status
+_COMPRESSED_OUTPUT_EXIT_STATUS_MARKER: Final[bytes] = b"\nMNGR_EXIT_STATUS="
+
+# Exit status of a compressed file read when the file does not exist
+_COMPRESSED_READ_MISSING_FILE_EXIT_STATUS: Final[int] = 66
+
+
+@pure
+def build_compressed_output_command(command: str) -> str:
+    """Wrap a command so that its stdout is gzip-compressed and base64-encoded for the transfer back.
+
+    The exit status of the pipeline is that of base64, so the command's own
+    exit status is appended inside the compressed stream.
+    """
+    return f"{{ ( {command}\n); printf '\\nMNGR_EXIT_STATUS=%s' \"$?\"; }} | gzip -c | base64"
+
+
+@pure
+def parse_compressed_output(stdout: str) -> tuple[bytes, int]:
+    """Decode the output of build_compressed_output_command into the command's stdout and exit status."""
+    try:
+        decoded = gzip.decompress(base64.b64decode(stdout))
+    except (binascii.Error, OSError, EOFError) as e:
+        raise MngrError(f"Failed to decode compressed command output: {e}") from e
+    output, marker, exit_status = decoded.rpartition(_COMPRESSED_OUTPUT_EXIT_STATUS_MARKER)
+    if not marker or not exit_status.isdigit():
+        raise MngrError("Compressed command output is missing the exit status of the command")
+    return output, int(exit_status)
+
+
 class HostLocation(FrozenModel):
     """A path on a specific host."""
 
@@ -176,6 +268,11 @@ class Host(BaseHost, OnlineHostInterface):
     )
     mngr_ctx: MngrContext = Field(frozen=True, repr=False, description="The mngr context")
 
+    _tmux_pane_watcher_by_session: dict[str, TmuxControlClient | None] = PrivateAttr(default_factory=dict)
+    _tmux_pane_watcher_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _is_output_compression_supported: bool | None = PrivateAttr(default=None)
+    _output_compression_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     @property
     def is_local(self) -> bool:
         """Check if this host uses the local connector."""
@@ -213,6 +310,11 @@ class Host(BaseHost, OnlineHostInterface):
         close the SSH connection. Failure to disconnect can lead to stale
         socket state causing "Socket is closed" errors in subsequent operations.
         """
+        with self._tmux_pane_watcher_lock:
+            for watcher in self._tmux_pane_watcher_by_session.values():
+                if watcher is not None:
+                    watcher.close()
+            self._tmux_pane_watcher_by_session.clear()
         if self.connector.host.connected:
             self.connector.host.disconnect()
             logger.trace("Disconnected pyinfra host {}", self.id)
@@ -615,6 +717,67 @@ class Host(BaseHost, OnlineHostInterface):
                 success=success,
             )
 
+    def execute_bulk_read_command(
+        self,
+        command: str,
+        user: str | None = None,
+        cwd: Path | None = None,
+        env: Mapping[str, str] | None = None,
+        timeout_seconds: float | None = None,
+    ) -> CommandResult:
+        """Execute a command with a large (typically text) output and return the result.
+
+        When remote compression is enabled and the host supports it, the output
+        is compressed on the host and decompressed here. Otherwise (and if the
+        compressed output cannot be decoded) this is execute_idempotent_command.
+        """
+        compressed_result = self._execute_with_compressed_output(command, user, cwd, env, timeout_seconds)
+        if compressed_result is None:
+            return self.execute_idempotent_command(
+                command, user=user, cwd=cwd, env=env, timeout_seconds=timeout_seconds
+            )
+        output, exit_status, stderr = compressed_result
+        stdout = output.decode("utf-8", errors="replace")
+        # Match execute_idempotent_command, whose output drops the final newline
+        return CommandResult(stdout=stdout.removesuffix("\n"), stderr=stderr, success=exit_status == 0)
+
+    def _should_compress_output(self) -> bool:
+        """Whether to compress bulk output on this host, probing once whether the host can."""
+        if self.is_local or not self.mngr_ctx.config.is_remote_compression_enabled:
+            return False
+        with self._output_compression_lock:
+            if self._is_output_compression_supported is None:
+                probe = self.execute_idempotent_command(_OUTPUT_COMPRESSION_PROBE_COMMAND, timeout_seconds=15.0)
+                self._is_output_compression_supported = probe.success and probe.stdout.strip() == "gzip"
+                if not self._is_output_compression_supported:
+                    logger.debug("Host {} cannot compress output, using plain transfers", self.id)
+            return self._is_output_compression_supported
+
+    def _execute_with_compressed_output(
+        self,
+        command: str,
+        user: str | None,
+        cwd: Path | None,
+        env: Mapping[str, str] | None,
+        timeout_seconds: float | None,
+    ) -> tuple[bytes, int, str] | None:
+        """Run a command with its stdout compressed in transit, returning (stdout, exit status, stderr).
+
+        Returns None if output compression is not used for this host or the
+        output could not be decoded, in which case callers use a plain transfer.
+        """
+        if not self._should_compress_output():
+            return None
+        result = self.execute_idempotent_command(
+            build_compressed_output_command(command), user=user, cwd=cwd, env=env, timeout_seconds=timeout_seconds
+        )
+        try:
+            output, exit_status = parse_compressed_output(result.stdout)
+        except MngrError as e:
+            logger.debug("Falling back to a plain transfer on host {}: {}", self.id, e)
+            return None
+        return output, exit_status, result.stderr
+
     def execute_stateful_command(
         self,
         command: str,
@@ -645,10 +808,24 @@ class Host(BaseHost, OnlineHostInterface):
         # this shortcut reduces the number of file descriptors opened on local hosts and speeds things up considerably
         if self.is_local:
             return path.read_bytes()
-        else:
-            output = io.BytesIO()
-            self._get_file(str(path), output)
-            return output.getvalue()
+        quoted_path = shlex.quote(str(path))
+        compressed_result = self._execute_with_compressed_output(
+            f"test -e {quoted_path} || exit {_COMPRESSED_READ_MISSING_FILE_EXIT_STATUS}; cat {quoted_path}",
+            None,
+            None,
+            None,
+            None,
+        )
+        if compressed_result is not None:
+            content, exit_status, _ = compressed_result
+            if exit_status == 0:
+                return content
+            if exit_status == _COMPRESSED_READ_MISSING_FILE_EXIT_STATUS:
+                raise FileNotFoundError(f"No such file on host {self.id}: {path}")
+            # Anything else (e.g. permissions) is reported by the plain read below
+        output = io.BytesIO()
+        self._get_file(str(path), output)
+        return output.getvalue()
 
     # it'd be really nice to change the default for is_atomic to True, but it's actually a non-trivial performance impact the way it is implemented right now...
     def write_file(self, path: Path, content: bytes, mode: str | None = None, is_atomic: bool = False) -> None:
@@ -701,6 +878,27 @@ class Host(BaseHost, OnlineHostInterface):
         """
         return self.read_file(path).decode(encoding)
 
+    def read_text_files(self, paths: Sequence[Path], encoding: str = "utf-8") -> dict[Path, str | None]:
+        """Read several small files, returning None for files that do not exist.
+
+        On remote hosts all files are fetched with a single command instead of one
+        SFTP round trip per file.
+        """
+        if not paths:
+            return {}
+        if self.is_local:
+            content_by_path: dict[Path, str | None] = {}
+            for path in paths:
+                try:
+                    content_by_path[path] = path.read_text(encoding=encoding)
+                except FileNotFoundError:
+                    content_by_path[path] = None
+            return content_by_path
+        result = self.execute_bulk_read_command(build_batched_file_read_command(paths))
+        if not result.success:
+            raise MngrError(f"Failed to read files on host {self.id}: {result.stderr}")
+        return parse_batched_file_read_output(result.stdout, paths, encoding)
+
     def write_text_file(
         self,
         path: Path,
@@ -790,6 +988,41 @@ class Host(BaseHost, OnlineHostInterface):
 
         return (user, hostname, port, Path(key_path_str))
 
+    def get_tmux_pane_watcher(self, session_name: str) -> TmuxPaneWatcherInterface | None:
+        """Return a shared tmux control-mode watcher for a session on this host.
+
+        Only remote hosts stream pane output: there every capture-pane is another
+        SSH exec, while local captures are cheap. The control client runs on its
+        own exec channel of the existing SSH transport. Watchers are cached per
+        session, and so are failures to start one (e.g. a tmux too old for control
+        mode), so callers fall back to polling without retrying each time. A
+        watcher whose connection was lost is replaced on the next call.
+        """
+        if self.is_local:
+            return None
+        with self._tmux_pane_watcher_lock:
+            if session_name in self._tmux_pane_watcher_by_session:
+                cached_watcher = self._tmux_pane_watcher_by_session[session_name]
+                if cached_watcher is None or not cached_watcher.is_closed:
+                    return cached_watcher
+            watcher = self._start_tmux_pane_watcher(session_name)
+            self._tmux_pane_watcher_by_session[session_name] = watcher
+            return watcher
+
+    def _start_tmux_pane_watcher(self, session_name: str) -> TmuxControlClient | None:
+        """Start a control-mode client for the session, returning None if that is not possible."""
+        try:
+            self._ensure_connected()
+            transport = _get_ssh_transport(self.connector.host)
+            if transport is None:
+                return None
+            channel = transport.open_session()
+            channel.exec_command(build_tmux_control_attach_command(session_name))
+            return TmuxControlClient.start(ParamikoTmuxControlChannel(channel=channel))
+        except (HostConnectionError, SSHException, TmuxControlModeError) as e:
+            logger.debug("Cannot stream tmux output for session {} on host {}: {}", session_name, self.id, e)
+            return None
+
     # =========================================================================
     # Activity Times
     # =========================================================================
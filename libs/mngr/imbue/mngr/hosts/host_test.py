@@ -1,5 +1,7 @@
 """Unit tests for Host implementation."""
 
+import base64
+import gzip
 import io
 import json
 from collections.abc import Callable
@@ -16,7 +18,9 @@ from paramiko import SSHException
 from pyinfra.api.command import StringCommand
 from pyinfra.api.host import Host as PyinfraHost
 from pyinfra.connectors.util import CommandOutput
+from pyinfra.connectors.util import OutputLine
 
+from imbue.imbue_common.model_update import to_update
 from imbue.mngr.agents.base_agent import BaseAgent
 from imbue.mngr.config.data_types import AgentTypeConfig
 from imbue.mngr.config.data_types import EnvVar
@@ -26,6 +30,7 @@ from imbue.mngr.errors import AgentError
 from imbue.mngr.errors import HostConnectionError
 from imbue.mngr.errors import HostDataSchemaError
 from imbue.mngr.errors import InvalidActivityTypeError
+from imbue.mngr.errors import MngrError
 from imbue.mngr.errors import NoCommandDefinedError
 from imbue.mngr.errors import UserInputError
 from imbue.mngr.hosts.host import Host
@@ -36,6 +41,8 @@ from imbue.mngr.hosts.host import _format_env_file
 from imbue.mngr.hosts.host import _is_transient_ssh_error
 from imbue.mngr.hosts.host import _parse_boot_time_output
 from imbue.mngr.hosts.host import _parse_uptime_output
+from imbue.mngr.hosts.host import build_compressed_output_command
+from imbue.mngr.hosts.host import parse_compressed_output
 from imbue.mngr.interfaces.data_types import PyinfraConnector
 from imbue.mngr.interfaces.host import AgentEnvironmentOptions
 from imbue.mngr.interfaces.host import AgentLabelOptions
@@ -927,6 +934,99 @@ def _create_host_with_fake_connector(
     )
 
 
+# =========================================================================
+# Tests for compressed bulk output
+# =========================================================================
+
+
+def _make_command_output(stdout: str) -> CommandOutput:
+    return CommandOutput([OutputLine("stdout", line) for line in stdout.splitlines()])
+
+
+def _make_compressed_command_output(stdout: bytes, exit_status: int) -> CommandOutput:
+    compressed = gzip.compress(stdout + b"\nMNGR_EXIT_STATUS=" + str(exit_status).encode())
+    return _make_command_output(base64.encodebytes(compressed).decode())
+
+
+def _create_host_with_compression_enabled(local_provider: LocalProviderInstance, fake_host: _FakePyinfraHost) -> Host:
+    mngr_ctx = local_provider.mngr_ctx
+    config = mngr_ctx.config.model_copy_update(
+        to_update(mngr_ctx.config.field_ref().is_remote_compression_enabled, True)
+    )
+    return Host(
+        id=HostId.generate(),
+        connector=PyinfraConnector(cast(PyinfraHost, fake_host)),
+        provider_instance=local_provider,
+        mngr_ctx=mngr_ctx.model_copy_update(to_update(mngr_ctx.field_ref().config, config)),
+    )
+
+
+def test_compressed_output_command_round_trips_output_and_exit_status(local_host: Host) -> None:
+    result = local_host.execute_idempotent_command(build_compressed_output_command("printf 'a\\nb'; exit 3"))
+
+    assert parse_compressed_output(result.stdout) == (b"a\nb", 3)
+
+
+def test_parse_compressed_output_rejects_undecodable_output() -> None:
+    with pytest.raises(MngrError, match="Failed to decode"):
+        parse_compressed_output("this is not compressed output")
+
+
+def test_read_file_uses_compressed_transfer_when_enabled(local_provider: LocalProviderInstance) -> None:
+    fake = _FakePyinfraHost(
+        run_shell_command_results=[
+            (True, _make_command_output("gzip\n")),
+            (True, _make_compressed_command_output(b'{"key": "value"}\n', 0)),
+        ]
+    )
+    host = _create_host_with_compression_enabled(local_provider, fake)
+
+    assert host.read_file(Path("/remote/data.json")) == b'{"key": "value"}\n'
+    assert fake._get_file_call_count == 0
+
+
+def test_read_file_raises_file_not_found_from_compressed_transfer(local_provider: LocalProviderInstance) -> None:
+    fake = _FakePyinfraHost(
+        run_shell_command_results=[
+            (True, _make_command_output("gzip\n")),
+            (True, _make_compressed_command_output(b"", 66)),
+        ]
+    )
+    host = _create_host_with_compression_enabled(local_provider, fake)
+
+    with pytest.raises(FileNotFoundError):
+        host.read_file(Path("/remote/missing.json"))
+
+
+def test_execute_bulk_read_command_probes_once_and_falls_back_without_gzip(
+    local_provider: LocalProviderInstance,
+) -> None:
+    fake = _FakePyinfraHost(
+        run_shell_command_results=[
+            (True, _make_command_output("")),
+            (True, _make_command_output("plain output\n")),
+            (True, _make_command_output("more plain output\n")),
+        ]
+    )
+    host = _create_host_with_compression_enabled(local_provider, fake)
+
+    first = host.execute_bulk_read_command("cat /remote/events.jsonl")
+    second = host.execute_bulk_read_command("cat /remote/events.jsonl")
+
+    assert (first.stdout, second.stdout) == ("plain output", "more plain output")
+    assert fake._run_shell_command_call_count == 3
+
+
+def test_execute_bulk_read_command_is_plain_when_compression_is_disabled(
+    local_provider: LocalProviderInstance,
+) -> None:
+    fake = _FakePyinfraHost(run_shell_command_results=[(True, _make_command_output("plain output\n"))])
+    host = _create_host_with_fake_connector(local_provider, fake)
+
+    assert host.execute_bulk_read_command("cat /remote/events.jsonl").stdout == "plain output"
+    assert fake._run_shell_command_call_count == 1
+
+
 @pytest.mark.parametrize(
     ("exception", "expected"),
     [
@@ -31,6 +31,8 @@ from imbue.mngr.errors import LockNotHeldError
 from imbue.mngr.errors import MngrError
 from imbue.mngr.hosts.common import is_macos
 from imbue.mngr.hosts.host import Host
+from imbue.mngr.hosts.host import build_batched_file_read_command
+from imbue.mngr.hosts.host import parse_batched_file_read_output
 from imbue.mngr.hosts.tmux import capture_tmux_pane_content
 from imbue.mngr.interfaces.agent import AgentInterface
 from imbue.mngr.interfaces.data_types import ActivityConfig
@@ -240,6 +242,44 @@ def test_read_text_file_with_unicode(host_with_temp_dir: tuple[Host, Path]) -> N
     assert "Hello World" in content
 
 
+def test_read_text_files_returns_none_for_missing_files(host_with_temp_dir: tuple[Host, Path]) -> None:
+    host, temp_dir = host_with_temp_dir
+    (temp_dir / "present.txt").write_text("here")
+
+    content_by_path = host.read_text_files([temp_dir / "present.txt", temp_dir / "missing.txt"])
+
+    assert content_by_path == {temp_dir / "present.txt": "here", temp_dir / "missing.txt": None}
+
+
+def test_batched_file_read_command_round_trips_contents(host_with_temp_dir: tuple[Host, Path]) -> None:
+    """The single-command read used for remote hosts preserves contents, including newlines and empty files."""
+    host, temp_dir = host_with_temp_dir
+    (temp_dir / "multi line.txt").write_text("first\nsecond\n")
+    (temp_dir / "empty.txt").write_text("")
+    paths = [temp_dir / "multi line.txt", temp_dir / "missing.txt", temp_dir / "empty.txt"]
+
+    result = host.execute_idempotent_command(build_batched_file_read_command(paths))
+
+    assert result.success
+    assert parse_batched_file_read_output(result.stdout, paths, "utf-8") == {
+        paths[0]: "first\nsecond\n",
+        paths[1]: None,
+        paths[2]: "",
+    }
+
+
+@pytest.mark.parametrize(
+    "stdout",
+    [
+        pytest.param("MNGR_FILE_FOUND\nnot*base64\n", id="invalid_base64"),
+        pytest.param("MNGR_FILE_FOUND\n//79\n", id="invalid_utf8"),
+    ],
+)
+def test_parse_batched_file_read_output_raises_mngr_error_for_undecodable_contents(stdout: str) -> None:
+    with pytest.raises(MngrError, match="Failed to decode"):
+        parse_batched_file_read_output(stdout, [Path("/file.txt")], "utf-8")
+
+
 # =============================================================================
 # Write Text File Tests
 # =============================================================================
@@ -1652,6 +1692,12 @@ def test_get_ssh_connection_info_returns_none_for_local_host(host_with_temp_dir:
     assert ssh_info is None
 
 
+def test_get_tmux_pane_watcher_returns_none_for_local_host(host_with_temp_dir: tuple[Host, Path]) -> None:
+    """Local hosts poll capture-pane directly rather than streaming pane output."""
+    host, _ = host_with_temp_dir
+    assert host.get_tmux_pane_watcher("mngr-some-session") is None
+
+
 def test_create_work_dir_same_path_no_transfer(host_with_temp_dir: tuple[Host, Path]) -> None:
     """Test that no transfer happens when source and target are the same."""
     host, temp_dir = host_with_temp_dir
@@ -0,0 +1,309 @@
+import shlex
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+from typing import Callable
+from typing import Final
+from uuid import uuid4
+
+from loguru import logger
+from paramiko import Channel
+from paramiko import ChannelFile
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import PrivateAttr
+
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.mutable_model import MutableModel
+from imbue.imbue_common.pure import pure
+from imbue.mngr.errors import TmuxControlModeError
+from imbue.mngr.interfaces.host import TmuxPaneWatcherInterface
+
+# Maximum time to wait for tmux to answer a single command sent over the control channel
+_CONTROL_COMMAND_TIMEOUT_SECONDS: Final[float] = 10.0
+
+# tmux sets this flag on %begin/%end/%error guard lines for commands sent by the
+# control client itself (as opposed to the command that created the session)
+_CLIENT_COMMAND_FLAG: Final[int] = 1
+
+# Prefix for the helper sessions that control-mode clients attach to. Deliberately
+# does not start with the agent session prefix so it is never mistaken for an agent.
+_WATCH_SESSION_PREFIX: Final[str] = "mngr_pane_watch_"
+
+
+class TmuxControlBlockMarker(FrozenModel):
+    """A parsed %begin, %end or %error guard line from a tmux control-mode stream."""
+
+    kind: str = Field(description="The guard keyword without the leading '%' (begin, end or error)")
+    command_number: int = Field(description="The tmux command number shared by a block's guard lines")
+    flags: int = Field(description="The guard flags (1 when the command came from this client)")
+
+
+def build_tmux_control_attach_command(session_name: str) -> str:
+    """Build the shell command that starts a control-mode client watching a session.
+
+    The client attaches to a new helper session grouped with the agent session
+    rather than to the agent session itself, so that the agent session's
+    client-attached hooks (e.g. the onboarding popup) are not triggered and its
+    attached-client list is unaffected. The helper session shares the agent
+    session's windows (so their output is streamed) and destroys itself once the
+    control client goes away.
+    """
+    watch_session_name = f"{_WATCH_SESSION_PREFIX}{uuid4().hex}"
+    return (
+        f"tmux -C new-session -t {shlex.quote(session_name)} -s {shlex.quote(watch_session_name)}"
+        " \\; set-option destroy-unattached on"
+    )
+
+
+@pure
+def parse_tmux_control_block_marker(line: str) -> TmuxControlBlockMarker | None:
+    """Parse a %begin/%end/%error guard line, returning None for any other line."""
+    parts = line.split(" ")
+    if len(parts) != 4 or parts[0] not in ("%begin", "%end", "%error"):
+        return None
+    if not parts[2].isdigit() or not parts[3].isdigit():
+        return None
+    return TmuxControlBlockMarker(kind=parts[0][1:], command_number=int(parts[2]), flags=int(parts[3]))
+
+
+@pure
+def parse_tmux_control_output_pane_id(line: str) -> str | None:
+    """Return the pane id (e.g. '%3') of a %output notification, or None for any other line."""
+    if not line.startswith("%output "):
+        return None
+    parts = line.split(" ", 2)
+    if len(parts) < 2 or not parts[1].startswith("%"):
+        return None
+    return parts[1]
+
+
+class TmuxControlChannel(MutableModel, ABC):
+    """A bidirectional byte stream connected to a running ``tmux -C`` client."""
+
+    @abstractmethod
+    def readline(self) -> bytes:
+        """Read one line (including its newline), returning b'' once the stream has ended."""
+        ...
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """Write data to the control client's stdin."""
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the stream, which makes the control client exit."""
+        ...
+
+
+class ParamikoTmuxControlChannel(TmuxControlChannel):
+    """Control channel running ``tmux -C`` over an SSH exec channel on an existing transport."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    channel: Channel = Field(frozen=True, description="The paramiko channel the control client was exec'd on")
+    _reader: ChannelFile | None = PrivateAttr(default=None)
+
+    def readline(self) -> bytes:
+        if self._reader is None:
+            self._reader = self.channel.makefile("rb")
+        return self._reader.readline()
+
+    def write(self, data: bytes) -> None:
+        self.channel.sendall(data)
+
+    def close(self) -> None:
+        self.channel.close()
+
+
+class TmuxControlClient(TmuxPaneWatcherInterface):
+    """Pane watcher backed by a single tmux control-mode client.
+
+    A background thread reads the control stream. %output notifications bump a
+    per-pane generation counter that waiters block on, and command responses are
+    handed back to the (single) in-flight command. Pane captures are issued as
+    control-mode commands, so waiting for a pane costs no extra process or SSH
+    exec per check.
+
+    Use start() to create an instance.
+    """
+
+    channel: TmuxControlChannel = Field(frozen=True, description="Stream connected to the tmux control client")
+
+    _condition: threading.Condition = PrivateAttr(default_factory=threading.Condition)
+    _command_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _is_closed: bool = PrivateAttr(default=False)
+    _is_awaiting_response: bool = PrivateAttr(default=False)
+    _response_lines: list[str] | None = PrivateAttr(default=None)
+    _response_error: str | None = PrivateAttr(default=None)
+    _output_generation_by_pane_id: dict[str, int] = PrivateAttr(default_factory=dict)
+    _pane_id_by_target: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def start(cls, channel: TmuxControlChannel) -> "TmuxControlClient":
+        """Start reading from the channel and confirm the control client is responsive.
+
+        Raises TmuxControlModeError (after closing the channel) if tmux does not
+        answer, e.g. because the session does not exist or tmux is too old.
+        """
+        client = cls(channel=channel)
+        reader_thread = threading.Thread(target=client._read_stream, name="tmux-control-reader", daemon=True)
+        reader_thread.start()
+        try:
+            client.run_command("display-message -p ready")
+        except TmuxControlModeError:
+            client.close()
+            raise
+        return client
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the control connection has ended (it cannot be reopened)."""
+        return self._is_closed
+
+    def run_command(self, command: str) -> list[str]:
+        """Run a tmux command over the control channel and return its output lines."""
+        with self._command_lock:
+            with self._condition:
+                self._raise_if_closed()
+                self._is_awaiting_response = True
+                self._response_lines = None
+                self._response_error = None
+            try:
+                self.channel.write(command.encode() + b"\n")
+            except OSError as e:
+                self.close()
+                raise TmuxControlModeError(f"Failed to write to tmux control-mode connection: {e}") from e
+            with self._condition:
+                is_answered = self._condition.wait_for(
+                    lambda: self._response_lines is not None or self._is_closed,
+                    timeout=_CONTROL_COMMAND_TIMEOUT_SECONDS,
+                )
+                self._is_awaiting_response = False
+                response_lines = self._response_lines
+                response_error = self._response_error
+        if not is_answered:
+            # A late answer would be mistaken for the next command's, so the client is unusable
+            self.close()
+            raise TmuxControlModeError(f"Timed out waiting for tmux control-mode response to: {command}")
+        if response_lines is None:
+            raise TmuxControlModeError(f"tmux control-mode connection closed while running: {command}")
+        if response_error is not None:
+            raise TmuxControlModeError(f"tmux command failed: {command}: {response_error}")
+        return response_lines
+
+    def capture_pane_content(self, tmux_target: str) -> str:
+        """Capture the visible content of a pane."""
+        return "\n".join(self.run_command(f"capture-pane -p -t {shlex.quote(tmux_target)}")).rstrip()
+
+    def wait_for_pane_content(
+        self,
+        tmux_target: str,
+        condition: Callable[[str], bool],
+        timeout_seconds: float,
+    ) -> bool:
+        deadline = time.monotonic() + timeout_seconds
+        pane_id = self._resolve_pane_id(tmux_target)
+        # Read the generation before capturing so that output arriving while the
+        # capture is in flight still triggers another check
+        seen_generation = self._get_output_generation(pane_id)
+        while not condition(self.capture_pane_content(tmux_target)):
+            new_generation = self._wait_for_pane_output(
+                pane_id, seen_generation, timeout_seconds=max(deadline - time.monotonic(), 0.0)
+            )
+            if new_generation is None:
+                return False
+            seen_generation = new_generation
+        return True
+
+    def close(self) -> None:
+        with self._condition:
+            if self._is_closed:
+                return
+            self._is_closed = True
+            self._condition.notify_all()
+        self.channel.close()
+
+    def _resolve_pane_id(self, tmux_target: str) -> str:
+        pane_id = self._pane_id_by_target.get(tmux_target)
+        if pane_id is None:
+            output_lines = self.run_command(f"display-message -p -t {shlex.quote(tmux_target)} '#{{pane_id}}'")
+            if len(output_lines) != 1:
+                raise TmuxControlModeError(f"Could not resolve tmux pane id for {tmux_target}: {output_lines}")
+            pane_id = output_lines[0].strip()
+            self._pane_id_by_target[tmux_target] = pane_id
+        return pane_id
+
+    def _wait_for_pane_output(self, pane_id: str, seen_generation: int, timeout_seconds: float) -> int | None:
+        """Block until the pane produces output after seen_generation, returning the new generation or None on timeout."""
+        with self._condition:
+            has_new_output = self._condition.wait_for(
+                lambda: self._is_closed or self._output_generation_by_pane_id.get(pane_id, 0) != seen_generation,
+                timeout=timeout_seconds,
+            )
+            self._raise_if_closed()
+            if not has_new_output:
+                return None
+            return self._output_generation_by_pane_id.get(pane_id, 0)
+
+    def _get_output_generation(self, pane_id: str) -> int:
+        with self._condition:
+            return self._output_generation_by_pane_id.get(pane_id, 0)
+
+    def _raise_if_closed(self) -> None:
+        if self._is_closed:
+            raise TmuxControlModeError("tmux control-mode connection is closed")
+
+    def _read_stream(self) -> None:
+        """Dispatch control-mode lines until the stream ends."""
+        block_marker: TmuxControlBlockMarker | None = None
+        block_lines: list[str] = []
+        try:
+            for raw_line in iter(self.channel.readline, b""):
+                line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+                if block_marker is not None:
+                    end_marker = parse_tmux_control_block_marker(line)
+                    if (
+                        end_marker is not None
+                        and end_marker.kind != "begin"
+                        and end_marker.command_number == block_marker.command_number
+                    ):
+                        if block_marker.flags == _CLIENT_COMMAND_FLAG:
+                            self._deliver_response(block_lines, is_error=end_marker.kind == "error")
+                        block_marker = None
+                        block_lines = []
+                    else:
+                        block_lines.append(line)
+                    continue
+                begin_marker = parse_tmux_control_block_marker(line)
+                if begin_marker is not None and begin_marker.kind == "begin":
+                    block_marker = begin_marker
+                    continue
+                pane_id = parse_tmux_control_output_pane_id(line)
+                if pane_id is not None:
+                    with self._condition:
+                        self._output_generation_by_pane_id[pane_id] = (
+                            self._output_generation_by_pane_id.get(pane_id, 0) + 1
+                        )
+                        self._condition.notify_all()
+                elif line.startswith("%exit"):
+                    break
+                else:
+                    pass
+        except OSError as e:
+            logger.debug("tmux control-mode stream failed: {}", e)
+        finally:
+            with self._condition:
+                self._is_closed = True
+                self._condition.notify_all()
+
+    def _deliver_response(self, lines: list[str], is_error: bool) -> None:
+        with self._condition:
+            if not self._is_awaiting_response:
+                logger.trace("Ignoring unexpected tmux control-mode response: {}", lines)
+                return
+            self._response_lines = lines
+            self._response_error = "\n".join(lines) if is_error else None
+            self._condition.notify_all()
@@ -0,0 +1,258 @@
+import queue
+import subprocess
+
+import pytest
+from pydantic import PrivateAttr
+
+from imbue.mngr.errors import TmuxControlModeError
+from imbue.mngr.hosts.tmux_control import TmuxControlBlockMarker
+from imbue.mngr.hosts.tmux_control import TmuxControlChannel
+from imbue.mngr.hosts.tmux_control import TmuxControlClient
+from imbue.mngr.hosts.tmux_control import build_tmux_control_attach_command
+from imbue.mngr.hosts.tmux_control import parse_tmux_control_block_marker
+from imbue.mngr.hosts.tmux_control import parse_tmux_control_output_pane_id
+from imbue.mngr.utils.polling import wait_for
+from imbue.mngr.utils.testing import cleanup_tmux_session
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+
+def test_parse_tmux_control_block_marker_parses_guard_lines() -> None:
+    assert parse_tmux_control_block_marker("%begin 1792360135 274 1") == TmuxControlBlockMarker(
+        kind="begin", command_number=274, flags=1
+    )
+    assert parse_tmux_control_block_marker("%end 1792360135 274 1") == TmuxControlBlockMarker(
+        kind="end", command_number=274, flags=1
+    )
+    assert parse_tmux_control_block_marker("%error 1792360135 12 0") == TmuxControlBlockMarker(
+        kind="error", command_number=12, flags=0
+    )
+
+
+def test_parse_tmux_control_block_marker_ignores_other_lines() -> None:
+    assert parse_tmux_control_block_marker("%output %0 hello") is None
+    assert parse_tmux_control_block_marker("%end of the world") is None
+    assert parse_tmux_control_block_marker("") is None
+
+
+def test_parse_tmux_control_output_pane_id() -> None:
+    assert parse_tmux_control_output_pane_id("%output %3 echo hi\\015\\012") == "%3"
+    assert parse_tmux_control_output_pane_id("%output %12 ") == "%12"
+    assert parse_tmux_control_output_pane_id("%window-add @0") is None
+    assert parse_tmux_control_output_pane_id("%output garbage") is None
+
+
+def test_build_tmux_control_attach_command_uses_a_separate_self_destroying_session() -> None:
+    command = build_tmux_control_attach_command("mngr-agent")
+
+    assert command.startswith("tmux -C new-session -t mngr-agent -s mngr_pane_watch_")
+    assert "destroy-unattached on" in command
+    # Each watcher gets its own helper session
+    assert build_tmux_control_attach_command("mngr-agent") != command
+
+
+# =============================================================================
+# Client protocol handling (scripted channel)
+# =============================================================================
+
+
+class _ScriptedTmuxControlChannel(TmuxControlChannel):
+    """Channel that answers each command with canned output, like a tmux control client."""
+
+    responses_by_command: dict[str, list[str]]
+    _lines: queue.Queue[bytes] = PrivateAttr(default_factory=queue.Queue)
+    _command_number: int = PrivateAttr(default=100)
+    _written_commands: list[str] = PrivateAttr(default_factory=list)
+
+    def readline(self) -> bytes:
+        return self._lines.get()
+
+    def write(self, data: bytes) -> None:
+        command = data.decode().rstrip("\n")
+        self._written_commands.append(command)
+        self._command_number += 1
+        output_lines = self.responses_by_command.get(command)
+        if output_lines is None:
+            self.push(f"%begin 1 {self._command_number} 1", "unknown command", f"%error 1 {self._command_number} 1")
+        else:
+            self.push(f"%begin 1 {self._command_number} 1", *output_lines, f"%end 1 {self._command_number} 1")
+
+    def close(self) -> None:
+        self._lines.put(b"")
+
+    def push(self, *lines: str) -> None:
+        for line in lines:
+            self._lines.put(line.encode() + b"\n")
+
+    @property
+    def written_commands(self) -> list[str]:
+        return self._written_commands
+
+
+def _make_scripted_client(
+    responses_by_command: dict[str, list[str]],
+) -> tuple[TmuxControlClient, _ScriptedTmuxControlChannel]:
+    channel = _ScriptedTmuxControlChannel(
+        responses_by_command={"display-message -p ready": ["ready"], **responses_by_command}
+    )
+    # Initial block for the command that created the session (flags 0) must be ignored
+    channel.push("%begin 1 1 0", "%end 1 1 0", "%session-changed $1 watch")
+    return TmuxControlClient.start(channel), channel
+
+
+def test_client_run_command_returns_block_lines_and_ignores_notifications() -> None:
+    client, channel = _make_scripted_client({"list-windows": ["0: bash", "%not-a-guard line"]})
+    try:
+        channel.push("%window-add @1", "%output %0 noise")
+        assert client.run_command("list-windows") == ["0: bash", "%not-a-guard line"]
+    finally:
+        client.close()
+
+
+def test_client_run_command_raises_on_error_block() -> None:
+    client, _ = _make_scripted_client({})
+    try:
+        with pytest.raises(TmuxControlModeError, match="unknown command"):
+            client.run_command("bogus")
+    finally:
+        client.close()
+
+
+def test_client_start_fails_when_stream_ends() -> None:
+    channel = _ScriptedTmuxControlChannel(responses_by_command={})
+    channel.push("%begin 1 1 0", "can't find session: missing", "%error 1 1 0", "%exit")
+
+    with pytest.raises(TmuxControlModeError):
+        TmuxControlClient.start(channel)
+
+
+def test_wait_for_pane_content_returns_immediately_when_condition_already_holds() -> None:
+    client, channel = _make_scripted_client(
+        {
+            "display-message -p -t agent:0 '#{pane_id}'": ["%0"],
+            "capture-pane -p -t agent:0": ["ready >", "", ""],
+        }
+    )
+    try:
+        assert client.wait_for_pane_content("agent:0", lambda content: content == "ready >", timeout_seconds=1.0)
+        assert channel.written_commands.count("capture-pane -p -t agent:0") == 1
+    finally:
+        client.close()
+
+
+def test_wait_for_pane_content_recaptures_only_after_output_from_the_pane() -> None:
+    capture_command = "capture-pane -p -t agent:0"
+    client, channel = _make_scripted_client(
+        {"display-message -p -t agent:0 '#{pane_id}'": ["%0"], capture_command: ["loading"]}
+    )
+    captured_contents: list[str] = []
+
+    def condition(content: str) -> bool:
+        captured_contents.append(content)
+        if len(captured_contents) == 1:
+            channel.responses_by_command[capture_command] = ["ready >"]
+            channel.push("%output %0 ready")
+        return content == "ready >"
+
+    try:
+        assert client.wait_for_pane_content("agent:0", condition, timeout_seconds=5.0)
+        assert captured_contents == ["loading", "ready >"]
+    finally:
+        client.close()
+
+
+def test_wait_for_pane_content_times_out_without_output_from_the_pane() -> None:
+    client, channel = _make_scripted_client(
+        {"display-message -p -t agent:0 '#{pane_id}'": ["%0"], "capture-pane -p -t agent:0": ["loading"]}
+    )
+
+    def condition(content: str) -> bool:
+        # Output from another pane in the session must not trigger a re-capture
+        channel.push("%output %1 elsewhere")
+        return "ready" in content
+
+    try:
+        assert not client.wait_for_pane_content("agent:0", condition, timeout_seconds=0.3)
+        assert channel.written_commands.count("capture-pane -p -t agent:0") == 1
+    finally:
+        client.close()
+
+
+def test_wait_for_pane_content_raises_when_stream_is_lost() -> None:
+    client, channel = _make_scripted_client(
+        {"display-message -p -t agent:0 '#{pane_id}'": ["%0"], "capture-pane -p -t agent:0": ["loading"]}
+    )
+
+    def condition(content: str) -> bool:
+        channel.push("%exit")
+        return False
+
+    with pytest.raises(TmuxControlModeError):
+        client.wait_for_pane_content("agent:0", condition, timeout_seconds=5.0)
+    assert client.is_closed
+
+
+# =============================================================================
+# Against a real tmux server
+# =============================================================================
+
+
+class _LocalProcessTmuxControlChannel(TmuxControlChannel):
+    """Runs the control client as a local process (real hosts use an SSH channel)."""
+
+    command: str
+    _process: subprocess.Popen[bytes] | None = PrivateAttr(default=None)
+
+    def start(self) -> None:
+        self._process = subprocess.Popen(
+            ["sh", "-c", self.command], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+
+    def readline(self) -> bytes:
+        assert self._process is not None and self._process.stdout is not None
+        return self._process.stdout.readline()
+
+    def write(self, data: bytes) -> None:
+        assert self._process is not None and self._process.stdin is not None
+        self._process.stdin.write(data)
+        self._process.stdin.flush()
+
+    def close(self) -> None:
+        assert self._process is not None and self._process.stdin is not None
+        self._process.stdin.close()
+        self._process.wait(timeout=5)
+
+
+def _list_tmux_session_names() -> list[str]:
+    result = subprocess.run(["tmux", "list-sessions", "-F", "#{session_name}"], capture_output=True, text=True)
+    return result.stdout.split()
+
+
+@pytest.mark.tmux
+def test_client_streams_real_pane_output_without_attaching_to_the_session(mngr_test_prefix: str) -> None:
+    session_name = f"{mngr_test_prefix}control"
+    subprocess.run(["tmux", "new-session", "-d", "-s", session_name, "cat"], check=True)
+    try:
+        channel = _LocalProcessTmuxControlChannel(command=build_tmux_control_attach_command(session_name))
+        channel.start()
+        client = TmuxControlClient.start(channel)
+        try:
+            subprocess.run(["tmux", "send-keys", "-t", f"{session_name}:0", "-l", "hello control"], check=True)
+            assert client.wait_for_pane_content(
+                f"{session_name}:0", lambda content: "hello control" in content, timeout_seconds=10.0
+            )
+            clients = subprocess.run(
+                ["tmux", "list-clients", "-t", session_name], capture_output=True, text=True, check=True
+            )
+            assert clients.stdout.strip() == ""
+        finally:
+            client.close()
+        # The helper session goes away with its control client
+        wait_for(
+            lambda: _list_tmux_session_names() == [session_name],
+            error_message="Expected the helper session to be destroyed when the control client exits",
+        )
+    finally:
+        cleanup_tmux_session(session_name)
@@ -278,6 +278,17 @@ class AgentInterface(MutableModel, ABC, Generic[AgentConfigT]):
     # Computed Properties
     # =========================================================================
 
+    @property
+    @abstractmethod
+    def session_name(self) -> str:
+        """Return the name of the tmux session the agent runs in."""
+        ...
+
+    @abstractmethod
+    def get_agent_dir(self) -> Path:
+        """Return the agent's state directory on its host."""
+        ...
+
     @property
     @abstractmethod
     def runtime_seconds(self) -> float | None:
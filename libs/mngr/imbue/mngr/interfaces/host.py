@@ -6,6 +6,7 @@ from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from typing import Callable
 from typing import Final
 from typing import Iterator
 from typing import Mapping
@@ -165,6 +166,32 @@ class HostInterface(MutableModel, ABC):
         ...
 
 
+class TmuxPaneWatcherInterface(MutableModel, ABC):
+    """Interface for a long-lived subscription to the output of the panes in a tmux session.
+
+    Lets callers wait for a pane to reach some state without re-capturing it on a
+    fixed interval: the pane is only re-captured after it has produced output.
+    """
+
+    @abstractmethod
+    def wait_for_pane_content(
+        self,
+        tmux_target: str,
+        condition: Callable[[str], bool],
+        timeout_seconds: float,
+    ) -> bool:
+        """Wait until the captured pane content satisfies condition, returning False on timeout.
+
+        Raises TmuxControlModeError if the subscription is lost while waiting.
+        """
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop the subscription and release its connection."""
+        ...
+
+
 class OnlineHostInterface(HostInterface, ABC):
     """Interface for hosts that are currently online and accessible for operations."""
 
@@ -186,6 +213,18 @@ class OnlineHostInterface(HostInterface, ABC):
         """Execute an idempotent shell command on this host and return the result."""
         ...
 
+    @abstractmethod
+    def execute_bulk_read_command(
+        self,
+        command: str,
+        user: str | None = None,
+        cwd: Path | None = None,
+        env: Mapping[str, str] | None = None,
+        timeout_seconds: float | None = None,
+    ) -> CommandResult:
+        """Execute an idempotent shell command with a large (typically text) output, which may be compressed in transit."""
+        ...
+
     @abstractmethod
     def execute_stateful_command(
         self,
@@ -226,6 +265,15 @@ class OnlineHostInterface(HostInterface, ABC):
         """Read a file and return its contents as a string."""
         ...
 
+    @abstractmethod
+    def read_text_files(
+        self,
+        paths: Sequence[Path],
+        encoding: str = "utf-8",
+    ) -> dict[Path, str | None]:
+        """Read several small files in a single round trip, returning None for files that do not exist."""
+        ...
+
     @abstractmethod
     def write_text_file(
         self,
@@ -504,6 +552,42 @@ class OnlineHostInterface(HostInterface, ABC):
         """
         ...
 
+    @abstractmethod
+    def get_tmux_pane_watcher(self, session_name: str) -> TmuxPaneWatcherInterface | None:
+        """Return a shared watcher that streams pane output for the given tmux session.
+
+        Returns None when pane output cannot be streamed from this host, in which
+        case callers should fall back to capturing the pane periodically.
+        """
+        ...
+
+
+class AgentStateFileFieldGenerator(FrozenModel):
+    """A listing field generator whose value depends only on files in the agent's state directory.
+
+    Declaring the files up front lets listing read them for every agent on a host
+    in one batched read (instead of a round trip per file per agent) and hand the
+    contents to compute. Calling the generator with (agent, host) reads the files
+    itself, so it can be used anywhere a plain field generator is expected.
+    """
+
+    file_names: tuple[str, ...] = Field(
+        description="Names of the files in the agent's state directory (host_dir/agents/<agent_id>) that compute reads",
+    )
+    compute: Callable[[Mapping[str, str | None]], Any] = Field(
+        description="Computes the field value (or None to omit it) from the file contents by name (None if missing)",
+    )
+
+    def get_file_paths(self, host_dir: Path, agent_id: AgentId) -> dict[str, Path]:
+        """Return the path of each declared file for the given agent, keyed by file name."""
+        agent_dir = host_dir / "agents" / str(agent_id)
+        return {file_name: agent_dir / file_name for file_name in self.file_names}
+
+    def __call__(self, agent: AgentInterface, host: OnlineHostInterface) -> Any:
+        path_by_file_name = self.get_file_paths(host.host_dir, agent.id)
+        content_by_path = host.read_text_files(list(path_by_file_name.values()))
+        return self.compute({file_name: content_by_path[path] for file_name, path in path_by_file_name.items()})
+
 
 class CreateWorkDirResult(FrozenModel):
     """Result of creating an agent work directory."""
@@ -28,6 +28,7 @@ from imbue.mngr.interfaces.data_types import HostLifecycleOptions
 from imbue.mngr.interfaces.data_types import HostResources
 from imbue.mngr.interfaces.data_types import SnapshotInfo
 from imbue.mngr.interfaces.data_types import VolumeInfo
+from imbue.mngr.interfaces.host import AgentStateFileFieldGenerator
 from imbue.mngr.interfaces.host import HostInterface
 from imbue.mngr.interfaces.host import OnlineHostInterface
 from imbue.mngr.interfaces.volume import HostVolume
@@ -140,8 +141,13 @@ def _build_agent_details_from_online_agent(
     host: OnlineHostInterface,
     ssh_activity: datetime | None,
     field_generators: Mapping[str, Mapping[str, Callable[[AgentInterface, OnlineHostInterface], Any]]],
+    prefetched_content_by_path: Mapping[Path, str | None],
 ) -> AgentDetails:
-    """Build AgentDetails from a live agent on an online host."""
+    """Build AgentDetails from a live agent on an online host.
+
+    prefetched_content_by_path holds the files declared by AgentStateFileFieldGenerators,
+    already read for all agents on the host (see prefetch_agent_state_files).
+    """
     # Get activity config from host
     activity_config = host.get_activity_config()
 
@@ -164,7 +170,16 @@ def _build_agent_details_from_online_agent(
     for plugin_name, generators in field_generators.items():
         plugin_fields: dict[str, Any] = {}
         for field_name, generator in generators.items():
-            value = generator(agent, host)
+            if isinstance(generator, AgentStateFileFieldGenerator):
+                path_by_file_name = generator.get_file_paths(host.host_dir, agent.id)
+                if all(path in prefetched_content_by_path for path in path_by_file_name.values()):
+                    value = generator.compute(
+                        {file_name: prefetched_content_by_path[path] for file_name, path in path_by_file_name.items()}
+                    )
+                else:
+                    value = generator(agent, host)
+            else:
+                value = generator(agent, host)
             if value is not None:
                 plugin_fields[field_name] = value
         if plugin_fields:
@@ -195,6 +210,69 @@ def _build_agent_details_from_online_agent(
     )
 
 
+def get_agent_state_file_names(
+    field_generators: Mapping[str, Mapping[str, Callable[[AgentInterface, OnlineHostInterface], Any]]],
+) -> tuple[str, ...]:
+    """Return the agent state files declared by all AgentStateFileFieldGenerators, without duplicates."""
+    file_names: dict[str, None] = {}
+    for generators in field_generators.values():
+        for generator in generators.values():
+            if isinstance(generator, AgentStateFileFieldGenerator):
+                file_names.update(dict.fromkeys(generator.file_names))
+    return tuple(file_names)
+
+
+def compute_plugin_data_from_agent_state_files(
+    field_generators: Mapping[str, Mapping[str, Callable[[AgentInterface, OnlineHostInterface], Any]]],
+    content_by_file_name: Mapping[str, str | None],
+) -> dict[str, Any]:
+    """Compute plugin fields from already-fetched agent state files.
+
+    Only AgentStateFileFieldGenerators can be evaluated this way; other generators
+    need a live agent and host and are skipped. Files missing from
+    content_by_file_name are treated as not existing.
+    """
+    plugin_data: dict[str, Any] = {}
+    for plugin_name, generators in field_generators.items():
+        plugin_fields: dict[str, Any] = {}
+        for field_name, generator in generators.items():
+            if not isinstance(generator, AgentStateFileFieldGenerator):
+                continue
+            value = generator.compute(
+                {file_name: content_by_file_name.get(file_name) for file_name in generator.file_names}
+            )
+            if value is not None:
+                plugin_fields[field_name] = value
+        if plugin_fields:
+            plugin_data[plugin_name] = plugin_fields
+    return plugin_data
+
+
+def prefetch_agent_state_files(
+    host: OnlineHostInterface,
+    agent_ids: Sequence[AgentId],
+    field_generators: Mapping[str, Mapping[str, Callable[[AgentInterface, OnlineHostInterface], Any]]],
+) -> dict[Path, str | None]:
+    """Read the state files declared by AgentStateFileFieldGenerators for all given agents in one batch.
+
+    Returns an empty mapping if the batched read fails for any reason other than a
+    lost connection, in which case each generator reads its own files instead.
+    """
+    file_names = get_agent_state_file_names(field_generators)
+    if not file_names or not agent_ids:
+        return {}
+    paths = [
+        host.host_dir / "agents" / str(agent_id) / file_name for agent_id in agent_ids for file_name in file_names
+    ]
+    try:
+        return host.read_text_files(paths)
+    except HostConnectionError:
+        raise
+    except MngrError as e:
+        logger.debug("Failed to prefetch agent state files on host {}, reading them per agent: {}", host.id, e)
+        return {}
+
+
 def _build_agent_details_from_offline_ref(
     agent_ref: DiscoveredAgent,
     host_details: HostDetails,
@@ -349,6 +427,30 @@ class ProviderInstanceInterface(MutableModel, ABC):
         """
         ...
 
+    @abstractmethod
+    def get_discovery_cache_ttl_seconds(self) -> float:
+        """
+        Returns the number of seconds that this provider's discovery results may be served from the
+        on-disk discovery cache. Zero means the results are not cached.
+        """
+        ...
+
+    @abstractmethod
+    def get_warm_pool_size(self) -> int:
+        """
+        Returns the number of idle, pre-provisioned hosts to keep ready for each host template used with this
+        provider. Zero means the provider has no warm pool.
+        """
+        ...
+
+    @abstractmethod
+    def get_warm_pool_max_idle_seconds(self) -> float:
+        """
+        Returns the number of seconds that a pre-provisioned host may stay unclaimed in the warm pool.
+        After this it is destroyed and replaced.
+        """
+        ...
+
     # =========================================================================
     # Discovery Methods
     # =========================================================================
@@ -439,6 +541,12 @@ class ProviderInstanceInterface(MutableModel, ABC):
 
             # Build AgentDetails for each agent on this host
             resolved_field_generators = field_generators or {}
+            prefetched_content_by_path: dict[Path, str | None] = {}
+            if agents is not None and isinstance(host, OnlineHostInterface):
+                listed_agent_ids = {agent_ref.agent_id for agent_ref in agent_refs}
+                prefetched_content_by_path = prefetch_agent_state_files(
+                    host, [a.id for a in agents if a.id in listed_agent_ids], resolved_field_generators
+                )
             agent_details_list: list[AgentDetails] = []
             for agent_ref in agent_refs:
                 try:
@@ -448,7 +556,12 @@ class ProviderInstanceInterface(MutableModel, ABC):
                         agent = next((a for a in agents if a.id == agent_ref.agent_id), None)
                         if agent is not None:
                             agent_details = _build_agent_details_from_online_agent(
-                                agent, host_details, host, ssh_activity, resolved_field_generators
+                                agent,
+                                host_details,
+                                host,
+                                ssh_activity,
+                                resolved_field_generators,
+                                prefetched_content_by_path,
                             )
                         else:
                             # Agent was discovered but is no longer on the host
@@ -1,5 +1,6 @@
 """Tests for ProviderInstanceInterface.get_host_and_agent_details."""
 
+from collections.abc import Mapping
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
@@ -11,7 +12,10 @@ from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import HostConnectionError
 from imbue.mngr.hosts.offline_host import OfflineHost
 from imbue.mngr.interfaces.data_types import CertifiedHostData
+from imbue.mngr.interfaces.host import AgentStateFileFieldGenerator
 from imbue.mngr.interfaces.host import OnlineHostInterface
+from imbue.mngr.interfaces.provider_instance import compute_plugin_data_from_agent_state_files
+from imbue.mngr.interfaces.provider_instance import get_agent_state_file_names
 from imbue.mngr.primitives import ActivitySource
 from imbue.mngr.primitives import AgentId
 from imbue.mngr.primitives import AgentLifecycleState
@@ -162,3 +166,42 @@ def test_connection_error_during_agent_detail_building_falls_back_to_offline(
     assert len(agent_details_list) == 1
     assert agent_details_list[0].name == "test-agent"
     assert agent_details_list[0].state == AgentLifecycleState.STOPPED
+
+
+def _count_lines(content_by_file_name: Mapping[str, str | None]) -> int | None:
+    content = content_by_file_name["log"]
+    return None if content is None else len(content.splitlines())
+
+
+def _has_marker(content_by_file_name: Mapping[str, str | None]) -> bool:
+    return content_by_file_name["marker"] is not None
+
+
+def test_get_agent_state_file_names_deduplicates_across_plugins() -> None:
+    field_generators = {
+        "plugin_a": {"lines": AgentStateFileFieldGenerator(file_names=("log",), compute=_count_lines)},
+        "plugin_b": {
+            "marked": AgentStateFileFieldGenerator(file_names=("marker", "log"), compute=_has_marker),
+            "plain": lambda agent, host: "x",
+        },
+    }
+
+    assert get_agent_state_file_names(field_generators) == ("log", "marker")
+
+
+def test_compute_plugin_data_from_agent_state_files_skips_plain_generators_and_none_values() -> None:
+    field_generators = {
+        "plugin_a": {"lines": AgentStateFileFieldGenerator(file_names=("log",), compute=_count_lines)},
+        "plugin_b": {
+            "marked": AgentStateFileFieldGenerator(file_names=("marker",), compute=_has_marker),
+            "plain": lambda agent, host: "x",
+        },
+    }
+
+    assert compute_plugin_data_from_agent_state_files(field_generators, {"marker": ""}) == {
+        "plugin_b": {"marked": True}
+    }
+    assert compute_plugin_data_from_agent_state_files(field_generators, {"log": "a\nb\n"}) == {
+        "plugin_a": {"lines": 2},
+        "plugin_b": {"marked": False},
+    }
@@ -1,6 +1,7 @@
 from abc import ABC
 from abc import abstractmethod
 from typing import Mapping
+from typing import Sequence
 
 from pydantic import ConfigDict
 from pydantic import Field
@@ -30,11 +31,31 @@ class Volume(MutableModel, ABC):
         """List file entries in the given directory path on the volume."""
         ...
 
+    @abstractmethod
+    def listdir_recursive(self, path: str) -> list[VolumeFile]:
+        """List all file and directory entries beneath the given path, at any depth.
+
+        Implementations should fetch the whole tree (including real mtimes) in a
+        single round trip where the backing store allows it. Entries are sorted
+        by path, and paths use the same form as listdir.
+        """
+        ...
+
     @abstractmethod
     def read_file(self, path: str) -> bytes:
         """Read a file from the volume and return its contents as bytes."""
         ...
 
+    @abstractmethod
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        """Read several small files (e.g. a directory of records) from the volume.
+
+        Implementations should fetch them in as few round trips as the backing
+        store allows. Returns contents keyed by the given paths; files that do not
+        exist are left out.
+        """
+        ...
+
     @abstractmethod
     def remove_file(self, path: str, *, recursive: bool = False) -> None:
         """Remove a file or directory from the volume.
@@ -73,6 +94,16 @@ class BaseVolume(Volume):
         """Return a ScopedVolume that prepends the given prefix to all operations."""
         return ScopedVolume(delegate=self, prefix=prefix)
 
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        """Read each file in turn. Volumes with per-read latency should override this."""
+        content_by_path: dict[str, bytes] = {}
+        for path in paths:
+            try:
+                content_by_path[path] = self.read_file(path)
+            except FileNotFoundError:
+                continue
+        return content_by_path
+
 
 def _scoped_path(base_prefix: str, path: str) -> str:
     """Prepend a base prefix to the given path."""
@@ -107,9 +138,21 @@ class ScopedVolume(BaseVolume):
             for e in entries
         ]
 
+    def listdir_recursive(self, path: str) -> list[VolumeFile]:
+        entries = self.delegate.listdir_recursive(_scoped_path(self.prefix, path))
+        return [
+            VolumeFile(path=self._strip_prefix(e.path), file_type=e.file_type, mtime=e.mtime, size=e.size)
+            for e in entries
+        ]
+
     def read_file(self, path: str) -> bytes:
         return self.delegate.read_file(_scoped_path(self.prefix, path))
 
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        path_by_scoped_path = {_scoped_path(self.prefix, path): path for path in paths}
+        content_by_scoped_path = self.delegate.read_files(tuple(path_by_scoped_path))
+        return {path_by_scoped_path[scoped_path]: data for scoped_path, data in content_by_scoped_path.items()}
+
     def remove_file(self, path: str, *, recursive: bool = False) -> None:
         self.delegate.remove_file(_scoped_path(self.prefix, path), recursive=recursive)
 
@@ -27,6 +27,14 @@ class InMemoryVolume(BaseVolume):
                 )
         return results
 
+    def listdir_recursive(self, path: str) -> list[VolumeFile]:
+        prefix = path.rstrip("/") + "/"
+        return [
+            VolumeFile(path=file_path, file_type=VolumeFileType.FILE, mtime=0, size=len(self.files[file_path]))
+            for file_path in sorted(self.files)
+            if not path.strip("/") or file_path.startswith(prefix)
+        ]
+
     def read_file(self, path: str) -> bytes:
         if path not in self.files:
             raise FileNotFoundError(path)
@@ -118,6 +126,20 @@ def test_scoped_volume_read_file_strips_leading_slash(volume_with_files: InMemor
     assert scoped.read_file("/data.json") == b'{"key": "value"}'
 
 
+def test_base_volume_read_files_leaves_out_missing_files(volume_with_files: InMemoryVolume) -> None:
+    assert volume_with_files.read_files(["/host/data.json", "/host/missing.json"]) == {
+        "/host/data.json": b'{"key": "value"}'
+    }
+
+
+def test_scoped_volume_read_files_keys_results_by_unscoped_paths(volume_with_files: InMemoryVolume) -> None:
+    scoped = volume_with_files.scoped("/host")
+    assert scoped.read_files(["agents/a1.json", "/agents/a2.json", "agents/a3.json"]) == {
+        "agents/a1.json": b'{"id": "a1"}',
+        "/agents/a2.json": b'{"id": "a2"}',
+    }
+
+
 def test_scoped_volume_write_files(volume_with_files: InMemoryVolume) -> None:
     scoped = volume_with_files.scoped("/host")
     scoped.write_files({"new.txt": b"new content"})
@@ -178,6 +200,19 @@ def test_scoped_volume_listdir_preserves_file_type(volume_with_files: InMemoryVo
         assert entry.file_type == VolumeFileType.FILE
 
 
+def test_scoped_volume_listdir_recursive_strips_prefix_at_every_depth() -> None:
+    vol = InMemoryVolume(
+        files={
+            "/host/agents/a1.json": b"a1",
+            "/host/agents/a1/events/events.jsonl": b"{}",
+            "/other/agents/a2.json": b"a2",
+        }
+    )
+    scoped = vol.scoped("/host")
+    entries = scoped.listdir_recursive("agents")
+    assert [e.path for e in entries] == ["agents/a1.json", "agents/a1/events/events.jsonl"]
+
+
 def test_scoped_volume_chained_scoping(volume_with_files: InMemoryVolume) -> None:
     scoped = volume_with_files.scoped("/host").scoped("agents")
     assert scoped.read_file("a1.json") == b'{"id": "a1"}'
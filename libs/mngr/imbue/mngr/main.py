@@ -45,6 +45,7 @@ from imbue.mngr.cli.snapshot import snapshot
 from imbue.mngr.cli.start import start
 from imbue.mngr.cli.stop import stop
 from imbue.mngr.cli.transcript import transcript
+from imbue.mngr.cli.warm_pool import warm_pool
 from imbue.mngr.config.loader import block_disabled_plugins
 from imbue.mngr.config.pre_readers import read_disabled_plugins
 from imbue.mngr.errors import BaseMngrError
@@ -355,6 +356,9 @@ cli.add_command(archive)
 cli.add_command(clone)
 cli.add_command(migrate)
 
+# Add internal commands that mngr runs itself (hidden from help).
+cli.add_command(warm_pool)
+
 # Register plugin commands after built-in commands but before applying CLI options.
 # This ordering allows plugins to add CLI options to other plugin commands.
 # Wrapped in try/except because this runs at module import time, before Click's
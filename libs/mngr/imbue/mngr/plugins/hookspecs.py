@@ -431,7 +431,10 @@ def agent_field_generators() -> tuple[str, dict[str, Callable[[AgentInterface, O
     Fields are namespaced under plugin.<plugin_name> in AgentDetails.
 
     Return None to contribute nothing. Generators must be thread-safe and fast
-    (they run per-agent in the listing hot path).
+    (they run per-agent in the listing hot path). Generators that only depend on
+    files in the agent's state directory should be AgentStateFileFieldGenerators:
+    listing then reads the declared files for all agents on a host in one batched
+    read and passes their contents in, so the field adds no per-agent round trips.
     """
 
 
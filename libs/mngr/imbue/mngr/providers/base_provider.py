@@ -1,3 +1,4 @@
+from typing import Final
 from typing import Mapping
 from typing import Sequence
 
@@ -14,6 +15,9 @@ from imbue.mngr.primitives import ImageReference
 from imbue.mngr.primitives import SnapshotId
 from imbue.mngr.primitives import SnapshotName
 
+# How long a pre-provisioned host may stay unclaimed in the warm pool when the provider does not say otherwise
+_DEFAULT_WARM_POOL_MAX_IDLE_SECONDS: Final[float] = 60.0 * 60.0
+
 
 class BaseProviderInstance(ProviderInstanceInterface):
     """
@@ -76,3 +80,23 @@ class BaseProviderInstance(ProviderInstanceInterface):
             return provider_config.destroyed_host_persisted_seconds
         # Fall back to the global default
         return self.mngr_ctx.config.default_destroyed_host_persisted_seconds
+
+    def get_discovery_cache_ttl_seconds(self) -> float:
+        # Check for a provider-level override first
+        provider_config = self.mngr_ctx.config.providers.get(self.name)
+        if provider_config is not None and provider_config.discovery_cache_ttl_seconds is not None:
+            return provider_config.discovery_cache_ttl_seconds
+        # Fall back to the global default
+        return self.mngr_ctx.config.default_discovery_cache_ttl_seconds
+
+    def get_warm_pool_size(self) -> int:
+        provider_config = self.mngr_ctx.config.providers.get(self.name)
+        if provider_config is None or provider_config.warm_pool_size is None:
+            return 0
+        return provider_config.warm_pool_size
+
+    def get_warm_pool_max_idle_seconds(self) -> float:
+        provider_config = self.mngr_ctx.config.providers.get(self.name)
+        if provider_config is None or provider_config.warm_pool_max_idle_seconds is None:
+            return _DEFAULT_WARM_POOL_MAX_IDLE_SECONDS
+        return provider_config.warm_pool_max_idle_seconds
@@ -1,5 +1,7 @@
 import json
+from collections.abc import Iterator
 from collections.abc import Mapping
+from contextlib import contextmanager
 from typing import Any
 
 from loguru import logger
@@ -67,6 +69,10 @@ class DockerHostStore(MutableModel):
 
     volume: Volume = Field(frozen=True, description="Volume for storing host state")
     _cache: dict[HostId, HostRecord] = PrivateAttr(default_factory=dict)
+    # Agent record paths found by list_all_host_records, only kept (and reused) within
+    # a reusing_agent_record_listing() block
+    _agent_record_paths_by_host_id: dict[HostId, list[str]] = PrivateAttr(default_factory=dict)
+    _is_reusing_agent_record_listing: bool = PrivateAttr(default=False)
 
     def _host_record_path(self, host_id: HostId) -> str:
         return f"host_state/{host_id}.json"
@@ -106,13 +112,11 @@ class DockerHostStore(MutableModel):
     def delete_host_record(self, host_id: HostId) -> None:
         """Delete a host record and associated agent data from the volume."""
         # Delete agent data files
+        self._agent_record_paths_by_host_id.pop(host_id, None)
         agent_dir = self._agent_data_dir(host_id)
         try:
-            agent_entries = self.volume.listdir(agent_dir)
-            for entry in agent_entries:
-                if entry.file_type != VolumeFileType.DIRECTORY:
-                    self.volume.remove_file(entry.path)
-        except (FileNotFoundError, OSError) as e:
+            self.volume.remove_directory(agent_dir)
+        except (OSError, MngrError) as e:
             logger.trace("No agent data to clean up for {}: {}", host_id, e)
 
         # Delete host record
@@ -127,26 +131,71 @@ class DockerHostStore(MutableModel):
         self._cache.pop(host_id, None)
 
     def list_all_host_records(self) -> list[HostRecord]:
-        """List all host records stored on the volume."""
-        records: list[HostRecord] = []
+        """List all host records stored on the volume.
+
+        A single recursive listing finds every host's agent records as well. Within a
+        reusing_agent_record_listing() block, list_persisted_agent_data_for_host reads
+        the agent records it found instead of listing them again.
+        """
         try:
-            entries = self.volume.listdir("host_state")
-        except (FileNotFoundError, OSError):
+            entries = self.volume.listdir_recursive("host_state")
+        except (FileNotFoundError, OSError, MngrError):
             return []
 
+        host_record_path_by_host_id: dict[HostId, str] = {}
+        agent_record_paths_by_host_id: dict[HostId, list[str]] = {}
         for entry in entries:
             if entry.file_type != VolumeFileType.FILE or not entry.path.endswith(".json"):
                 continue
-            # Extract host_id from filename
-            filename = entry.path.rsplit("/", 1)[-1]
-            host_id_str = filename.removesuffix(".json")
-            host_id = HostId(host_id_str)
-            record = self.read_host_record(host_id, use_cache=False)
-            if record is not None:
-                records.append(record)
+            # Either host_state/<host_id>.json or host_state/<host_id>/<agent_id>.json
+            path_parts = entry.path.strip("/").split("/")
+            if len(path_parts) == 2:
+                host_id = HostId(path_parts[1].removesuffix(".json"))
+                host_record_path_by_host_id[host_id] = entry.path
+                agent_record_paths_by_host_id.setdefault(host_id, [])
+            elif len(path_parts) == 3:
+                agent_record_paths_by_host_id.setdefault(HostId(path_parts[1]), []).append(entry.path)
+            else:
+                logger.trace("Skipped unexpected host state entry: {}", entry.path)
 
+        try:
+            content_by_path = self.volume.read_files(list(host_record_path_by_host_id.values()))
+        except (OSError, MngrError) as e:
+            logger.warning("Failed to read host records: {}", e)
+            return []
+
+        records: list[HostRecord] = []
+        for host_id, path in host_record_path_by_host_id.items():
+            # Records removed between the listing and the read are simply missing from the result
+            content = content_by_path.get(path)
+            if content is None:
+                continue
+            try:
+                host_record = HostRecord.model_validate_json(content)
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning("Failed to read host record {}: {}", path, e)
+                continue
+            self._cache[host_id] = host_record
+            records.append(host_record)
+
+        if self._is_reusing_agent_record_listing:
+            self._agent_record_paths_by_host_id = agent_record_paths_by_host_id
         return records
 
+    @contextmanager
+    def reusing_agent_record_listing(self) -> Iterator[None]:
+        """Reuse the agent records found by list_all_host_records for the duration of one discovery pass.
+
+        Outside such a block, list_persisted_agent_data_for_host always lists the host's
+        agent records, so that records written by other processes in the meantime are found.
+        """
+        self._is_reusing_agent_record_listing = True
+        try:
+            yield
+        finally:
+            self._is_reusing_agent_record_listing = False
+            self._agent_record_paths_by_host_id.clear()
+
     def persist_agent_data(self, host_id: HostId, agent_data: Mapping[str, object]) -> None:
         """Write agent data for offline listing."""
         agent_id = agent_data.get("id")
@@ -154,6 +203,7 @@ class DockerHostStore(MutableModel):
             logger.warning("Cannot persist agent data without id field")
             return
 
+        self._agent_record_paths_by_host_id.pop(host_id, None)
         path = self._agent_data_path(host_id, AgentId(str(agent_id)))
         data = json.dumps(dict(agent_data), indent=2)
         self.volume.write_files({path: data.encode("utf-8")})
@@ -161,28 +211,41 @@ class DockerHostStore(MutableModel):
 
     def list_persisted_agent_data_for_host(self, host_id: HostId) -> list[dict[str, Any]]:
         """Read persisted agent data for a host."""
-        agent_dir = self._agent_data_dir(host_id)
+        record_paths = self._agent_record_paths_by_host_id.get(host_id)
+        if record_paths is None:
+            agent_dir = self._agent_data_dir(host_id)
+            try:
+                entries = self.volume.listdir(agent_dir)
+            except (FileNotFoundError, OSError):
+                return []
+            record_paths = [
+                entry.path
+                for entry in entries
+                if entry.file_type == VolumeFileType.FILE and entry.path.endswith(".json")
+            ]
         try:
-            entries = self.volume.listdir(agent_dir)
-        except (FileNotFoundError, OSError):
+            content_by_path = self.volume.read_files(record_paths)
+        except (OSError, MngrError) as e:
+            logger.trace("Failed to read agent records for host {}: {}", host_id, e)
             return []
 
         agent_records: list[dict[str, Any]] = []
-        for entry in entries:
-            if entry.file_type != VolumeFileType.FILE or not entry.path.endswith(".json"):
+        for path in record_paths:
+            # Records removed between the listing and the read are simply missing from the result
+            content = content_by_path.get(path)
+            if content is None:
                 continue
             try:
-                content = self.volume.read_file(entry.path)
-                agent_data = json.loads(content)
-                agent_records.append(agent_data)
-            except (json.JSONDecodeError, FileNotFoundError, OSError) as e:
-                logger.trace("Skipped invalid agent record {}: {}", entry.path, e)
+                agent_records.append(json.loads(content))
+            except json.JSONDecodeError as e:
+                logger.trace("Skipped invalid agent record {}: {}", path, e)
                 continue
 
         return agent_records
 
     def remove_persisted_agent_data(self, host_id: HostId, agent_id: AgentId) -> None:
         """Remove persisted agent data."""
+        self._agent_record_paths_by_host_id.pop(host_id, None)
         path = self._agent_data_path(host_id, agent_id)
         try:
             self.volume.remove_file(path)
@@ -194,3 +257,4 @@ class DockerHostStore(MutableModel):
     def clear_cache(self) -> None:
         """Clear the in-memory cache."""
         self._cache.clear()
+        self._agent_record_paths_by_host_id.clear()
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
@@ -16,6 +17,7 @@ HOST_ID_A = "host-00000000000000000000000000000001"
 HOST_ID_B = "host-00000000000000000000000000000002"
 HOST_ID_C = "host-00000000000000000000000000000003"
 AGENT_ID_A = "agent-00000000000000000000000000000001"
+AGENT_ID_B = "agent-00000000000000000000000000000002"
 
 
 def _make_host_record(
@@ -89,6 +91,16 @@ def test_delete_host_record(store: DockerHostStore) -> None:
     assert result is None
 
 
+def test_delete_host_record_removes_agent_data(store: DockerHostStore) -> None:
+    store.write_host_record(_make_host_record())
+    store.persist_agent_data(HostId(HOST_ID_A), {"id": AGENT_ID_A, "name": "test-agent"})
+
+    store.delete_host_record(HostId(HOST_ID_A))
+
+    assert store.list_persisted_agent_data_for_host(HostId(HOST_ID_A)) == []
+    assert store.volume.listdir("host_state") == []
+
+
 def test_delete_host_record_nonexistent_is_noop(store: DockerHostStore) -> None:
     store.delete_host_record(HostId(HOST_ID_B))
 
@@ -122,6 +134,40 @@ def test_list_all_host_records_skips_corrupt_files(store: DockerHostStore, tmp_p
     assert results[0].certified_host_data.host_id == HOST_ID_A
 
 
+def test_list_persisted_agent_data_for_host_finds_records_written_after_listing_host_records(
+    store: DockerHostStore,
+) -> None:
+    store.write_host_record(_make_host_record(host_id=HOST_ID_A))
+    store.persist_agent_data(HostId(HOST_ID_A), {"id": AGENT_ID_A, "name": "test-agent"})
+
+    store.list_all_host_records()
+    # Written concurrently by another process, behind the store's back
+    store.volume.write_files({f"host_state/{HOST_ID_A}/{AGENT_ID_B}.json": json.dumps({"id": AGENT_ID_B}).encode()})
+
+    records = store.list_persisted_agent_data_for_host(HostId(HOST_ID_A))
+    assert sorted(data["id"] for data in records) == [AGENT_ID_A, AGENT_ID_B]
+
+
+def test_list_all_host_records_agent_record_listing_is_only_reused_within_one_discovery_pass(
+    store: DockerHostStore,
+) -> None:
+    store.write_host_record(_make_host_record(host_id=HOST_ID_A, host_name="host-one"))
+    store.write_host_record(_make_host_record(host_id=HOST_ID_B, host_name="host-two"))
+    store.persist_agent_data(HostId(HOST_ID_A), {"id": AGENT_ID_A, "name": "test-agent"})
+
+    with store.reusing_agent_record_listing():
+        store.list_all_host_records()
+        store.volume.write_files(
+            {f"host_state/{HOST_ID_A}/{AGENT_ID_B}.json": json.dumps({"id": AGENT_ID_B}).encode()}
+        )
+
+        # The pass reads the agent records its own listing found
+        assert [data["id"] for data in store.list_persisted_agent_data_for_host(HostId(HOST_ID_A))] == [AGENT_ID_A]
+        assert store.list_persisted_agent_data_for_host(HostId(HOST_ID_B)) == []
+
+    assert len(store.list_persisted_agent_data_for_host(HostId(HOST_ID_A))) == 2
+
+
 def test_persist_agent_data(store: DockerHostStore) -> None:
     host_id = HostId(HOST_ID_A)
     agent_data = {"id": AGENT_ID_A, "name": "test-agent", "type": "echo"}
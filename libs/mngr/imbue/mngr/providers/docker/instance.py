@@ -43,6 +43,7 @@ from imbue.mngr.interfaces.host import HostInterface
 from imbue.mngr.interfaces.volume import HostVolume
 from imbue.mngr.primitives import ActivitySource
 from imbue.mngr.primitives import AgentId
+from imbue.mngr.primitives import DiscoveredAgent
 from imbue.mngr.primitives import DiscoveredHost
 from imbue.mngr.primitives import HostId
 from imbue.mngr.primitives import HostName
@@ -1210,6 +1211,15 @@ kill -TERM 1
 
         raise HostNotFoundError(host)
 
+    def discover_hosts_and_agents(
+        self,
+        cg: ConcurrencyGroup,
+        include_destroyed: bool = False,
+    ) -> dict[DiscoveredHost, list[DiscoveredAgent]]:
+        """Discover hosts and their agents, reading offline hosts' agents from the host record listing."""
+        with self._host_store.reusing_agent_record_listing():
+            return super().discover_hosts_and_agents(cg, include_destroyed)
+
     def discover_hosts(
         self,
         cg: ConcurrencyGroup,
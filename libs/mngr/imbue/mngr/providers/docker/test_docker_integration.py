@@ -479,6 +479,24 @@ def test_docker_volume_listdir(docker_provider: DockerProviderInstance) -> None:
     assert "b.txt" in names
 
 
+@pytest.mark.timeout(DOCKER_TEST_TIMEOUT)
+@pytest.mark.docker_sdk
+def test_docker_volume_listdir_recursive_returns_whole_tree_with_mtimes(
+    docker_provider: DockerProviderInstance,
+) -> None:
+    """Verify DockerVolume.listdir_recursive returns nested entries with real mtimes."""
+    volume = docker_provider._state_volume
+    volume.write_files({"listdir-recursive-test/top.txt": b"t", "listdir-recursive-test/sub/deep.txt": b"dd"})
+    entries = volume.listdir_recursive("listdir-recursive-test")
+    assert [e.path for e in entries] == [
+        "listdir-recursive-test/sub",
+        "listdir-recursive-test/sub/deep.txt",
+        "listdir-recursive-test/top.txt",
+    ]
+    assert entries[1].size == 2
+    assert all(e.mtime > 0 for e in entries)
+
+
 @pytest.mark.timeout(DOCKER_TEST_TIMEOUT)
 @pytest.mark.docker_sdk
 def test_docker_volume_remove_file(docker_provider: DockerProviderInstance) -> None:
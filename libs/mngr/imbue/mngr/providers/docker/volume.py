@@ -1,7 +1,9 @@
 import io
+import shlex
 import tarfile
 from typing import Final
 from typing import Mapping
+from typing import Sequence
 
 import docker
 import docker.errors
@@ -10,6 +12,7 @@ from loguru import logger
 from pydantic import ConfigDict
 from pydantic import Field
 
+from imbue.imbue_common.pure import pure
 from imbue.mngr.errors import MngrError
 from imbue.mngr.interfaces.data_types import VolumeFile
 from imbue.mngr.interfaces.data_types import VolumeFileType
@@ -30,6 +33,70 @@ CONTAINER_ENTRYPOINT_CMD: Final[str] = "trap 'exit 0' TERM; tail -f /dev/null &
 STATE_CONTAINER_IMAGE: Final[str] = "alpine:latest"
 STATE_VOLUME_MOUNT_PATH: Final[str] = "/mngr-state"
 
+# stat format used for listings: file type, size, mtime, then the full path last
+# (so that paths containing the separator still parse). BusyBox find in the
+# alpine state container has no -printf, so we pipe matches through stat instead.
+_STAT_LISTING_FORMAT: Final[str] = "%F\t%s\t%Y\t%n"
+
+# Shell loop that prints each existing file as a "<path>\n<size>\n" header followed by its raw bytes,
+# so that several files can be read with a single exec. Missing files are skipped. The size is
+# captured once and exactly that many bytes are printed, so a file that grows meanwhile still parses.
+_BATCHED_READ_SCRIPT: Final[str] = (
+    'for f in "$@"; do if [ -f "$f" ]; then'
+    ' s=$(wc -c < "$f" | tr -d " "); printf "%s\\n%s\\n" "$f" "$s"; head -c "$s" "$f";'
+    " fi; done"
+)
+
+
+@pure
+def _parse_stat_listing_output(output: str, listed_dir: str, path_prefix: str) -> list[VolumeFile]:
+    """Parse the output of the stat listing command into VolumeFiles.
+
+    listed_dir is the absolute directory that was listed inside the container, and
+    path_prefix is the volume-relative path that listed entries should be reported under.
+    """
+    entries: list[VolumeFile] = []
+    listed_dir_prefix = listed_dir.rstrip("/") + "/"
+    for line in output.splitlines():
+        parts = line.split("\t", 3)
+        if len(parts) != 4 or not parts[3].startswith(listed_dir_prefix):
+            continue
+        type_description, size_str, mtime_str, full_path = parts
+        relative_path = full_path[len(listed_dir_prefix) :]
+        entries.append(
+            VolumeFile(
+                path=f"{path_prefix.rstrip('/')}/{relative_path}" if path_prefix.strip("/") else relative_path,
+                file_type=VolumeFileType.DIRECTORY if type_description == "directory" else VolumeFileType.FILE,
+                mtime=int(mtime_str) if mtime_str.isdigit() else 0,
+                size=int(size_str) if size_str.isdigit() else 0,
+            )
+        )
+    return sorted(entries, key=lambda e: e.path)
+
+
+@pure
+def _parse_batched_read_output(output: bytes) -> dict[str, bytes]:
+    """Parse the output of the batched read script into file contents keyed by the paths it printed.
+
+    Raises MngrError if the output is malformed (e.g. truncated).
+    """
+    content_by_path: dict[str, bytes] = {}
+    offset = 0
+    while offset < len(output):
+        try:
+            path_end = output.index(b"\n", offset)
+            size_end = output.index(b"\n", path_end + 1)
+            path = output[offset:path_end].decode("utf-8")
+            size = int(output[path_end + 1 : size_end].strip())
+        except ValueError as e:
+            raise MngrError(f"Malformed batched read output at byte {offset}: {e}") from e
+        content_start = size_end + 1
+        if content_start + size > len(output):
+            raise MngrError(f"Batched read output for '{path}' is truncated")
+        content_by_path[path] = output[content_start : content_start + size]
+        offset = content_start + size
+    return content_by_path
+
 
 def _state_container_name(prefix: str, user_id: str) -> str:
     """Generate the name for the singleton state container."""
@@ -118,41 +185,24 @@ class DockerVolume(BaseVolume):
         output_str = output.decode("utf-8") if isinstance(output, bytes) else str(output)
         return exit_code, output_str
 
-    def listdir(self, path: str) -> list[VolumeFile]:
+    def _list_with_stat(self, path: str, is_recursive: bool) -> list[VolumeFile]:
+        """List entries under a directory with a single find+stat exec."""
         resolved = self._resolve(path)
-        # BusyBox-compatible: use ls -la and parse output
-        exit_code, output = self._exec(f"ls -la '{resolved}'")
+        depth_args = "-mindepth 1" if is_recursive else "-mindepth 1 -maxdepth 1"
+        command = (
+            f"test -d {shlex.quote(resolved)} && "
+            f"find {shlex.quote(resolved)} {depth_args} -exec stat -c {shlex.quote(_STAT_LISTING_FORMAT)} {{}} +"
+        )
+        exit_code, output = self._exec(command)
         if exit_code != 0:
             raise FileNotFoundError(f"Directory not found on volume: {path}")
-        if not output.strip():
-            return []
-
-        entries: list[VolumeFile] = []
-        for line in output.strip().split("\n"):
-            # Skip total line and . / .. entries
-            if line.startswith("total ") or not line.strip():
-                continue
-            parts = line.split()
-            if len(parts) < 9:
-                continue
-            name = " ".join(parts[8:])
-            if name in (".", ".."):
-                continue
-
-            perms = parts[0]
-            size = int(parts[4]) if parts[4].isdigit() else 0
-            file_type = VolumeFileType.DIRECTORY if perms.startswith("d") else VolumeFileType.FILE
-            path_str = path.rstrip("/") + "/" + name if path.strip("/") else name
-
-            entries.append(
-                VolumeFile(
-                    path=path_str,
-                    file_type=file_type,
-                    mtime=0,
-                    size=size,
-                )
-            )
-        return sorted(entries, key=lambda e: e.path)
+        return _parse_stat_listing_output(output, listed_dir=resolved, path_prefix=path)
+
+    def listdir(self, path: str) -> list[VolumeFile]:
+        return self._list_with_stat(path, is_recursive=False)
+
+    def listdir_recursive(self, path: str) -> list[VolumeFile]:
+        return self._list_with_stat(path, is_recursive=True)
 
     def read_file(self, path: str) -> bytes:
         resolved = self._resolve(path)
@@ -161,6 +211,23 @@ class DockerVolume(BaseVolume):
             raise FileNotFoundError(f"File not found on volume: {path}")
         return output if isinstance(output, bytes) else output.encode("utf-8")
 
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        """Read all the files with a single exec into the state container."""
+        if not paths:
+            return {}
+        path_by_resolved = {self._resolve(path): path for path in paths}
+        exit_code, output = self.container.exec_run(
+            ["sh", "-c", _BATCHED_READ_SCRIPT, "sh", *path_by_resolved], stderr=False
+        )
+        if exit_code != 0:
+            raise MngrError(f"Failed to read {len(paths)} file(s) from volume: {output!r}")
+        output_bytes = output if isinstance(output, bytes) else output.encode("utf-8")
+        return {
+            path_by_resolved[resolved]: data
+            for resolved, data in _parse_batched_read_output(output_bytes).items()
+            if resolved in path_by_resolved
+        }
+
     def remove_file(self, path: str, *, recursive: bool = False) -> None:
         resolved = self._resolve(path)
         rm_flag = "-rf" if recursive else "-f"
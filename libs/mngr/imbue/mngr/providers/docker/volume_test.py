@@ -0,0 +1,63 @@
+import pytest
+
+from imbue.mngr.errors import MngrError
+from imbue.mngr.interfaces.data_types import VolumeFileType
+from imbue.mngr.providers.docker.volume import _parse_batched_read_output
+from imbue.mngr.providers.docker.volume import _parse_stat_listing_output
+
+
+def test_parse_stat_listing_output_reports_types_sizes_and_mtimes() -> None:
+    output = (
+        "directory\t4096\t1767225600\t/mngr-state/host_state/host-abc\n"
+        "regular file\t12\t1767225601\t/mngr-state/host_state/host-abc/agent-1.json\n"
+        "regular empty file\t0\t1767225602\t/mngr-state/host_state/host-abc.json\n"
+    )
+    entries = _parse_stat_listing_output(output, listed_dir="/mngr-state/host_state", path_prefix="host_state")
+    assert [(e.path, e.file_type, e.size, e.mtime) for e in entries] == [
+        ("host_state/host-abc", VolumeFileType.DIRECTORY, 4096, 1767225600),
+        ("host_state/host-abc.json", VolumeFileType.FILE, 0, 1767225602),
+        ("host_state/host-abc/agent-1.json", VolumeFileType.FILE, 12, 1767225601),
+    ]
+
+
+def test_parse_stat_listing_output_uses_bare_names_for_volume_root() -> None:
+    output = "regular file\t3\t1767225600\t/mngr-state/top.txt\n"
+    entries = _parse_stat_listing_output(output, listed_dir="/mngr-state", path_prefix="")
+    assert [e.path for e in entries] == ["top.txt"]
+
+
+def test_parse_stat_listing_output_keeps_tabs_in_file_names() -> None:
+    output = "regular file\t3\t1767225600\t/mngr-state/dir/odd\tname.txt\n"
+    entries = _parse_stat_listing_output(output, listed_dir="/mngr-state/dir", path_prefix="dir")
+    assert [e.path for e in entries] == ["dir/odd\tname.txt"]
+
+
+def test_parse_stat_listing_output_skips_malformed_lines() -> None:
+    output = "garbage line\nregular file\t3\t1767225600\t/elsewhere/file.txt\n"
+    assert _parse_stat_listing_output(output, listed_dir="/mngr-state", path_prefix="") == []
+
+
+def test_parse_batched_read_output_splits_files_by_size() -> None:
+    output = b'/mngr-state/a.json\n  7\n{"a":1}/mngr-state/b.bin\n3\n\n\x00\n/mngr-state/empty\n0\n'
+    assert _parse_batched_read_output(output) == {
+        "/mngr-state/a.json": b'{"a":1}',
+        "/mngr-state/b.bin": b"\n\x00\n",
+        "/mngr-state/empty": b"",
+    }
+
+
+def test_parse_batched_read_output_returns_nothing_for_empty_output() -> None:
+    assert _parse_batched_read_output(b"") == {}
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        pytest.param(b"/mngr-state/a.json\n", id="missing_size"),
+        pytest.param(b"/mngr-state/a.json\nnot-a-size\n", id="invalid_size"),
+        pytest.param(b'/mngr-state/a.json\n7\n{"a"', id="truncated_content"),
+    ],
+)
+def test_parse_batched_read_output_raises_mngr_error_for_malformed_output(output: bytes) -> None:
+    with pytest.raises(MngrError):
+        _parse_batched_read_output(output)
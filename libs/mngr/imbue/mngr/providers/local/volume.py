@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 from typing import Mapping
@@ -51,6 +52,32 @@ class LocalVolume(BaseVolume):
             )
         return entries
 
+    def listdir_recursive(self, path: str) -> list[VolumeFile]:
+        resolved = self._resolve(path)
+        if not resolved.is_dir():
+            return []
+        root_resolved = self.root_path.resolve()
+        entries: list[VolumeFile] = []
+        # Walk with os.scandir so each entry's type and stat come from a single syscall where possible.
+        # Symlinked directories are reported but not descended into, to avoid cycles.
+        directories_to_visit = [str(resolved)]
+        while directories_to_visit:
+            with os.scandir(directories_to_visit.pop()) as iterator:
+                for dir_entry in iterator:
+                    stat = dir_entry.stat()
+                    is_directory = dir_entry.is_dir()
+                    entries.append(
+                        VolumeFile(
+                            path=str(Path(dir_entry.path).relative_to(root_resolved)),
+                            file_type=VolumeFileType.DIRECTORY if is_directory else VolumeFileType.FILE,
+                            mtime=int(stat.st_mtime),
+                            size=stat.st_size,
+                        )
+                    )
+                    if is_directory and not dir_entry.is_symlink():
+                        directories_to_visit.append(dir_entry.path)
+        return sorted(entries, key=lambda e: e.path)
+
     def read_file(self, path: str) -> bytes:
         resolved = self._resolve(path)
         return resolved.read_bytes()
@@ -143,3 +143,25 @@ def test_path_traversal_blocked(volume: LocalVolume) -> None:
 def test_path_traversal_blocked_on_write(volume: LocalVolume) -> None:
     with pytest.raises(MngrError, match="escapes volume root"):
         volume.write_files({"../../evil.txt": b"bad"})
+
+
+def test_listdir_recursive_returns_nested_entries_sorted(volume: LocalVolume) -> None:
+    volume.write_files({"top.txt": b"t", "sub/mid.txt": b"mm", "sub/deep/leaf.txt": b"lll"})
+    entries = volume.listdir_recursive("")
+    assert [e.path for e in entries] == ["sub", "sub/deep", "sub/deep/leaf.txt", "sub/mid.txt", "top.txt"]
+    leaf_entry = next(e for e in entries if e.path == "sub/deep/leaf.txt")
+    assert leaf_entry.file_type == VolumeFileType.FILE
+    assert leaf_entry.size == 3
+    assert leaf_entry.mtime > 0
+
+
+def test_listdir_recursive_nonexistent_dir(volume: LocalVolume) -> None:
+    assert volume.listdir_recursive("does_not_exist") == []
+
+
+def test_scoped_listdir_recursive_works_when_root_path_is_symlink(symlink_volume: LocalVolume) -> None:
+    symlink_volume.write_files({"agents/a1/events/claude/events.jsonl": b"{}"})
+
+    scoped = symlink_volume.scoped("agents/a1")
+    entries = scoped.listdir_recursive("events")
+    assert [e.path for e in entries] == ["events/claude", "events/claude/events.jsonl"]
@@ -0,0 +1,350 @@
+"""Native evaluation of common CEL expression shapes, bypassing celpy's interpreter.
+
+Filters and sort keys such as ``state == "RUNNING"``, ``host.provider in ["local", "docker"]``,
+``name.startsWith("prod-")`` or ``labels["team"] == "infra"`` are evaluated directly against
+the raw (JSON-like) context, without converting it to celpy values first.
+
+The fast path only answers when the result is certain to match celpy's. Whenever an operand
+has an unexpected type, a field is missing, or anything else is out of the ordinary, evaluation
+returns CEL_FAST_PATH_FALLBACK and the caller evaluates the expression with celpy instead (which
+also produces celpy's error, if any).
+"""
+
+import re
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Mapping
+from typing import Any
+from typing import Final
+
+import celpy
+from celpy import celtypes
+from lark import Token
+from lark import Tree
+from pydantic import Field
+
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.pure import pure
+
+# Returned by fast-path evaluation when the expression must be evaluated by celpy instead
+CEL_FAST_PATH_FALLBACK: Final[object] = object()
+
+# Grammar rules that simply wrap a single child (e.g. a relation with no operator)
+_PASSTHROUGH_RULES: Final[frozenset[str]] = frozenset(
+    {"expr", "conditionalor", "conditionaland", "relation", "addition", "multiplication", "unary", "member"}
+)
+
+_COMPARISON_OPERATOR_BY_RULE: Final[dict[str, str]] = {
+    "relation_eq": "==",
+    "relation_ne": "!=",
+    "relation_lt": "<",
+    "relation_le": "<=",
+    "relation_gt": ">",
+    "relation_ge": ">=",
+}
+
+_STRING_METHOD_NAMES: Final[frozenset[str]] = frozenset({"startsWith", "endsWith", "contains"})
+
+# Operand types the fast path compares natively; all others fall back to celpy
+_NATIVE_SCALAR_TYPES: Final[tuple[type, ...]] = (str, int, float, bool)
+
+_SIMPLE_STRING_LITERAL_PATTERN: Final[re.Pattern[str]] = re.compile(r"^(\"[^\"\\\n]*\"|'[^'\\\n]*')$")
+_DECIMAL_INT_LITERAL_PATTERN: Final[re.Pattern[str]] = re.compile(r"^-?[0-9]+$")
+_DECIMAL_FLOAT_LITERAL_PATTERN: Final[re.Pattern[str]] = re.compile(r"^-?[0-9]*\.?[0-9]+([eE][+-]?[0-9]+)?$")
+
+
+class CelFastPathNode(FrozenModel, ABC):
+    """A natively evaluable CEL sub-expression."""
+
+    @abstractmethod
+    def evaluate_native(self, context: Mapping[str, Any]) -> Any:
+        """Evaluate to a plain Python value, or CEL_FAST_PATH_FALLBACK if celpy must decide."""
+        ...
+
+
+class CelFieldPathNode(CelFastPathNode):
+    """A variable followed by field selections or string-keyed indexing (e.g. ``labels["team"]``)."""
+
+    keys: tuple[str, ...] = Field(description="The variable name followed by each selected key")
+
+    def evaluate_native(self, context: Mapping[str, Any]) -> Any:
+        value: Any = context
+        for key in self.keys:
+            if not isinstance(value, dict) or key not in value:
+                return CEL_FAST_PATH_FALLBACK
+            value = value[key]
+        return value
+
+
+class CelLiteralNode(CelFastPathNode):
+    """A string, number, bool or null literal."""
+
+    value: str | bool | int | float | None = Field(description="The literal's Python value")
+
+    def evaluate_native(self, context: Mapping[str, Any]) -> Any:
+        return self.value
+
+
+class CelComparisonNode(CelFastPathNode):
+    """An equality or ordering comparison between two operands of the same scalar type."""
+
+    operator: str = Field(description="One of ==, !=, <, <=, >, >=")
+    left: CelFastPathNode = Field(description="The left operand")
+    right: CelFastPathNode = Field(description="The right operand")
+
+    def evaluate_native(self, context: Mapping[str, Any]) -> Any:
+        left = self.left.evaluate_native(context)
+        if left is CEL_FAST_PATH_FALLBACK:
+            return CEL_FAST_PATH_FALLBACK
+        right = self.right.evaluate_native(context)
+        if right is CEL_FAST_PATH_FALLBACK:
+            return CEL_FAST_PATH_FALLBACK
+        # celpy has its own rules for mixed types (e.g. 1 == true, 1 < 1.5 is an error), so only
+        # compare values of exactly the same type here
+        if left is None and right is None and self.operator in ("==", "!="):
+            return self.operator == "=="
+        if type(left) is not type(right) or not isinstance(left, _NATIVE_SCALAR_TYPES):
+            return CEL_FAST_PATH_FALLBACK
+        match self.operator:
+            case "==":
+                return left == right
+            case "!=":
+                return left != right
+            case "<":
+                return left < right
+            case "<=":
+                return left <= right
+            case ">":
+                return left > right
+            case ">=":
+                return left >= right
+            case _:
+                return CEL_FAST_PATH_FALLBACK
+
+
+class CelMembershipNode(CelFastPathNode):
+    """An ``x in [...]`` test against a non-empty list of literals of one type."""
+
+    element: CelFastPathNode = Field(description="The value being looked up")
+    candidates: tuple[str | bool | int | float, ...] = Field(description="The literal list elements")
+
+    def evaluate_native(self, context: Mapping[str, Any]) -> Any:
+        element = self.element.evaluate_native(context)
+        if element is CEL_FAST_PATH_FALLBACK or type(element) is not type(self.candidates[0]):
+            return CEL_FAST_PATH_FALLBACK
+        return element in self.candidates
+
+
+class CelStringMethodNode(CelFastPathNode):
+    """A ``startsWith``, ``endsWith`` or ``contains`` call with a string literal argument."""
+
+    method_name: str = Field(description="The CEL string method name")
+    target: CelFastPathNode = Field(description="The string the method is called on")
+    argument: str = Field(description="The literal argument")
+
+    def evaluate_native(self, context: Mapping[str, Any]) -> Any:
+        target = self.target.evaluate_native(context)
+        if type(target) is not str:
+            return CEL_FAST_PATH_FALLBACK
+        match self.method_name:
+            case "startsWith":
+                return target.startswith(self.argument)
+            case "endsWith":
+                return target.endswith(self.argument)
+            case "contains":
+                return self.argument in target
+            case _:
+                return CEL_FAST_PATH_FALLBACK
+
+
+class CelNotNode(CelFastPathNode):
+    """Logical negation of a bool."""
+
+    operand: CelFastPathNode = Field(description="The negated operand")
+
+    def evaluate_native(self, context: Mapping[str, Any]) -> Any:
+        operand = self.operand.evaluate_native(context)
+        if type(operand) is not bool:
+            return CEL_FAST_PATH_FALLBACK
+        return not operand
+
+
+class CelLogicalNode(CelFastPathNode):
+    """A short-circuiting ``&&`` or ``||`` of two bools."""
+
+    is_and: bool = Field(description="True for &&, False for ||")
+    left: CelFastPathNode = Field(description="The left operand")
+    right: CelFastPathNode = Field(description="The right operand")
+
+    def evaluate_native(self, context: Mapping[str, Any]) -> Any:
+        # CEL's && and || ignore errors in the other operand once one side decides the result,
+        # so deciding from the left operand alone always agrees with celpy
+        left = self.left.evaluate_native(context)
+        if type(left) is bool and left is not self.is_and:
+            return left
+        right = self.right.evaluate_native(context)
+        if type(left) is not bool or type(right) is not bool:
+            if type(right) is bool and right is not self.is_and:
+                return right
+            return CEL_FAST_PATH_FALLBACK
+        return right
+
+
+@pure
+def get_cel_referenced_names(ast: Tree) -> frozenset[str]:
+    """Return the top-level variable names that a compiled CEL expression refers to."""
+    names: set[str] = set()
+    for primary in ast.find_data("primary"):
+        child = primary.children[0]
+        if isinstance(child, Tree) and child.data == "ident":
+            names.add(str(child.children[0]))
+    return frozenset(names)
+
+
+@pure
+def compile_cel_fast_path(ast: Tree) -> CelFastPathNode | None:
+    """Build a natively evaluable form of a compiled CEL expression, or None if it has an unsupported shape."""
+    return _compile_node(ast)
+
+
+def evaluate_cel_fast_path(node: CelFastPathNode, context: Mapping[str, Any]) -> Any:
+    """Evaluate a fast-path expression, returning the same CEL value celpy would (or CEL_FAST_PATH_FALLBACK)."""
+    result = node.evaluate_native(context)
+    if result is CEL_FAST_PATH_FALLBACK:
+        return CEL_FAST_PATH_FALLBACK
+    if isinstance(node, CelFieldPathNode):
+        return celpy.json_to_cel(result)
+    if type(result) is bool:
+        return celtypes.BoolType(result)
+    # Literal-only expressions are rare enough to leave to celpy
+    return CEL_FAST_PATH_FALLBACK
+
+
+def _unwrap(tree: Tree) -> Tree:
+    """Skip past grammar rules that only wrap a single child."""
+    node = tree
+    while node.data in _PASSTHROUGH_RULES and len(node.children) == 1 and isinstance(node.children[0], Tree):
+        node = node.children[0]
+    return node
+
+
+def _compile_node(tree: Tree) -> CelFastPathNode | None:
+    node = _unwrap(tree)
+    children = node.children
+    if node.data == "conditionalor" and len(children) == 2:
+        return _compile_logical(children, is_and=False)
+    if node.data == "conditionaland" and len(children) == 2:
+        return _compile_logical(children, is_and=True)
+    if node.data == "relation" and len(children) == 2:
+        # The operator rule wraps the left operand: relation(relation_eq(left), right)
+        return _compile_relation(children[0], children[1])
+    if node.data == "unary" and len(children) == 2 and _is_tree(children[0], "unary_not"):
+        operand = _compile_node(children[1])
+        return CelNotNode(operand=operand) if operand is not None else None
+    if node.data == "member_dot_arg":
+        return _compile_string_method(children)
+    if node.data in ("member_dot", "member_index") or (node.data == "primary" and _is_tree(children[0], "ident")):
+        keys = _compile_field_path(node)
+        return CelFieldPathNode(keys=keys) if keys is not None else None
+    if node.data == "primary" and _is_tree(children[0], "literal"):
+        is_parsed, value = _parse_literal(children[0])
+        return CelLiteralNode(value=value) if is_parsed else None
+    if node.data == "primary" and _is_tree(children[0], "paren_expr"):
+        return _compile_node(children[0].children[0])
+    return None
+
+
+def _is_tree(child: Tree | Token, rule: str) -> bool:
+    return isinstance(child, Tree) and child.data == rule
+
+
+def _compile_logical(children: list[Any], is_and: bool) -> CelFastPathNode | None:
+    left = _compile_node(children[0])
+    right = _compile_node(children[1])
+    if left is None or right is None:
+        return None
+    return CelLogicalNode(is_and=is_and, left=left, right=right)
+
+
+def _compile_relation(operator_tree: Tree, right_tree: Tree) -> CelFastPathNode | None:
+    if operator_tree.data == "relation_in":
+        return _compile_membership(operator_tree.children[0], right_tree)
+    operator = _COMPARISON_OPERATOR_BY_RULE.get(operator_tree.data)
+    left = _compile_node(operator_tree.children[0])
+    right = _compile_node(right_tree)
+    if operator is None or left is None or right is None:
+        return None
+    return CelComparisonNode(operator=operator, left=left, right=right)
+
+
+def _compile_membership(element_tree: Tree, list_tree: Tree) -> CelFastPathNode | None:
+    element = _compile_node(element_tree)
+    list_node = _unwrap(list_tree)
+    if element is None or list_node.data != "primary" or not _is_tree(list_node.children[0], "list_lit"):
+        return None
+    list_lit = list_node.children[0]
+    if not list_lit.children:
+        return None
+    candidates: list[str | bool | int | float] = []
+    for item in list_lit.children[0].children:
+        literal_node = _compile_node(item)
+        if not isinstance(literal_node, CelLiteralNode) or literal_node.value is None:
+            return None
+        candidates.append(literal_node.value)
+    if len({type(candidate) for candidate in candidates}) != 1:
+        return None
+    return CelMembershipNode(element=element, candidates=tuple(candidates))
+
+
+def _compile_string_method(children: list[Any]) -> CelFastPathNode | None:
+    target_tree, method_token, argument_list = children
+    method_name = str(method_token)
+    if method_name not in _STRING_METHOD_NAMES or len(argument_list.children) != 1:
+        return None
+    target = _compile_node(target_tree)
+    argument = _compile_node(argument_list.children[0])
+    if target is None or not isinstance(argument, CelLiteralNode) or type(argument.value) is not str:
+        return None
+    return CelStringMethodNode(method_name=method_name, target=target, argument=argument.value)
+
+
+def _compile_field_path(node: Tree) -> tuple[str, ...] | None:
+    """Collect the keys of an ``a.b["c"].d`` style path, or None if it is anything more complex."""
+    keys: list[str] = []
+    current = node
+    while current.data != "primary":
+        if current.data == "member_dot":
+            keys.append(str(current.children[1]))
+        elif current.data == "member_index":
+            key_node = _compile_node(current.children[1])
+            if not isinstance(key_node, CelLiteralNode) or type(key_node.value) is not str:
+                return None
+            keys.append(key_node.value)
+        else:
+            return None
+        current = _unwrap(current.children[0])
+    if not _is_tree(current.children[0], "ident"):
+        return None
+    keys.append(str(current.children[0].children[0]))
+    return tuple(reversed(keys))
+
+
+def _parse_literal(literal: Tree) -> tuple[bool, str | bool | int | float | None]:
+    """Parse a literal token into (is_parsed, value), declining anything with escapes or prefixes."""
+    token = literal.children[0]
+    if not isinstance(token, Token):
+        return False, None
+    text = str(token)
+    match token.type:
+        case "STRING_LIT" if _SIMPLE_STRING_LITERAL_PATTERN.match(text):
+            return True, text[1:-1]
+        case "INT_LIT" if _DECIMAL_INT_LITERAL_PATTERN.match(text):
+            return True, int(text)
+        case "FLOAT_LIT" if _DECIMAL_FLOAT_LITERAL_PATTERN.match(text):
+            return True, float(text)
+        case "BOOL_LIT":
+            return True, text == "true"
+        case "NULL_LIT":
+            return True, None
+        case _:
+            return False, None
@@ -0,0 +1,152 @@
+from typing import Any
+
+import celpy
+import pytest
+from celpy import celtypes
+from celpy.evaluation import CELEvalError
+
+from imbue.mngr.utils.cel_fast_path import CEL_FAST_PATH_FALLBACK
+from imbue.mngr.utils.cel_fast_path import compile_cel_fast_path
+from imbue.mngr.utils.cel_fast_path import evaluate_cel_fast_path
+from imbue.mngr.utils.cel_fast_path import get_cel_referenced_names
+from imbue.mngr.utils.cel_utils import build_cel_context
+
+_CONTEXTS: list[dict[str, Any]] = [
+    {
+        "name": "prod-api",
+        "state": "RUNNING",
+        "age": 120.5,
+        "runtime": 42,
+        "is_idle": False,
+        "labels": {"team": "infra", "tier": "1"},
+        "host": {"provider": "local", "name": "laptop", "is_locked": True, "cpu": 4},
+        "parent": None,
+    },
+    {
+        "name": "dev-worker",
+        "state": "STOPPED",
+        "age": 3,
+        "runtime": 42.0,
+        "is_idle": True,
+        "labels": {},
+        "host": {"provider": "docker", "name": "box", "is_locked": False, "cpu": 2.0},
+        "parent": "prod-api",
+    },
+    {
+        "name": 7,
+        "state": None,
+        "age": "old",
+        "runtime": True,
+        "is_idle": "yes",
+        "labels": None,
+        "host": "not-a-dict",
+        "parent": 0,
+    },
+    {},
+]
+
+_EXPRESSIONS: list[str] = [
+    'state == "RUNNING"',
+    'state != "RUNNING"',
+    "state == null",
+    "parent != null",
+    "runtime == 42",
+    "runtime == 42.0",
+    "runtime == true",
+    "age > 100",
+    "age > 100.0",
+    "age <= 3",
+    'name < "m"',
+    "is_idle",
+    "!is_idle",
+    'state in ["RUNNING", "STOPPED"]',
+    "runtime in [42, 43]",
+    'name.startsWith("prod-")',
+    'name.endsWith("worker")',
+    'name.contains("api")',
+    'labels.team == "infra"',
+    'labels["tier"] == "1"',
+    'host.provider == "local" && host.is_locked',
+    'host.provider == "docker" || is_idle',
+    'is_idle || state == "RUNNING"',
+    'is_idle && name.contains("dev")',
+    '!(host.provider in ["local"]) && host.cpu >= 2',
+    'labels.missing == "x" || true',
+    'labels.missing == "x" && false',
+    "host.name",
+    "labels",
+    "runtime",
+]
+
+
+@pytest.mark.parametrize("expression", _EXPRESSIONS)
+def test_fast_path_matches_celpy(expression: str) -> None:
+    """The fast path must either agree with celpy exactly or fall back to it."""
+    env = celpy.Environment()
+    ast = env.compile(expression)
+    program = env.program(ast)
+    fast_path = compile_cel_fast_path(ast)
+    assert fast_path is not None
+
+    for context in _CONTEXTS:
+        fast_result = evaluate_cel_fast_path(fast_path, context)
+        if fast_result is CEL_FAST_PATH_FALLBACK:
+            continue
+        try:
+            expected = program.evaluate(build_cel_context(context))
+        except CELEvalError as e:
+            pytest.fail(f"fast path returned {fast_result!r} where celpy failed ({e}) for {expression} on {context}")
+        assert type(fast_result) is type(expected), f"{expression} on {context}"
+        assert fast_result == expected, f"{expression} on {context}"
+
+
+def test_fast_path_answers_common_filters_natively() -> None:
+    """The fast path should not fall back for well-typed inputs."""
+    env = celpy.Environment()
+    context = _CONTEXTS[0]
+    for expression in (
+        'state == "RUNNING"',
+        'state in ["RUNNING", "STOPPED"]',
+        'name.startsWith("prod-")',
+        'labels["team"] == "infra"',
+        'host.provider == "local" && !is_idle',
+        "age > 100.0",
+        "host.name",
+    ):
+        fast_path = compile_cel_fast_path(env.compile(expression))
+        assert fast_path is not None
+        assert evaluate_cel_fast_path(fast_path, context) is not CEL_FAST_PATH_FALLBACK, expression
+
+
+def test_fast_path_falls_back_on_mixed_types() -> None:
+    """celpy has its own rules for mixed-type comparisons, so those are left to it."""
+    env = celpy.Environment()
+    fast_path = compile_cel_fast_path(env.compile("age > 100"))
+    assert fast_path is not None
+    assert evaluate_cel_fast_path(fast_path, {"age": 120.5}) is CEL_FAST_PATH_FALLBACK
+    assert evaluate_cel_fast_path(fast_path, {"age": 120}) == celtypes.BoolType(True)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "size(name) > 3",
+        "runtime + 1 > 3",
+        "-runtime < 0",
+        'name.matches("^prod")',
+        'labels.exists(k, k == "team")',
+        'name == "escaped\\"quote"',
+        "state in []",
+        "runtime == 0x10",
+        'name in ["a", 1]',
+    ],
+)
+def test_fast_path_declines_unsupported_shapes(expression: str) -> None:
+    env = celpy.Environment()
+    assert compile_cel_fast_path(env.compile(expression)) is None
+
+
+def test_get_cel_referenced_names() -> None:
+    env = celpy.Environment()
+    ast = env.compile('host.provider == "local" && size(labels) > 0 && name.startsWith(prefix)')
+    assert get_cel_referenced_names(ast) == frozenset({"host", "labels", "name", "prefix"})
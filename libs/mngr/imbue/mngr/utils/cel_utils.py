@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from collections.abc import Mapping
 from collections.abc import Sequence
 from typing import Any
 
@@ -5,38 +7,83 @@ import celpy
 from celpy.celparser import CELParseError
 from celpy.evaluation import CELEvalError
 from loguru import logger
+from pydantic import ConfigDict
+from pydantic import Field
 
+from imbue.imbue_common.frozen_model import FrozenModel
 from imbue.imbue_common.pure import pure
 from imbue.mngr.errors import MngrError
+from imbue.mngr.utils.cel_fast_path import CEL_FAST_PATH_FALLBACK
+from imbue.mngr.utils.cel_fast_path import CelFastPathNode
+from imbue.mngr.utils.cel_fast_path import compile_cel_fast_path
+from imbue.mngr.utils.cel_fast_path import evaluate_cel_fast_path
+from imbue.mngr.utils.cel_fast_path import get_cel_referenced_names
+
+
+class CompiledCelExpression(FrozenModel):
+    """A compiled CEL expression, plus what is needed to evaluate it cheaply.
+
+    evaluate_raw() takes a raw (JSON-like) context: it first tries the native fast
+    path, and otherwise converts only the variables the expression references. It
+    returns the same values (and raises the same errors) as the celpy program would
+    on the fully converted context.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    expression: str = Field(description="The CEL source text")
+    program: Any = Field(description="The compiled celpy program")
+    referenced_names: frozenset[str] = Field(description="Top-level variable names the expression refers to")
+    fast_path: CelFastPathNode | None = Field(description="Native evaluator, if the expression has a supported shape")
+
+    def evaluate_raw(self, context: Mapping[str, Any]) -> Any:
+        if self.fast_path is not None:
+            result = evaluate_cel_fast_path(self.fast_path, context)
+            if result is not CEL_FAST_PATH_FALLBACK:
+                return result
+        return self.program.evaluate(build_lazy_cel_context(context, self.referenced_names))
+
+
+def compile_cel_expression(env: celpy.Environment, expression: str) -> CompiledCelExpression:
+    """Compile a CEL expression. Raises CELParseError if it is invalid."""
+    ast = env.compile(expression)
+    return CompiledCelExpression(
+        expression=expression,
+        program=env.program(ast),
+        referenced_names=get_cel_referenced_names(ast),
+        fast_path=compile_cel_fast_path(ast),
+    )
+
+
+@pure
+def get_referenced_cel_names(expressions: Iterable[CompiledCelExpression]) -> frozenset[str]:
+    """Return the union of the top-level variable names referenced by the expressions."""
+    return frozenset(name for expression in expressions for name in expression.referenced_names)
 
 
 @pure
 def compile_cel_filters(
     include_filters: Sequence[str],
     exclude_filters: Sequence[str],
-) -> tuple[list[Any], list[Any]]:
+) -> tuple[list[CompiledCelExpression], list[CompiledCelExpression]]:
     """Compile CEL filter expressions into evaluable programs.
 
     Raises MngrError if any filter expression is invalid.
     """
-    compiled_includes: list[Any] = []
-    compiled_excludes: list[Any] = []
+    compiled_includes: list[CompiledCelExpression] = []
+    compiled_excludes: list[CompiledCelExpression] = []
 
     env = celpy.Environment()
 
     for filter_expr in include_filters:
         try:
-            ast = env.compile(filter_expr)
-            prgm = env.program(ast)
-            compiled_includes.append(prgm)
+            compiled_includes.append(compile_cel_expression(env, filter_expr))
         except CELParseError as e:
             raise MngrError(f"Invalid include filter expression '{filter_expr}': {e}") from e
 
     for filter_expr in exclude_filters:
         try:
-            ast = env.compile(filter_expr)
-            prgm = env.program(ast)
-            compiled_excludes.append(prgm)
+            compiled_excludes.append(compile_cel_expression(env, filter_expr))
         except CELParseError as e:
             raise MngrError(f"Invalid exclude filter expression '{filter_expr}': {e}") from e
 
@@ -59,10 +106,20 @@ def build_cel_context(raw_context: dict[str, Any]) -> dict[str, Any]:
     return {k: _convert_to_cel_value(v) for k, v in raw_context.items()}
 
 
+@pure
+def build_lazy_cel_context(raw_context: Mapping[str, Any], referenced_names: frozenset[str]) -> dict[str, Any]:
+    """Convert only the variables an expression references (converting the rest would be wasted work).
+
+    Keys are matched on their first dotted segment, since celpy also resolves
+    qualified names like ``a.b`` against a key named "a.b".
+    """
+    return {k: _convert_to_cel_value(v) for k, v in raw_context.items() if k.partition(".")[0] in referenced_names}
+
+
 def apply_cel_filters_to_context(
-    context: dict[str, Any],
-    include_filters: Sequence[Any],
-    exclude_filters: Sequence[Any],
+    context: Mapping[str, Any],
+    include_filters: Sequence[CompiledCelExpression],
+    exclude_filters: Sequence[CompiledCelExpression],
     # Used in warning messages to identify what is being filtered
     error_context_description: str,
 ) -> bool:
@@ -73,13 +130,12 @@ def apply_cel_filters_to_context(
 
     Nested dictionaries in the context are automatically converted to CEL-compatible
     objects, enabling standard CEL dot notation (e.g., host.provider == "local").
+    Only the variables each filter references are converted, and common filter
+    shapes are evaluated natively without any conversion.
     """
-    # Convert nested dicts to CEL-compatible objects for dot notation support
-    cel_context = build_cel_context(context)
-
     for prgm in include_filters:
         try:
-            result = prgm.evaluate(cel_context)
+            result = prgm.evaluate_raw(context)
             if not result:
                 return False
         except (CELEvalError, TypeError) as e:
@@ -88,7 +144,7 @@ def apply_cel_filters_to_context(
 
     for prgm in exclude_filters:
         try:
-            result = prgm.evaluate(cel_context)
+            result = prgm.evaluate_raw(context)
             if result:
                 return False
         except (CELEvalError, TypeError) as e:
@@ -125,34 +181,32 @@ def parse_cel_sort_spec(sort_spec: str) -> list[tuple[str, bool]]:
 @pure
 def compile_cel_sort_keys(
     sort_spec: str,
-) -> list[tuple[Any, bool]]:
+) -> list[tuple[CompiledCelExpression, bool]]:
     """Compile a sort specification into (program, is_descending) pairs.
 
     Raises MngrError if any sort expression is invalid CEL.
     """
     parsed = parse_cel_sort_spec(sort_spec)
     env = celpy.Environment()
-    compiled: list[tuple[Any, bool]] = []
+    compiled: list[tuple[CompiledCelExpression, bool]] = []
     for expression, is_descending in parsed:
         try:
-            ast = env.compile(expression)
-            prgm = env.program(ast)
-            compiled.append((prgm, is_descending))
+            compiled.append((compile_cel_expression(env, expression), is_descending))
         except CELParseError as e:
             raise MngrError(f"Invalid sort expression '{expression}': {e}") from e
     return compiled
 
 
 def evaluate_cel_sort_key(
-    program: Any,
-    cel_context: dict[str, Any],
+    program: CompiledCelExpression,
+    context: Mapping[str, Any],
 ) -> Any:
-    """Evaluate a single CEL sort key against a pre-built CEL context.
+    """Evaluate a single CEL sort key against a raw (unconverted) context.
 
     Returns the evaluated value, or None if evaluation fails.
     """
     try:
-        return program.evaluate(cel_context)
+        return program.evaluate_raw(context)
     except CELEvalError as e:
         logger.trace("CEL sort key evaluation failed: {}", e)
         return None
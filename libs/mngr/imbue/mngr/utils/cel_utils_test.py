@@ -5,9 +5,11 @@ import pytest
 from imbue.mngr.errors import MngrError
 from imbue.mngr.utils.cel_utils import apply_cel_filters_to_context
 from imbue.mngr.utils.cel_utils import build_cel_context
+from imbue.mngr.utils.cel_utils import build_lazy_cel_context
 from imbue.mngr.utils.cel_utils import compile_cel_filters
 from imbue.mngr.utils.cel_utils import compile_cel_sort_keys
 from imbue.mngr.utils.cel_utils import evaluate_cel_sort_key
+from imbue.mngr.utils.cel_utils import get_referenced_cel_names
 from imbue.mngr.utils.cel_utils import parse_cel_sort_spec
 
 
@@ -271,8 +273,7 @@ def test_evaluate_cel_sort_key_returns_value_for_existing_field() -> None:
     """evaluate_cel_sort_key should return the CEL value for a valid field."""
     compiled = compile_cel_sort_keys("name")
     program, _is_descending = compiled[0]
-    cel_ctx = build_cel_context({"name": "test-agent"})
-    result = evaluate_cel_sort_key(program, cel_ctx)
+    result = evaluate_cel_sort_key(program, {"name": "test-agent"})
     assert str(result) == "test-agent"
 
 
@@ -280,6 +281,35 @@ def test_evaluate_cel_sort_key_returns_none_for_missing_field() -> None:
     """evaluate_cel_sort_key should return None when the field does not exist."""
     compiled = compile_cel_sort_keys("nonexistent")
     program, _is_descending = compiled[0]
-    cel_ctx = build_cel_context({"name": "test-agent"})
-    result = evaluate_cel_sort_key(program, cel_ctx)
+    result = evaluate_cel_sort_key(program, {"name": "test-agent"})
     assert result is None
+
+
+def test_evaluate_cel_sort_key_falls_back_to_celpy_for_unsupported_expressions() -> None:
+    """evaluate_cel_sort_key should evaluate expressions the fast path does not handle."""
+    compiled = compile_cel_sort_keys("size(name)")
+    program, _is_descending = compiled[0]
+    assert program.fast_path is None
+    assert evaluate_cel_sort_key(program, {"name": "test-agent"}) == 10
+
+
+# =============================================================================
+# Tests for lazy CEL contexts
+# =============================================================================
+
+
+def test_build_lazy_cel_context_converts_only_referenced_names() -> None:
+    """build_lazy_cel_context should skip variables the expression does not reference."""
+    raw = {"name": "test-agent", "host": {"provider": "local"}, "host.alias": "h", "labels": {"team": "a"}}
+    cel_ctx = build_lazy_cel_context(raw, frozenset({"host"}))
+    assert set(cel_ctx) == {"host", "host.alias"}
+    assert cel_ctx["host"] == build_cel_context(raw)["host"]
+
+
+def test_get_referenced_cel_names_collects_top_level_variables() -> None:
+    """get_referenced_cel_names should return the union of top-level names across expressions."""
+    includes, excludes = compile_cel_filters(
+        include_filters=('host.provider == "local" && labels["team"].startsWith("a")',),
+        exclude_filters=("size(name) > 3",),
+    )
+    assert get_referenced_cel_names([*includes, *excludes]) == frozenset({"host", "labels", "name"})
@@ -6,6 +6,7 @@ import sys
 import threading
 import traceback
 from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 from typing import Final
@@ -17,6 +18,7 @@ from loguru import logger
 from pydantic import Field
 
 from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.logging import BufferedJsonlFileSink
 from imbue.imbue_common.logging import make_jsonl_file_sink
 from imbue.imbue_common.primitives import NonEmptyStr
 from imbue.mngr.primitives import LogLevel
@@ -41,6 +43,10 @@ class LoggingConfig(FrozenModel):
         default=10,
         description="Maximum size of each log file in MB",
     )
+    is_file_logging_buffered: bool = Field(
+        default=False,
+        description="Write file logs on a background thread in batches (error records are still flushed immediately)",
+    )
     console_level: LogLevel = Field(
         default=LogLevel.BUILD,
         description="Log level for console output",
@@ -81,6 +87,9 @@ class LoggingConfig(FrozenModel):
             file_level=override.file_level if override.file_level is not None else self.file_level,
             log_dir=override.log_dir if override.log_dir is not None else self.log_dir,
             max_log_size_mb=override.max_log_size_mb if override.max_log_size_mb is not None else self.max_log_size_mb,
+            is_file_logging_buffered=override.is_file_logging_buffered
+            if override.is_file_logging_buffered is not None
+            else self.is_file_logging_buffered,
             console_level=override.console_level if override.console_level is not None else self.console_level,
             log_file_path=override.log_file_path if override.log_file_path is not None else self.log_file_path,
             is_logging_commands=override.is_logging_commands
@@ -421,13 +430,26 @@ def setup_logging(
     # Use a callable sink (not a format function) to bypass loguru's colorizer,
     # which would otherwise choke on angle brackets in serialized extra data.
     loguru_file_level = LEVEL_MAP[config.file_level]
-    jsonl_sink = make_jsonl_file_sink(
-        file_path=str(log_file),
-        event_type=config.event_type,
-        event_source=config.event_source,
-        command=command,
-        max_size_bytes=config.max_log_size_mb * 1024 * 1024,
-    )
+    max_size_bytes = config.max_log_size_mb * 1024 * 1024
+    jsonl_sink: Callable[..., None] | BufferedJsonlFileSink
+    if config.is_file_logging_buffered:
+        # Loguru stops the sink (writing out anything still queued) when the
+        # handler is removed, which includes interpreter exit
+        jsonl_sink = BufferedJsonlFileSink.start(
+            file_path=str(log_file),
+            event_type=config.event_type,
+            event_source=config.event_source,
+            command=command,
+            max_size_bytes=max_size_bytes,
+        )
+    else:
+        jsonl_sink = make_jsonl_file_sink(
+            file_path=str(log_file),
+            event_type=config.event_type,
+            event_source=config.event_source,
+            command=command,
+            max_size_bytes=max_size_bytes,
+        )
     logger.add(
         jsonl_sink,
         level=loguru_file_level,
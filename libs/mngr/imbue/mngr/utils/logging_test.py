@@ -122,6 +122,21 @@ def test_setup_logging_writes_flat_jsonl_with_envelope_and_loguru_fields(temp_mn
     assert "thread_id" in parsed
 
 
+def test_setup_logging_with_buffered_file_logging_writes_events_on_removal(temp_mngr_ctx: MngrContext) -> None:
+    """Buffered file logging should write queued records once the handler is removed."""
+    log_dir = temp_mngr_ctx.config.default_host_dir / temp_mngr_ctx.config.logging.log_dir
+    logging_config = LoggingConfig(console_level=LogLevel.NONE, is_file_logging_buffered=True)
+
+    setup_logging(logging_config, default_host_dir=temp_mngr_ctx.config.default_host_dir, command="list")
+    logger.info("buffered message")
+    logger.remove()
+
+    events_file = log_dir / "logs" / "mngr" / "events.jsonl"
+    parsed = json.loads(events_file.read_text().strip().split("\n")[-1])
+    assert parsed["message"] == "buffered message"
+    assert parsed["command"] == "list"
+
+
 def test_setup_logging_uses_custom_log_file_path(tmp_path: Path, temp_mngr_ctx: MngrContext) -> None:
     """setup_logging should create log file at custom path when log_file_path is provided."""
     custom_log_path = tmp_path / "custom_log.jsonl"
@@ -248,7 +248,7 @@ class HeadlessClaude(NoPermissionsClaudeAgent, StreamingHeadlessAgentMixin):
 
     def _get_stdout_path(self) -> Path:
         """Return the path to the stdout.jsonl file for this agent."""
-        return self._get_agent_dir() / "stdout.jsonl"
+        return self.get_agent_dir() / "stdout.jsonl"
 
     def _is_agent_finished(self) -> bool:
         """Check if the agent process has exited (tmux lifecycle) or is no longer running."""
@@ -47,6 +47,7 @@ from imbue.mngr.hosts.common import is_macos
 from imbue.mngr.interfaces.agent import AgentInterface
 from imbue.mngr.interfaces.data_types import FileTransferSpec
 from imbue.mngr.interfaces.data_types import RelativePath
+from imbue.mngr.interfaces.host import AgentStateFileFieldGenerator
 from imbue.mngr.interfaces.host import CreateAgentOptions
 from imbue.mngr.interfaces.host import OnlineHostInterface
 from imbue.mngr.plugins.hookspecs import OnBeforeCreateArgs
@@ -938,7 +939,7 @@ class ClaudeAgent(BaseAgent[ClaudeAgentConfig]):
         This directory replaces ~/.claude/ for this agent when CLAUDE_CONFIG_DIR
         is set. Located at $MNGR_AGENT_STATE_DIR/plugin/claude/anthropic/.
         """
-        return self._get_agent_dir() / "plugin" / "claude" / "anthropic"
+        return self.get_agent_dir() / "plugin" / "claude" / "anthropic"
 
     def modify_env_vars(self, host: OnlineHostInterface, env_vars: dict[str, str]) -> None:
         """Add CLAUDE_CONFIG_DIR and optionally enable common transcript emission."""
@@ -956,7 +957,7 @@ class ClaudeAgent(BaseAgent[ClaudeAgentConfig]):
         """
         state = super().get_lifecycle_state()
         if state == AgentLifecycleState.RUNNING:
-            if self._check_file_exists(self._get_agent_dir() / "permissions_waiting"):
+            if self._check_file_exists(self.get_agent_dir() / "permissions_waiting"):
                 return AgentLifecycleState.WAITING
         return state
 
@@ -1002,7 +1003,7 @@ class ClaudeAgent(BaseAgent[ClaudeAgentConfig]):
         and captures the tmux pane for known dialog indicators.
         Raises DialogDetectedError if any are found.
         """
-        if self._check_file_exists(self._get_agent_dir() / "permissions_waiting"):
+        if self._check_file_exists(self.get_agent_dir() / "permissions_waiting"):
             raise DialogDetectedError(str(self.name), "permission dialog")
 
         content = self._capture_pane_content(tmux_target)
@@ -1027,7 +1028,7 @@ class ClaudeAgent(BaseAgent[ClaudeAgentConfig]):
             timeout = _READY_SIGNAL_TIMEOUT_SECONDS
 
         # this file is removed when we start the agent, see assemble_command, and created by the SessionStart hook when the session is ready
-        session_started_path = self._get_agent_dir() / "session_started"
+        session_started_path = self.get_agent_dir() / "session_started"
 
         with log_span("Waiting for session_started file (timeout={}s)", timeout):
             # Run the start action (e.g., start the agent)
@@ -1492,7 +1493,7 @@ class ClaudeAgent(BaseAgent[ClaudeAgentConfig]):
 
             # Provision background task scripts to the agent state directory
             provision_backgroun_script_thread = concurrency_group.start_new_thread(
-                _provision_background_scripts, (host, self._get_agent_dir(), concurrency_group)
+                _provision_background_scripts, (host, self.get_agent_dir(), concurrency_group)
             )
 
             if host.is_local:
@@ -1622,7 +1623,7 @@ class ClaudeAgent(BaseAgent[ClaudeAgentConfig]):
         stale_index = dest_project_dir / "sessions-index.json"
         host.execute_idempotent_command(f"rm -f {shlex.quote(str(stale_index))}")
 
-        host.write_text_file(self._get_agent_dir() / "claude_session_id", last_session_id)
+        host.write_text_file(self.get_agent_dir() / "claude_session_id", last_session_id)
         logger.info("Adopted {} session(s), active session: {}", len(adopt_session_args), last_session_id)
 
     def _transfer_source_plugin_data(
@@ -1638,7 +1639,7 @@ class ClaudeAgent(BaseAgent[ClaudeAgentConfig]):
         new agent.
         """
         source_plugin_dir = source_agent_state_dir / "plugin"
-        dest_plugin_dir = self._get_agent_dir() / "plugin"
+        dest_plugin_dir = self.get_agent_dir() / "plugin"
 
         if not source_plugin_dir.exists():
             logger.debug("No plugin directory in source agent, skipping clone transfer")
@@ -1765,16 +1766,7 @@ class WaitingReason(UpperCaseStrEnum):
     END_OF_TURN = auto()
 
 
-def _host_file_exists(host: OnlineHostInterface, path: Path) -> bool:
-    """Check if a file exists on the host without SSH overhead."""
-    try:
-        host.read_text_file(path)
-        return True
-    except FileNotFoundError:
-        return False
-
-
-def _waiting_reason(agent: AgentInterface, host: OnlineHostInterface) -> WaitingReason | None:
+def _waiting_reason_from_state_files(content_by_file_name: Mapping[str, str | None]) -> WaitingReason | None:
     """Return why the agent is waiting based on marker files, or None.
 
     Checks the agent state directory for marker files rather than calling
@@ -1784,14 +1776,20 @@ def _waiting_reason(agent: AgentInterface, host: OnlineHostInterface) -> Waiting
     - active file absent -> END_OF_TURN (idle, turn complete)
     - otherwise -> None (agent is actively running)
     """
-    agent_dir = host.host_dir / "agents" / str(agent.id)
-    if _host_file_exists(host, agent_dir / "permissions_waiting"):
+    if content_by_file_name["permissions_waiting"] is not None:
         return WaitingReason.PERMISSIONS
-    if not _host_file_exists(host, agent_dir / "active"):
+    if content_by_file_name["active"] is None:
         return WaitingReason.END_OF_TURN
     return None
 
 
+# Declares its marker files so that listing can read them for all agents on a host at once
+_waiting_reason = AgentStateFileFieldGenerator(
+    file_names=("permissions_waiting", "active"),
+    compute=_waiting_reason_from_state_files,
+)
+
+
 @hookimpl
 def agent_field_generators() -> tuple[str, dict[str, Callable[[AgentInterface, OnlineHostInterface], Any]]] | None:
     """Expose Claude-specific agent fields for listing."""
@@ -26,6 +26,7 @@ from imbue.mngr.errors import PluginMngrError
 from imbue.mngr.errors import UserInputError
 from imbue.mngr.hosts.host import Host
 from imbue.mngr.interfaces.host import AgentEnvironmentOptions
+from imbue.mngr.interfaces.host import AgentStateFileFieldGenerator
 from imbue.mngr.interfaces.host import CreateAgentOptions
 from imbue.mngr.interfaces.host import NewHostOptions
 from imbue.mngr.interfaces.host import OnlineHostInterface
@@ -633,16 +634,16 @@ def test_get_lifecycle_state_returns_waiting_when_permissions_waiting(
 ) -> None:
     """ClaudeAgent.get_lifecycle_state downgrades RUNNING to WAITING when permissions_waiting exists."""
     agent, _ = make_claude_agent(local_provider, tmp_path, temp_mngr_ctx)
-    agent._get_agent_dir().mkdir(parents=True, exist_ok=True)
+    agent.get_agent_dir().mkdir(parents=True, exist_ok=True)
 
     with patch.object(BaseAgent, "get_lifecycle_state", return_value=AgentLifecycleState.RUNNING):
         assert agent.get_lifecycle_state() == AgentLifecycleState.RUNNING
 
-        (agent._get_agent_dir() / "permissions_waiting").touch()
+        (agent.get_agent_dir() / "permissions_waiting").touch()
         assert agent.get_lifecycle_state() == AgentLifecycleState.WAITING
 
     # Non-RUNNING states should pass through unchanged
-    (agent._get_agent_dir() / "permissions_waiting").touch()
+    (agent.get_agent_dir() / "permissions_waiting").touch()
     for state in (
         AgentLifecycleState.STOPPED,
         AgentLifecycleState.WAITING,
@@ -664,6 +665,20 @@ def test_agent_field_generators_returns_correct_structure() -> None:
     assert callable(generators["waiting_reason"])
 
 
+def test_agent_field_generators_waiting_reason_declares_its_marker_files() -> None:
+    """waiting_reason declares its marker files so listing can batch-read them for all agents."""
+    result = agent_field_generators()
+    assert result is not None
+    _, generators = result
+    waiting_reason = generators["waiting_reason"]
+
+    assert isinstance(waiting_reason, AgentStateFileFieldGenerator)
+    assert set(waiting_reason.file_names) == {"permissions_waiting", "active"}
+    assert waiting_reason.compute({"permissions_waiting": "", "active": ""}) == WaitingReason.PERMISSIONS
+    assert waiting_reason.compute({"permissions_waiting": None, "active": None}) == WaitingReason.END_OF_TURN
+    assert waiting_reason.compute({"permissions_waiting": None, "active": ""}) is None
+
+
 def test_agent_field_generators_waiting_reason_returns_permissions(
     local_provider: LocalProviderInstance, tmp_path: Path, temp_mngr_ctx: MngrContext
 ) -> None:
@@ -2435,7 +2450,7 @@ def test_on_after_provisioning_adopts_session_by_id(
     (project_dir / f"{target_session_id}.jsonl").write_text('{"type":"message"}\n')
     (project_dir / "CLAUDE.md").write_text("# Memory\n")
 
-    agent_state_dir = agent._get_agent_dir()
+    agent_state_dir = agent.get_agent_dir()
     agent_state_dir.mkdir(parents=True, exist_ok=True)
 
     options = CreateAgentOptions(
@@ -2478,7 +2493,7 @@ def test_on_after_provisioning_raises_when_session_not_found(
 
     (Path.home() / ".claude" / "projects" / "some-project").mkdir(parents=True)
 
-    agent_state_dir = agent._get_agent_dir()
+    agent_state_dir = agent.get_agent_dir()
     agent_state_dir.mkdir(parents=True, exist_ok=True)
 
     options = CreateAgentOptions(
@@ -2510,7 +2525,7 @@ def test_on_after_provisioning_finds_session_despite_claude_config_dir(
     agent_config_dir = tmp_path / "agent_claude_config"
     (agent_config_dir / "projects").mkdir(parents=True)
 
-    agent_state_dir = agent._get_agent_dir()
+    agent_state_dir = agent.get_agent_dir()
     agent_state_dir.mkdir(parents=True, exist_ok=True)
 
     options = CreateAgentOptions(
@@ -2545,7 +2560,7 @@ def test_on_after_provisioning_adopts_session_from_jsonl_path(
     session_file = project_dir / "abc123-def456.jsonl"
     session_file.write_text('{"type":"message"}\n')
 
-    agent_state_dir = agent._get_agent_dir()
+    agent_state_dir = agent.get_agent_dir()
     agent_state_dir.mkdir(parents=True, exist_ok=True)
 
     options = CreateAgentOptions(
@@ -2577,7 +2592,7 @@ def test_transfer_source_plugin_data_copies_plugin_dir(
     """_transfer_source_plugin_data should copy the plugin/ directory via rsync."""
     agent, host = make_claude_agent(local_provider, tmp_path, temp_mngr_ctx)
 
-    dest_dir = agent._get_agent_dir()
+    dest_dir = agent.get_agent_dir()
     dest_dir.mkdir(parents=True, exist_ok=True)
     (dest_dir / "data.json").write_text('{"id": "new-agent"}')
 
@@ -2608,7 +2623,7 @@ def test_transfer_source_plugin_data_skips_when_no_plugin_dir(
     """_transfer_source_plugin_data should skip gracefully when source has no plugin/ dir."""
     agent, host = make_claude_agent(local_provider, tmp_path, temp_mngr_ctx)
 
-    dest_dir = agent._get_agent_dir()
+    dest_dir = agent.get_agent_dir()
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     source_dir = tmp_path / "source_agent_state"
@@ -263,7 +263,7 @@ class ClaudeMindAgent(ClaudeAgent):
         role_dir_abs = f"{work_dir_abs}/{active_role}"
         self._configure_role_settings(host, active_role, role_dir_abs, provisioning)
 
-        agent_state_dir = self._get_agent_dir()
+        agent_state_dir = self.get_agent_dir()
 
         provision_supporting_services(host, agent_state_dir, provisioning)
         provision_llm_tools(host, agent_state_dir, provisioning)
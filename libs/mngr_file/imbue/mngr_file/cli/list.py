@@ -1,6 +1,5 @@
 import json
 import shlex
-from collections import deque
 from collections.abc import Sequence
 from datetime import datetime
 from datetime import timezone
@@ -25,6 +24,7 @@ from imbue.mngr.cli.output_helpers import write_human_line
 from imbue.mngr.config.data_types import CommonCliOptions
 from imbue.mngr.config.data_types import OutputOptions
 from imbue.mngr.errors import MngrError
+from imbue.mngr.interfaces.data_types import VolumeFile
 from imbue.mngr.interfaces.data_types import VolumeFileType
 from imbue.mngr.interfaces.host import OnlineHostInterface
 from imbue.mngr.interfaces.volume import Volume
@@ -186,13 +186,9 @@ def list_files_on_host(
     return parse_list_output(result.stdout)
 
 
-def _list_volume_directory(
-    volume: Volume,
-    vol_path: str,
-) -> list[FileEntry]:
-    """List immediate children of a directory on a volume."""
-    volume_files = volume.listdir(vol_path)
-
+@pure
+def _volume_files_to_file_entries(volume_files: Sequence[VolumeFile]) -> list[FileEntry]:
+    """Convert volume listing entries into FileEntry objects."""
     entries: list[FileEntry] = []
     for vf in volume_files:
         name = vf.path.rsplit("/", 1)[-1] if "/" in vf.path else vf.path
@@ -228,22 +224,14 @@ def list_files_on_volume(
     vol_path: str,
     is_recursive: bool,
 ) -> list[FileEntry]:
-    """List files in a directory using a Volume interface."""
-    with log_span("Listing files on volume"):
-        entries = _list_volume_directory(volume, vol_path)
+    """List files in a directory using a Volume interface.
 
-    if not is_recursive:
-        return entries
-
-    # Recurse into subdirectories via BFS
-    directories_to_visit = deque(e.path for e in entries if e.file_type == FileType.DIRECTORY)
-    while directories_to_visit:
-        subdir_path = directories_to_visit.popleft()
-        sub_entries = _list_volume_directory(volume, subdir_path)
-        entries.extend(sub_entries)
-        directories_to_visit.extend(e.path for e in sub_entries if e.file_type == FileType.DIRECTORY)
-
-    return entries
+    Recursive listings fetch the whole tree with a single listdir_recursive call
+    rather than one listdir per subdirectory.
+    """
+    with log_span("Listing files on volume"):
+        volume_files = volume.listdir_recursive(vol_path) if is_recursive else volume.listdir(vol_path)
+    return _volume_files_to_file_entries(volume_files)
 
 
 @pure
@@ -261,3 +261,17 @@ def test_list_files_on_volume_recursive(tmp_path: Path) -> None:
     assert "nested.txt" in names
     assert "deep" in names
     assert "deep.txt" in names
+
+
+def test_list_files_on_volume_recursive_reports_full_paths_and_mtimes(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "leaf.txt").write_text("leaf")
+
+    volume = LocalVolume(root_path=root)
+    entries = list_files_on_volume(volume=volume, vol_path="a", is_recursive=True)
+
+    assert [e.path for e in entries] == ["a/b", "a/b/leaf.txt"]
+    leaf_entry = entries[1]
+    assert leaf_entry.size == 4
+    assert leaf_entry.modified is not None
@@ -169,6 +169,10 @@ class KanpanPluginConfig(PluginConfig):
         default=60.0,
         description="Minimum seconds before retrying after a failed full refresh",
     )
+    pr_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="Seconds a repo's fetched PR data is reused by later automatic full refreshes (0 disables reuse)",
+    )
     on_before_refresh: dict[str, RefreshHook] = Field(
         default_factory=dict,
         description="Hook commands to run before each full refresh, keyed by identifier",
@@ -196,6 +200,9 @@ class KanpanPluginConfig(PluginConfig):
             if override.retry_cooldown_seconds is not None
             else self.retry_cooldown_seconds
         )
+        merged_pr_cache_ttl = (
+            override.pr_cache_ttl_seconds if override.pr_cache_ttl_seconds is not None else self.pr_cache_ttl_seconds
+        )
         merged_on_before_refresh = {**self.on_before_refresh, **override.on_before_refresh}
         merged_on_after_refresh = {**self.on_after_refresh, **override.on_after_refresh}
         return KanpanPluginConfig(
@@ -205,6 +212,7 @@ class KanpanPluginConfig(PluginConfig):
             column_order=merged_column_order,
             refresh_interval_seconds=merged_refresh_interval,
             retry_cooldown_seconds=merged_auto_cooldown,
+            pr_cache_ttl_seconds=merged_pr_cache_ttl,
             on_before_refresh=merged_on_before_refresh,
             on_after_refresh=merged_on_after_refresh,
         )
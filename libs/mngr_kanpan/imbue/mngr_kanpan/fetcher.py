@@ -1,15 +1,25 @@
 import os
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any
+from typing import Final
+from typing import TypeVar
 from urllib.parse import urlparse
 
 from loguru import logger
+from pydantic import Field
+from pydantic import PrivateAttr
 
 from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
 from imbue.concurrency_group.errors import ProcessError
+from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
 from imbue.concurrency_group.local_process import RunningProcess
+from imbue.imbue_common.frozen_model import FrozenModel
 from imbue.imbue_common.model_update import to_update
+from imbue.imbue_common.mutable_model import MutableModel
 from imbue.imbue_common.pure import pure
 from imbue.mngr.api.discover import discover_hosts_and_agents
 from imbue.mngr.api.find import find_and_maybe_start_agent_by_name_or_id
@@ -26,15 +36,86 @@ from imbue.mngr_kanpan.data_types import GitHubData
 from imbue.mngr_kanpan.data_types import PrInfo
 from imbue.mngr_kanpan.data_types import PrState
 from imbue.mngr_kanpan.data_types import RefreshHook
+from imbue.mngr_kanpan.github import FetchPrsResult
 from imbue.mngr_kanpan.github import fetch_all_prs
 
 PLUGIN_NAME = "kanpan"
 
+# Upper bound on concurrent gh / git subprocesses started by a single refresh
+_MAX_FETCH_WORKERS: Final[int] = 16
+
+# (path, inode, mtime_ns, size) for each file that determines a work dir's commits-ahead count.
+# Missing files are recorded with -1 for every stat field.
+GitRefFingerprint = tuple[tuple[str, int, int, int], ...]
+
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+
+class _CommitsAheadCacheEntry(FrozenModel):
+    """A commits-ahead count together with the git ref state it was computed from."""
+
+    fingerprint: GitRefFingerprint = Field(description="Git ref state of the work dir when the count was taken")
+    commits_ahead: int | None = Field(description="The cached commits-ahead count")
+
+
+class KanpanFetchCache(MutableModel):
+    """Data reused across kanpan refreshes so that unchanged data is not re-fetched.
+
+    PR lists are kept per repo for pr_ttl_seconds (or until clear_prs is called,
+    e.g. for a manual refresh). Commits-ahead counts are kept
+    per work dir for as long as the work dir's HEAD and refs are unchanged.
+    Safe to share between the refresh threads.
+    """
+
+    pr_ttl_seconds: float = Field(
+        description="Seconds a successful PR fetch for a repo is reused (0 disables PR caching)",
+    )
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _prs_by_repo: dict[str, tuple[float, FetchPrsResult]] = PrivateAttr(default_factory=dict)
+    _commits_ahead_by_work_dir: dict[Path, _CommitsAheadCacheEntry] = PrivateAttr(default_factory=dict)
+
+    def get_prs(self, repo_path: str) -> FetchPrsResult | None:
+        """Return the cached PRs for a repo, or None if there are none younger than the TTL."""
+        with self._lock:
+            cached = self._prs_by_repo.get(repo_path)
+        if cached is None:
+            return None
+        fetched_at, pr_result = cached
+        if time.monotonic() - fetched_at >= self.pr_ttl_seconds:
+            return None
+        return pr_result
+
+    def store_prs(self, repo_path: str, pr_result: FetchPrsResult) -> None:
+        with self._lock:
+            self._prs_by_repo[repo_path] = (time.monotonic(), pr_result)
+
+    def clear_prs(self) -> None:
+        """Forget every cached PR list, so that the next fetch gets fresh PR data for every repo."""
+        with self._lock:
+            self._prs_by_repo.clear()
+
+    def get_commits_ahead(self, work_dir: Path, fingerprint: GitRefFingerprint) -> _CommitsAheadCacheEntry | None:
+        """Return the cached commits-ahead entry for a work dir if its ref state still matches."""
+        with self._lock:
+            entry = self._commits_ahead_by_work_dir.get(work_dir)
+        if entry is None or entry.fingerprint != fingerprint:
+            return None
+        return entry
+
+    def store_commits_ahead(self, work_dir: Path, fingerprint: GitRefFingerprint, commits_ahead: int | None) -> None:
+        with self._lock:
+            self._commits_ahead_by_work_dir[work_dir] = _CommitsAheadCacheEntry(
+                fingerprint=fingerprint, commits_ahead=commits_ahead
+            )
+
 
 def fetch_agent_snapshot(
     mngr_ctx: MngrContext,
     include_filters: tuple[str, ...] = (),
     exclude_filters: tuple[str, ...] = (),
+    cache: KanpanFetchCache | None = None,
 ) -> BoardSnapshot:
     """Fetch agent state: agents, git branches, commits ahead, mute state.
 
@@ -42,7 +123,6 @@ def fetch_agent_snapshot(
     """
     start_time = time.monotonic()
     errors: list[str] = []
-    cg = mngr_ctx.concurrency_group
 
     result = list_agents(
         mngr_ctx,
@@ -55,13 +135,12 @@ def fetch_agent_snapshot(
         errors.append(f"{error.exception_type}: {error.message}")
 
     muted_agents = _load_muted_agents(mngr_ctx)
+    local_work_dirs = [_get_local_work_dir(agent) for agent in result.agents]
+    commits_ahead_by_work_dir = _get_commits_ahead_by_work_dir(mngr_ctx, local_work_dirs, cache)
 
     entries: list[AgentBoardEntry] = []
-    for agent in result.agents:
+    for agent, local_work_dir in zip(result.agents, local_work_dirs, strict=True):
         branch = agent.initial_branch
-        is_local = agent.host.provider_name == LOCAL_PROVIDER_NAME
-        local_work_dir = agent.work_dir if is_local and agent.work_dir.exists() else None
-        commits_ahead = _get_commits_ahead(local_work_dir, cg) if local_work_dir is not None else None
         entries.append(
             AgentBoardEntry(
                 name=agent.name,
@@ -69,7 +148,7 @@ def fetch_agent_snapshot(
                 provider_name=agent.host.provider_name,
                 work_dir=local_work_dir,
                 branch=branch,
-                commits_ahead=commits_ahead,
+                commits_ahead=commits_ahead_by_work_dir.get(local_work_dir) if local_work_dir is not None else None,
                 is_muted=agent.name in muted_agents,
                 column_data=ColumnData(
                     labels=agent.labels,
@@ -87,12 +166,17 @@ def fetch_agent_snapshot(
     )
 
 
-def fetch_github_data(mngr_ctx: MngrContext, agents: list[AgentDetails]) -> GitHubData:
+def fetch_github_data(
+    mngr_ctx: MngrContext,
+    agents: list[AgentDetails],
+    cache: KanpanFetchCache | None = None,
+) -> GitHubData:
     """Fetch GitHub PR data from all unique repos and build the PR-to-branch index.
 
     Discovers repos from each agent's 'remote' label (set at creation time).
-    Fetches PRs once per unique repo via gh --repo (no local cwd needed).
-    Agents without the 'remote' label are skipped.
+    Fetches PRs once per unique repo via gh --repo (no local cwd needed), with
+    the repos fetched concurrently. Repos with a fresh entry in the cache are
+    not re-fetched. Agents without the 'remote' label are skipped.
     """
     cg = mngr_ctx.concurrency_group
     errors: list[str] = []
@@ -108,8 +192,9 @@ def fetch_github_data(mngr_ctx: MngrContext, agents: list[AgentDetails]) -> GitH
     pr_by_repo_branch: dict[str, dict[str, PrInfo]] = {}
     repo_pr_loaded: dict[str, bool] = {}
 
-    for repo_path in all_repos:
-        pr_result = fetch_all_prs(cg, repo=repo_path)
+    sorted_repos = sorted(all_repos)
+    pr_results = _map_concurrently(cg, "kanpan_fetch_prs", _fetch_repo_prs, sorted_repos, cg, cache)
+    for repo_path, pr_result in zip(sorted_repos, pr_results, strict=True):
         if pr_result.error is None:
             repo_index = _build_pr_branch_index(pr_result.prs)
             if repo_index:
@@ -164,10 +249,12 @@ def fetch_board_snapshot(
     on_before_refresh: list[RefreshHook] | None,
     on_after_refresh: list[RefreshHook] | None,
     prev_snapshot: BoardSnapshot | None,
+    cache: KanpanFetchCache | None = None,
 ) -> BoardSnapshot:
     """Full fetch: local snapshot enriched with GitHub PR data, with optional refresh hooks.
 
     Lists agents once and uses the result for both local and remote fetching.
+    The PR fetch and the per-agent commits-ahead checks run concurrently.
     Before-hooks run against the previous snapshot's entries (skipped when prev_snapshot is None).
     After-hooks run against the new snapshot's entries.
     Hook errors are appended to the snapshot's errors but do not block the refresh.
@@ -190,17 +277,23 @@ def fetch_board_snapshot(
         errors.append(f"{error.exception_type}: {error.message}")
 
     muted_agents = _load_muted_agents(mngr_ctx)
-
-    # Fetch remote data (GitHub PRs)
-    remote = fetch_github_data(mngr_ctx, result.agents)
+    local_work_dirs = [_get_local_work_dir(agent) for agent in result.agents]
+
+    # Fetch remote data (GitHub PRs), overlapping it with the local git checks when there are any
+    if any(work_dir is not None for work_dir in local_work_dirs):
+        with ConcurrencyGroupExecutor(parent_cg=cg, name="kanpan_fetch_remote", max_workers=1) as executor:
+            remote_future = executor.submit(fetch_github_data, mngr_ctx, result.agents, cache)
+            commits_ahead_by_work_dir = _get_commits_ahead_by_work_dir(mngr_ctx, local_work_dirs, cache)
+        remote = remote_future.result()
+    else:
+        remote = fetch_github_data(mngr_ctx, result.agents, cache)
+        commits_ahead_by_work_dir = {}
 
     # Build board entries with both local and remote info
     entries: list[AgentBoardEntry] = []
-    for agent in result.agents:
+    for agent, local_work_dir in zip(result.agents, local_work_dirs, strict=True):
         branch = agent.initial_branch
-        is_local = agent.host.provider_name == LOCAL_PROVIDER_NAME
-        local_work_dir = agent.work_dir if is_local and agent.work_dir.exists() else None
-        commits_ahead = _get_commits_ahead(local_work_dir, cg) if local_work_dir is not None else None
+        commits_ahead = commits_ahead_by_work_dir.get(local_work_dir) if local_work_dir is not None else None
         agent_repo = _get_agent_repo_path(agent)
         pr = _lookup_pr(remote, agent_repo, branch)
         agent_prs_loaded = agent_repo is not None and remote.repo_pr_loaded.get(agent_repo) is True
@@ -338,6 +431,132 @@ def _is_agent_muted(certified_data: Any) -> bool:
     return certified_data.get("plugin", {}).get(PLUGIN_NAME, {}).get("muted", False)
 
 
+def _map_concurrently(
+    cg: ConcurrencyGroup,
+    name: str,
+    fn: Callable[..., _ResultT],
+    items: list[_ItemT],
+    *extra_args: Any,
+) -> list[_ResultT]:
+    """Call fn(item, *extra_args) for each item on the concurrency group's threads, returning results in item order.
+
+    A single item is handled on the calling thread since there is nothing to overlap it with.
+    """
+    if len(items) <= 1:
+        return [fn(item, *extra_args) for item in items]
+    futures: list[Future[_ResultT]] = []
+    with ConcurrencyGroupExecutor(parent_cg=cg, name=name, max_workers=_MAX_FETCH_WORKERS) as executor:
+        for item in items:
+            futures.append(executor.submit(fn, item, *extra_args))
+    return [future.result() for future in futures]
+
+
+def _fetch_repo_prs(repo_path: str, cg: ConcurrencyGroup, cache: KanpanFetchCache | None) -> FetchPrsResult:
+    """Fetch the PRs for a repo, reusing a fresh cached result when there is one.
+
+    Failed fetches are not cached, so they are retried on the next refresh.
+    """
+    if cache is not None:
+        cached = cache.get_prs(repo_path)
+        if cached is not None:
+            return cached
+    pr_result = fetch_all_prs(cg, repo=repo_path)
+    if cache is not None and pr_result.error is None:
+        cache.store_prs(repo_path, pr_result)
+    return pr_result
+
+
+def _get_local_work_dir(agent: AgentDetails) -> Path | None:
+    """Return the agent's work dir if it is on the local host and exists."""
+    is_local = agent.host.provider_name == LOCAL_PROVIDER_NAME
+    return agent.work_dir if is_local and agent.work_dir.exists() else None
+
+
+def _get_commits_ahead_by_work_dir(
+    mngr_ctx: MngrContext,
+    work_dirs: list[Path | None],
+    cache: KanpanFetchCache | None,
+) -> dict[Path, int | None]:
+    """Get the commits-ahead count of each (deduplicated) work dir concurrently."""
+    cg = mngr_ctx.concurrency_group
+    unique_work_dirs = sorted({work_dir for work_dir in work_dirs if work_dir is not None})
+    counts = _map_concurrently(cg, "kanpan_commits_ahead", _get_cached_commits_ahead, unique_work_dirs, cg, cache)
+    return dict(zip(unique_work_dirs, counts, strict=True))
+
+
+def _get_cached_commits_ahead(work_dir: Path, cg: ConcurrencyGroup, cache: KanpanFetchCache | None) -> int | None:
+    """Get the commits-ahead count, reusing the cached count while the work dir's refs are unchanged."""
+    fingerprint = get_git_ref_fingerprint(work_dir) if cache is not None else None
+    if cache is None or fingerprint is None:
+        return _get_commits_ahead(work_dir, cg)
+    cached = cache.get_commits_ahead(work_dir, fingerprint)
+    if cached is not None:
+        return cached.commits_ahead
+    commits_ahead = _get_commits_ahead(work_dir, cg)
+    # Only keep the count if nothing moved while git was running
+    if get_git_ref_fingerprint(work_dir) == fingerprint:
+        cache.store_commits_ahead(work_dir, fingerprint, commits_ahead)
+    return commits_ahead
+
+
+def get_git_ref_fingerprint(work_dir: Path) -> GitRefFingerprint | None:
+    """Fingerprint the files that determine how far a work dir's HEAD is ahead of its upstream.
+
+    Covers HEAD, the local and remote-tracking refs (loose and packed) and the
+    repo config (which holds the upstream setting). Git replaces these files
+    rather than editing them in place, so the inode changes on every update.
+    Returns None when the work dir is not the top level of a git checkout.
+    """
+    git_dirs = _resolve_git_dirs(work_dir)
+    if git_dirs is None:
+        return None
+    git_dir, common_dir = git_dirs
+    paths = [
+        git_dir / "HEAD",
+        common_dir / "packed-refs",
+        common_dir / "config",
+        *_walk_ref_paths(common_dir / "refs" / "heads"),
+        *_walk_ref_paths(common_dir / "refs" / "remotes"),
+    ]
+    return tuple(_stat_for_fingerprint(path) for path in paths)
+
+
+def _resolve_git_dirs(work_dir: Path) -> tuple[Path, Path] | None:
+    """Return (git dir, common dir) for a checkout; they differ for linked worktrees."""
+    dot_git = work_dir / ".git"
+    try:
+        if dot_git.is_dir():
+            git_dir = dot_git
+        else:
+            content = dot_git.read_text().strip()
+            if not content.startswith("gitdir: "):
+                return None
+            git_dir = work_dir / content.removeprefix("gitdir: ").strip()
+        commondir_file = git_dir / "commondir"
+        common_dir = git_dir / commondir_file.read_text().strip() if commondir_file.exists() else git_dir
+    except OSError:
+        return None
+    return git_dir, common_dir
+
+
+def _walk_ref_paths(refs_dir: Path) -> list[Path]:
+    """List a ref directory and everything under it (directories are included so deletions show up)."""
+    paths = [refs_dir]
+    for dir_path, dir_names, file_names in os.walk(refs_dir):
+        dir_names.sort()
+        paths.extend(Path(dir_path) / name for name in dir_names)
+        paths.extend(Path(dir_path) / name for name in sorted(file_names))
+    return paths
+
+
+def _stat_for_fingerprint(path: Path) -> tuple[str, int, int, int]:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return (str(path), -1, -1, -1)
+    return (str(path), stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+
 def _get_commits_ahead(work_dir: Path | None, cg: ConcurrencyGroup) -> int | None:
     """Get the number of commits the local branch is ahead of its remote tracking branch.
 
@@ -1,18 +1,22 @@
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.mngr.interfaces.data_types import AgentDetails
 from imbue.mngr.primitives import AgentLifecycleState
 from imbue.mngr.primitives import AgentName
 from imbue.mngr.primitives import ProviderInstanceName
 from imbue.mngr.utils.testing import init_git_repo_with_config
+from imbue.mngr.utils.testing import run_git_command
 from imbue.mngr_kanpan.data_types import AgentBoardEntry
 from imbue.mngr_kanpan.data_types import BoardSnapshot
 from imbue.mngr_kanpan.data_types import ColumnData
 from imbue.mngr_kanpan.data_types import GitHubData
 from imbue.mngr_kanpan.data_types import PrState
 from imbue.mngr_kanpan.data_types import RefreshHook
+from imbue.mngr_kanpan.fetcher import KanpanFetchCache
 from imbue.mngr_kanpan.fetcher import _build_hook_env
 from imbue.mngr_kanpan.fetcher import _build_pr_branch_index
 from imbue.mngr_kanpan.fetcher import _pr_priority
@@ -20,6 +24,7 @@ from imbue.mngr_kanpan.fetcher import enrich_snapshot_with_github_data
 from imbue.mngr_kanpan.fetcher import fetch_agent_snapshot
 from imbue.mngr_kanpan.fetcher import fetch_board_snapshot
 from imbue.mngr_kanpan.fetcher import fetch_github_data
+from imbue.mngr_kanpan.fetcher import get_git_ref_fingerprint
 from imbue.mngr_kanpan.fetcher import run_refresh_hooks
 from imbue.mngr_kanpan.github import FetchPrsResult
 from imbue.mngr_kanpan.testing import make_agent_details
@@ -113,7 +118,7 @@ def test_fetch_github_data_skips_agents_without_remote_label(tmp_path: Path) ->
     assert result.pr_by_repo_branch["org/repo"]["mngr/feature"] == pr
 
 
-def test_fetch_github_data_fetches_per_repo(tmp_path: Path) -> None:
+def test_fetch_github_data_fetches_per_repo(tmp_path: Path, cg: ConcurrencyGroup) -> None:
     """Agents in different repos trigger separate PR fetches."""
     dir_a = tmp_path / "repo-a"
     dir_a.mkdir()
@@ -148,6 +153,7 @@ def test_fetch_github_data_fetches_per_repo(tmp_path: Path) -> None:
         return FetchPrsResult(prs=(), error=f"unexpected repo: {repo}")
 
     mngr_ctx = MagicMock()
+    mngr_ctx.concurrency_group = cg
 
     with patch("imbue.mngr_kanpan.fetcher.fetch_all_prs", side_effect=mock_fetch_prs):
         result = fetch_github_data(mngr_ctx, [agent_a, agent_b])
@@ -185,7 +191,7 @@ def test_fetch_github_data_deduplicates_repos(tmp_path: Path) -> None:
     assert result.repo_pr_loaded["org/repo"] is True
 
 
-def test_fetch_github_data_partial_failure(tmp_path: Path) -> None:
+def test_fetch_github_data_partial_failure(tmp_path: Path, cg: ConcurrencyGroup) -> None:
     """If one repo fails to fetch PRs, others still succeed."""
     good_dir = tmp_path / "good"
     good_dir.mkdir()
@@ -213,6 +219,7 @@ def test_fetch_github_data_partial_failure(tmp_path: Path) -> None:
         return FetchPrsResult(prs=(), error="gh pr list failed: auth required")
 
     mngr_ctx = MagicMock()
+    mngr_ctx.concurrency_group = cg
 
     with patch("imbue.mngr_kanpan.fetcher.fetch_all_prs", side_effect=mock_fetch_prs):
         result = fetch_github_data(mngr_ctx, [agent_good, agent_bad])
@@ -248,6 +255,124 @@ def test_fetch_github_data_no_local_agents() -> None:
     assert result.pr_by_repo_branch["org/repo"]["mngr/feature"] == pr
 
 
+def _make_remote_agent(name: str, repo: str) -> AgentDetails:
+    return make_agent_details(name=name, provider_name="modal", labels={"remote": f"git@github.com:{repo}.git"})
+
+
+def test_fetch_github_data_reuses_cached_prs_within_ttl() -> None:
+    """A second fetch within the TTL is served from the cache."""
+    pr = make_pr_info(number=7, head_branch="mngr/feature")
+    cache = KanpanFetchCache(pr_ttl_seconds=3600.0)
+    mngr_ctx = MagicMock()
+
+    with patch(
+        "imbue.mngr_kanpan.fetcher.fetch_all_prs", return_value=FetchPrsResult(prs=(pr,), error=None)
+    ) as mock_fetch:
+        first = fetch_github_data(mngr_ctx, [_make_remote_agent("a1", "org/repo")], cache)
+        second = fetch_github_data(mngr_ctx, [_make_remote_agent("a1", "org/repo")], cache)
+
+    assert mock_fetch.call_count == 1
+    assert first.pr_by_repo_branch == second.pr_by_repo_branch
+    assert second.pr_by_repo_branch["org/repo"]["mngr/feature"] == pr
+
+
+def test_fetch_github_data_refetches_after_ttl() -> None:
+    cache = KanpanFetchCache(pr_ttl_seconds=0.0)
+    mngr_ctx = MagicMock()
+
+    with patch(
+        "imbue.mngr_kanpan.fetcher.fetch_all_prs", return_value=FetchPrsResult(prs=(), error=None)
+    ) as mock_fetch:
+        fetch_github_data(mngr_ctx, [_make_remote_agent("a1", "org/repo")], cache)
+        fetch_github_data(mngr_ctx, [_make_remote_agent("a1", "org/repo")], cache)
+
+    assert mock_fetch.call_count == 2
+
+
+def test_fetch_github_data_refetches_after_clearing_cached_prs() -> None:
+    cache = KanpanFetchCache(pr_ttl_seconds=3600.0)
+    mngr_ctx = MagicMock()
+
+    with patch(
+        "imbue.mngr_kanpan.fetcher.fetch_all_prs", return_value=FetchPrsResult(prs=(), error=None)
+    ) as mock_fetch:
+        fetch_github_data(mngr_ctx, [_make_remote_agent("a1", "org/repo")], cache)
+        cache.clear_prs()
+        fetch_github_data(mngr_ctx, [_make_remote_agent("a1", "org/repo")], cache)
+
+    assert mock_fetch.call_count == 2
+
+
+def test_fetch_github_data_does_not_cache_failed_fetches() -> None:
+    cache = KanpanFetchCache(pr_ttl_seconds=3600.0)
+    mngr_ctx = MagicMock()
+
+    with patch(
+        "imbue.mngr_kanpan.fetcher.fetch_all_prs", return_value=FetchPrsResult(prs=(), error="gh failed")
+    ) as mock_fetch:
+        fetch_github_data(mngr_ctx, [_make_remote_agent("a1", "org/repo")], cache)
+        result = fetch_github_data(mngr_ctx, [_make_remote_agent("a1", "org/repo")], cache)
+
+    assert mock_fetch.call_count == 2
+    assert result.repo_pr_loaded == {"org/repo": False}
+
+
+def test_fetch_github_data_fetches_repos_concurrently(cg: ConcurrencyGroup) -> None:
+    """Each repo's fetch waits for all the others to start, which only completes if they run concurrently."""
+    repos = ["org/repo-a", "org/repo-b", "org/repo-c"]
+    barrier = threading.Barrier(len(repos), timeout=10.0)
+
+    def mock_fetch_prs(cg: object, cwd: Path | None = None, repo: str | None = None) -> FetchPrsResult:
+        barrier.wait()
+        return FetchPrsResult(prs=(make_pr_info(number=1, head_branch=f"{repo}-branch"),), error=None)
+
+    mngr_ctx = MagicMock()
+    mngr_ctx.concurrency_group = cg
+    agents = [_make_remote_agent(f"agent-{idx}", repo) for idx, repo in enumerate(repos)]
+
+    with patch("imbue.mngr_kanpan.fetcher.fetch_all_prs", side_effect=mock_fetch_prs):
+        result = fetch_github_data(mngr_ctx, agents)
+
+    assert result.errors == ()
+    assert all(result.repo_pr_loaded[repo] for repo in repos)
+    assert result.pr_by_repo_branch["org/repo-b"]["org/repo-b-branch"].number == 1
+
+
+# === get_git_ref_fingerprint ===
+
+
+def test_get_git_ref_fingerprint_changes_when_head_moves(tmp_path: Path) -> None:
+    repo_dir = tmp_path / "repo"
+    init_git_repo_with_config(repo_dir)
+
+    before = get_git_ref_fingerprint(repo_dir)
+    assert before is not None
+    assert get_git_ref_fingerprint(repo_dir) == before
+
+    run_git_command(repo_dir, "commit", "--allow-empty", "-m", "second")
+
+    assert get_git_ref_fingerprint(repo_dir) != before
+
+
+def test_get_git_ref_fingerprint_supports_worktrees(tmp_path: Path) -> None:
+    repo_dir = tmp_path / "repo"
+    init_git_repo_with_config(repo_dir)
+    worktree_dir = tmp_path / "worktree"
+    run_git_command(repo_dir, "worktree", "add", "-b", "mngr/wt", str(worktree_dir))
+
+    before = get_git_ref_fingerprint(worktree_dir)
+    assert before is not None
+
+    # A fetch into the shared repo updates the remote-tracking refs the worktree's count depends on
+    run_git_command(repo_dir, "update-ref", "refs/remotes/origin/main", "HEAD")
+
+    assert get_git_ref_fingerprint(worktree_dir) != before
+
+
+def test_get_git_ref_fingerprint_returns_none_outside_a_checkout(tmp_path: Path) -> None:
+    assert get_git_ref_fingerprint(tmp_path) is None
+
+
 # === enrich_snapshot_with_github_data ===
 
 
@@ -379,6 +504,35 @@ def test_fetch_agent_snapshot_entries_have_no_pr() -> None:
     assert snapshot.fetch_time_seconds > 0
 
 
+def test_fetch_agent_snapshot_reuses_commits_ahead_until_refs_change(tmp_path: Path, cg: ConcurrencyGroup) -> None:
+    repo_dir = tmp_path / "repo"
+    init_git_repo_with_config(repo_dir)
+    agent = make_agent_details(name="agent-1", work_dir=repo_dir, provider_name="local")
+
+    mock_list_result = MagicMock()
+    mock_list_result.agents = [agent]
+    mock_list_result.errors = []
+
+    mngr_ctx = MagicMock()
+    mngr_ctx.concurrency_group = cg
+    cache = KanpanFetchCache(pr_ttl_seconds=3600.0)
+
+    with (
+        patch("imbue.mngr_kanpan.fetcher.list_agents", return_value=mock_list_result),
+        patch("imbue.mngr_kanpan.fetcher._get_commits_ahead", return_value=3) as mock_commits_ahead,
+    ):
+        first = fetch_agent_snapshot(mngr_ctx, cache=cache)
+        second = fetch_agent_snapshot(mngr_ctx, cache=cache)
+        assert mock_commits_ahead.call_count == 1
+
+        run_git_command(repo_dir, "commit", "--allow-empty", "-m", "second")
+        fetch_agent_snapshot(mngr_ctx, cache=cache)
+        assert mock_commits_ahead.call_count == 2
+
+    assert first.entries[0].commits_ahead == 3
+    assert second.entries[0].commits_ahead == 3
+
+
 def test_fetch_board_snapshot_passes_filters_to_list_agents() -> None:
     """Filters should be forwarded to list_agents."""
     mock_list_result = MagicMock()
@@ -481,7 +635,9 @@ def test_fetch_agent_snapshot_passes_labels_and_plugin_data() -> None:
     assert snapshot.entries[0].column_data.plugin_data == {"kanpan": {"muted": True}}
 
 
-def test_fetch_board_snapshot_surfaces_gh_errors_and_suppresses_create_pr_url(tmp_path: Path) -> None:
+def test_fetch_board_snapshot_surfaces_gh_errors_and_suppresses_create_pr_url(
+    tmp_path: Path, cg: ConcurrencyGroup
+) -> None:
     repo_dir = tmp_path / "repo"
     init_git_repo_with_config(repo_dir)
 
@@ -504,7 +660,7 @@ def test_fetch_board_snapshot_surfaces_gh_errors_and_suppresses_create_pr_url(tm
     mock_list_result.errors = []
 
     mngr_ctx = MagicMock()
-    mngr_ctx.concurrency_group = MagicMock()
+    mngr_ctx.concurrency_group = cg
 
     with (
         patch("imbue.mngr_kanpan.fetcher.list_agents", return_value=mock_list_result),
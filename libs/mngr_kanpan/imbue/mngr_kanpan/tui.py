@@ -40,6 +40,7 @@ from imbue.mngr_kanpan.data_types import CustomCommand
 from imbue.mngr_kanpan.data_types import KanpanPluginConfig
 from imbue.mngr_kanpan.data_types import PrState
 from imbue.mngr_kanpan.data_types import RefreshHook
+from imbue.mngr_kanpan.fetcher import KanpanFetchCache
 from imbue.mngr_kanpan.fetcher import fetch_agent_snapshot
 from imbue.mngr_kanpan.fetcher import fetch_board_snapshot
 from imbue.mngr_kanpan.fetcher import repo_path_from_labels
@@ -209,6 +210,8 @@ class _KanpanState(MutableModel):
     # Cooldown durations (loaded from plugin config)
     refresh_interval_seconds: float = DEFAULT_REFRESH_INTERVAL_SECONDS
     retry_cooldown_seconds: float = 60.0
+    # PR data and commits-ahead counts reused across refreshes
+    fetch_cache: KanpanFetchCache
     # Palette attr names for mark indicators (e.g. "mark_d", "mark_p")
     mark_attr_names: tuple[str, ...] = ()
     # Column definitions (builtins + any custom columns from config)
@@ -659,6 +662,8 @@ def _dispatch_command(state: _KanpanState, key: str, cmd: CustomCommand) -> None
     """Dispatch a command by key. Routes to builtins, markable commands, or immediate shell commands."""
     if key == _BUILTIN_COMMAND_KEY_REFRESH and not cmd.command:
         if state.loop is not None and state.refresh_future is None:
+            # A manual refresh is usually asked for right after changing a PR, so don't serve cached PR data
+            state.fetch_cache.clear_prs()
             _start_refresh(state.loop, state)
         return
     if key == _BUILTIN_COMMAND_KEY_MUTE and not cmd.command:
@@ -801,7 +806,7 @@ def _start_local_refresh(loop: MainLoop, state: _KanpanState) -> None:
     state.spinner_index = 0
     state.refresh_is_local_only = True
     state.refresh_future = state.executor.submit(
-        fetch_agent_snapshot, state.mngr_ctx, state.include_filters, state.exclude_filters
+        fetch_agent_snapshot, state.mngr_ctx, state.include_filters, state.exclude_filters, state.fetch_cache
     )
     _schedule_spinner_tick(loop, state)
 
@@ -821,6 +826,7 @@ def _start_refresh(loop: MainLoop, state: _KanpanState) -> None:
         state.on_before_refresh or None,
         state.on_after_refresh or None,
         state.snapshot,
+        state.fetch_cache,
     )
     _schedule_spinner_tick(loop, state)
 
@@ -1547,6 +1553,7 @@ def run_kanpan(
         on_after_refresh=on_after_refresh,
         refresh_interval_seconds=plugin_config.refresh_interval_seconds,
         retry_cooldown_seconds=plugin_config.retry_cooldown_seconds,
+        fetch_cache=KanpanFetchCache(pr_ttl_seconds=plugin_config.pr_cache_ttl_seconds),
         mark_attr_names=mark_attr_names,
         column_defs=column_defs,
         col_attr_names=col_attr_names,
@@ -30,6 +30,8 @@ from imbue.mngr_kanpan.data_types import KanpanPluginConfig
 from imbue.mngr_kanpan.data_types import PrInfo
 from imbue.mngr_kanpan.data_types import PrState
 from imbue.mngr_kanpan.data_types import RefreshHook
+from imbue.mngr_kanpan.fetcher import KanpanFetchCache
+from imbue.mngr_kanpan.github import FetchPrsResult
 from imbue.mngr_kanpan.testing import make_pr_info
 from imbue.mngr_kanpan.tui import DEFAULT_REFRESH_INTERVAL_SECONDS
 from imbue.mngr_kanpan.tui import _BOARD_COLUMN_DEFS
@@ -179,6 +181,7 @@ def _make_state(
         list_walker=None,
         focused_agent_name=None,
         steady_footer_text="  Loading...",
+        fetch_cache=KanpanFetchCache(pr_ttl_seconds=60.0),
         mark_attr_names=(),
     )
 
@@ -1325,6 +1328,7 @@ def _make_debounce_state(**overrides: Any) -> _KanpanState:
         "footer_left_text": SimpleNamespace(set_text=lambda text: None),
         "footer_left_attr": SimpleNamespace(set_attr_map=lambda m: None),
         "footer_right": SimpleNamespace(set_text=lambda text: None),
+        "fetch_cache": KanpanFetchCache(pr_ttl_seconds=60.0),
     }
     defaults.update(overrides)
     return _KanpanState.model_construct(**defaults)
@@ -1345,6 +1349,18 @@ def test_request_refresh_starts_immediately_when_cooldown_expired() -> None:
     assert state.refresh_future is pre_built_future
 
 
+def test_manual_refresh_clears_cached_prs() -> None:
+    pre_built_future: Future[BoardSnapshot] = Future()
+    pre_built_future.set_result(_make_dummy_snapshot())
+    state = _make_debounce_state(loop=_TestableLoop(), executor=_FakeExecutor(pre_built_future))
+    state.fetch_cache.store_prs("/repo", FetchPrsResult(prs=(), error=None))
+
+    _dispatch_command(state, "r", CustomCommand(name="refresh"))
+
+    assert state.refresh_future is pre_built_future
+    assert state.fetch_cache.get_prs("/repo") is None
+
+
 def test_request_refresh_defers_when_within_cooldown() -> None:
     loop = _TestableLoop()
     state = _make_debounce_state(last_refresh_time=time.monotonic())
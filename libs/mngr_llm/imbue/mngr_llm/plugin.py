@@ -177,7 +177,7 @@ class LlmAgent(BaseAgent[LlmAgentConfig]):
         if config.install_llm:
             install_llm_toolchain(host, provisioning)
 
-        agent_state_dir = self._get_agent_dir()
+        agent_state_dir = self.get_agent_dir()
 
         configure_llm_user_path(host, agent_state_dir, provisioning)
         create_mind_conversations_table(host, agent_state_dir, provisioning)
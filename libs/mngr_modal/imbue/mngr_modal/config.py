@@ -114,6 +114,14 @@ class ModalProviderConfig(ProviderInstanceConfig):
         default=60.0,
         description="Timeout in seconds for waiting for sshd to be ready on the sandbox",
     )
+    record_cache_max_age_seconds: float = Field(
+        default=600.0,
+        description=(
+            "Maximum age in seconds of host and agent records cached on local disk. Records on the state "
+            "volume are only read again when their size or modification time changes, or once their cached "
+            "copy is older than this. Set to 0 to disable the cache and always read every record."
+        ),
+    )
     is_host_volume_created: bool = Field(
         default=True,
         description=(
@@ -1,7 +1,9 @@
 import argparse
+import base64
 import json
 import os
 import re
+import shlex
 import tempfile
 import threading
 import uuid
@@ -9,8 +11,10 @@ from collections.abc import Callable
 from concurrent.futures import Future
 from datetime import datetime
 from datetime import timezone
+from functools import cached_property
 from functools import wraps
 from pathlib import Path
+from pathlib import PurePosixPath
 from typing import Any
 from typing import Final
 from typing import Mapping
@@ -59,9 +63,12 @@ from imbue.mngr.interfaces.data_types import HostResources
 from imbue.mngr.interfaces.data_types import PyinfraConnector
 from imbue.mngr.interfaces.data_types import SnapshotInfo
 from imbue.mngr.interfaces.data_types import SnapshotRecord
+from imbue.mngr.interfaces.data_types import VolumeFile
 from imbue.mngr.interfaces.data_types import VolumeInfo
 from imbue.mngr.interfaces.host import HostInterface
 from imbue.mngr.interfaces.host import OnlineHostInterface
+from imbue.mngr.interfaces.provider_instance import compute_plugin_data_from_agent_state_files
+from imbue.mngr.interfaces.provider_instance import get_agent_state_file_names
 from imbue.mngr.interfaces.volume import HostVolume
 from imbue.mngr.primitives import ActivitySource
 from imbue.mngr.primitives import AgentId
@@ -90,6 +97,10 @@ from imbue.mngr.providers.ssh_host_setup import parse_warnings_from_output
 from imbue.mngr_modal.config import ModalProviderConfig
 from imbue.mngr_modal.errors import ModalSandboxTimeoutMngrError
 from imbue.mngr_modal.errors import NoSnapshotsModalMngrError
+from imbue.mngr_modal.record_cache import CachedVolumeRecord
+from imbue.mngr_modal.record_cache import HostRecordCacheEntry
+from imbue.mngr_modal.record_cache import ModalRecordCache
+from imbue.mngr_modal.record_cache import make_cached_volume_record
 from imbue.mngr_modal.routes.deployment import deploy_function
 from imbue.mngr_modal.routes.deployment import get_function_url
 from imbue.mngr_modal.ssh_utils import add_host_to_known_hosts
@@ -255,11 +266,24 @@ _SEP_AGENT_DATA_START: Final[str] = "---MNGR_AGENT_DATA_START---"
 _SEP_AGENT_DATA_END: Final[str] = "---MNGR_AGENT_DATA_END---"
 _SEP_PS_START: Final[str] = "---MNGR_PS_START---"
 _SEP_PS_END: Final[str] = "---MNGR_PS_END---"
+_STATE_FILE_LINE_PREFIX: Final[str] = "STATE_FILE="
 
 
 @pure
-def _build_listing_collection_script(host_dir: str, prefix: str) -> str:
-    """Build a shell script that collects all listing data in one command."""
+def _build_listing_collection_script(host_dir: str, prefix: str, agent_state_file_names: Sequence[str]) -> str:
+    """Build a shell script that collects all listing data in one command.
+
+    agent_state_file_names are files in each agent's state directory (declared by
+    plugin field generators) whose contents are included, base64-encoded.
+    """
+    state_file_commands = "".join(
+        f"""
+        state_file="${{agent_dir}}"{shlex.quote(file_name)}
+        if [ -f "$state_file" ]; then
+            echo {shlex.quote(_STATE_FILE_LINE_PREFIX + file_name + ":")}"$(base64 < "$state_file" | tr -d '\\n')"
+        fi"""
+        for file_name in agent_state_file_names
+    )
     return f"""
 # Uptime
 echo "UPTIME=$(cat /proc/uptime 2>/dev/null | awk '{{print $1}}')"
@@ -309,7 +333,7 @@ if [ -d '{host_dir}/agents' ]; then
             echo "ACTIVE=false"
         fi
         url=$(cat "${{agent_dir}}status/url" 2>/dev/null | tr -d '\\n')
-        echo "URL=$url"
+        echo "URL=$url"{state_file_commands}
         echo '{_SEP_AGENT_END}'
     done
 fi
@@ -377,6 +401,12 @@ def _parse_agent_section(lines: list[str], idx: int) -> tuple[dict[str, Any], in
         elif aline.startswith("URL="):
             val = aline[len("URL=") :].strip()
             agent_raw["url"] = val if val else None
+        elif aline.startswith(_STATE_FILE_LINE_PREFIX):
+            file_name, _, encoded_content = aline[len(_STATE_FILE_LINE_PREFIX) :].partition(":")
+            try:
+                agent_raw.setdefault("state_files", {})[file_name] = base64.b64decode(encoded_content.strip()).decode()
+            except (ValueError, UnicodeDecodeError) as e:
+                logger.warning("Failed to decode agent state file {} in listing output: {}", file_name, e)
         else:
             pass
         idx += 1
@@ -491,6 +521,59 @@ class HostRecord(FrozenModel):
     config: SandboxConfig | None = Field(default=None, description="Sandbox configuration")
 
 
+class StateVolumeRecordPaths(FrozenModel):
+    """Host ids and agent record paths found by listing /hosts/ on the state volume."""
+
+    host_ids: tuple[HostId, ...] = Field(description="Hosts that have a /hosts/<host_id>.json record")
+    agent_record_paths_by_host_id: dict[HostId, tuple[str, ...]] = Field(
+        description="Paths of /hosts/<host_id>/<agent_id>.json records, grouped by host"
+    )
+
+
+@pure
+def _group_state_volume_record_paths(entry_paths: Sequence[str]) -> StateVolumeRecordPaths:
+    """Split (possibly recursive) listing paths under /hosts/ into host records and per-host agent records."""
+    host_ids: list[HostId] = []
+    agent_record_paths_by_host_id: dict[HostId, list[str]] = {}
+    for entry_path in entry_paths:
+        if not entry_path.endswith(".json"):
+            continue
+        # Paths look like "hosts/<host_id>.json" or "hosts/<host_id>/<agent_id>.json"
+        parts = entry_path.strip("/").split("/")
+        if len(parts) == 2:
+            host_ids.append(HostId(parts[1].removesuffix(".json")))
+        elif len(parts) == 3:
+            agent_record_paths_by_host_id.setdefault(HostId(parts[1]), []).append(entry_path)
+        else:
+            logger.trace("Skipped unexpected state volume entry: {}", entry_path)
+    return StateVolumeRecordPaths(
+        host_ids=tuple(host_ids),
+        agent_record_paths_by_host_id={
+            host_id: tuple(paths) for host_id, paths in agent_record_paths_by_host_id.items()
+        },
+    )
+
+
+def _parse_host_record(host_id: HostId, data: bytes) -> HostRecord:
+    try:
+        return HostRecord.model_validate_json(data)
+    except ValidationError as e:
+        raise MngrError(f"Failed to parse host record JSON for host_id={host_id}: {e}\n{data}") from e
+
+
+@pure
+def _get_unchanged_cached_record(
+    entry: VolumeFile, cached_record: CachedVolumeRecord | None
+) -> CachedVolumeRecord | None:
+    """Return the cached copy of a listed state volume file if the file has not changed since it was cached."""
+    if cached_record is None or not cached_record.is_current_for(entry):
+        return None
+    if cached_record.volume_mtime is None:
+        # Written by this machine since the last listing: remember the modification time the volume gave it
+        return cached_record.model_copy_update(to_update(cached_record.field_ref().volume_mtime, entry.mtime))
+    return cached_record
+
+
 class ModalProviderApp(FrozenModel):
     """Encapsulates a Modal app and its associated resources.
 
@@ -648,6 +731,14 @@ class ModalProviderInstance(BaseProviderInstance):
         """Get the path to the known_hosts file for this provider instance."""
         return self._keys_dir / "known_hosts"
 
+    @cached_property
+    def _record_cache(self) -> ModalRecordCache:
+        """On-disk cache of the records on this instance's state volume."""
+        return ModalRecordCache(
+            cache_dir=self._keys_dir / "record_cache" / self.environment_name / self.app_name,
+            max_age_seconds=self.config.record_cache_max_age_seconds,
+        )
+
     # =========================================================================
     # Host Volume Methods
     # =========================================================================
@@ -732,8 +823,9 @@ class ModalProviderInstance(BaseProviderInstance):
         volume.write_files({path: data.encode("utf-8")})
         logger.trace("Wrote host record to volume: {}", path, host_data=data)
 
-        # Update the cache with the new host record
+        # Update the caches with the new host record
         self._host_record_cache_by_id[host_id] = host_record
+        self._record_cache.update_host_record(host_id, data.encode("utf-8"))
 
     def _save_failed_host_record(
         self,
@@ -784,16 +876,13 @@ class ModalProviderInstance(BaseProviderInstance):
 
         try:
             data = volume.read_file(path)
-            try:
-                host_record = HostRecord.model_validate_json(data)
-            except ValidationError as e:
-                raise MngrError(f"Failed to parse host record JSON for host_id={host_id}: {e}\n{data}") from e
-            logger.trace("Read host record from volume: {}", path, host_data=data.decode("utf-8"))
-            # Cache the result
-            self._host_record_cache_by_id[host_id] = host_record
-            return host_record
         except (ModalProxyNotFoundError, FileNotFoundError):
             return None
+        host_record = _parse_host_record(host_id, data)
+        logger.trace("Read host record from volume: {}", path, host_data=data.decode("utf-8"))
+        # Cache the result
+        self._host_record_cache_by_id[host_id] = host_record
+        return host_record
 
     def _destroy_agents_on_host(self, host_id: HostId) -> None:
         """Remove the agents for this host from the state volume."""
@@ -810,6 +899,7 @@ class ModalProviderInstance(BaseProviderInstance):
         # Clear cache entries for this host
         self._host_by_id_cache.pop(host_id, None)
         self._host_record_cache_by_id.pop(host_id, None)
+        self._record_cache.remove_agent_records(host_id)
 
     def _delete_host_record(self, host_id: HostId) -> None:
         """Delete a host record from the state volume and clear caches."""
@@ -826,6 +916,7 @@ class ModalProviderInstance(BaseProviderInstance):
         # Clear cache entries for this host
         self._host_by_id_cache.pop(host_id, None)
         self._host_record_cache_by_id.pop(host_id, None)
+        self._record_cache.remove_host(host_id)
 
     def _clear_snapshots_from_host_record(self, host_id: HostId) -> None:
         """Clear all snapshot records from a host record on the state volume.
@@ -861,48 +952,144 @@ class ModalProviderInstance(BaseProviderInstance):
         host_records, _agent_record_by_host_id = self._list_all_host_and_agent_records(cg, is_including_agents=False)
         return host_records
 
-    # FOLLOWUP: this takes the vast majority of the time for most commands, eg, is a significant performance bottleneck
-    #  In order to work around that, we should cache this data locally. We'll need to invalidate that cache any time we mutate a host record, but otherwise it will really help us speed up listing (and all operations that use listing, which is basically everything, because we often need to find a host/agent by name or id)
-    #  If we use the cache *only for mngr list*, we should be relatively safe--we can regenerate the cache after basically any command that changes it (and time it out), and then list will show you what you expect
     def _list_all_host_and_agent_records(
         self, cg: ConcurrencyGroup, is_including_agents: bool = True
     ) -> tuple[list[HostRecord], dict[HostId, list[dict[str, Any]]]]:
+        """List every host record (and, optionally, every host's agent records) on the state volume.
+
+        Reading each record is what makes this slow, so records are served from the on-disk
+        record cache whenever the listing shows that they have not changed since they were cached.
+        """
         with log_span("Listing all host/agent records from state volume"):
             volume = self.get_state_volume()
 
-            futures: list[Future[HostRecord | None]] = []
-            future_by_host_id: dict[HostId, Future[list[dict[str, Any]]]] = {}
+            # List the /hosts/ directory on the volume. When agents are needed, a single recursive
+            # listing also finds every host's agent records, so no per-host listdir is required.
+            with log_span("Listing /hosts/ directory on state volume"):
+                try:
+                    entries = volume.listdir_recursive("/hosts/") if is_including_agents else volume.listdir("/hosts/")
+                except (ModalProxyNotFoundError, FileNotFoundError):
+                    entries = []
+            logger.debug("Found {} entries in /hosts/ on state volume", len(entries))
+            record_paths = _group_state_volume_record_paths(tuple(entry.path for entry in entries))
+            entry_by_path = {entry.path.strip("/"): entry for entry in entries}
+
+            future_by_host_id: dict[HostId, Future[tuple[HostRecord | None, list[dict[str, Any]]]]] = {}
             with ConcurrencyGroupExecutor(
                 parent_cg=cg, name="modal_list_all_host_records", max_workers=32
             ) as executor:
-                # List files in the /hosts/ directory on the volume
-                with log_span("Listing /hosts/ directory on state volume"):
-                    try:
-                        entries = volume.listdir("/hosts/")
-                    except (ModalProxyNotFoundError, FileNotFoundError):
-                        entries = []
-                logger.debug("Found {} entries in /hosts/ on state volume", len(entries))
-
-                for entry in entries:
-                    filename = entry.path
-                    # Host records are stored as hosts/<host_id>.json
-                    if filename.endswith(".json"):
-                        # Extract host_id from path like "hosts/host-abc.json"
-                        basename = filename.rsplit("/", 1)[-1]
-                        host_id_str = basename.removesuffix(".json")
-                        host_id = HostId(host_id_str)
-                        futures.append(executor.submit(self._read_host_record, host_id))
-                        if is_including_agents:
-                            future_by_host_id[host_id] = executor.submit(
-                                self.list_persisted_agent_data_for_host, host_id
-                            )
-
-            result = [record for future in futures if (record := future.result()) is not None]
+                for host_id in record_paths.host_ids:
+                    future_by_host_id[host_id] = executor.submit(
+                        self._load_host_and_agent_records,
+                        host_id,
+                        record_paths.agent_record_paths_by_host_id.get(host_id, ()) if is_including_agents else None,
+                        entry_by_path,
+                    )
+            # Hosts whose records are gone from the volume should not linger in the record cache
+            self._record_cache.remove_hosts_except(set(record_paths.host_ids))
+
+            result: list[HostRecord] = []
+            other_result: dict[HostId, list[dict[str, Any]]] = {}
+            for host_id, future in future_by_host_id.items():
+                host_record, agent_records = future.result()
+                if host_record is not None:
+                    result.append(host_record)
+                if is_including_agents:
+                    other_result[host_id] = agent_records
             logger.debug("Listed {} host record(s) from volume", len(result))
-            other_result = {host_id: future.result() for host_id, future in future_by_host_id.items()}
             return result, other_result
 
-    # FIXME: needs to be parallelized if there are many agents on a single host, pass in the concurrency group and use that if there are many entries
+    def _load_host_and_agent_records(
+        self,
+        host_id: HostId,
+        agent_record_paths: Sequence[str] | None,
+        entry_by_path: Mapping[str, VolumeFile],
+    ) -> tuple[HostRecord | None, list[dict[str, Any]]]:
+        """Load a host's record and agent records, reading only those that changed since they were cached.
+
+        entry_by_path holds the state volume listing the paths were found in. Agent records are
+        skipped (and left alone in the cache) when agent_record_paths is None.
+        """
+        cached_entry = self._record_cache.load_entry(host_id)
+
+        # A record this process has already read or written is at least as fresh as the cached one
+        host_record = self._host_record_cache_by_id.get(host_id)
+        cached_host_record = cached_entry.host_record
+        if host_record is None:
+            host_entry = entry_by_path[self._get_host_record_path(host_id).strip("/")]
+            cached_host_record = _get_unchanged_cached_record(host_entry, cached_entry.host_record)
+            if cached_host_record is not None:
+                host_record = _parse_host_record(host_id, cached_host_record.content.encode("utf-8"))
+                self._host_record_cache_by_id[host_id] = host_record
+            else:
+                host_record = self._read_host_record(host_id, use_cache=False)
+                if host_record is not None:
+                    cached_host_record = make_cached_volume_record(
+                        host_record.model_dump_json(by_alias=True, indent=2), host_entry
+                    )
+
+        agent_records: list[dict[str, Any]] = []
+        cached_agent_record_by_id = cached_entry.agent_record_by_id
+        if agent_record_paths is not None:
+            agent_records, cached_agent_record_by_id = self._load_agent_records(
+                agent_record_paths, entry_by_path, cached_entry.agent_record_by_id
+            )
+
+        updated_entry = HostRecordCacheEntry(
+            host_id=host_id, host_record=cached_host_record, agent_record_by_id=cached_agent_record_by_id
+        )
+        if updated_entry != cached_entry:
+            self._record_cache.save_entry(updated_entry)
+        return host_record, agent_records
+
+    def _load_agent_records(
+        self,
+        agent_record_paths: Sequence[str],
+        entry_by_path: Mapping[str, VolumeFile],
+        cached_agent_record_by_id: Mapping[str, CachedVolumeRecord],
+    ) -> tuple[list[dict[str, Any]], dict[str, CachedVolumeRecord]]:
+        """Load agent records, reading only those that changed since they were cached.
+
+        Returns the parsed records along with the cache records to keep for them.
+        """
+        cached_agent_record_by_path: dict[str, CachedVolumeRecord] = {}
+        stale_agent_paths: list[str] = []
+        for agent_record_path in agent_record_paths:
+            agent_path = agent_record_path.strip("/")
+            agent_id = PurePosixPath(agent_path).stem
+            cached_agent_record = _get_unchanged_cached_record(
+                entry_by_path[agent_path], cached_agent_record_by_id.get(agent_id)
+            )
+            if cached_agent_record is None:
+                stale_agent_paths.append(agent_path)
+            else:
+                cached_agent_record_by_path[agent_path] = cached_agent_record
+
+        # Records deleted between listdir and read (TOCTOU race on distributed volume) are left out of the result
+        content_by_path = self.get_state_volume().read_files(stale_agent_paths) if stale_agent_paths else {}
+        for agent_path, content in content_by_path.items():
+            cached_agent_record_by_path[agent_path] = make_cached_volume_record(
+                content.decode("utf-8", errors="replace"), entry_by_path[agent_path]
+            )
+
+        agent_records: list[dict[str, Any]] = []
+        updated_agent_record_by_id: dict[str, CachedVolumeRecord] = {}
+        for agent_record_path in agent_record_paths:
+            agent_path = agent_record_path.strip("/")
+            agent_id = PurePosixPath(agent_path).stem
+            cached_agent_record = cached_agent_record_by_path.get(agent_path)
+            if cached_agent_record is None:
+                continue
+            try:
+                agent_data = json.loads(cached_agent_record.content)
+            except json.JSONDecodeError as e:
+                # Corrupted or partially written file. Log and skip it.
+                logger.warning("Skipped invalid agent record file {}: {}", agent_path, e)
+                continue
+            agent_records.append(agent_data)
+            updated_agent_record_by_id[agent_id] = cached_agent_record
+        return agent_records, updated_agent_record_by_id
+
     def list_persisted_agent_data_for_host(self, host_id: HostId) -> list[dict[str, Any]]:
         """List persisted agent data for a stopped host.
 
@@ -912,33 +1099,25 @@ class ModalProviderInstance(BaseProviderInstance):
         """
         volume = self.get_state_volume()
 
-        agent_records: list[dict[str, Any]] = []
         host_dir = f"/hosts/{host_id}"
         try:
             entries = volume.listdir(host_dir)
         except (ModalProxyNotFoundError, FileNotFoundError):
             # Host directory doesn't exist yet (no agents persisted for this host)
-            return agent_records
-
-        for entry in entries:
-            filename = entry.path
-            if filename.endswith(".json"):
-                # Read the agent record
-                agent_path = filename.lstrip("/")
-                try:
-                    content = volume.read_file(agent_path)
-                except (ModalProxyNotFoundError, FileNotFoundError):
-                    # File was deleted between listdir and read (TOCTOU race on distributed volume)
-                    continue
-                try:
-                    agent_data = json.loads(content.decode("utf-8"))
-                except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                    # Corrupted or partially written file. Log and skip it.
-                    logger.warning("Skipped invalid agent record file {}: {}", agent_path, e)
-                    continue
-                else:
-                    agent_records.append(agent_data)
+            return []
 
+        cached_entry = self._record_cache.load_entry(host_id)
+        agent_records, cached_agent_record_by_id = self._load_agent_records(
+            tuple(entry.path for entry in entries if entry.path.endswith(".json")),
+            {entry.path.strip("/"): entry for entry in entries},
+            cached_entry.agent_record_by_id,
+        )
+        if cached_agent_record_by_id != cached_entry.agent_record_by_id:
+            self._record_cache.save_entry(
+                cached_entry.model_copy_update(
+                    to_update(cached_entry.field_ref().agent_record_by_id, cached_agent_record_by_id)
+                )
+            )
         logger.trace("Listed agent records for host {} from volume", host_id)
         return agent_records
 
@@ -962,6 +1141,7 @@ class ModalProviderInstance(BaseProviderInstance):
 
         volume.write_files({agent_path: data.encode("utf-8")})
         logger.trace("Persisted agent data to volume: {}", agent_path)
+        self._record_cache.update_agent_record(host_id, str(agent_id), data.encode("utf-8"))
 
     def remove_persisted_agent_data(self, host_id: HostId, agent_id: AgentId) -> None:
         """Remove persisted agent data from the state volume.
@@ -978,6 +1158,7 @@ class ModalProviderInstance(BaseProviderInstance):
             # File doesn't exist, nothing to remove
             pass
         logger.trace("Removed agent data from volume: {}", agent_path)
+        self._record_cache.remove_agent_record(host_id, str(agent_id))
 
     def _on_certified_host_data_updated(self, host_id: HostId, certified_data: CertifiedHostData) -> None:
         """Update the certified host data in the volume's host record.
@@ -2634,7 +2815,9 @@ log "=== Shutdown script completed ==="
                 # Collect all data in one SSH command
                 with trace_span("Collecting listing data for {}", host_ref.host_id, _is_trace_span_enabled=False):
                     try:
-                        raw = self._collect_all_listing_data_via_ssh(host)
+                        raw = self._collect_all_listing_data_via_ssh(
+                            host, get_agent_state_file_names(field_generators or {})
+                        )
                     except MngrError as e:
                         if on_error:
                             on_error(host_ref, e)
@@ -2657,17 +2840,19 @@ log "=== Shutdown script completed ==="
             # Build AgentDetails for each agent
             with trace_span("Assembling agent details for {}", host_ref.host_id, _is_trace_span_enabled=False):
                 certified_data = host_record.certified_host_data if host_record is not None else None
-                agent_details_list = self._build_agent_details_from_raw(host_details, certified_data, raw)
+                agent_details_list = self._build_agent_details_from_raw(
+                    host_details, certified_data, raw, field_generators or {}
+                )
 
             return host_details, agent_details_list
 
-    def _collect_all_listing_data_via_ssh(self, host: Host) -> dict[str, Any]:
+    def _collect_all_listing_data_via_ssh(self, host: Host, agent_state_file_names: Sequence[str]) -> dict[str, Any]:
         """Execute a single SSH command to collect all data needed for listing."""
         host_dir = str(self.host_dir)
         prefix = self.mngr_ctx.config.prefix
 
         # Build a shell script that collects everything we need
-        script = _build_listing_collection_script(host_dir, prefix)
+        script = _build_listing_collection_script(host_dir, prefix, agent_state_file_names)
 
         with log_span("Collecting listing data via single SSH command", host_id=str(host.id)):
             result = host.execute_idempotent_command(script, timeout_seconds=30.0)
@@ -2792,6 +2977,7 @@ log "=== Shutdown script completed ==="
         host_details: HostDetails,
         certified_host_data: CertifiedHostData | None,
         raw: dict[str, Any],
+        field_generators: Mapping[str, Mapping[str, Callable[[AgentInterface, OnlineHostInterface], Any]]],
     ) -> list[AgentDetails]:
         """Build AgentDetails objects from SSH-collected agent data."""
         # Activity config from certified data
@@ -2818,6 +3004,7 @@ log "=== Shutdown script completed ==="
                     idle_timeout_seconds=idle_timeout_seconds,
                     activity_sources=activity_sources,
                     idle_mode=idle_mode,
+                    field_generators=field_generators,
                 )
                 if agent_details is not None:
                     agent_details_list.append(agent_details)
@@ -2836,8 +3023,14 @@ log "=== Shutdown script completed ==="
         idle_timeout_seconds: int,
         activity_sources: tuple[ActivitySource, ...],
         idle_mode: IdleMode,
+        field_generators: Mapping[str, Mapping[str, Callable[[AgentInterface, OnlineHostInterface], Any]]],
     ) -> AgentDetails | None:
-        """Build a single AgentDetails from raw SSH-collected data."""
+        """Build a single AgentDetails from raw SSH-collected data.
+
+        Plugin fields are computed only for generators that declare their agent state
+        files (those files were collected by the same SSH command); other generators
+        need a live agent object and are skipped on this path.
+        """
         agent_data = agent_raw.get("data", {})
         agent_id_str = agent_data.get("id")
         agent_name_str = agent_data.get("name")
@@ -2898,7 +3091,7 @@ log "=== Shutdown script completed ==="
             activity_sources=tuple(s.value for s in activity_sources),
             labels=agent_data.get("labels", {}),
             host=host_details,
-            plugin={},
+            plugin=compute_plugin_data_from_agent_state_files(field_generators, agent_raw.get("state_files", {})),
         )
 
     # =========================================================================
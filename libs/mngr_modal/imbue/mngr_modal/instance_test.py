@@ -1510,27 +1510,28 @@ def test_list_all_host_and_agent_records_returns_empty_when_volume_empty(
 
     assert host_records == []
     assert agent_data == {}
-    mock_volume.listdir.assert_called_once_with("/hosts/")
+    mock_volume.listdir.assert_called_once_with("/hosts/", recursive=True)
 
 
 def test_list_all_host_and_agent_records_returns_host_records_and_agent_data(
     modal_provider: ModalProviderInstance,
 ) -> None:
-    """_list_all_host_and_agent_records reads host records and agent data for .json entries."""
+    """_list_all_host_and_agent_records reads host records and agent data from one recursive listing."""
     host_id = HostId.generate()
     agent_id = AgentId.generate()
     host_record = _make_host_record(host_id)
-    agent_data_list = [{"id": str(agent_id), "name": "test-agent", "type": "claude"}]
+    agent_record = {"id": str(agent_id), "name": "test-agent", "type": "claude"}
 
-    mock_entry = MagicMock()
-    mock_entry.path = f"hosts/{host_id}.json"
+    mock_host_entry = MagicMock()
+    mock_host_entry.path = f"hosts/{host_id}.json"
+    mock_agent_entry = MagicMock()
+    mock_agent_entry.path = f"hosts/{host_id}/{agent_id}.json"
     mock_volume = cast(Any, modal_provider.modal_app.volume)
-    mock_volume.listdir.return_value = [mock_entry]
+    mock_volume.listdir.return_value = [mock_host_entry, mock_agent_entry]
+    agent_path = f"hosts/{host_id}/{agent_id}.json"
+    mock_volume.read_files.return_value = {agent_path: json.dumps(agent_record).encode("utf-8")}
 
-    with (
-        patch.object(modal_provider, "_read_host_record", return_value=host_record),
-        patch.object(ModalProviderInstance, "list_persisted_agent_data_for_host", return_value=agent_data_list),
-    ):
+    with patch.object(modal_provider, "_read_host_record", return_value=host_record):
         host_records, agent_data = modal_provider._list_all_host_and_agent_records(
             modal_provider.mngr_ctx.concurrency_group
         )
@@ -1540,6 +1541,10 @@ def test_list_all_host_and_agent_records_returns_host_records_and_agent_data(
     assert host_id in agent_data
     assert len(agent_data[host_id]) == 1
     assert agent_data[host_id][0]["id"] == str(agent_id)
+    # The agent records were found without a per-host listdir
+    mock_volume.listdir.assert_called_once_with("/hosts/", recursive=True)
+    # The agent records of the host were read in one batch
+    mock_volume.read_files.assert_called_once_with([agent_path])
 
 
 def test_list_all_host_and_agent_records_skips_non_json_files(
@@ -1556,7 +1561,7 @@ def test_list_all_host_and_agent_records_skips_non_json_files(
 
     with (
         patch.object(modal_provider, "_read_host_record", return_value=None) as mock_read,
-        patch.object(ModalProviderInstance, "list_persisted_agent_data_for_host", return_value=[]) as mock_list_agent,
+        patch.object(ModalProviderInstance, "_load_agent_records", return_value=([], {})) as mock_list_agent,
     ):
         modal_provider._list_all_host_and_agent_records(modal_provider.mngr_ctx.concurrency_group)
         assert mock_read.call_count == 1
@@ -1577,7 +1582,7 @@ def test_list_all_host_and_agent_records_without_agents(
 
     with (
         patch.object(modal_provider, "_read_host_record", return_value=host_record),
-        patch.object(ModalProviderInstance, "list_persisted_agent_data_for_host") as mock_list_agent,
+        patch.object(ModalProviderInstance, "_load_agent_records") as mock_list_agent,
     ):
         host_records, agent_data = modal_provider._list_all_host_and_agent_records(
             modal_provider.mngr_ctx.concurrency_group, is_including_agents=False
@@ -1601,7 +1606,7 @@ def test_list_all_host_and_agent_records_skips_none_host_records(
 
     with (
         patch.object(modal_provider, "_read_host_record", return_value=None),
-        patch.object(ModalProviderInstance, "list_persisted_agent_data_for_host", return_value=[]),
+        patch.object(ModalProviderInstance, "_load_agent_records", return_value=([], {})),
     ):
         host_records, agent_data = modal_provider._list_all_host_and_agent_records(
             modal_provider.mngr_ctx.concurrency_group
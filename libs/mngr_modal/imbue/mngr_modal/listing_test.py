@@ -1,7 +1,10 @@
+import base64
 from datetime import datetime
 from datetime import timezone
+from typing import Mapping
 
 from imbue.mngr.interfaces.data_types import HostDetails
+from imbue.mngr.interfaces.host import AgentStateFileFieldGenerator
 from imbue.mngr.primitives import ActivitySource
 from imbue.mngr.primitives import AgentId
 from imbue.mngr.primitives import AgentLifecycleState
@@ -14,7 +17,7 @@ from imbue.mngr_modal.instance import _parse_listing_collection_output
 
 
 def test_build_listing_collection_script_contains_key_sections() -> None:
-    script = _build_listing_collection_script("/mngr", "mngr-")
+    script = _build_listing_collection_script("/mngr", "mngr-", ())
     assert "UPTIME=" in script
     assert "BTIME=" in script
     assert "LOCK_MTIME=" in script
@@ -24,6 +27,27 @@ def test_build_listing_collection_script_contains_key_sections() -> None:
     assert "MNGR_PS_START" in script
 
 
+def test_build_listing_collection_script_includes_declared_agent_state_files() -> None:
+    script = _build_listing_collection_script("/mngr", "mngr-", ("permissions_waiting",))
+    assert 'state_file="${agent_dir}"permissions_waiting' in script
+    assert "STATE_FILE=permissions_waiting:" in script
+
+
+def test_parse_listing_output_decodes_agent_state_files() -> None:
+    encoded = base64.b64encode(b"line1\nline2").decode()
+    output = (
+        "---MNGR_AGENT_START:agent-abc---\n"
+        "---MNGR_AGENT_DATA_START---\n"
+        '{"id": "agent-abc", "name": "test"}\n'
+        "---MNGR_AGENT_DATA_END---\n"
+        f"STATE_FILE=permissions_waiting:{encoded}\n"
+        "STATE_FILE=empty:\n"
+        "---MNGR_AGENT_END---\n"
+    )
+    result = _parse_listing_collection_output(output)
+    assert result["agents"][0]["state_files"] == {"permissions_waiting": "line1\nline2", "empty": ""}
+
+
 def test_parse_listing_output_extracts_uptime() -> None:
     output = "UPTIME=123.45\nBTIME=\nLOCK_MTIME=\nSSH_ACTIVITY_MTIME=\n"
     result = _parse_listing_collection_output(output)
@@ -155,6 +179,7 @@ def test_build_single_agent_details_returns_agent_with_correct_state(
         idle_timeout_seconds=300,
         activity_sources=(ActivitySource.USER,),
         idle_mode=IdleMode.USER,
+        field_generators={},
     )
     assert result is not None
     # pane shows bash shell, expected process is "my-agent" (not found) -> DONE
@@ -174,5 +199,37 @@ def test_build_single_agent_details_returns_none_for_missing_id(
         idle_timeout_seconds=300,
         activity_sources=(ActivitySource.USER,),
         idle_mode=IdleMode.USER,
+        field_generators={},
     )
     assert result is None
+
+
+def _is_marked(content_by_file_name: Mapping[str, str | None]) -> bool | None:
+    return True if content_by_file_name["marker"] is not None else None
+
+
+def test_build_single_agent_details_computes_plugin_fields_from_collected_state_files(
+    testing_provider: ModalProviderInstance,
+) -> None:
+    """Plugin fields that declare their state files are computed from the files collected over SSH."""
+    agent_raw: dict = {
+        "data": {"id": str(AgentId.generate()), "name": "test-agent", "type": "unknown-type"},
+        "state_files": {"marker": ""},
+    }
+    result = testing_provider._build_single_agent_details(
+        agent_raw=agent_raw,
+        host_details=_make_host_details(),
+        ssh_activity=None,
+        ps_output="",
+        idle_timeout_seconds=300,
+        activity_sources=(ActivitySource.USER,),
+        idle_mode=IdleMode.USER,
+        field_generators={
+            "test_plugin": {
+                "marked": AgentStateFileFieldGenerator(file_names=("marker",), compute=_is_marked),
+                "live_only": lambda agent, host: "never computed here",
+            }
+        },
+    )
+    assert result is not None
+    assert result.plugin == {"test_plugin": {"marked": True}}
@@ -0,0 +1,223 @@
+import threading
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+
+from loguru import logger
+from pydantic import Field
+from pydantic import PrivateAttr
+from pydantic import ValidationError
+
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.model_update import to_update
+from imbue.imbue_common.mutable_model import MutableModel
+from imbue.mngr.interfaces.data_types import VolumeFile
+from imbue.mngr.primitives import HostId
+from imbue.mngr.utils.file_utils import atomic_write
+
+
+class CachedVolumeRecord(FrozenModel):
+    """The content of one record file on the state volume, as last seen by this machine."""
+
+    content: str = Field(description="Raw JSON content of the record file")
+    volume_size: int = Field(description="Size of the record file on the volume, in bytes")
+    volume_mtime: int | None = Field(
+        description=(
+            "Modification time the volume reported for the record file. None when the record was written "
+            "by this machine and has not been listed since"
+        )
+    )
+    cached_at: datetime = Field(description="When the content was last read from or written to the volume")
+
+    def is_current_for(self, entry: VolumeFile) -> bool:
+        """Whether this cached content still matches the listed volume file."""
+        if self.volume_size != entry.size:
+            return False
+        return self.volume_mtime is None or self.volume_mtime == entry.mtime
+
+
+class HostRecordCacheEntry(FrozenModel):
+    """Cached records for one host: its host record and the agent records persisted for it."""
+
+    host_id: HostId = Field(description="ID of the host")
+    host_record: CachedVolumeRecord | None = Field(default=None, description="The cached host record")
+    agent_record_by_id: dict[str, CachedVolumeRecord] = Field(
+        default_factory=dict, description="The cached agent records, by agent ID (the record's file name)"
+    )
+
+
+def make_cached_volume_record(content: str, entry: VolumeFile) -> CachedVolumeRecord:
+    """Build a cache record for content that was just read from the listed volume file."""
+    return CachedVolumeRecord(
+        content=content,
+        volume_size=entry.size,
+        volume_mtime=entry.mtime,
+        cached_at=datetime.now(timezone.utc),
+    )
+
+
+def make_written_volume_record(content: bytes) -> CachedVolumeRecord:
+    """Build a cache record for content that this machine just wrote to the volume."""
+    return CachedVolumeRecord(
+        content=content.decode("utf-8"),
+        volume_size=len(content),
+        volume_mtime=None,
+        cached_at=datetime.now(timezone.utc),
+    )
+
+
+class ModalRecordCache(MutableModel):
+    """On-disk cache of the host and agent records stored on the Modal state volume.
+
+    Listing every host and agent record is the slowest part of most mngr commands
+    against Modal, because each record is a separate volume read. This keeps one
+    file per host under cache_dir, holding the raw content of the host record and
+    its agent records along with the modification time and size the volume
+    reported for each of them. A listing of /hosts/ already returns that
+    metadata, so only records whose metadata changed need to be read again.
+
+    The volume only reports whole-second modification times, so another machine
+    rewriting a record with content of exactly the same size within the same
+    second would go unnoticed. Cached records are therefore read again once they
+    are older than max_age_seconds.
+
+    All methods are safe to call from multiple threads. Writes from multiple
+    processes can race, but the worst outcome of a lost update is an extra
+    volume read on the next listing, since every cached record is checked
+    against the volume's listing before it is used.
+    """
+
+    cache_dir: Path = Field(frozen=True, description="Directory holding one cache file per host")
+    max_age_seconds: float = Field(
+        frozen=True, description="Cached records older than this are read from the volume again"
+    )
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.max_age_seconds > 0
+
+    def _get_entry_path(self, host_id: HostId) -> Path:
+        return self.cache_dir / f"{host_id}.json"
+
+    def load_entry(self, host_id: HostId) -> HostRecordCacheEntry:
+        """Load the cached records for a host, dropping any that are older than the maximum age."""
+        empty_entry = HostRecordCacheEntry(host_id=host_id)
+        if not self.is_enabled:
+            return empty_entry
+        with self._lock:
+            entry = self._load_entry_unlocked(host_id)
+        if entry is None:
+            return empty_entry
+        oldest_allowed = datetime.now(timezone.utc) - timedelta(seconds=self.max_age_seconds)
+        host_record = entry.host_record
+        if host_record is not None and host_record.cached_at < oldest_allowed:
+            host_record = None
+        return HostRecordCacheEntry(
+            host_id=host_id,
+            host_record=host_record,
+            agent_record_by_id={
+                agent_id: record
+                for agent_id, record in entry.agent_record_by_id.items()
+                if record.cached_at >= oldest_allowed
+            },
+        )
+
+    def save_entry(self, entry: HostRecordCacheEntry) -> None:
+        """Replace the cached records for a host."""
+        if not self.is_enabled:
+            return
+        with self._lock:
+            self._save_entry_unlocked(entry)
+
+    def update_host_record(self, host_id: HostId, content: bytes) -> None:
+        """Write through a host record that this machine just wrote to the volume."""
+        if not self.is_enabled:
+            return
+        with self._lock:
+            entry = self._load_entry_unlocked(host_id) or HostRecordCacheEntry(host_id=host_id)
+            self._save_entry_unlocked(
+                entry.model_copy_update(
+                    to_update(entry.field_ref().host_record, make_written_volume_record(content)),
+                )
+            )
+
+    def update_agent_record(self, host_id: HostId, agent_id: str, content: bytes) -> None:
+        """Write through an agent record that this machine just wrote to the volume."""
+        if not self.is_enabled:
+            return
+        with self._lock:
+            entry = self._load_entry_unlocked(host_id) or HostRecordCacheEntry(host_id=host_id)
+            agent_record_by_id = {**entry.agent_record_by_id, agent_id: make_written_volume_record(content)}
+            self._save_entry_unlocked(
+                entry.model_copy_update(to_update(entry.field_ref().agent_record_by_id, agent_record_by_id))
+            )
+
+    def remove_agent_record(self, host_id: HostId, agent_id: str) -> None:
+        """Forget an agent record that this machine just removed from the volume."""
+        if not self.is_enabled:
+            return
+        with self._lock:
+            entry = self._load_entry_unlocked(host_id)
+            if entry is None or agent_id not in entry.agent_record_by_id:
+                return
+            agent_record_by_id = {
+                other_id: record for other_id, record in entry.agent_record_by_id.items() if other_id != agent_id
+            }
+            self._save_entry_unlocked(
+                entry.model_copy_update(to_update(entry.field_ref().agent_record_by_id, agent_record_by_id))
+            )
+
+    def remove_agent_records(self, host_id: HostId) -> None:
+        """Forget every agent record of a host whose agent records were just removed from the volume."""
+        if not self.is_enabled:
+            return
+        with self._lock:
+            entry = self._load_entry_unlocked(host_id)
+            if entry is None or not entry.agent_record_by_id:
+                return
+            self._save_entry_unlocked(entry.model_copy_update(to_update(entry.field_ref().agent_record_by_id, {})))
+
+    def remove_host(self, host_id: HostId) -> None:
+        """Forget everything cached for a host."""
+        if not self.is_enabled:
+            return
+        with self._lock:
+            self._get_entry_path(host_id).unlink(missing_ok=True)
+
+    def remove_hosts_except(self, host_ids: set[HostId]) -> None:
+        """Forget every host that is not in host_ids, e.g. because a listing no longer found it."""
+        if not self.is_enabled:
+            return
+        with self._lock:
+            try:
+                entry_paths = list(self.cache_dir.glob("host-*.json"))
+            except OSError:
+                return
+            for entry_path in entry_paths:
+                if HostId(entry_path.stem) not in host_ids:
+                    entry_path.unlink(missing_ok=True)
+
+    def _load_entry_unlocked(self, host_id: HostId) -> HostRecordCacheEntry | None:
+        entry_path = self._get_entry_path(host_id)
+        try:
+            content = entry_path.read_text()
+        except FileNotFoundError:
+            return None
+        try:
+            return HostRecordCacheEntry.model_validate_json(content)
+        except ValidationError as e:
+            # A cache file from an older version or a partially written one; it is rebuilt on the next listing
+            logger.debug("Ignored invalid Modal record cache file {}: {}", entry_path, e)
+            return None
+
+    def _save_entry_unlocked(self, entry: HostRecordCacheEntry) -> None:
+        if entry.host_record is None and not entry.agent_record_by_id:
+            self._get_entry_path(entry.host_id).unlink(missing_ok=True)
+            return
+        try:
+            atomic_write(self._get_entry_path(entry.host_id), entry.model_dump_json())
+        except OSError as e:
+            logger.debug("Failed to write Modal record cache file for {}: {}", entry.host_id, e)
@@ -0,0 +1,95 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+
+from imbue.mngr.interfaces.data_types import VolumeFile
+from imbue.mngr.interfaces.data_types import VolumeFileType
+from imbue.mngr.primitives import HostId
+from imbue.mngr_modal.record_cache import CachedVolumeRecord
+from imbue.mngr_modal.record_cache import HostRecordCacheEntry
+from imbue.mngr_modal.record_cache import ModalRecordCache
+from imbue.mngr_modal.record_cache import make_cached_volume_record
+from imbue.mngr_modal.record_cache import make_written_volume_record
+
+
+def _make_volume_file(size: int, mtime: int = 1000) -> VolumeFile:
+    return VolumeFile(path="hosts/record.json", file_type=VolumeFileType.FILE, mtime=mtime, size=size)
+
+
+def test_cached_record_is_current_only_for_the_same_size_and_mtime() -> None:
+    record = make_cached_volume_record('{"a": 1}', _make_volume_file(size=8, mtime=1000))
+
+    assert record.is_current_for(_make_volume_file(size=8, mtime=1000))
+    assert not record.is_current_for(_make_volume_file(size=8, mtime=1001))
+    assert not record.is_current_for(_make_volume_file(size=9, mtime=1000))
+
+
+def test_written_record_is_current_for_any_mtime_with_the_written_size() -> None:
+    record = make_written_volume_record(b'{"a": 1}')
+
+    assert record.volume_mtime is None
+    assert record.is_current_for(_make_volume_file(size=8, mtime=1234))
+    assert not record.is_current_for(_make_volume_file(size=9, mtime=1234))
+
+
+def test_record_cache_round_trips_entries_through_disk(tmp_path: Path) -> None:
+    host_id = HostId.generate()
+    cache = ModalRecordCache(cache_dir=tmp_path / "cache", max_age_seconds=600.0)
+
+    cache.update_host_record(host_id, b'{"host": 1}')
+    cache.update_agent_record(host_id, "agent-1", b'{"agent": 1}')
+    cache.update_agent_record(host_id, "agent-2", b'{"agent": 2}')
+    cache.remove_agent_record(host_id, "agent-1")
+
+    reloaded = ModalRecordCache(cache_dir=tmp_path / "cache", max_age_seconds=600.0).load_entry(host_id)
+    assert reloaded.host_record is not None
+    assert reloaded.host_record.content == '{"host": 1}'
+    assert set(reloaded.agent_record_by_id) == {"agent-2"}
+
+
+def test_record_cache_drops_records_older_than_max_age(tmp_path: Path) -> None:
+    host_id = HostId.generate()
+    cache = ModalRecordCache(cache_dir=tmp_path, max_age_seconds=60.0)
+    old_record = CachedVolumeRecord(
+        content="{}",
+        volume_size=2,
+        volume_mtime=1000,
+        cached_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+    )
+    fresh_record = make_written_volume_record(b"{}")
+    cache.save_entry(
+        HostRecordCacheEntry(
+            host_id=host_id,
+            host_record=old_record,
+            agent_record_by_id={"old": old_record, "fresh": fresh_record},
+        )
+    )
+
+    entry = cache.load_entry(host_id)
+
+    assert entry.host_record is None
+    assert set(entry.agent_record_by_id) == {"fresh"}
+
+
+def test_record_cache_forgets_hosts_that_are_no_longer_listed(tmp_path: Path) -> None:
+    kept_host_id = HostId.generate()
+    removed_host_id = HostId.generate()
+    cache = ModalRecordCache(cache_dir=tmp_path, max_age_seconds=600.0)
+    cache.update_host_record(kept_host_id, b"{}")
+    cache.update_host_record(removed_host_id, b"{}")
+
+    cache.remove_hosts_except({kept_host_id})
+
+    assert cache.load_entry(kept_host_id).host_record is not None
+    assert cache.load_entry(removed_host_id).host_record is None
+
+
+def test_disabled_record_cache_stores_nothing(tmp_path: Path) -> None:
+    host_id = HostId.generate()
+    cache = ModalRecordCache(cache_dir=tmp_path / "cache", max_age_seconds=0.0)
+
+    cache.update_host_record(host_id, b"{}")
+
+    assert not (tmp_path / "cache").exists()
+    assert cache.load_entry(host_id).host_record is None
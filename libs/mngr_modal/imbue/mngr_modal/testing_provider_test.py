@@ -6,10 +6,12 @@ Modal credentials or SSH connections.
 """
 
 import contextlib
+import os
 from datetime import datetime
 from datetime import timezone
 from io import StringIO
 from pathlib import Path
+from typing import cast
 
 import pytest
 
@@ -68,6 +70,7 @@ from imbue.mngr_modal.volume import _proxy_file_entry_type_to_volume_file_type
 from imbue.modal_proxy.data_types import FileEntryType as ProxyFileEntryType
 from imbue.modal_proxy.errors import ModalProxyError
 from imbue.modal_proxy.testing import TestingModalInterface
+from imbue.modal_proxy.testing import TestingVolume
 
 # ---------------------------------------------------------------------------
 # Host Record CRUD Tests
@@ -152,6 +155,66 @@ def test_list_all_host_records_empty(testing_provider: ModalProviderInstance) ->
     assert records == []
 
 
+def _rewrite_keeping_size_and_mtime(path: Path, old: str, new: str) -> None:
+    """Change a volume file behind mngr's back without changing what a listing reports for it."""
+    stat = path.stat()
+    content = path.read_text()
+    assert len(old) == len(new) and old in content
+    path.write_text(content.replace(old, new))
+    os.utime(path, (stat.st_atime, stat.st_mtime))
+
+
+def test_list_all_host_and_agent_records_reads_only_changed_records(
+    temp_mngr_ctx: MngrContext, testing_modal: TestingModalInterface
+) -> None:
+    cg = temp_mngr_ctx.concurrency_group
+    writer = make_testing_provider(temp_mngr_ctx, testing_modal)
+    host_id = HostId.generate()
+    agent_id = AgentId.generate()
+    writer._write_host_record(make_host_record(host_id=host_id, host_name="host-a"))
+    writer.persist_agent_data(host_id, {"id": str(agent_id), "name": "agent-a", "type": "claude"})
+    volume_root = cast(TestingVolume, writer.modal_app.volume).root_dir
+
+    # A new process lists the records it wrote through to the on-disk record cache
+    host_records, agent_data = make_testing_provider(temp_mngr_ctx, testing_modal)._list_all_host_and_agent_records(cg)
+    assert [record.certified_host_data.host_name for record in host_records] == ["host-a"]
+    assert [agent["name"] for agent in agent_data[host_id]] == ["agent-a"]
+
+    # Records whose listed size and mtime are unchanged are served from the cache, not read again
+    _rewrite_keeping_size_and_mtime(volume_root / "hosts" / f"{host_id}.json", "host-a", "host-b")
+    _rewrite_keeping_size_and_mtime(volume_root / "hosts" / str(host_id) / f"{agent_id}.json", "agent-a", "agent-b")
+    host_records, agent_data = make_testing_provider(temp_mngr_ctx, testing_modal)._list_all_host_and_agent_records(cg)
+    assert [record.certified_host_data.host_name for record in host_records] == ["host-a"]
+    assert [agent["name"] for agent in agent_data[host_id]] == ["agent-a"]
+
+    # A record that changed on the volume is read again
+    agent_path = volume_root / "hosts" / str(host_id) / f"{agent_id}.json"
+    agent_path.write_text(agent_path.read_text().replace("agent-b", "agent-changed"))
+    host_records, agent_data = make_testing_provider(temp_mngr_ctx, testing_modal)._list_all_host_and_agent_records(cg)
+    assert [record.certified_host_data.host_name for record in host_records] == ["host-a"]
+    assert [agent["name"] for agent in agent_data[host_id]] == ["agent-changed"]
+
+
+def test_list_all_host_records_drops_deleted_hosts_from_record_cache(
+    temp_mngr_ctx: MngrContext, testing_modal: TestingModalInterface
+) -> None:
+    cg = temp_mngr_ctx.concurrency_group
+    writer = make_testing_provider(temp_mngr_ctx, testing_modal)
+    kept_host_id = HostId.generate()
+    deleted_host_id = HostId.generate()
+    writer._write_host_record(make_host_record(host_id=kept_host_id, host_name="kept"))
+    writer._write_host_record(make_host_record(host_id=deleted_host_id, host_name="deleted"))
+    writer._list_all_host_records(cg)
+
+    # Another machine deletes a host record directly on the volume
+    volume_root = cast(TestingVolume, writer.modal_app.volume).root_dir
+    (volume_root / "hosts" / f"{deleted_host_id}.json").unlink()
+
+    records = make_testing_provider(temp_mngr_ctx, testing_modal)._list_all_host_records(cg)
+    assert [record.certified_host_data.host_name for record in records] == ["kept"]
+    assert writer._record_cache.load_entry(deleted_host_id).host_record is None
+
+
 def test_save_failed_host_record(testing_provider: ModalProviderInstance) -> None:
     host_id = HostId.generate()
     testing_provider._save_failed_host_record(
@@ -2486,6 +2549,6 @@ def test_discover_hosts_empty_volume_and_no_sandboxes(
 
 
 def test_build_listing_script_uses_host_dir() -> None:
-    script = _build_listing_collection_script("/custom/host/dir", "test-prefix-")
+    script = _build_listing_collection_script("/custom/host/dir", "test-prefix-", ())
     assert "/custom/host/dir" in script
     assert "test-prefix-" in script
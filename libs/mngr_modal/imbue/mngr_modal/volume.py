@@ -1,4 +1,5 @@
 from typing import Mapping
+from typing import Sequence
 
 from pydantic import Field
 
@@ -43,9 +44,16 @@ class ModalVolume(BaseVolume):
         entries = self.modal_volume.listdir(path)
         return [_proxy_file_entry_to_volume_file(e) for e in entries]
 
+    def listdir_recursive(self, path: str) -> list[VolumeFile]:
+        entries = self.modal_volume.listdir(path, recursive=True)
+        return sorted((_proxy_file_entry_to_volume_file(e) for e in entries), key=lambda e: e.path)
+
     def read_file(self, path: str) -> bytes:
         return self.modal_volume.read_file(path)
 
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        return self.modal_volume.read_files(paths)
+
     def remove_file(self, path: str, *, recursive: bool = False) -> None:
         self.modal_volume.remove_file(path, recursive=recursive)
 
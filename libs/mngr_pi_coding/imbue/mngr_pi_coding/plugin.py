@@ -116,7 +116,7 @@ class PiCodingAgent(BaseAgent[PiCodingAgentConfig]):
         This directory replaces ~/.pi/agent/ for this agent when PI_CODING_AGENT_DIR
         is set. Located at $MNGR_AGENT_STATE_DIR/plugin/pi_coding/.
         """
-        return self._get_agent_dir() / "plugin" / "pi_coding"
+        return self.get_agent_dir() / "plugin" / "pi_coding"
 
     def modify_env_vars(self, host: OnlineHostInterface, env_vars: dict[str, str]) -> None:
         """Set PI_CODING_AGENT_DIR to isolate pi's config per-agent."""
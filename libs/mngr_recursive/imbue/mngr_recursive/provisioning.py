@@ -1,18 +1,29 @@
 """Core provisioning logic for injecting mngr into hosts and agents."""
 
+import fcntl
+import hashlib
 import importlib.metadata
+import io
 import json
 import shlex
 import subprocess
 import tempfile
+from collections.abc import Iterator
 from concurrent.futures import Future
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Final
+from typing import Sequence
 from typing import assert_never
+from uuid import uuid4
 
 from loguru import logger
 
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.concurrency_group.errors import ProcessError
 from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
 from imbue.imbue_common.logging import log_span
+from imbue.imbue_common.pure import pure
 from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import MngrError
 from imbue.mngr.interfaces.agent import AgentInterface
@@ -20,6 +31,7 @@ from imbue.mngr.interfaces.host import OnlineHostInterface
 from imbue.mngr.providers.deploy_utils import MngrInstallMode
 from imbue.mngr.providers.deploy_utils import collect_deploy_files
 from imbue.mngr.providers.deploy_utils import resolve_mngr_install_mode
+from imbue.mngr.utils.polling import wait_for
 from imbue.mngr_recursive.data_types import RecursivePluginConfig
 
 
@@ -222,22 +234,21 @@ def _install_mngr_package_mode(
 
 def _install_mngr_editable_mode(
     host: OnlineHostInterface,
-    tool_dir: Path,
-    bin_dir: Path,
+    repo_root: Path,
+    install_dir: Path,
 ) -> None:
-    """Install mngr from local source in editable mode.
+    """Install mngr from local source in editable mode into a shared install directory.
 
     For local hosts, installs directly from the monorepo source tree.
     For remote hosts, packages the monorepo into a tarball, uploads it,
-    extracts it, and installs in editable mode.
+    extracts it into the install directory, and installs in editable mode.
     """
-    repo_root = _get_mngr_repo_root()
-    uv_env = _build_uv_env_prefix(tool_dir, bin_dir)
+    uv_env = _build_uv_env_prefix(install_dir / "tools", install_dir / "bin")
 
     if host.is_local:
         _install_mngr_editable_local(host, repo_root, uv_env)
     else:
-        _install_mngr_editable_remote(host, repo_root, uv_env)
+        _install_mngr_editable_remote(host, repo_root, install_dir / "repo", uv_env)
 
 
 def _install_mngr_editable_local(
@@ -269,9 +280,14 @@ def _install_mngr_editable_local(
 def _install_mngr_editable_remote(
     host: OnlineHostInterface,
     repo_root: Path,
+    remote_repo_dir: Path,
     uv_env: str,
 ) -> None:
-    """Install mngr in editable mode on a remote host by uploading a tarball."""
+    """Install mngr in editable mode on a remote host by uploading a tarball.
+
+    The monorepo is extracted into remote_repo_dir, which must stay in place
+    for as long as the editable install is used.
+    """
     with tempfile.TemporaryDirectory() as tmpdir:
         tarball_path = Path(tmpdir) / "mngr-repo.tar.gz"
 
@@ -286,9 +302,10 @@ def _install_mngr_editable_remote(
             if result.returncode != 0:
                 raise MngrError(f"Failed to create mngr monorepo tarball: {result.stderr.strip()}")
 
-        # Upload tarball to remote host
-        remote_tarball = Path("/tmp/mngr-repo.tar.gz")
-        remote_repo_dir = Path("/tmp/mngr-repo")
+        # Upload tarball to remote host, next to the directory it is extracted into
+        remote_tarball = remote_repo_dir.with_name(remote_repo_dir.name + ".tar.gz")
+        quoted_repo_dir = shlex.quote(str(remote_repo_dir))
+        quoted_tarball = shlex.quote(str(remote_tarball))
 
         with log_span("Uploading mngr monorepo to remote host"):
             tarball_content = tarball_path.read_bytes()
@@ -296,19 +313,19 @@ def _install_mngr_editable_remote(
 
         # Extract and install on remote
         with log_span("Installing mngr (editable mode, remote)"):
-            extract_cmd = f"rm -rf {remote_repo_dir} && mkdir -p {remote_repo_dir} && tar -xzf {remote_tarball} -C {remote_repo_dir} && rm {remote_tarball}"
+            extract_cmd = f"rm -rf {quoted_repo_dir} && mkdir -p {quoted_repo_dir} && tar -xzf {quoted_tarball} -C {quoted_repo_dir} && rm {quoted_tarball}"
             result = host.execute_idempotent_command(extract_cmd)
             if not result.success:
                 raise MngrError(f"Failed to extract mngr tarball: {result.stderr.strip()}")
 
             # Build the install command with editable installs for all workspace packages
             # First, discover which libs exist in the tarball
-            ls_result = host.execute_idempotent_command(f"ls {remote_repo_dir}/libs/")
+            ls_result = host.execute_idempotent_command(f"ls {quoted_repo_dir}/libs/")
             if not ls_result.success:
                 raise MngrError(f"Failed to list mngr libs: {ls_result.stderr.strip()}")
 
             lib_names = ls_result.stdout.strip().split()
-            install_parts = [f"{_UV_PATH_PREFIX}{uv_env}cd {remote_repo_dir} && uv tool install -e libs/mngr"]
+            install_parts = [f"{_UV_PATH_PREFIX}{uv_env}cd {quoted_repo_dir} && uv tool install -e libs/mngr"]
             for lib_name in lib_names:
                 if lib_name != "imbue-mngr" and lib_name.startswith("mngr_"):
                     install_parts.append(f"--with-editable libs/{lib_name}")
@@ -322,11 +339,258 @@ def _install_mngr_editable_remote(
                     raise MngrError(f"Failed to install mngr in editable mode: {result.stderr.strip()}")
 
 
+_SHARED_INSTALLS_DIR_NAME: Final[str] = "mngr_installs"
+
+_SHARED_INSTALLS_LOCK_FILE_NAME: Final[str] = ".lock"
+
+_SHARED_INSTALLS_LOCK_TIMEOUT_SECONDS: Final[int] = 600
+
+_INSTALL_KEY_FILE_NAME: Final[str] = "install_key"
+"""Written into a shared install directory once the install in it has completed."""
+
+_MISSING_INSTALL_MARKER: Final[str] = "MNGR_SHARED_INSTALL_MISSING"
+
+# Run while holding the shared installs lock, with the arguments
+# (installs dir, install key, staged install dir name or "", agents dir, agent state dir).
+#
+# uv tool venvs refer to their own absolute paths, so installs are never moved. Each one is
+# made in a uniquely named staging directory instead, and published by pointing a symlink
+# named after its key at it, unless an install with that key was published meanwhile. The
+# agent is then linked to the published install, and the installs (and stale staging
+# directories left behind by interrupted installs) that no agent links to are pruned.
+_PUBLISH_AND_LINK_SCRIPT: Final[str] = f"""
+installs_dir=$1; key=$2; staged=$3; agents_dir=$4; agent_dir=$5
+cd "$installs_dir" || exit 1
+if [ -f "$key/{_INSTALL_KEY_FILE_NAME}" ]; then
+    if [ -n "$staged" ]; then rm -rf "$staged"; fi
+elif [ -n "$staged" ]; then
+    rm -rf "$key" && ln -s "$staged" "$key" || exit 1
+else
+    echo {_MISSING_INSTALL_MARKER}; exit 0
+fi
+mkdir -p "$agent_dir" || exit 1
+for name in tools bin; do
+    rm -rf "$agent_dir/$name" && ln -s "$installs_dir/$key/$name" "$agent_dir/$name" || exit 1
+done
+referenced=$(for link in "$agents_dir"/*/tools; do if [ -L "$link" ]; then readlink "$link"; fi; done)
+for entry in *; do
+    if [ -L "$entry" ] && ! printf '%s\n' "$referenced" | grep -qxF "$installs_dir/$entry/tools"; then
+        rm -rf "$(readlink "$entry")" "$entry"
+    fi
+done
+published=$(for entry in *; do if [ -L "$entry" ]; then readlink "$entry"; fi; done)
+for entry in *; do
+    if [ -d "$entry" ] && [ ! -L "$entry" ] \
+        && ! printf '%s\n' "$published" | grep -qxF "$entry" \
+        && ! printf '%s\n' "$referenced" | grep -qxF "$installs_dir/$entry/tools" \
+        && [ -n "$(find "$entry" -maxdepth 0 -mmin +1440)" ]; then
+        rm -rf "$entry"
+    fi
+done
+"""
+
+
+# Runs its remaining arguments as a command while holding the lock at $1. Uses flock(1) where the
+# host has it (it does not exist on macOS, for example), and otherwise an mkdir lock next to the
+# lock file, which is taken over once it is older than the lock timeout (e.g. when the process
+# holding it was killed).
+_LOCKED_RUN_SCRIPT: Final[str] = f"""
+lock=$1; shift
+if command -v flock >/dev/null 2>&1; then exec flock "$lock" "$@"; fi
+lock_dir="$lock.d"; waited=0
+until mkdir "$lock_dir" 2>/dev/null; do
+    if [ -n "$(find "$lock_dir" -maxdepth 0 -mmin +{_SHARED_INSTALLS_LOCK_TIMEOUT_SECONDS // 60} 2>/dev/null)" ]; then
+        rmdir "$lock_dir" 2>/dev/null; continue
+    fi
+    if [ "$waited" -ge {_SHARED_INSTALLS_LOCK_TIMEOUT_SECONDS} ]; then echo "Timed out waiting for $lock_dir" >&2; exit 1; fi
+    sleep 1; waited=$((waited + 1))
+done
+trap 'rmdir "$lock_dir"' EXIT
+trap 'exit 1' HUP INT TERM
+"$@"
+"""
+
+
+def _try_lock_file(lock_file: io.TextIOWrapper) -> bool:
+    """Try to take an exclusive flock on a file without blocking, returning whether it was taken."""
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+@contextmanager
+def _lock_local_shared_installs(installs_dir: Path) -> Iterator[None]:
+    """Hold the lock on the shared installs directory of the local host."""
+    installs_dir.mkdir(parents=True, exist_ok=True)
+    lock_path = installs_dir / _SHARED_INSTALLS_LOCK_FILE_NAME
+    # Closing the file also releases the lock
+    with open(lock_path, "w") as lock_file:
+        try:
+            wait_for(
+                lambda: _try_lock_file(lock_file),
+                timeout=_SHARED_INSTALLS_LOCK_TIMEOUT_SECONDS,
+                poll_interval=0.1,
+                error_message=f"Failed to acquire lock {lock_path} within {_SHARED_INSTALLS_LOCK_TIMEOUT_SECONDS}s",
+            )
+        except TimeoutError as e:
+            raise MngrError(str(e)) from e
+        yield
+
+
+@pure
+def _compute_install_key(parts: Sequence[str]) -> str:
+    """Compute a short content hash identifying everything that determines an install."""
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _get_package_install_key(packages: Sequence[tuple[str, str]]) -> str:
+    """Get the install key for a package-mode install of the given (name, version) packages."""
+    return _compute_install_key(["package", *sorted(f"{name}=={version}" for name, version in packages)])
+
+
+def _get_git_tree_hash(repo_root: Path, cg: ConcurrencyGroup) -> str:
+    """Get the hash of the git tree at HEAD, i.e. of exactly the content that git archive packages."""
+    try:
+        result = cg.run_process_to_completion(["git", "rev-parse", "HEAD^{tree}"], cwd=repo_root)
+    except ProcessError as e:
+        raise MngrError(f"Failed to get git tree hash of {repo_root}: {e.stderr.strip()}") from e
+    return result.stdout.strip()
+
+
+def _get_editable_install_key(host: OnlineHostInterface, repo_root: Path, cg: ConcurrencyGroup) -> str:
+    """Get the install key for an editable-mode install from the given monorepo.
+
+    Local installs point at the live source tree, so they only depend on where
+    it is and which plugin libs it has. Remote installs depend on the content
+    of the uploaded tree.
+    """
+    if host.is_local:
+        libs_dir = repo_root / "libs"
+        lib_names = sorted(d.name for d in libs_dir.iterdir() if d.is_dir()) if libs_dir.is_dir() else []
+        return _compute_install_key(["editable-local", str(repo_root), *lib_names])
+    return _compute_install_key(["editable-remote", _get_git_tree_hash(repo_root, cg)])
+
+
+def _get_shared_installs_dir(host: OnlineHostInterface) -> Path:
+    """Get the directory holding the shared mngr installs on the host."""
+    return host.host_dir / _SHARED_INSTALLS_DIR_NAME
+
+
+def _is_shared_install_complete(host: OnlineHostInterface, install_dir: Path, install_key: str) -> bool:
+    """Check whether a completed install with the given key is already present in install_dir."""
+    result = host.execute_idempotent_command(f"cat {shlex.quote(str(install_dir / _INSTALL_KEY_FILE_NAME))}")
+    return result.success and result.stdout.strip() == install_key
+
+
+def _stage_shared_mngr_install(
+    host: OnlineHostInterface,
+    install_key: str,
+    packages: list[tuple[str, str]],
+    repo_root: Path | None,
+) -> str:
+    """Install mngr into a new staging directory next to the shared installs, returning its name.
+
+    The staging directory is removed again if the install fails.
+    """
+    staged_name = f"{install_key}.{uuid4().hex}"
+    staging_dir = _get_shared_installs_dir(host) / staged_name
+    tool_dir = staging_dir / "tools"
+    bin_dir = staging_dir / "bin"
+    for d in (tool_dir, bin_dir):
+        mkdir_result = host.execute_idempotent_command(f"mkdir -p {shlex.quote(str(d))}")
+        if not mkdir_result.success:
+            raise MngrError(f"Failed to create directory {d}: {mkdir_result.stderr}")
+
+    try:
+        if repo_root is None:
+            _install_mngr_package_mode(host, packages, tool_dir, bin_dir)
+        else:
+            _install_mngr_editable_mode(host, repo_root, staging_dir)
+        # Only written once the install succeeded, so that an incomplete install is never published
+        host.write_text_file(staging_dir / _INSTALL_KEY_FILE_NAME, install_key)
+    except MngrError:
+        host.execute_idempotent_command(f"rm -rf {shlex.quote(str(staging_dir))}")
+        raise
+    return staged_name
+
+
+def _publish_and_link_shared_install(
+    host: OnlineHostInterface,
+    install_key: str,
+    staged_name: str | None,
+    agent_state_dir: Path,
+) -> bool:
+    """Publish a staged install (if any), link the agent to the install with the key, and prune unused installs.
+
+    Returns False, without linking the agent, if no install with the key is published
+    (e.g. because it was pruned since it was found) and none was staged.
+    """
+    installs_dir = _get_shared_installs_dir(host)
+    args = [str(installs_dir), install_key, staged_name or "", str(host.host_dir / "agents"), str(agent_state_dir)]
+    publish_command = ["sh", "-c", _PUBLISH_AND_LINK_SCRIPT, "sh", *args]
+    if host.is_local:
+        with _lock_local_shared_installs(installs_dir):
+            result = host.execute_idempotent_command(shlex.join(publish_command))
+    else:
+        lock_path = str(installs_dir / _SHARED_INSTALLS_LOCK_FILE_NAME)
+        locked_command = shlex.join(["sh", "-c", _LOCKED_RUN_SCRIPT, "sh", lock_path, *publish_command])
+        result = host.execute_idempotent_command(f"mkdir -p {shlex.quote(str(installs_dir))} && {locked_command}")
+    if not result.success:
+        raise MngrError(f"Failed to link agent to shared mngr install {install_key}: {result.stderr.strip()}")
+    return _MISSING_INSTALL_MARKER not in result.stdout
+
+
+def _ensure_shared_mngr_install(
+    host: OnlineHostInterface,
+    resolved_mode: MngrInstallMode,
+    agent_state_dir: Path,
+    mngr_ctx: MngrContext,
+) -> None:
+    """Link the agent to a shared mngr install matching the local mngr, installing it first if needed.
+
+    Installs are keyed by a hash of the installed package versions (package mode)
+    or of the monorepo tree (editable mode), and kept under host_dir so that every
+    agent on the host installing the same mngr can share them. Nothing is
+    uploaded or installed when an install with the same key is already present.
+    Installs that no agent links to anymore are pruned.
+    """
+    match resolved_mode:
+        case MngrInstallMode.PACKAGE:
+            packages = _get_installed_mngr_packages()
+            if not packages:
+                logger.warning("No mngr packages found locally; cannot install for agent")
+                return
+            repo_root = None
+            install_key = _get_package_install_key(packages)
+        case MngrInstallMode.EDITABLE:
+            packages = []
+            repo_root = _get_mngr_repo_root()
+            install_key = _get_editable_install_key(host, repo_root, mngr_ctx.concurrency_group)
+        case MngrInstallMode.SKIP:
+            return
+        case MngrInstallMode.AUTO:
+            raise MngrError(f"Unexpected unresolved install mode: {resolved_mode}")
+        case _ as unreachable:
+            assert_never(unreachable)
+
+    if _is_shared_install_complete(host, _get_shared_installs_dir(host) / install_key, install_key):
+        logger.debug("Reusing shared mngr install {}", install_key)
+        if _publish_and_link_shared_install(host, install_key, None, agent_state_dir):
+            return
+        logger.debug("Shared mngr install {} was pruned before it could be linked", install_key)
+
+    staged_name = _stage_shared_mngr_install(host, install_key, packages, repo_root)
+    if not _publish_and_link_shared_install(host, install_key, staged_name, agent_state_dir):
+        raise MngrError(f"Shared mngr install {install_key} disappeared while it was being published")
+
+
 def _get_agent_state_dir(agent: AgentInterface, host: OnlineHostInterface) -> Path:
     """Get the agent's state directory path.
 
     Mirrors the convention in host.py:_get_agent_state_dir and
-    base_agent.py:_get_agent_dir.
+    base_agent.py:get_agent_dir.
     """
     return host.host_dir / "agents" / str(agent.id)
 
@@ -386,17 +650,18 @@ def provision_mngr_for_agent(
     host: OnlineHostInterface,
     mngr_ctx: MngrContext,
 ) -> None:
-    """Install mngr into the agent's state directory.
+    """Give the agent its own mngr, linked from a shared install on the host.
 
     Installs mngr using ``uv tool install`` with ``UV_TOOL_DIR`` and
-    ``UV_TOOL_BIN_DIR`` set to per-agent directories, so each agent gets
-    its own isolated mngr installation:
+    ``UV_TOOL_BIN_DIR`` set to a shared install directory keyed by a hash of
+    what is installed, then links the agent's directories to it:
 
     - ``<agent_state_dir>/tools/``  -- tool venv (UV_TOOL_DIR)
     - ``<agent_state_dir>/bin/``    -- entrypoint script (UV_TOOL_BIN_DIR)
 
-    This ensures multiple agents on the same host (even local) can each
-    have their own mngr version without conflicts.
+    Agents that need the same mngr share one install, so only the first of them
+    pays for the upload and install. Agents that need a different mngr version
+    get a different install, so they still do not conflict.
     """
     plugin_config = mngr_ctx.get_plugin_config("recursive", RecursivePluginConfig)
 
@@ -406,32 +671,10 @@ def provision_mngr_for_agent(
         return
 
     agent_state_dir = _get_agent_state_dir(agent, host)
-    tool_dir = agent_state_dir / "tools"
-    bin_dir = agent_state_dir / "bin"
 
     try:
         with log_span("Installing mngr for agent '{}' into {}", agent.name, agent_state_dir):
-            # Create the target directories
-            for d in (tool_dir, bin_dir):
-                mkdir_result = host.execute_idempotent_command(f"mkdir -p {shlex.quote(str(d))}")
-                if not mkdir_result.success:
-                    raise MngrError(f"Failed to create directory {d}: {mkdir_result.stderr}")
-
-            match resolved_mode:
-                case MngrInstallMode.PACKAGE:
-                    packages = _get_installed_mngr_packages()
-                    if packages:
-                        _install_mngr_package_mode(host, packages, tool_dir, bin_dir)
-                    else:
-                        logger.warning("No mngr packages found locally; cannot install for agent")
-                case MngrInstallMode.EDITABLE:
-                    _install_mngr_editable_mode(host, tool_dir, bin_dir)
-                case MngrInstallMode.SKIP:
-                    pass
-                case MngrInstallMode.AUTO:
-                    raise MngrError(f"Unexpected unresolved install mode: {resolved_mode}")
-                case _ as unreachable:
-                    assert_never(unreachable)
+            _ensure_shared_mngr_install(host, resolved_mode, agent_state_dir, mngr_ctx)
 
     except MngrError as e:
         if plugin_config.is_errors_fatal:
@@ -1,5 +1,8 @@
 """Unit tests for mngr_recursive provisioning logic."""
 
+import os
+import shutil
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -13,10 +16,13 @@ from imbue.mngr.providers.deploy_utils import MngrInstallMode
 from imbue.mngr_recursive.data_types import RecursivePluginConfig
 from imbue.mngr_recursive.plugin import on_host_created
 from imbue.mngr_recursive.provisioning import _build_uv_env_prefix
+from imbue.mngr_recursive.provisioning import _compute_install_key
 from imbue.mngr_recursive.provisioning import _ensure_uv_available
 from imbue.mngr_recursive.provisioning import _get_installed_mngr_packages
 from imbue.mngr_recursive.provisioning import _get_mngr_repo_root
+from imbue.mngr_recursive.provisioning import _get_package_install_key
 from imbue.mngr_recursive.provisioning import _install_mngr_package_mode
+from imbue.mngr_recursive.provisioning import _publish_and_link_shared_install
 from imbue.mngr_recursive.provisioning import _resolve_remote_path
 from imbue.mngr_recursive.provisioning import _upload_deploy_files
 from imbue.mngr_recursive.provisioning import provision_mngr_for_agent
@@ -277,10 +283,10 @@ def test_agent_package_mode_builds_correct_command() -> None:
     assert "imbue-mngr==0.1.4" in install_cmd
     assert "--with imbue-mngr-pair==0.1.0" in install_cmd
 
-    # Verify UV_TOOL_DIR and UV_TOOL_BIN_DIR are set to agent-specific paths
-    agent_state_dir = host_dir / "agents" / "agent-123"
-    assert str(agent_state_dir / "tools") in install_cmd
-    assert str(agent_state_dir / "bin") in install_cmd
+    # Verify UV_TOOL_DIR and UV_TOOL_BIN_DIR are set to a shared install directory
+    install_dir = host_dir / "mngr_installs"
+    assert f"UV_TOOL_DIR={install_dir}/" in install_cmd
+    assert f"UV_TOOL_BIN_DIR={install_dir}/" in install_cmd
 
 
 def test_agent_editable_local_mode_builds_correct_command(tmp_path: Path) -> None:
@@ -320,10 +326,10 @@ def test_agent_editable_local_mode_builds_correct_command(tmp_path: Path) -> Non
     # Should NOT include non-mngr libs (like imbue_common)
     assert "imbue_common" not in install_cmd
 
-    # Should have per-agent UV_TOOL_DIR and UV_TOOL_BIN_DIR
-    agent_state_dir = host_dir / "agents" / "agent-123"
-    assert str(agent_state_dir / "tools") in install_cmd
-    assert str(agent_state_dir / "bin") in install_cmd
+    # Should have a shared UV_TOOL_DIR and UV_TOOL_BIN_DIR
+    install_dir = host_dir / "mngr_installs"
+    assert f"UV_TOOL_DIR={install_dir}/" in install_cmd
+    assert f"UV_TOOL_BIN_DIR={install_dir}/" in install_cmd
 
     # Should cd to the repo root
     assert str(repo_root) in install_cmd
@@ -368,8 +374,8 @@ def test_agent_errors_non_fatal_warns() -> None:
     provision_mngr_for_agent(agent=agent, host=host, mngr_ctx=ctx)
 
 
-def test_agent_creates_tool_and_bin_dirs() -> None:
-    """provision_mngr_for_agent should create the tools/ and bin/ directories."""
+def test_agent_links_tool_and_bin_dirs_to_shared_install() -> None:
+    """provision_mngr_for_agent should stage the install and then link the agent's directories to it."""
     host_dir = Path("/tmp/mngr-test/host")
     host = _make_mock_host(host_dir=host_dir)
     host.execute_idempotent_command.return_value = _make_command_result(True)
@@ -377,15 +383,158 @@ def test_agent_creates_tool_and_bin_dirs() -> None:
         plugin_config=RecursivePluginConfig(install_mode=MngrInstallMode.PACKAGE),
     )
     agent = _make_mock_agent(mngr_ctx=ctx)
+    install_key = _get_package_install_key([("imbue-mngr", "0.1.4")])
 
     with patch("imbue.mngr_recursive.provisioning._get_installed_mngr_packages") as mock_packages:
         mock_packages.return_value = [("imbue-mngr", "0.1.4")]
         provision_mngr_for_agent(agent=agent, host=host, mngr_ctx=ctx)
 
-    agent_state_dir = host_dir / "agents" / "agent-123"
+    staging_dir = host.write_text_file.call_args.args[0].parent
+    assert staging_dir.parent == host_dir / "mngr_installs"
+    assert staging_dir.name.startswith(f"{install_key}.")
+    host.write_text_file.assert_called_once_with(staging_dir / "install_key", install_key)
     mkdir_calls = [str(call) for call in host.execute_idempotent_command.call_args_list if "mkdir -p" in str(call)]
-    assert any(str(agent_state_dir / "tools") in c for c in mkdir_calls)
-    assert any(str(agent_state_dir / "bin") in c for c in mkdir_calls)
+    assert any(str(staging_dir / "tools") in c for c in mkdir_calls)
+    assert any(str(staging_dir / "bin") in c for c in mkdir_calls)
+    link_calls = [str(call) for call in host.execute_idempotent_command.call_args_list if "flock" in str(call)]
+    assert len(link_calls) == 1
+    assert (
+        f"{install_key} {staging_dir.name} {host_dir / 'agents'} {host_dir / 'agents' / 'agent-123'}"
+        in (link_calls[0])
+    )
+
+
+def test_agent_reuses_existing_shared_install() -> None:
+    """When the shared install for the same packages is already present, nothing is installed again."""
+    packages = [("imbue-mngr", "0.1.4"), ("imbue-mngr-pair", "0.1.0")]
+    install_key = _get_package_install_key(packages)
+    host = _make_mock_host()
+    host.execute_idempotent_command.side_effect = lambda cmd, **kwargs: _make_command_result(
+        True, stdout=f"{install_key}\n" if cmd.endswith("install_key") else ""
+    )
+    ctx = _make_mock_mngr_ctx(
+        plugin_config=RecursivePluginConfig(is_errors_fatal=True, install_mode=MngrInstallMode.PACKAGE),
+    )
+    agent = _make_mock_agent(mngr_ctx=ctx)
+
+    with patch("imbue.mngr_recursive.provisioning._get_installed_mngr_packages") as mock_packages:
+        mock_packages.return_value = packages
+        provision_mngr_for_agent(agent=agent, host=host, mngr_ctx=ctx)
+
+    commands = [str(call) for call in host.execute_idempotent_command.call_args_list]
+    assert not any("uv tool install" in c for c in commands)
+    link_commands = [
+        call.args[0] for call in host.execute_idempotent_command.call_args_list if "flock" in call.args[0]
+    ]
+    assert len(link_commands) == 1 and f"{install_key} '' " in link_commands[0]
+    host.write_text_file.assert_not_called()
+
+
+def _make_shell_host(
+    host_dir: Path, cg: ConcurrencyGroup, is_local: bool = True, env: dict[str, str] | None = None
+) -> MagicMock:
+    """Create a mock host that runs its commands in a local shell."""
+    host = _make_mock_host(is_local=is_local, host_dir=host_dir)
+
+    def run_command(cmd: str, **kwargs: object) -> CommandResult:
+        finished = cg.run_process_to_completion(["sh", "-c", cmd], is_checked_after=False, env=env)
+        return _make_command_result(finished.returncode == 0, stdout=finished.stdout, stderr=finished.stderr)
+
+    host.execute_idempotent_command.side_effect = run_command
+    return host
+
+
+def _make_staged_install(installs_dir: Path, staged_name: str, install_key: str) -> Path:
+    staging_dir = installs_dir / staged_name
+    for name in ("tools", "bin"):
+        (staging_dir / name).mkdir(parents=True)
+    (staging_dir / "install_key").write_text(install_key)
+    return staging_dir
+
+
+def test_publish_links_agents_and_prunes_unused_installs(
+    tmp_path: Path, test_concurrency_group: ConcurrencyGroup
+) -> None:
+    host = _make_shell_host(tmp_path, test_concurrency_group)
+    installs_dir = tmp_path / "mngr_installs"
+    agent_dir = tmp_path / "agents" / "agent-1"
+    old_staging_dir = _make_staged_install(installs_dir, "old.aaa", "old")
+
+    assert _publish_and_link_shared_install(host, "old", "old.aaa", agent_dir)
+    assert (installs_dir / "old").resolve() == old_staging_dir
+    assert (agent_dir / "tools").resolve() == old_staging_dir / "tools"
+
+    # Interrupted installs are only pruned once they are stale, since they may still be in progress
+    stale_staging_dir = _make_staged_install(installs_dir, "stale.bbb", "stale")
+    two_days_ago = time.time() - 2 * 24 * 60 * 60
+    os.utime(stale_staging_dir, (two_days_ago, two_days_ago))
+    in_progress_staging_dir = _make_staged_install(installs_dir, "in-progress.ccc", "in-progress")
+    new_staging_dir = _make_staged_install(installs_dir, "new.ddd", "new")
+
+    assert _publish_and_link_shared_install(host, "new", "new.ddd", agent_dir)
+
+    assert (agent_dir / "bin").resolve() == new_staging_dir / "bin"
+    assert sorted(path.name for path in installs_dir.iterdir()) == [".lock", "in-progress.ccc", "new", "new.ddd"]
+    assert in_progress_staging_dir.is_dir()
+
+
+def test_publish_keeps_the_install_published_first(tmp_path: Path, test_concurrency_group: ConcurrencyGroup) -> None:
+    host = _make_shell_host(tmp_path, test_concurrency_group)
+    installs_dir = tmp_path / "mngr_installs"
+    first_staging_dir = _make_staged_install(installs_dir, "key.aaa", "key")
+    _make_staged_install(installs_dir, "key.bbb", "key")
+    second_agent_dir = tmp_path / "agents" / "agent-2"
+
+    assert _publish_and_link_shared_install(host, "key", "key.aaa", tmp_path / "agents" / "agent-1")
+    assert _publish_and_link_shared_install(host, "key", "key.bbb", second_agent_dir)
+
+    assert (second_agent_dir / "tools").resolve() == first_staging_dir / "tools"
+    assert sorted(path.name for path in installs_dir.iterdir()) == [".lock", "key", "key.aaa"]
+
+
+def _make_path_without_flock(bin_dir: Path) -> str:
+    """Return a PATH with the commands the publish script uses, but without flock (as on macOS)."""
+    bin_dir.mkdir()
+    for name in ("sh", "mkdir", "rmdir", "rm", "ln", "readlink", "find", "grep", "sleep"):
+        command_path = shutil.which(name)
+        assert command_path is not None
+        (bin_dir / name).symlink_to(command_path)
+    return str(bin_dir)
+
+
+def test_publish_on_a_remote_host_without_flock_uses_an_mkdir_lock(
+    tmp_path: Path, test_concurrency_group: ConcurrencyGroup
+) -> None:
+    host_dir = tmp_path / "host"
+    host = _make_shell_host(
+        host_dir,
+        test_concurrency_group,
+        is_local=False,
+        env={"PATH": _make_path_without_flock(tmp_path / "bin")},
+    )
+    installs_dir = host_dir / "mngr_installs"
+    staging_dir = _make_staged_install(installs_dir, "key.aaa", "key")
+    agent_dir = host_dir / "agents" / "agent-1"
+
+    assert _publish_and_link_shared_install(host, "key", "key.aaa", agent_dir)
+
+    assert (agent_dir / "tools").resolve() == staging_dir / "tools"
+    # The lock is released again once the install is published
+    assert sorted(path.name for path in installs_dir.iterdir()) == ["key", "key.aaa"]
+
+
+def test_publish_reports_a_missing_install(tmp_path: Path, test_concurrency_group: ConcurrencyGroup) -> None:
+    host = _make_shell_host(tmp_path, test_concurrency_group)
+    agent_dir = tmp_path / "agents" / "agent-1"
+
+    assert not _publish_and_link_shared_install(host, "key", None, agent_dir)
+    assert not agent_dir.exists()
+
+
+def test_package_install_key_depends_on_versions_but_not_order() -> None:
+    key = _get_package_install_key([("imbue-mngr", "0.1.4"), ("imbue-mngr-pair", "0.1.0")])
+    assert key == _get_package_install_key([("imbue-mngr-pair", "0.1.0"), ("imbue-mngr", "0.1.4")])
+    assert key != _get_package_install_key([("imbue-mngr", "0.1.5"), ("imbue-mngr-pair", "0.1.0")])
 
 
 # --- uv installation ---
@@ -548,6 +697,8 @@ def test_install_package_mode_raises_when_force_reinstall_also_fails() -> None:
     host.execute_idempotent_command.side_effect = [
         _make_command_result(False, stderr="install failed"),
         _make_command_result(False, stderr="reinstall also failed"),
+        # Removal of the staging directory
+        _make_command_result(True),
     ]
     with pytest.raises(MngrError, match="Failed to install mngr"):
         _install_mngr_package_mode(host, [("imbue-mngr", "0.1.4")], Path("/tools"), Path("/bin"))
@@ -616,10 +767,14 @@ def test_editable_local_raises_when_force_reinstall_also_fails(tmp_path: Path) -
     host_dir.mkdir()
     host = _make_mock_host(is_local=True, host_dir=host_dir)
     host.execute_idempotent_command.side_effect = [
+        # No shared install present yet
+        _make_command_result(False),
         _make_command_result(True),
         _make_command_result(True),
         _make_command_result(False, stderr="install failed"),
         _make_command_result(False, stderr="reinstall also failed"),
+        # Removal of the staging directory
+        _make_command_result(True),
     ]
 
     ctx = _make_mock_mngr_ctx(
@@ -631,3 +786,31 @@ def test_editable_local_raises_when_force_reinstall_also_fails(tmp_path: Path) -
         mock_root.return_value = repo_root
         with pytest.raises(MngrError, match="Failed to install mngr in editable mode"):
             provision_mngr_for_agent(agent=agent, host=host, mngr_ctx=ctx)
+
+
+def test_editable_remote_skips_upload_when_tree_already_installed(test_concurrency_group: ConcurrencyGroup) -> None:
+    """A remote editable install of an already installed monorepo tree uploads and installs nothing."""
+    install_key = _compute_install_key(["editable-remote", "abc123"])
+    host = _make_mock_host(is_local=False)
+    host.execute_idempotent_command.side_effect = lambda cmd, **kwargs: _make_command_result(
+        True, stdout=install_key if cmd.endswith("install_key") else ""
+    )
+    ctx = _make_mock_mngr_ctx(
+        plugin_config=RecursivePluginConfig(is_errors_fatal=True, install_mode=MngrInstallMode.EDITABLE),
+        concurrency_group=test_concurrency_group,
+    )
+    agent = _make_mock_agent(mngr_ctx=ctx)
+
+    with (
+        patch("imbue.mngr_recursive.provisioning._get_mngr_repo_root", return_value=Path("/repo")),
+        patch("imbue.mngr_recursive.provisioning._get_git_tree_hash", return_value="abc123"),
+    ):
+        provision_mngr_for_agent(agent=agent, host=host, mngr_ctx=ctx)
+
+    host.write_file.assert_not_called()
+    commands = [str(call) for call in host.execute_idempotent_command.call_args_list]
+    assert not any("uv tool install" in c for c in commands)
+    link_commands = [
+        call.args[0] for call in host.execute_idempotent_command.call_args_list if "flock" in call.args[0]
+    ]
+    assert len(link_commands) == 1 and f"{install_key} '' " in link_commands[0]
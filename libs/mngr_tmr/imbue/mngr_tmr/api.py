@@ -27,6 +27,7 @@ from imbue.mngr.config.data_types import MngrContext
 from imbue.mngr.errors import AgentNotFoundOnHostError
 from imbue.mngr.errors import HostError
 from imbue.mngr.errors import MngrError
+from imbue.mngr.hosts.host import Host
 from imbue.mngr.hosts.host import HostLocation
 from imbue.mngr.interfaces.agent import AgentInterface
 from imbue.mngr.interfaces.data_types import AgentDetails
@@ -39,6 +40,8 @@ from imbue.mngr.interfaces.host import OnlineHostInterface
 from imbue.mngr.primitives import AgentId
 from imbue.mngr.primitives import AgentLifecycleState
 from imbue.mngr.primitives import AgentName
+from imbue.mngr.primitives import DiscoveredAgent
+from imbue.mngr.primitives import DiscoveredHost
 from imbue.mngr.primitives import ErrorBehavior
 from imbue.mngr.primitives import HostName
 from imbue.mngr.primitives import LOCAL_PROVIDER_NAME
@@ -46,6 +49,8 @@ from imbue.mngr.primitives import ProviderInstanceName
 from imbue.mngr.primitives import SnapshotName
 from imbue.mngr.primitives import TransferMode
 from imbue.mngr.primitives import UncommittedChangesMode
+from imbue.mngr_tmr.completion import AgentCompletionMonitor
+from imbue.mngr_tmr.completion import FINISHED_STATES
 from imbue.mngr_tmr.data_types import Change
 from imbue.mngr_tmr.data_types import ChangeKind
 from imbue.mngr_tmr.data_types import ChangeStatus
@@ -60,18 +65,13 @@ from imbue.mngr_tmr.prompts import build_integrator_prompt
 from imbue.mngr_tmr.prompts import build_test_agent_prompt
 from imbue.mngr_tmr.report import generate_html_report
 
-_TERMINAL_STATES = frozenset(
-    {
-        AgentLifecycleState.DONE,
-        AgentLifecycleState.STOPPED,
-        AgentLifecycleState.WAITING,
-    }
-)
-
 _SHORT_ID_LENGTH = 6
 
 _MISSING_AGENT_MAX_ROUNDS = 30
 
+# Upper bound on hosts checked for agent completion at the same time
+_MAX_CONCURRENT_HOST_CHECKS = 256
+
 
 _LIST_AGENTS_TIMEOUT_SECONDS = 60.0
 
@@ -452,23 +452,76 @@ def launch_and_poll_agents(
     artifact_output_dir: Path | None = None,
     local_host: OnlineHostInterface | None = None,
 ) -> tuple[dict[str, AgentDetails], set[str], dict[str, TestResult]]:
-    """Launch agents incrementally and poll until all finish.
+    """Launch agents incrementally and wait until all finish.
 
     Handles two modes depending on arguments:
 
     1. Incremental launching (max_agents > 0, test_node_ids non-empty): launches
-       up to max_agents at a time, polling and launching more as capacity opens.
+       up to max_agents at a time, launching more as capacity opens.
     2. Pre-launched polling (test_node_ids empty, all_agents pre-populated):
-       polls the already-launched agents without launching any new ones.
+       waits for the already-launched agents without launching any new ones.
+
+    Completion is detected per host by an AgentCompletionMonitor: one blocking
+    check per host covers all of its pending agents and returns as soon as one
+    writes its result file or reaches a finished lifecycle state. Agents whose
+    host check keeps failing fall back to reading their result file directly
+    every result_check_interval_seconds. poll_interval_seconds bounds how long
+    the loop waits between timeout checks and launches.
 
     all_agents and all_hosts are input/output parameters: pre-existing entries
     are tracked from the start, and newly launched agents are appended during
     execution.
 
-    Returns (final_details, timed_out_ids) where final_details maps agent_id
-    strings to AgentDetails, and timed_out_ids is the set of agent_id strings
-    that were stopped because they exceeded agent_timeout_seconds.
+    Returns (final_details, timed_out_ids, cached_results) where final_details
+    maps agent_id strings to AgentDetails (missing for agents whose details could
+    not be read, such as those detected by a direct read of their result file),
+    timed_out_ids is the set of agent_id strings that were stopped because they
+    exceeded agent_timeout_seconds, and cached_results holds results read before
+    each finished agent was stopped.
     """
+    with ConcurrencyGroupExecutor(
+        parent_cg=mngr_ctx.concurrency_group,
+        name="tmr_completion",
+        max_workers=_MAX_CONCURRENT_HOST_CHECKS,
+    ) as executor:
+        monitor = AgentCompletionMonitor(executor=executor, retry_delay_seconds=poll_interval_seconds)
+        return _launch_and_wait_for_agents(
+            test_node_ids=test_node_ids,
+            config=config,
+            mngr_ctx=mngr_ctx,
+            pytest_flags=pytest_flags,
+            prompt_suffix=prompt_suffix,
+            max_agents=max_agents,
+            agent_timeout_seconds=agent_timeout_seconds,
+            poll_interval_seconds=poll_interval_seconds,
+            result_check_interval_seconds=result_check_interval_seconds,
+            report_path=report_path,
+            all_agents=all_agents,
+            all_hosts=all_hosts,
+            artifact_output_dir=artifact_output_dir,
+            local_host=local_host,
+            monitor=monitor,
+        )
+
+
+def _launch_and_wait_for_agents(
+    test_node_ids: list[str],
+    config: TmrLaunchConfig,
+    mngr_ctx: MngrContext,
+    pytest_flags: tuple[str, ...],
+    prompt_suffix: str,
+    max_agents: int,
+    agent_timeout_seconds: float,
+    poll_interval_seconds: float,
+    result_check_interval_seconds: float,
+    report_path: Path | None,
+    all_agents: list[TestAgentInfo],
+    all_hosts: dict[str, OnlineHostInterface],
+    artifact_output_dir: Path | None,
+    local_host: OnlineHostInterface | None,
+    monitor: AgentCompletionMonitor,
+) -> tuple[dict[str, AgentDetails], set[str], dict[str, TestResult]]:
+    """Body of launch_and_poll_agents, run while the monitor's executor is open."""
     remaining_tests = list(test_node_ids)
     pending_ids: set[str] = set()
     agent_id_to_info: dict[str, TestAgentInfo] = {}
@@ -486,7 +539,6 @@ def launch_and_poll_agents(
         agent_id_str = str(info.agent_id)
         agent_id_to_info[agent_id_str] = info
         pending_ids.add(agent_id_str)
-        last_result_check[agent_id_str] = info.created_at
 
     # Shared kwargs for _launch_agents_up_to_limit (avoids fragile *args tuple)
     launch_kwargs: dict = {
@@ -504,9 +556,7 @@ def launch_and_poll_agents(
 
     # Launch initial batch (no-op when remaining_tests is empty)
     _launch_agents_up_to_limit(**launch_kwargs)
-    for aid in pending_ids:
-        if aid not in last_result_check:
-            last_result_check[aid] = agent_id_to_info[aid].created_at
+    _track_new_agents(pending_ids, agent_id_to_info, all_hosts, last_result_check, monitor)
 
     if report_path is not None:
         current_results = build_current_results(all_agents, final_details, timed_out_ids, all_hosts)
@@ -520,6 +570,7 @@ def launch_and_poll_agents(
             info = agent_id_to_info[agent_id_str]
             elapsed = now - info.created_at
             if elapsed >= agent_timeout_seconds:
+                monitor.remove_agent(AgentId(agent_id_str))
                 # Before stopping, try to read the result file -- the agent may have finished
                 result = try_read_agent_result(AgentId(agent_id_str), all_hosts[agent_id_str])
                 if result is not None:
@@ -536,9 +587,7 @@ def launch_and_poll_agents(
 
         # Launch new agents if capacity opened up
         _launch_agents_up_to_limit(**launch_kwargs)
-        for aid in pending_ids:
-            if aid not in last_result_check:
-                last_result_check[aid] = agent_id_to_info[aid].created_at
+        _track_new_agents(pending_ids, agent_id_to_info, all_hosts, last_result_check, monitor)
 
         if timed_out_this_round and report_path is not None:
             current_results = build_current_results(all_agents, final_details, timed_out_ids, all_hosts)
@@ -550,57 +599,59 @@ def launch_and_poll_agents(
         if not pending_ids:
             continue
 
-        pending_names = [agent_id_to_info[aid].agent_name for aid in pending_ids]
-        logger.info("Polling {} pending agent(s): {}", len(pending_ids), ", ".join(str(n) for n in pending_names))
-        list_result = try_list_agents(mngr_ctx)
-        if list_result is None:
-            time.sleep(poll_interval_seconds)
-            continue
-
-        seen_ids: set[str] = set()
+        logger.debug("Waiting for {} pending agent(s)", len(pending_ids))
         changed = False
-        for agent_detail in list_result.agents:
-            agent_id_str = str(agent_detail.id)
-            seen_ids.add(agent_id_str)
+        for status in monitor.wait_for_agent_statuses(timeout_seconds=poll_interval_seconds):
+            agent_id_str = str(status.agent_id)
             if agent_id_str not in pending_ids:
                 continue
-            if agent_detail.state not in _TERMINAL_STATES:
+            info = agent_id_to_info[agent_id_str]
+
+            if status.state is None:
+                rounds = missing_rounds.get(agent_id_str, 0) + 1
+                missing_rounds[agent_id_str] = rounds
+                if rounds >= _MISSING_AGENT_MAX_ROUNDS:
+                    logger.warning("Agent {} disappeared after {} rounds, treating as error", agent_id_str, rounds)
+                    monitor.remove_agent(status.agent_id)
+                    pending_ids.discard(agent_id_str)
+                    changed = True
                 continue
 
-            logger.info("Agent '{}' finished (state={})", agent_detail.name, agent_detail.state)
-            final_details[agent_id_str] = agent_detail
+            logger.info(
+                "Agent '{}' finished (state={}, result file written={})",
+                info.agent_name,
+                status.state,
+                status.has_result_file,
+            )
+            monitor.remove_agent(status.agent_id)
             pending_ids.discard(agent_id_str)
             missing_rounds.pop(agent_id_str, None)
             changed = True
 
+            # Read the agent's details before it is stopped, for agents that finish without writing a result
+            detail = _try_get_agent_details(status.agent_id, info.agent_name, all_hosts[agent_id_str])
+            if detail is not None:
+                final_details[agent_id_str] = detail
             pre_read = _finalize_agent(
-                agent_id=agent_detail.id,
-                agent_name=agent_detail.name,
+                agent_id=status.agent_id,
+                agent_name=info.agent_name,
                 host=all_hosts[agent_id_str],
                 artifact_output_dir=artifact_output_dir,
                 local_host=local_host,
-                should_stop=agent_detail.state == AgentLifecycleState.WAITING,
+                should_stop=status.state not in (AgentLifecycleState.DONE, AgentLifecycleState.STOPPED),
             )
             if pre_read is not None:
                 cached_results[agent_id_str] = pre_read
 
-        for agent_id_str in list(pending_ids):
-            if agent_id_str not in seen_ids:
-                rounds = missing_rounds.get(agent_id_str, 0) + 1
-                missing_rounds[agent_id_str] = rounds
-                if rounds >= _MISSING_AGENT_MAX_ROUNDS:
-                    logger.warning("Agent {} disappeared after {} rounds, treating as error", agent_id_str, rounds)
-                    pending_ids.discard(agent_id_str)
-                    changed = True
-
         # Launch new agents if capacity opened up from finished agents
         _launch_agents_up_to_limit(**launch_kwargs)
-        for aid in pending_ids:
-            if aid not in last_result_check:
-                last_result_check[aid] = agent_id_to_info[aid].created_at
+        _track_new_agents(pending_ids, agent_id_to_info, all_hosts, last_result_check, monitor)
 
-        # Periodically check result files directly for agents whose status may be stale
+        # Agents whose host cannot be checked right now fall back to reading their result file directly
+        now = time.monotonic()
         for agent_id_str in list(pending_ids):
+            if monitor.is_watched(AgentId(agent_id_str)):
+                continue
             if now - last_result_check[agent_id_str] >= result_check_interval_seconds:
                 last_result_check[agent_id_str] = now
                 result = try_read_agent_result(AgentId(agent_id_str), all_hosts[agent_id_str])
@@ -610,6 +661,7 @@ def launch_and_poll_agents(
                         "Agent '{}' has result file (detected via direct check), treating as done",
                         info.agent_name,
                     )
+                    monitor.remove_agent(AgentId(agent_id_str))
                     pre_read = _finalize_agent(
                         agent_id=AgentId(agent_id_str),
                         agent_name=info.agent_name,
@@ -623,16 +675,48 @@ def launch_and_poll_agents(
                     pending_ids.discard(agent_id_str)
                     changed = True
 
-        if (changed or timed_out_this_round) and report_path is not None:
-            current_results = build_current_results(all_agents, final_details, timed_out_ids, all_hosts)
+        if changed and report_path is not None:
+            current_results = build_current_results(
+                all_agents, final_details, timed_out_ids, all_hosts, cached_results=cached_results
+            )
             generate_html_report(current_results, report_path, test_artifacts_dir=artifact_output_dir)
 
-        if pending_ids or remaining_tests:
-            time.sleep(poll_interval_seconds)
-
     return final_details, timed_out_ids, cached_results
 
 
+def _try_get_agent_details(
+    agent_id: AgentId,
+    agent_name: AgentName,
+    host: OnlineHostInterface,
+) -> AgentDetails | None:
+    """Build the AgentDetails of one agent on a host, returning None if they cannot be read."""
+    if not isinstance(host, Host):
+        return None
+    provider = host.provider_instance
+    host_ref = DiscoveredHost(host_id=host.id, host_name=host.get_name(), provider_name=provider.name)
+    agent_ref = DiscoveredAgent(host_id=host.id, agent_id=agent_id, agent_name=agent_name, provider_name=provider.name)
+    try:
+        _, agent_details = provider.get_host_and_agent_details(host_ref, [agent_ref])
+    except (MngrError, HostError) as exc:
+        logger.warning("Failed to read details of agent '{}': {}", agent_name, exc)
+        return None
+    return agent_details[0] if agent_details else None
+
+
+def _track_new_agents(
+    pending_ids: set[str],
+    agent_id_to_info: dict[str, TestAgentInfo],
+    all_hosts: dict[str, OnlineHostInterface],
+    last_result_check: dict[str, float],
+    monitor: AgentCompletionMonitor,
+) -> None:
+    """Start watching pending agents that are not tracked yet."""
+    for agent_id_str in pending_ids:
+        if agent_id_str not in last_result_check:
+            last_result_check[agent_id_str] = agent_id_to_info[agent_id_str].created_at
+            monitor.add_agent(AgentId(agent_id_str), all_hosts[agent_id_str])
+
+
 def _parse_result_json(raw: str) -> TestResult:
     """Parse a result.json string into a TestResult.
 
@@ -875,9 +959,29 @@ def pull_agent_branch(
 
     Returns the branch name if successful, None otherwise.
     """
-    branch_name = agent_detail.initial_branch
+    return _pull_branch_from_agent(
+        agent_detail.id,
+        agent_detail.name,
+        agent_detail.initial_branch,
+        host,
+        destination,
+        cg,
+        base_commit=base_commit,
+    )
+
+
+def _pull_branch_from_agent(
+    agent_id: AgentId,
+    agent_name: AgentName,
+    branch_name: str | None,
+    host: OnlineHostInterface,
+    destination: Path,
+    cg: ConcurrencyGroup,
+    base_commit: str | None = None,
+) -> str | None:
+    """Pull an agent's git branch into the local repo (see pull_agent_branch)."""
     if branch_name is None:
-        logger.warning("Agent '{}' has no branch to pull", agent_detail.name)
+        logger.warning("Agent '{}' has no branch to pull", agent_name)
         return None
 
     try:
@@ -885,7 +989,7 @@ def pull_agent_branch(
             _create_local_branch(destination, branch_name, base_commit, cg)
 
         pull_git(
-            agent=_get_agent_from_host(host, agent_detail.id),
+            agent=_get_agent_from_host(host, agent_id),
             host=host,
             destination=destination,
             source_branch=branch_name,
@@ -894,13 +998,13 @@ def pull_agent_branch(
             uncommitted_changes=UncommittedChangesMode.STASH,
             cg=cg,
         )
-        logger.info("Pulled branch '{}' from agent '{}'", branch_name, agent_detail.name)
+        logger.info("Pulled branch '{}' from agent '{}'", branch_name, agent_name)
         return branch_name
     except HostError as exc:
-        logger.warning("Connection lost while pulling branch from agent '{}': {}", agent_detail.name, exc)
+        logger.warning("Connection lost while pulling branch from agent '{}': {}", agent_name, exc)
         return None
     except (MngrError, ProcessError) as exc:
-        logger.warning("Failed to pull branch from agent '{}': {}", agent_detail.name, exc)
+        logger.warning("Failed to pull branch from agent '{}': {}", agent_name, exc)
         return None
 
 
@@ -1052,10 +1156,24 @@ def gather_results(
     if base_commit is not None:
         for result in results:
             if should_pull_changes(result):
-                agent_id_str = next(str(info.agent_id) for info in agents if info.test_node_id == result.test_node_id)
+                info = next(info for info in agents if info.test_node_id == result.test_node_id)
+                agent_id_str = str(info.agent_id)
                 detail = final_details.get(agent_id_str)
                 if detail is not None:
                     pull_agent_branch(detail, hosts[agent_id_str], source_dir, cg, base_commit=base_commit)
+                elif agent_id_str in hosts:
+                    # Agents detected through a direct read of their result file have no AgentDetails
+                    _pull_branch_from_agent(
+                        info.agent_id,
+                        info.agent_name,
+                        info.branch_name,
+                        hosts[agent_id_str],
+                        source_dir,
+                        cg,
+                        base_commit=base_commit,
+                    )
+                else:
+                    pass
 
     return results
 
@@ -1065,6 +1183,7 @@ def build_current_results(
     final_details: dict[str, AgentDetails],
     timed_out_ids: set[str],
     hosts: dict[str, OnlineHostInterface],
+    cached_results: dict[str, TestResult] | None = None,
 ) -> list[TestMapReduceResult]:
     """Build current results without pulling branches, for intermediate reports."""
     return _collect_agent_results(
@@ -1074,6 +1193,7 @@ def build_current_results(
         hosts=hosts,
         missing_detail_errored=False,
         missing_detail_summary="Agent is still running...",
+        cached_results=cached_results,
     )
 
 
@@ -1136,7 +1256,7 @@ def wait_for_integrator(
                 _stop_agent_on_host(host, agent_detail.id, agent_detail.name)
                 return agent_detail.initial_branch
 
-            if agent_detail.state in _TERMINAL_STATES:
+            if agent_detail.state in FINISHED_STATES:
                 logger.info("Integrator agent finished (state={})", agent_detail.state)
                 return agent_detail.initial_branch
 
@@ -417,7 +417,7 @@ def _run_integrator_phase(
     default=10.0,
     show_default=True,
     type=float,
-    help="Seconds between polling cycles when waiting for agents to finish",
+    help="Maximum seconds between checks for timed-out agents and free launch slots while waiting for agents to finish",
 )
 @click.option(
     "--timeout",
@@ -431,7 +431,7 @@ def _run_integrator_phase(
     default=300.0,
     show_default=True,
     type=float,
-    help="Seconds between direct result file checks for agents whose status may be stale",
+    help="Seconds between direct result file checks for agents whose host cannot be watched for completion",
 )
 @click.option(
     "--integrator-timeout",
@@ -0,0 +1,387 @@
+"""Push-style completion detection for tmr test agents.
+
+Instead of listing every agent across every provider to find the few that
+finished, each host with pending agents runs one long-lived shell command that
+covers all of its pending agents. The command returns as soon as any of them
+writes its result file or changes tmux/"active" state, so the launcher learns
+about finished agents within about a second of it happening.
+"""
+
+import math
+import shlex
+import time
+from collections.abc import Mapping
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import wait
+from pathlib import Path
+from typing import Final
+
+from loguru import logger
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import PrivateAttr
+
+from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.mutable_model import MutableModel
+from imbue.imbue_common.pure import pure
+from imbue.mngr.errors import HostError
+from imbue.mngr.errors import MngrError
+from imbue.mngr.hosts.common import check_agent_type_known
+from imbue.mngr.hosts.common import determine_lifecycle_state
+from imbue.mngr.interfaces.host import OnlineHostInterface
+from imbue.mngr.primitives import AgentId
+from imbue.mngr.primitives import AgentLifecycleState
+from imbue.mngr.primitives import HostId
+from imbue.mngr_tmr.prompts import PLUGIN_NAME
+
+# Lifecycle states in which a test agent has stopped working on its test
+FINISHED_STATES: Final[frozenset[AgentLifecycleState]] = frozenset(
+    {
+        AgentLifecycleState.DONE,
+        AgentLifecycleState.STOPPED,
+        AgentLifecycleState.WAITING,
+    }
+)
+
+# How long a single host check blocks waiting for a change before reporting anyway
+DEFAULT_HOST_CHECK_WAIT_SECONDS: Final[float] = 15.0
+
+# Extra time allowed for a host check beyond its own deadline (connection setup, etc.)
+_HOST_CHECK_GRACE_SECONDS: Final[float] = 15.0
+
+# Interval at which the host check re-reads agent state while waiting for a change
+_HOST_CHECK_RECHECK_SECONDS: Final[float] = 0.5
+
+_TOKEN_PREFIX: Final[str] = "TOKEN "
+_PANE_PREFIX: Final[str] = "PANE "
+_ACTIVE_PREFIX: Final[str] = "ACTIVE "
+_RESULT_PREFIX: Final[str] = "RESULT "
+_PS_MARKER: Final[str] = "PS"
+
+
+class CompletionWatchTarget(FrozenModel):
+    """What a host check needs to know about one agent to compute its lifecycle state."""
+
+    agent_id: AgentId = Field(description="The agent's ID")
+    session_name: str = Field(description="The agent's tmux session name")
+    expected_process_name: str = Field(description="Process name that indicates the agent is still running")
+    is_agent_type_known: bool = Field(description="Whether the agent's type has a registered agent class")
+
+
+class AgentCompletionStatus(FrozenModel):
+    """The state of one agent as seen by a host check."""
+
+    agent_id: AgentId = Field(description="The agent's ID")
+    state: AgentLifecycleState | None = Field(
+        description="The agent's lifecycle state, or None if it is not on the host"
+    )
+    has_result_file: bool = Field(description="Whether the agent has written its result.json")
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the agent is done with its test (its result may still be missing)."""
+        return self.has_result_file or self.state in FINISHED_STATES
+
+
+class HostCompletionCheck(FrozenModel):
+    """The outcome of one host check."""
+
+    token: str = Field(description="Fingerprint of the watched state, passed to the next check of the same host")
+    statuses: tuple[AgentCompletionStatus, ...] = Field(description="The status of every checked agent")
+
+
+def build_completion_watch_targets(
+    host: OnlineHostInterface,
+    agent_ids: Sequence[AgentId],
+) -> dict[AgentId, CompletionWatchTarget]:
+    """Look up the watch targets for the given agents with a single listing of the host's agents.
+
+    Agents that are not on the host are left out of the result.
+    """
+    wanted_ids = set(agent_ids)
+    targets: dict[AgentId, CompletionWatchTarget] = {}
+    for agent in host.get_agents():
+        if agent.id in wanted_ids:
+            targets[agent.id] = CompletionWatchTarget(
+                agent_id=agent.id,
+                session_name=agent.session_name,
+                expected_process_name=agent.get_expected_process_name(),
+                is_agent_type_known=check_agent_type_known(str(agent.agent_type), agent.mngr_ctx.config),
+            )
+    return targets
+
+
+@pure
+def build_host_completion_check_command(
+    agents_dir: Path,
+    targets: Sequence[CompletionWatchTarget],
+    previous_token: str | None,
+    wait_seconds: float,
+) -> str:
+    """Build the shell command that reports the state of all watched agents on a host.
+
+    The report lists the first pane of each agent's tmux session, which agents
+    have an "active" marker and which have written their result file. When the
+    report's checksum equals previous_token, the command first waits (up to
+    wait_seconds) for it to change, so an unchanged host costs one idle command
+    per wait_seconds. The ps output needed to tell RUNNING from DONE is printed
+    once at the end rather than being part of the fingerprint, since unrelated
+    processes come and go constantly.
+    """
+    session_names = " ".join(target.session_name for target in targets)
+    agent_ids = " ".join(shlex.quote(str(target.agent_id)) for target in targets)
+    quoted_agents_dir = shlex.quote(str(agents_dir))
+    quoted_result_path = shlex.quote(f"plugin/{PLUGIN_NAME}/result.json")
+    # date +%s only has whole-second resolution, so add a second to make sure the check waits at least wait_seconds
+    wait_whole_seconds = max(math.ceil(wait_seconds), 1) + 1
+    quoted_previous_token = shlex.quote(previous_token or "")
+    return (
+        "report() {"
+        " tmux list-panes -a -F '#{session_name}|#{window_index}|#{pane_dead}|#{pane_current_command}|#{pane_pid}'"
+        f" 2>/dev/null | awk -F'|' -v names={shlex.quote(session_names)}"
+        ' \'BEGIN { n = split(names, list, " "); for (i = 1; i <= n; i++) wanted[list[i]] = 1 }'
+        f' $2 == "0" && ($1 in wanted) && !seen[$1]++ {{ print "{_PANE_PREFIX}" $0 }}\';'
+        f" for id in {agent_ids}; do"
+        f' if [ -e {quoted_agents_dir}/"$id"/active ]; then echo "{_ACTIVE_PREFIX}$id"; fi;'
+        f' if [ -e {quoted_agents_dir}/"$id"/{quoted_result_path} ]; then echo "{_RESULT_PREFIX}$id"; fi;'
+        " done;"
+        " }; "
+        'fingerprint() { printf "%s" "$1" | cksum | tr " " "-"; }; '
+        'current=$(report); token=$(fingerprint "$current"); '
+        f'if [ "$token" = {quoted_previous_token} ]; then '
+        f"deadline=$(( $(date +%s) + {wait_whole_seconds} )); "
+        'while [ "$(date +%s)" -lt "$deadline" ]; do '
+        f"sleep {_HOST_CHECK_RECHECK_SECONDS}; "
+        'current=$(report); token=$(fingerprint "$current"); '
+        f'if [ "$token" != {quoted_previous_token} ]; then break; fi; '
+        "done; "
+        "fi; "
+        f'echo "{_TOKEN_PREFIX}$token"; '
+        'printf "%s\\n" "$current"; '
+        f"echo {_PS_MARKER}; "
+        "ps -e -o pid=,ppid=,comm= 2>/dev/null || true"
+    )
+
+
+@pure
+def parse_host_completion_check_output(
+    stdout: str,
+    targets: Sequence[CompletionWatchTarget],
+) -> HostCompletionCheck:
+    """Turn the output of a host check into per-agent statuses. Raises MngrError on malformed output."""
+    token: str | None = None
+    pane_by_session_name: dict[str, str] = {}
+    active_ids: set[str] = set()
+    result_ids: set[str] = set()
+    lines = stdout.splitlines()
+    ps_start_index: int | None = None
+    for index, line in enumerate(lines):
+        if line == _PS_MARKER:
+            ps_start_index = index + 1
+            break
+        elif line.startswith(_TOKEN_PREFIX):
+            token = line.removeprefix(_TOKEN_PREFIX).strip()
+        elif line.startswith(_PANE_PREFIX):
+            # session_name|window_index|pane_dead|pane_current_command|pane_pid
+            session_name, _window_index, pane_info = line.removeprefix(_PANE_PREFIX).split("|", 2)
+            pane_by_session_name[session_name] = pane_info
+        elif line.startswith(_ACTIVE_PREFIX):
+            active_ids.add(line.removeprefix(_ACTIVE_PREFIX).strip())
+        elif line.startswith(_RESULT_PREFIX):
+            result_ids.add(line.removeprefix(_RESULT_PREFIX).strip())
+        else:
+            pass
+    if token is None or ps_start_index is None:
+        raise MngrError(f"Unexpected output from tmr completion check: {stdout!r}")
+    ps_output = "\n".join(lines[ps_start_index:])
+
+    statuses = tuple(
+        AgentCompletionStatus(
+            agent_id=target.agent_id,
+            state=determine_lifecycle_state(
+                tmux_info=pane_by_session_name.get(target.session_name),
+                is_active=str(target.agent_id) in active_ids,
+                expected_process_name=target.expected_process_name,
+                ps_output=ps_output,
+                is_agent_type_known=target.is_agent_type_known,
+            ),
+            has_result_file=str(target.agent_id) in result_ids,
+        )
+        for target in targets
+    )
+    return HostCompletionCheck(token=token, statuses=statuses)
+
+
+def check_host_agent_completions(
+    host: OnlineHostInterface,
+    targets: Sequence[CompletionWatchTarget],
+    previous_token: str | None,
+    wait_seconds: float,
+) -> HostCompletionCheck:
+    """Run one batched check of the given agents on a host.
+
+    Returns immediately when the agents' state differs from previous_token
+    (always the case when previous_token is None), and otherwise once it
+    changes or wait_seconds pass. Raises MngrError if the check cannot be run.
+    """
+    command = build_host_completion_check_command(host.host_dir / "agents", targets, previous_token, wait_seconds)
+    result = host.execute_idempotent_command(command, timeout_seconds=wait_seconds + _HOST_CHECK_GRACE_SECONDS)
+    if not result.success:
+        raise MngrError(f"tmr completion check failed on host {host.id}: {result.stderr.strip()}")
+    return parse_host_completion_check_output(result.stdout, targets)
+
+
+def _run_host_check(
+    host: OnlineHostInterface,
+    agent_ids: tuple[AgentId, ...],
+    known_targets: Mapping[AgentId, CompletionWatchTarget],
+    previous_token: str | None,
+    wait_seconds: float,
+) -> tuple[dict[AgentId, CompletionWatchTarget], HostCompletionCheck]:
+    """Resolve any unknown targets and check the host. Agents missing from the host are reported with state None."""
+    targets = {agent_id: known_targets[agent_id] for agent_id in agent_ids if agent_id in known_targets}
+    unknown_ids = [agent_id for agent_id in agent_ids if agent_id not in targets]
+    if unknown_ids:
+        targets.update(build_completion_watch_targets(host, unknown_ids))
+        # The set of watched agents changed, so do not wait on the old fingerprint
+        previous_token = None
+    check = (
+        check_host_agent_completions(host, list(targets.values()), previous_token, wait_seconds)
+        if targets
+        else HostCompletionCheck(token="", statuses=())
+    )
+    missing_statuses = tuple(
+        AgentCompletionStatus(agent_id=agent_id, state=None, has_result_file=False)
+        for agent_id in agent_ids
+        if agent_id not in targets
+    )
+    return targets, HostCompletionCheck(token=check.token, statuses=(*check.statuses, *missing_statuses))
+
+
+class AgentCompletionMonitor(MutableModel):
+    """Tracks pending agents and reports the ones that finished.
+
+    Keeps at most one check in flight per host, running on the given executor.
+    Each check covers all of the host's tracked agents and blocks on the host
+    until something changes, so finished agents are reported within about a
+    second without listing agents across providers. Only used from one thread.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    executor: ConcurrencyGroupExecutor = Field(frozen=True, description="Runs the host checks")
+    wait_seconds: float = Field(
+        default=DEFAULT_HOST_CHECK_WAIT_SECONDS,
+        frozen=True,
+        description="How long each host check blocks waiting for a change",
+    )
+    retry_delay_seconds: float = Field(
+        frozen=True,
+        description="Delay before re-checking a host whose check failed or reported agents missing from the host",
+    )
+
+    _host_by_id: dict[HostId, OnlineHostInterface] = PrivateAttr(default_factory=dict)
+    _agent_ids_by_host_id: dict[HostId, set[AgentId]] = PrivateAttr(default_factory=dict)
+    _host_id_by_agent_id: dict[AgentId, HostId] = PrivateAttr(default_factory=dict)
+    _target_by_agent_id: dict[AgentId, CompletionWatchTarget] = PrivateAttr(default_factory=dict)
+    _token_by_host_id: dict[HostId, str] = PrivateAttr(default_factory=dict)
+    _future_by_host_id: dict[HostId, Future[tuple[dict[AgentId, CompletionWatchTarget], HostCompletionCheck]]] = (
+        PrivateAttr(default_factory=dict)
+    )
+    _next_check_at_by_host_id: dict[HostId, float] = PrivateAttr(default_factory=dict)
+    _failing_host_ids: set[HostId] = PrivateAttr(default_factory=set)
+
+    def add_agent(self, agent_id: AgentId, host: OnlineHostInterface) -> None:
+        """Start tracking an agent."""
+        self._host_by_id[host.id] = host
+        self._agent_ids_by_host_id.setdefault(host.id, set()).add(agent_id)
+        self._host_id_by_agent_id[agent_id] = host.id
+
+    def remove_agent(self, agent_id: AgentId) -> None:
+        """Stop tracking an agent (e.g. because it finished or timed out)."""
+        host_id = self._host_id_by_agent_id.pop(agent_id, None)
+        self._target_by_agent_id.pop(agent_id, None)
+        if host_id is not None:
+            self._agent_ids_by_host_id.get(host_id, set()).discard(agent_id)
+
+    def is_tracking(self, agent_id: AgentId) -> bool:
+        return agent_id in self._host_id_by_agent_id
+
+    def is_watched(self, agent_id: AgentId) -> bool:
+        """Whether the agent's host is currently being checked successfully."""
+        host_id = self._host_id_by_agent_id.get(agent_id)
+        return host_id is not None and host_id not in self._failing_host_ids
+
+    def wait_for_agent_statuses(self, timeout_seconds: float) -> list[AgentCompletionStatus]:
+        """Wait up to timeout_seconds for host checks to report, returning finished and missing agents.
+
+        Only statuses of agents that are finished (see AgentCompletionStatus.is_finished)
+        or missing from their host (state None) are returned.
+        """
+        self._start_due_host_checks()
+        if not self._future_by_host_id:
+            time.sleep(max(min(timeout_seconds, self._get_seconds_until_next_check()), 0.0))
+            return []
+        done_futures, _ = wait(
+            list(self._future_by_host_id.values()), timeout=timeout_seconds, return_when=FIRST_COMPLETED
+        )
+        statuses: list[AgentCompletionStatus] = []
+        for host_id, future in list(self._future_by_host_id.items()):
+            if future not in done_futures:
+                continue
+            del self._future_by_host_id[host_id]
+            try:
+                targets, check = future.result()
+            except (MngrError, HostError, OSError) as e:
+                logger.debug("tmr completion check failed on host {} (will retry): {}", host_id, e)
+                self._failing_host_ids.add(host_id)
+                self._next_check_at_by_host_id[host_id] = time.monotonic() + self.retry_delay_seconds
+                continue
+            self._failing_host_ids.discard(host_id)
+            self._token_by_host_id[host_id] = check.token
+            is_any_agent_missing = False
+            for status in check.statuses:
+                if not self.is_tracking(status.agent_id):
+                    continue
+                if status.agent_id in targets:
+                    self._target_by_agent_id[status.agent_id] = targets[status.agent_id]
+                if status.state is None:
+                    is_any_agent_missing = True
+                if status.state is None or status.is_finished:
+                    statuses.append(status)
+            # Missing agents are looked up again on every check, so pace those checks
+            if is_any_agent_missing:
+                self._next_check_at_by_host_id[host_id] = time.monotonic() + self.retry_delay_seconds
+        return statuses
+
+    def _start_due_host_checks(self) -> None:
+        now = time.monotonic()
+        for host_id, agent_ids in self._agent_ids_by_host_id.items():
+            if not agent_ids or host_id in self._future_by_host_id:
+                continue
+            if self._next_check_at_by_host_id.get(host_id, 0.0) > now:
+                continue
+            self._future_by_host_id[host_id] = self.executor.submit(
+                _run_host_check,
+                self._host_by_id[host_id],
+                tuple(sorted(agent_ids)),
+                {
+                    agent_id: self._target_by_agent_id[agent_id]
+                    for agent_id in agent_ids
+                    if agent_id in self._target_by_agent_id
+                },
+                self._token_by_host_id.get(host_id),
+                self.wait_seconds,
+            )
+
+    def _get_seconds_until_next_check(self) -> float:
+        now = time.monotonic()
+        check_times = [
+            check_at
+            for host_id, check_at in self._next_check_at_by_host_id.items()
+            if self._agent_ids_by_host_id.get(host_id)
+        ]
+        return min(check_times) - now if check_times else math.inf
@@ -0,0 +1,137 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
+from imbue.mngr.errors import MngrError
+from imbue.mngr.interfaces.host import OnlineHostInterface
+from imbue.mngr.primitives import AgentId
+from imbue.mngr.primitives import AgentLifecycleState
+from imbue.mngr_tmr.completion import AgentCompletionMonitor
+from imbue.mngr_tmr.completion import AgentCompletionStatus
+from imbue.mngr_tmr.completion import CompletionWatchTarget
+from imbue.mngr_tmr.completion import check_host_agent_completions
+from imbue.mngr_tmr.completion import parse_host_completion_check_output
+from imbue.mngr_tmr.prompts import PLUGIN_NAME
+
+
+def _make_target(agent_id: AgentId, session_name: str = "mngr-tmr-test") -> CompletionWatchTarget:
+    return CompletionWatchTarget(
+        agent_id=agent_id,
+        session_name=session_name,
+        expected_process_name="claude",
+        is_agent_type_known=True,
+    )
+
+
+def _write_result_file(host_dir: Path, agent_id: AgentId) -> None:
+    result_path = host_dir / "agents" / str(agent_id) / "plugin" / PLUGIN_NAME / "result.json"
+    result_path.parent.mkdir(parents=True, exist_ok=True)
+    result_path.write_text("{}")
+
+
+# === parse_host_completion_check_output ===
+
+
+def test_parse_host_completion_check_output_computes_states() -> None:
+    running_id = AgentId.generate()
+    waiting_id = AgentId.generate()
+    done_id = AgentId.generate()
+    targets = [
+        _make_target(running_id, "mngr-running"),
+        _make_target(waiting_id, "mngr-waiting"),
+        _make_target(done_id, "mngr-done"),
+    ]
+    stdout = "\n".join(
+        [
+            "TOKEN 123-45",
+            "PANE mngr-running|0|0|claude|100",
+            "PANE mngr-waiting|0|0|claude|200",
+            "PANE mngr-done|0|1|bash|300",
+            f"ACTIVE {running_id}",
+            f"RESULT {done_id}",
+            "PS",
+            "100 1 bash",
+            "101 100 claude",
+        ]
+    )
+
+    check = parse_host_completion_check_output(stdout, targets)
+
+    assert check.token == "123-45"
+    status_by_id = {status.agent_id: status for status in check.statuses}
+    assert status_by_id[running_id].state == AgentLifecycleState.RUNNING
+    assert not status_by_id[running_id].is_finished
+    assert status_by_id[waiting_id].state == AgentLifecycleState.WAITING
+    assert status_by_id[waiting_id].is_finished
+    assert status_by_id[done_id].state == AgentLifecycleState.DONE
+    assert status_by_id[done_id].has_result_file
+
+
+def test_parse_host_completion_check_output_rejects_truncated_output() -> None:
+    with pytest.raises(MngrError):
+        parse_host_completion_check_output("TOKEN 1-2\n", [_make_target(AgentId.generate())])
+
+
+def test_agent_completion_status_result_file_means_finished() -> None:
+    status = AgentCompletionStatus(
+        agent_id=AgentId.generate(), state=AgentLifecycleState.RUNNING, has_result_file=True
+    )
+    assert status.is_finished
+
+
+# === check_host_agent_completions ===
+
+
+@pytest.mark.tmux
+def test_check_host_agent_completions_reports_result_files(localhost: OnlineHostInterface) -> None:
+    finished_id = AgentId.generate()
+    pending_id = AgentId.generate()
+    _write_result_file(localhost.host_dir, finished_id)
+
+    check = check_host_agent_completions(
+        localhost, [_make_target(finished_id), _make_target(pending_id)], previous_token=None, wait_seconds=5.0
+    )
+
+    status_by_id = {status.agent_id: status for status in check.statuses}
+    assert status_by_id[finished_id].has_result_file
+    assert not status_by_id[pending_id].has_result_file
+    assert check.token != ""
+
+
+@pytest.mark.tmux
+def test_check_host_agent_completions_waits_for_a_change(localhost: OnlineHostInterface) -> None:
+    agent_id = AgentId.generate()
+    targets = [_make_target(agent_id)]
+    first = check_host_agent_completions(localhost, targets, previous_token=None, wait_seconds=1.0)
+
+    start = time.monotonic()
+    unchanged = check_host_agent_completions(localhost, targets, previous_token=first.token, wait_seconds=1.0)
+    assert time.monotonic() - start >= 0.9
+    assert unchanged.token == first.token
+
+    _write_result_file(localhost.host_dir, agent_id)
+    changed = check_host_agent_completions(localhost, targets, previous_token=first.token, wait_seconds=30.0)
+    assert changed.token != first.token
+    assert changed.statuses[0].has_result_file
+
+
+# === AgentCompletionMonitor ===
+
+
+def test_monitor_reports_agents_missing_from_their_host(localhost: OnlineHostInterface, cg: ConcurrencyGroup) -> None:
+    agent_id = AgentId.generate()
+    with ConcurrencyGroupExecutor(parent_cg=cg, name="test_monitor", max_workers=4) as executor:
+        monitor = AgentCompletionMonitor(executor=executor, wait_seconds=1.0, retry_delay_seconds=1.0)
+        monitor.add_agent(agent_id, localhost)
+
+        statuses = monitor.wait_for_agent_statuses(timeout_seconds=30.0)
+
+        assert [status.agent_id for status in statuses] == [agent_id]
+        assert statuses[0].state is None
+        assert monitor.is_watched(agent_id)
+
+        monitor.remove_agent(agent_id)
+        assert not monitor.is_tracking(agent_id)
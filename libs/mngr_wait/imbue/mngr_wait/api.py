@@ -2,6 +2,7 @@ import time
 from collections.abc import Callable
 from collections.abc import Mapping
 from collections.abc import Sequence
+from typing import Final
 
 from loguru import logger
 from pydantic import Field
@@ -13,6 +14,7 @@ from imbue.mngr.api.find import resolve_agent_reference
 from imbue.mngr.api.find import resolve_host_reference
 from imbue.mngr.api.providers import get_provider_instance
 from imbue.mngr.config.data_types import MngrContext
+from imbue.mngr.errors import BaseMngrError
 from imbue.mngr.errors import HostConnectionError
 from imbue.mngr.errors import UserInputError
 from imbue.mngr.interfaces.host import OnlineHostInterface
@@ -29,6 +31,9 @@ from imbue.mngr_wait.data_types import WaitTarget
 from imbue.mngr_wait.data_types import check_state_match
 from imbue.mngr_wait.primitives import WaitTargetType
 
+# Factor by which the poll interval grows while the state stays the same (when backoff is enabled)
+_POLL_BACKOFF_FACTOR: Final[float] = 1.5
+
 
 class ResolvedTarget(FrozenModel):
     """Resolved wait target with provider and host references for polling."""
@@ -230,15 +235,26 @@ def wait_for_state(
     timeout_seconds: float | None,
     interval_seconds: float,
     on_state_change: Callable[[StateChange], None] | None,
+    # Blocks until the target may have changed (or the given number of seconds pass). When
+    # None, or when it fails, the wait falls back to sleeping between polls.
+    wait_for_change_fn: Callable[[float], bool] | None = None,
+    # Upper bound for the backed-off poll interval, and the longest a single wait_for_change_fn
+    # call may block before the state is re-polled anyway. None disables backoff.
+    max_interval_seconds: float | None = None,
 ) -> WaitResult:
     """Poll until the target reaches one of the target states, or timeout.
 
-    poll_fn is called each iteration to get the current combined state.
+    poll_fn is called each iteration to get the current combined state. Between
+    polls, wait_for_change_fn (if given) is used to wake up as soon as the target
+    changes. Otherwise the wait sleeps for the poll interval, which backs off
+    towards max_interval_seconds while the state stays the same.
     """
     start_time = time.monotonic()
     state_changes: list[StateChange] = []
     previous_state = CombinedState()
     is_waiting = True
+    sleep_seconds = interval_seconds
+    max_sleep_seconds = max(max_interval_seconds, interval_seconds) if max_interval_seconds is not None else None
 
     while is_waiting:
         elapsed = time.monotonic() - start_time
@@ -250,6 +266,10 @@ def wait_for_state(
             logger.warning("Polling error (will retry): {}", exc)
             current_state = CombinedState()
 
+        # Any change resets the backoff, since more changes often follow quickly
+        if current_state != previous_state:
+            sleep_seconds = interval_seconds
+
         # Detect and log state changes
         _detect_state_changes(
             previous_state=previous_state,
@@ -281,8 +301,13 @@ def wait_for_state(
         if timeout_seconds is not None and elapsed >= timeout_seconds:
             is_waiting = False
         else:
-            # Sleep for the poll interval
-            time.sleep(interval_seconds)
+            remaining_seconds = None if timeout_seconds is None else timeout_seconds - (time.monotonic() - start_time)
+            watch_seconds = _cap_to_remaining(max_sleep_seconds or interval_seconds, remaining_seconds)
+            if wait_for_change_fn is None or not _wait_for_change(wait_for_change_fn, watch_seconds):
+                # No push source: sleep for the poll interval, backing off while nothing changes
+                time.sleep(_cap_to_remaining(sleep_seconds, remaining_seconds))
+                if max_sleep_seconds is not None:
+                    sleep_seconds = min(sleep_seconds * _POLL_BACKOFF_FACTOR, max_sleep_seconds)
 
     final_elapsed = time.monotonic() - start_time
     return WaitResult(
@@ -296,6 +321,21 @@ def wait_for_state(
     )
 
 
+def _cap_to_remaining(seconds: float, remaining_seconds: float | None) -> float:
+    return seconds if remaining_seconds is None else max(min(seconds, remaining_seconds), 0.0)
+
+
+def _wait_for_change(wait_for_change_fn: Callable[[float], bool], timeout_seconds: float) -> bool:
+    """Block on the push source, returning False if it failed (so the caller should sleep instead)."""
+    try:
+        is_changed = wait_for_change_fn(timeout_seconds)
+    except (BaseMngrError, OSError) as exc:
+        logger.debug("Waiting for a state change failed (falling back to polling): {}", exc)
+        return False
+    logger.trace("Push source returned (changed={})", is_changed)
+    return True
+
+
 def _detect_state_changes(
     previous_state: CombinedState,
     current_state: CombinedState,
@@ -515,3 +515,85 @@ def test_wait_for_state_detects_destroyed_after_connection_errors() -> None:
     assert len(result.state_changes) == 1
     assert result.state_changes[0].old_value == "RUNNING"
     assert result.state_changes[0].new_value == "DESTROYED"
+
+
+def test_wait_for_state_wakes_on_push_source_instead_of_sleeping() -> None:
+    target = _make_wait_target(WaitTargetType.AGENT)
+    current_state = CombinedState(host_state=HostState.RUNNING, agent_state=AgentLifecycleState.RUNNING)
+    watch_timeouts: list[float] = []
+
+    def _wait_for_change(timeout_seconds: float) -> bool:
+        nonlocal current_state
+        watch_timeouts.append(timeout_seconds)
+        current_state = CombinedState(host_state=HostState.RUNNING, agent_state=AgentLifecycleState.DONE)
+        return True
+
+    result = wait_for_state(
+        target=target,
+        poll_fn=lambda: current_state,
+        target_states=frozenset({"DONE"}),
+        timeout_seconds=30.0,
+        # Far longer than the test takes, so a sleep would show up as a timeout
+        interval_seconds=60.0,
+        on_state_change=None,
+        wait_for_change_fn=_wait_for_change,
+        max_interval_seconds=120.0,
+    )
+
+    assert result.is_matched is True
+    assert result.elapsed_seconds < 5.0
+    # The watch is capped by the remaining timeout
+    assert len(watch_timeouts) == 1
+    assert watch_timeouts[0] <= 30.0
+
+
+def test_wait_for_state_falls_back_to_polling_when_push_source_fails() -> None:
+    target = _make_wait_target(WaitTargetType.AGENT)
+    poll_count = 0
+
+    def _poll() -> CombinedState:
+        nonlocal poll_count
+        poll_count += 1
+        agent_state = AgentLifecycleState.DONE if poll_count >= 3 else AgentLifecycleState.RUNNING
+        return CombinedState(host_state=HostState.RUNNING, agent_state=agent_state)
+
+    def _failing_wait_for_change(timeout_seconds: float) -> bool:
+        raise ConnectionError("watch unavailable")
+
+    result = wait_for_state(
+        target=target,
+        poll_fn=_poll,
+        target_states=frozenset({"DONE"}),
+        timeout_seconds=5.0,
+        interval_seconds=0.01,
+        on_state_change=None,
+        wait_for_change_fn=_failing_wait_for_change,
+        max_interval_seconds=0.05,
+    )
+
+    assert result.is_matched is True
+    assert poll_count == 3
+
+
+def test_wait_for_state_backs_off_while_state_is_unchanged() -> None:
+    target = _make_wait_target(WaitTargetType.HOST)
+    poll_count = 0
+
+    def _poll() -> CombinedState:
+        nonlocal poll_count
+        poll_count += 1
+        return CombinedState(host_state=HostState.RUNNING)
+
+    result = wait_for_state(
+        target=target,
+        poll_fn=_poll,
+        target_states=frozenset({"STOPPED"}),
+        timeout_seconds=0.6,
+        interval_seconds=0.05,
+        on_state_change=None,
+        max_interval_seconds=0.4,
+    )
+
+    assert result.is_timed_out is True
+    # Without backoff this would poll about 12 times
+    assert poll_count <= 7
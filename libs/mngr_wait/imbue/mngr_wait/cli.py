@@ -31,6 +31,7 @@ from imbue.mngr_wait.primitives import ALL_VALID_STATE_STRINGS
 from imbue.mngr_wait.primitives import EXIT_CODE_ERROR
 from imbue.mngr_wait.primitives import EXIT_CODE_SUCCESS
 from imbue.mngr_wait.primitives import EXIT_CODE_TIMEOUT
+from imbue.mngr_wait.watch import build_agent_state_watcher
 
 
 class WaitCliOptions(CommonCliOptions):
@@ -41,6 +42,7 @@ class WaitCliOptions(CommonCliOptions):
     state: tuple[str, ...]
     timeout: str | None
     interval: str
+    max_interval: str
 
 
 def _read_target_from_stdin(
@@ -157,6 +159,13 @@ def _output_result(result: WaitResult, output_opts: OutputOptions) -> None:
     show_default=True,
     help="Poll interval (e.g. '5s', '1m'). Default: 5s.",
 )
+@optgroup.option(
+    "--max-interval",
+    default="30s",
+    show_default=True,
+    help="Longest gap between polls. Agents are re-polled as soon as their state may have changed; "
+    "targets without a change signal (e.g. hosts) back off from --interval up to this.",
+)
 @add_common_options
 @click.pass_context
 def wait(ctx: click.Context, **kwargs: object) -> None:
@@ -186,8 +195,9 @@ def wait(ctx: click.Context, **kwargs: object) -> None:
     if opts.timeout is not None:
         timeout_seconds = parse_duration_to_seconds(opts.timeout)
 
-    # Parse interval
+    # Parse intervals
     interval_seconds = parse_duration_to_seconds(opts.interval)
+    max_interval_seconds = parse_duration_to_seconds(opts.max_interval)
 
     # Poll the initial state
     initial_state = poll_target_state(resolved)
@@ -226,7 +236,12 @@ def wait(ctx: click.Context, **kwargs: object) -> None:
     )
     if timeout_seconds is not None:
         logger.info("Timeout: {:.0f}s", timeout_seconds)
-    logger.info("Poll interval: {:.0f}s", interval_seconds)
+    logger.info("Poll interval: {:.0f}s (backing off to {:.0f}s)", interval_seconds, max_interval_seconds)
+
+    # Wake up as soon as the agent's state may have changed, where possible
+    watcher = build_agent_state_watcher(resolved)
+    if watcher is not None:
+        logger.debug("Watching agent {} for state changes", resolved.target.identifier)
 
     # Run the wait loop
     captured_output_format = output_opts.output_format
@@ -238,6 +253,8 @@ def wait(ctx: click.Context, **kwargs: object) -> None:
             timeout_seconds=timeout_seconds,
             interval_seconds=interval_seconds,
             on_state_change=lambda change: _emit_state_change(change, captured_output_format),
+            wait_for_change_fn=watcher.wait_for_change if watcher is not None else None,
+            max_interval_seconds=max_interval_seconds,
         )
     except KeyboardInterrupt:
         logger.debug("Received keyboard interrupt")
@@ -276,6 +293,10 @@ When watching an agent, both agent and host states are tracked:
 - RUNNING only counts if the agent itself is running (not the host)
 - Host-specific states (CRASHED, PAUSED, etc.) are matched against the host
 
+Agents on online hosts are watched with a single long-running command on their host (using inotifywait
+when available), so the wait reacts as soon as the agent's state may have changed. Otherwise (e.g. for
+hosts), the state is polled every --interval, backing off to --max-interval while nothing changes.
+
 Exit codes:
   0 - Target reached one of the requested states
   1 - Error
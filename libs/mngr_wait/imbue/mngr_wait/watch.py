@@ -0,0 +1,121 @@
+import math
+import shlex
+from pathlib import Path
+from typing import Final
+
+from loguru import logger
+from pydantic import Field
+
+from imbue.imbue_common.frozen_model import FrozenModel
+from imbue.imbue_common.pure import pure
+from imbue.mngr.errors import HostConnectionError
+from imbue.mngr.errors import MngrError
+from imbue.mngr.interfaces.host import OnlineHostInterface
+from imbue.mngr_wait.api import ResolvedTarget
+
+# Printed by the watch command to report whether anything changed before it gave up
+_CHANGED_MARKER: Final[str] = "MNGR_WAIT_CHANGED"
+_UNCHANGED_MARKER: Final[str] = "MNGR_WAIT_UNCHANGED"
+
+# Extra time allowed for the watch command beyond its own deadline (connection setup, etc.)
+_WATCH_COMMAND_GRACE_SECONDS: Final[float] = 15.0
+
+
+class AgentStateWatcher(FrozenModel):
+    """Blocks until the inputs to an agent's lifecycle state change.
+
+    Runs a single long-lived command on the agent's host that watches the
+    agent's tmux pane (its status and current command) and the
+    "active" marker in the agent's state directory. The command uses
+    inotifywait when it is installed and otherwise re-checks locally on the
+    host every half second, so waiting costs one command per change instead of
+    a full state poll every interval.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    host: OnlineHostInterface = Field(description="The host the agent runs on")
+    session_name: str = Field(description="The agent's tmux session name")
+    agent_dir: Path = Field(description="The agent's state directory on the host")
+
+    def wait_for_change(self, timeout_seconds: float) -> bool:
+        """Block until something changes (returning True) or timeout_seconds pass (returning False).
+
+        Raises MngrError if the watch command cannot be run.
+        """
+        command = build_agent_state_watch_command(self.session_name, self.agent_dir, timeout_seconds)
+        result = self.host.execute_idempotent_command(
+            command, timeout_seconds=timeout_seconds + _WATCH_COMMAND_GRACE_SECONDS
+        )
+        if not result.success:
+            raise MngrError(f"Agent state watch failed on host {self.host.id}: {result.stderr.strip()}")
+        return parse_agent_state_watch_output(result.stdout)
+
+
+def build_agent_state_watcher(resolved: ResolvedTarget) -> AgentStateWatcher | None:
+    """Build a watcher for an agent target, or None when no push source is available.
+
+    Host targets and agents on offline or unreachable hosts have no push
+    source, so callers fall back to polling for them.
+    """
+    if resolved.agent_id is None:
+        return None
+    try:
+        host = resolved.provider.get_host(resolved.host_id)
+        if not isinstance(host, OnlineHostInterface):
+            return None
+        for agent in host.get_agents():
+            if agent.id == resolved.agent_id:
+                return AgentStateWatcher(
+                    host=host,
+                    session_name=agent.session_name,
+                    agent_dir=agent.get_agent_dir(),
+                )
+    except HostConnectionError as e:
+        logger.debug("Cannot watch agent {} for state changes: {}", resolved.agent_id, e)
+    return None
+
+
+@pure
+def build_agent_state_watch_command(session_name: str, agent_dir: Path, timeout_seconds: float) -> str:
+    """Build a shell command that prints a marker once the agent's state inputs change or the timeout passes.
+
+    The fingerprint covers the pane's dead flag, current command and pid, and
+    whether the agent's "active" marker file exists. The processes under the
+    pane are left out: a busy agent starts short-lived subprocesses all the
+    time, and each of them would otherwise end the wait.
+    """
+    watch_seconds = max(math.ceil(timeout_seconds), 1)
+    quoted_target = shlex.quote(f"{session_name}:0")
+    quoted_agent_dir = shlex.quote(str(agent_dir))
+    quoted_active_path = shlex.quote(str(agent_dir / "active"))
+    return (
+        "fingerprint() {"
+        f" pane=$(tmux list-panes -t {quoted_target} -F '#{{pane_dead}}|#{{pane_current_command}}|#{{pane_pid}}'"
+        " 2>/dev/null | head -n 1);"
+        ' printf "%s\\n" "$pane";'
+        f" if [ -e {quoted_active_path} ]; then echo active; fi;"
+        " }; "
+        f"deadline=$(( $(date +%s) + {watch_seconds} )); "
+        "initial=$(fingerprint); "
+        'while [ "$(date +%s)" -lt "$deadline" ]; do '
+        "if command -v inotifywait >/dev/null 2>&1; then "
+        f"inotifywait -qq -t 1 -e create,delete,move {quoted_agent_dir} >/dev/null 2>&1 || [ $? -eq 2 ] || sleep 0.5; "
+        "else sleep 0.5; fi; "
+        f'if [ "$(fingerprint)" != "$initial" ]; then echo {_CHANGED_MARKER}; exit 0; fi; '
+        "done; "
+        f"echo {_UNCHANGED_MARKER}"
+    )
+
+
+@pure
+def parse_agent_state_watch_output(stdout: str) -> bool:
+    """Return whether the watch command saw a change. Raises MngrError on unexpected output."""
+    lines = stdout.strip().splitlines()
+    last_line = lines[-1].strip() if lines else ""
+    if last_line == _CHANGED_MARKER:
+        return True
+    elif last_line == _UNCHANGED_MARKER:
+        return False
+    else:
+        raise MngrError(f"Unexpected output from agent state watch: {stdout!r}")
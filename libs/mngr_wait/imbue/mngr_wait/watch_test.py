@@ -0,0 +1,51 @@
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from imbue.mngr.errors import MngrError
+from imbue.mngr_wait.watch import build_agent_state_watch_command
+from imbue.mngr_wait.watch import parse_agent_state_watch_output
+
+
+def test_parse_agent_state_watch_output() -> None:
+    assert parse_agent_state_watch_output("MNGR_WAIT_CHANGED\n") is True
+    assert parse_agent_state_watch_output("noise\nMNGR_WAIT_UNCHANGED\n") is False
+    with pytest.raises(MngrError):
+        parse_agent_state_watch_output("bash: syntax error\n")
+
+
+def test_build_agent_state_watch_command_quotes_paths() -> None:
+    command = build_agent_state_watch_command("mngr-agent", Path("/tmp/with space/agents/agent-1"), 2.5)
+
+    assert "'/tmp/with space/agents/agent-1/active'" in command
+    assert "mngr-agent:0" in command
+    # Timeouts are rounded up to whole seconds
+    assert "+ 3 ))" in command
+
+
+def _run_watch_command(agent_dir: Path, timeout_seconds: float) -> str:
+    command = build_agent_state_watch_command("mngr-watch-test-missing-session", agent_dir, timeout_seconds)
+    result = subprocess.run(["sh", "-c", command], capture_output=True, text=True, timeout=timeout_seconds + 10)
+    return result.stdout
+
+
+@pytest.mark.tmux
+def test_watch_command_reports_unchanged_when_nothing_happens(tmp_path: Path) -> None:
+    assert parse_agent_state_watch_output(_run_watch_command(tmp_path, 1.0)) is False
+
+
+@pytest.mark.tmux
+def test_watch_command_reports_change_when_agent_becomes_active(tmp_path: Path) -> None:
+    toucher = threading.Timer(0.3, (tmp_path / "active").touch)
+    toucher.start()
+    start = time.monotonic()
+    try:
+        output = _run_watch_command(tmp_path, 10.0)
+    finally:
+        toucher.cancel()
+
+    assert parse_agent_state_watch_output(output) is True
+    assert time.monotonic() - start < 5.0
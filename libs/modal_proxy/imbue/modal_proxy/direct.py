@@ -10,6 +10,7 @@ import subprocess
 import tempfile
 from collections.abc import Callable
 from collections.abc import Generator
+from concurrent.futures import Future
 from functools import wraps
 from pathlib import Path
 from typing import Any
@@ -31,6 +32,8 @@ from tenacity import retry_if_exception_type
 from tenacity import stop_after_attempt
 from tenacity import wait_exponential
 
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.concurrency_group.executor import ConcurrencyGroupExecutor
 from imbue.modal_proxy.data_types import FileEntry
 from imbue.modal_proxy.data_types import FileEntryType
 from imbue.modal_proxy.data_types import StreamType
@@ -156,6 +159,7 @@ def _unwrap_secret(iface: SecretInterface) -> modal.Secret:
 _VOLUME_RETRY = retry_if_exception_type((modal.exception.InternalError, StreamTerminatedError, ProtocolError))
 _VOLUME_STOP = stop_after_attempt(3)
 _VOLUME_WAIT = wait_exponential(multiplier=1, min=1, max=3)
+_MAX_CONCURRENT_VOLUME_READS = 16
 
 
 # ---------------------------------------------------------------------------
@@ -257,8 +261,8 @@ class DirectVolume(VolumeInterface):
 
     @_translate_exceptions
     @retry(retry=_VOLUME_RETRY, stop=_VOLUME_STOP, wait=_VOLUME_WAIT, reraise=True)
-    def listdir(self, path: str) -> list[FileEntry]:
-        entries = self.volume.listdir(path)
+    def listdir(self, path: str, *, recursive: bool = False) -> list[FileEntry]:
+        entries = self.volume.listdir(path, recursive=recursive)
         return [
             FileEntry(
                 path=e.path,
@@ -274,6 +278,23 @@ class DirectVolume(VolumeInterface):
     def read_file(self, path: str) -> bytes:
         return b"".join(self.volume.read_file(path))
 
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        # Modal has no batch read, so the per-file round trips are overlapped instead
+        future_by_path: dict[str, Future[bytes]] = {}
+        with ConcurrencyGroup(name="modal_volume_read_files") as cg:
+            with ConcurrencyGroupExecutor(
+                parent_cg=cg, name="modal_volume_read_files", max_workers=_MAX_CONCURRENT_VOLUME_READS
+            ) as executor:
+                for path in paths:
+                    future_by_path[path] = executor.submit(self.read_file, path)
+        content_by_path: dict[str, bytes] = {}
+        for path, future in future_by_path.items():
+            try:
+                content_by_path[path] = future.result()
+            except ModalProxyNotFoundError:
+                continue
+        return content_by_path
+
     @_translate_exceptions
     @retry(retry=_VOLUME_RETRY, stop=_VOLUME_STOP, wait=_VOLUME_WAIT, reraise=True)
     def remove_file(self, path: str, *, recursive: bool = False) -> None:
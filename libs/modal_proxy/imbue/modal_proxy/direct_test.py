@@ -4,6 +4,7 @@ from typing import Any
 from typing import Mapping
 from typing import Sequence
 
+import modal.exception
 import pytest
 from modal.stream_type import StreamType as ModalStreamType
 from modal.volume import FileEntryType as ModalFileEntryType
@@ -71,12 +72,15 @@ class _FakeVolume(VolumeInterface):
     def get_name(self) -> str | None:
         return None
 
-    def listdir(self, path: str) -> list[FileEntry]:
+    def listdir(self, path: str, *, recursive: bool = False) -> list[FileEntry]:
         raise NotImplementedError
 
     def read_file(self, path: str) -> bytes:
         raise NotImplementedError
 
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        raise NotImplementedError
+
     def remove_file(self, path: str, *, recursive: bool = False) -> None:
         raise NotImplementedError
 
@@ -149,3 +153,24 @@ def test_unwrap_accepts_direct(unwrap_fn: Any, fake_cls: Any, direct_cls: Any, f
     sentinel = object()
     direct = direct_cls.model_construct(**{field_name: sentinel})
     assert unwrap_fn(direct) is sentinel
+
+
+class _FakeModalVolume:
+    """Stands in for a modal.Volume, serving reads from a dict."""
+
+    def __init__(self, content_by_path: dict[str, bytes]) -> None:
+        self.content_by_path = content_by_path
+
+    def read_file(self, path: str) -> Generator[bytes, None, None]:
+        if path not in self.content_by_path:
+            raise modal.exception.NotFoundError(path)
+        yield self.content_by_path[path]
+
+
+def test_direct_volume_read_files_leaves_out_missing_files() -> None:
+    fake_modal_volume = _FakeModalVolume({"hosts/a.json": b"a", "hosts/b.json": b"b"})
+    volume = DirectVolume.model_construct(volume=fake_modal_volume)
+
+    content_by_path = volume.read_files(["hosts/a.json", "hosts/missing.json", "hosts/b.json"])
+
+    assert content_by_path == {"hosts/a.json": b"a", "hosts/b.json": b"b"}
@@ -104,8 +104,8 @@ class VolumeInterface(MutableModel, ABC):
         ...
 
     @abstractmethod
-    def listdir(self, path: str) -> list[FileEntry]:
-        """List entries in a directory on the volume."""
+    def listdir(self, path: str, *, recursive: bool = False) -> list[FileEntry]:
+        """List entries in a directory on the volume (at any depth if recursive)."""
         ...
 
     @abstractmethod
@@ -113,6 +113,11 @@ class VolumeInterface(MutableModel, ABC):
         """Read a file from the volume and return its contents."""
         ...
 
+    @abstractmethod
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        """Read several small files from the volume, keyed by path. Files that do not exist are left out."""
+        ...
+
     @abstractmethod
     def remove_file(self, path: str, *, recursive: bool = False) -> None:
         """Remove a file or directory from the volume."""
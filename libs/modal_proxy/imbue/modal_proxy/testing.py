@@ -128,14 +128,15 @@ class TestingVolume(VolumeInterface):
             raise ModalProxyError(f"Path escapes volume root: {path}")
         return resolved
 
-    def listdir(self, path: str) -> list[FileEntry]:
+    def listdir(self, path: str, *, recursive: bool = False) -> list[FileEntry]:
         target = self._resolve(path)
         if not target.exists():
             raise ModalProxyNotFoundError(f"Path not found: {path}")
         if not target.is_dir():
             raise ModalProxyError(f"Not a directory: {path}")
         entries: list[FileEntry] = []
-        for child in sorted(target.iterdir()):
+        children = target.rglob("*") if recursive else target.iterdir()
+        for child in sorted(children):
             relative = str(child.relative_to(self.root_dir))
             stat = child.stat()
             entries.append(
@@ -156,6 +157,15 @@ class TestingVolume(VolumeInterface):
             raise ModalProxyError(f"Not a file: {path}")
         return target.read_bytes()
 
+    def read_files(self, paths: Sequence[str]) -> dict[str, bytes]:
+        content_by_path: dict[str, bytes] = {}
+        for path in paths:
+            try:
+                content_by_path[path] = self.read_file(path)
+            except ModalProxyNotFoundError:
+                continue
+        return content_by_path
+
     def remove_file(self, path: str, *, recursive: bool = False) -> None:
         target = self._resolve(path)
         if not target.exists():
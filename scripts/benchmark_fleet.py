@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmarks mngr listing, discovery and events against a synthetic fleet of hosts and agents.
+
+The fleet is written to a temporary directory and served by an in-process fake
+provider, so no real hosts are created. Round trips are counted at the points
+where a remote host or provider API would be contacted; use
+--simulated-round-trip-seconds to approximate remote latency.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from imbue.concurrency_group.concurrency_group import ConcurrencyGroup
+from imbue.mngr.benchmarks.harness import FleetBenchmarkOptions
+from imbue.mngr.benchmarks.harness import format_fleet_benchmark_report
+from imbue.mngr.benchmarks.harness import run_fleet_benchmark
+from imbue.mngr.benchmarks.synthetic_fleet import SyntheticFleetSpec
+
+
+@click.command()
+@click.option("--hosts", "host_count", default=200, show_default=True, help="Number of synthetic hosts")
+@click.option("--agents-per-host", default=10, show_default=True, help="Number of agents on each host")
+@click.option(
+    "--offline-fraction", default=0.25, show_default=True, help="Fraction of hosts that are stopped (offline)"
+)
+@click.option("--events-per-file", default=50, show_default=True, help="Events in each agent event file")
+@click.option(
+    "--discovery-events", default=1000, show_default=True, help="Incremental discovery events after the snapshot"
+)
+@click.option(
+    "--simulated-round-trip-seconds",
+    default=0.0,
+    show_default=True,
+    help="Latency added to every host round trip",
+)
+@click.option("--seed", default=0, show_default=True, help="Seed for the generated fleet")
+@click.option(
+    "--keep-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Write the fleet here and keep it, instead of using a temporary directory",
+)
+def main(
+    host_count: int,
+    agents_per_host: int,
+    offline_fraction: float,
+    events_per_file: int,
+    discovery_events: int,
+    simulated_round_trip_seconds: float,
+    seed: int,
+    keep_dir: Path | None,
+) -> None:
+    spec = SyntheticFleetSpec(
+        host_count=host_count,
+        agents_per_host=agents_per_host,
+        offline_host_fraction=offline_fraction,
+        events_per_file=events_per_file,
+        discovery_incremental_events=discovery_events,
+        seed=seed,
+    )
+    # The benchmarked code logs every command it runs, which would drown out the report
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    options = FleetBenchmarkOptions(simulated_round_trip_seconds=simulated_round_trip_seconds)
+    click.echo(f"Benchmarking a fleet of {spec.host_count} hosts and {spec.agent_count} agents...")
+    with ConcurrencyGroup(name="benchmark_fleet") as cg:
+        if keep_dir is not None:
+            report = run_fleet_benchmark(keep_dir, spec, options, cg)
+        else:
+            with tempfile.TemporaryDirectory(prefix="mngr-fleet-benchmark-") as tmp_dir:
+                report = run_fleet_benchmark(Path(tmp_dir), spec, options, cg)
+    click.echo(format_fleet_benchmark_report(report))
+
+
+if __name__ == "__main__":
+    main()